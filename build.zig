@@ -34,6 +34,18 @@ pub fn build(b: *std.Build) !void {
         "Enable building lunasvg to provide better emoji support in freetype. Requires freetype to be enabled."
     ) orelse false;
 
+    const enable_thread_local_context = b.option(bool, "enable_thread_local_context",
+        "Make the current ImGui context thread-local, so separate contexts can build frames on separate threads at once."
+    ) orelse false;
+
+    const enable_instrumentation = b.option(bool, "enable_instrumentation",
+        "Count calls to every function in `raw`, see `instrumentation` in the bindings."
+    ) orelse false;
+
+    const instrumentation_timing = b.option(bool, "instrumentation_timing",
+        "Also measure the time spent in every function in `raw`. Requires instrumentation to be enabled."
+    ) orelse false;
+
     const freetype_dep: ?*std.Build.Dependency = switch (enable_freetype) {
         true => b.lazyDependency("freetype", .{ .target = target, .optimize = optimize }),
         else => null,
@@ -51,45 +63,245 @@ pub fn build(b: *std.Build) !void {
     );
     cli_generate_step.dependOn(generator_dep.builder.getInstallStep());
 
+    const cimgui_config: CimguiConfig = .{
+        .imgui_dep = imgui_dep,
+        .freetype_dep = freetype_dep,
+        .lunasvg_dep = lunasvg_dep,
+        .enable_freetype = enable_freetype,
+        .enable_lunasvg = enable_lunasvg,
+        .enable_thread_local_context = enable_thread_local_context,
+    };
+    const cimgui = addCimgui(b, "cimgui", target, optimize, cimgui_config);
+    b.installArtifact(cimgui);
+
+    const zig_imgui = b.addModule("Zig-ImGui", .{
+        .root_source_file = b.path("src/generated/imgui.zig"),
+        .target = target,
+        .optimize = optimize,
+    });
+    zig_imgui.linkLibrary(cimgui);
+
+    const zig_imgui_extras = b.addModule("Zig-ImGui-extras", .{
+        .root_source_file = b.path("src/extras/extras.zig"),
+        .target = target,
+        .optimize = optimize,
+    });
+    zig_imgui_extras.addImport("Zig-ImGui", zig_imgui);
+    {
+        const opts = bindingsOptions(b, enable_thread_local_context, enable_instrumentation, instrumentation_timing);
+        zig_imgui.addOptions("build_options", opts);
+        zig_imgui_extras.addOptions("build_options", opts);
+    }
+
+    const test_exe = b.addTest(.{
+        .root_source_file = b.path("src/tests.zig"),
+        .target = target,
+        .optimize = optimize,
+    });
+    test_exe.root_module.addImport("Zig-ImGui", zig_imgui);
+    test_exe.root_module.addImport("Zig-ImGui-extras", zig_imgui_extras);
+
+    const test_step = b.step("test", "Run zig-imgui tests");
+    const test_run = b.addRunArtifact(test_exe);
+    test_step.dependOn(&test_run.step);
+
+    // Tests that are skipped unless the bindings are built with a particular
+    // option also run against a build with that option turned on.
+    if (!enable_thread_local_context) {
+        var thread_local_config = cimgui_config;
+        thread_local_config.enable_thread_local_context = true;
+        const thread_local_cimgui = addCimgui(b, "cimgui-thread-local", target, optimize, thread_local_config);
+        const opts = bindingsOptions(b, true, enable_instrumentation, instrumentation_timing);
+        test_step.dependOn(&addTestVariant(b, "thread-local", target, optimize, thread_local_cimgui, opts).step);
+    }
+    if (!enable_instrumentation) {
+        const opts = bindingsOptions(b, enable_thread_local_context, true, true);
+        test_step.dependOn(&addTestVariant(b, "instrumented", target, optimize, cimgui, opts).step);
+    }
+
+    const bench_baseline = b.option([]const u8, "bench_baseline",
+        "Results of an earlier bench-compile run to compare against, written if missing. Default=zig-out/compile-bench-baseline.json"
+    ) orelse b.getInstallPath(.prefix, "compile-bench-baseline.json");
+
+    const bench_update_baseline = b.option(bool, "bench_update_baseline",
+        "Overwrite the bench-compile baseline with the new results instead of comparing against it."
+    ) orelse false;
+
+    const bench_tolerance = b.option(f64, "bench_tolerance",
+        "Percentage by which bench-compile results may exceed the baseline before failing. Default=10"
+    ) orelse 10;
+
+    const bench_bindings = b.option([]const []const u8, "bench_bindings",
+        "Other bindings to compare in bench-compile, as name=path/to/imgui.zig, for example generator output with different options."
+    ) orelse &.{};
+
+    const bench_exe = b.addExecutable(.{
+        .name = "compile_bench",
+        .root_source_file = b.path("src/bench/compile_bench.zig"),
+        .target = b.host,
+        .optimize = .ReleaseSafe,
+    });
+    const bench_run = b.addRunArtifact(bench_exe);
+    bench_run.has_side_effects = true;
+    bench_run.addArgs(&.{ "--zig", b.graph.zig_exe, "--baseline", bench_baseline });
+    bench_run.addArgs(&.{ "--tolerance", b.fmt("{d}", .{ bench_tolerance }) });
+    if (bench_update_baseline) bench_run.addArg("--update-baseline");
+    bench_run.addArg("--work-dir");
+    _ = bench_run.addOutputDirectoryArg("compile-bench");
+
+    for ([_][]const u8{ "minimal", "typical", "everything" }) |program| {
+        bench_run.addArgs(&.{ "--program", program });
+        bench_run.addFileArg(b.path(b.fmt("src/bench/{s}.zig", .{ program })));
+    }
+
+    // The checked in bindings, with and without instrumentation, followed by
+    // any other generator output passed with -Dbench_bindings.
+    const default_bench_options = bindingsOptions(b, enable_thread_local_context, false, false);
+    const instrumented_bench_options = bindingsOptions(b, enable_thread_local_context, true, true);
+    bench_run.addArgs(&.{ "--variant", "default" });
+    bench_run.addFileArg(b.path("src/generated/imgui.zig"));
+    bench_run.addFileArg(default_bench_options.getOutput());
+    bench_run.addArgs(&.{ "--variant", "instrumented" });
+    bench_run.addFileArg(b.path("src/generated/imgui.zig"));
+    bench_run.addFileArg(instrumented_bench_options.getOutput());
+    for (bench_bindings) |spec| {
+        const separator = std.mem.indexOfScalar(u8, spec, '=') orelse return error.InvalidBenchBindings;
+        bench_run.addArgs(&.{ "--variant", spec[0..separator] });
+        bench_run.addFileArg(.{ .cwd_relative = spec[separator + 1 ..] });
+        bench_run.addFileArg(default_bench_options.getOutput());
+    }
+
+    const bench_step = b.step(
+        "bench-compile",
+        "Measure compile time and peak memory of programs using the bindings, and fail on regressions.",
+    );
+    bench_step.dependOn(&bench_run.step);
+}
+
+/// Run the tests against private copies of the bindings and extras modules,
+/// built with `opts` and linked against `cimgui`.
+fn addTestVariant(
+    b: *std.Build,
+    name: []const u8,
+    target: std.Build.ResolvedTarget,
+    optimize: std.builtin.OptimizeMode,
+    cimgui: *std.Build.Step.Compile,
+    opts: *std.Build.Step.Options,
+) *std.Build.Step.Run {
+    const bindings = b.createModule(.{
+        .root_source_file = b.path("src/generated/imgui.zig"),
+        .target = target,
+        .optimize = optimize,
+    });
+    bindings.linkLibrary(cimgui);
+    bindings.addOptions("build_options", opts);
+
+    const extras = b.createModule(.{
+        .root_source_file = b.path("src/extras/extras.zig"),
+        .target = target,
+        .optimize = optimize,
+    });
+    extras.addImport("Zig-ImGui", bindings);
+    extras.addOptions("build_options", opts);
+
+    const test_exe = b.addTest(.{
+        .name = b.fmt("test-{s}", .{ name }),
+        .root_source_file = b.path("src/tests.zig"),
+        .target = target,
+        .optimize = optimize,
+    });
+    test_exe.root_module.addImport("Zig-ImGui", bindings);
+    test_exe.root_module.addImport("Zig-ImGui-extras", extras);
+    return b.addRunArtifact(test_exe);
+}
+
+/// Options the bindings read through @import("build_options").
+fn bindingsOptions(
+    b: *std.Build,
+    enable_thread_local_context: bool,
+    enable_instrumentation: bool,
+    instrumentation_timing: bool,
+) *std.Build.Step.Options {
+    const opts = b.addOptions();
+    opts.addOption(bool, "enable_thread_local_context", enable_thread_local_context);
+    opts.addOption(bool, "enable_instrumentation", enable_instrumentation);
+    opts.addOption(bool, "instrumentation_timing", instrumentation_timing);
+    return opts;
+}
+
+const CimguiConfig = struct {
+    imgui_dep: *std.Build.Dependency,
+    freetype_dep: ?*std.Build.Dependency,
+    lunasvg_dep: ?*std.Build.Dependency,
+    enable_freetype: bool,
+    enable_lunasvg: bool,
+    enable_thread_local_context: bool,
+};
+
+/// The Dear ImGui sources and the generated C bindings, as a static library.
+fn addCimgui(
+    b: *std.Build,
+    name: []const u8,
+    target: std.Build.ResolvedTarget,
+    optimize: std.builtin.OptimizeMode,
+    config: CimguiConfig,
+) *std.Build.Step.Compile {
     const cimgui = b.addStaticLibrary(.{
-        .name = "cimgui",
+        .name = name,
         .target = target,
         .optimize = optimize,
     });
     cimgui.root_module.link_libcpp = true;
 
-    if (enable_freetype) {
+    if (config.enable_freetype) {
         cimgui.root_module.addCMacro("IMGUI_ENABLE_FREETYPE", "1");
         cimgui.root_module.addCMacro("CIMGUI_FREETYPE", "1");
-        if (freetype_dep) |dep| {
+        if (config.freetype_dep) |dep| {
             cimgui.linkLibrary(dep.artifact("freetype"));
         }
     }
 
+    if (config.enable_thread_local_context) {
+        // Dear ImGui only ever accesses the current context via GImGui, which
+        // the user config header redefines as a thread_local variable.
+        // Backends only use the public API, so they don't need this define.
+        cimgui.root_module.addCMacro("IMGUI_USER_CONFIG", "\"zig_imgui_thread_local_context.h\"");
+        cimgui.addIncludePath(b.path("src/vendor/"));
+        cimgui.addCSourceFile(.{
+            .file = b.path("src/vendor/zig_imgui_thread_local_context.cpp"),
+            .flags = IMGUI_C_FLAGS,
+        });
+    }
+
     const imgui_sources: []const std.Build.LazyPath = &.{
         b.path("src/generated/cimgui.cpp"),
-        imgui_dep.path("imgui.cpp"),
-        imgui_dep.path("imgui_demo.cpp"),
-        imgui_dep.path("imgui_draw.cpp"),
-        imgui_dep.path("imgui_tables.cpp"),
-        imgui_dep.path("imgui_widgets.cpp"),
+        config.imgui_dep.path("imgui.cpp"),
+        config.imgui_dep.path("imgui_demo.cpp"),
+        config.imgui_dep.path("imgui_draw.cpp"),
+        config.imgui_dep.path("imgui_tables.cpp"),
+        config.imgui_dep.path("imgui_widgets.cpp"),
     };
 
     for (IMGUI_C_DEFINES) |c_define| {
         cimgui.root_module.addCMacro(c_define[0], c_define[1]);
     }
     cimgui.addIncludePath(b.path("src/generated/"));
-    cimgui.addIncludePath(imgui_dep.path("."));
+    cimgui.addIncludePath(config.imgui_dep.path("."));
     for (imgui_sources) |file| {
         cimgui.addCSourceFile(.{
             .file = file,
             .flags = IMGUI_C_FLAGS,
         });
     }
+    // Internals used by MemoryTrimmer in the extras module.
+    cimgui.addCSourceFile(.{
+        .file = b.path("src/vendor/zig_imgui_memory_trimmer.cpp"),
+        .flags = IMGUI_C_FLAGS,
+    });
 
-    if (enable_freetype) {
-        if (enable_lunasvg) {
-            if (lunasvg_dep) |dep| {
+    if (config.enable_freetype) {
+        if (config.enable_lunasvg) {
+            if (config.lunasvg_dep) |dep| {
                 cimgui.root_module.addCMacro("IMGUI_ENABLE_FREETYPE_LUNASVG", "1");
 
                 cimgui.addIncludePath(dep.path("3rdparty/plutovg/"));
@@ -145,28 +357,11 @@ pub fn build(b: *std.Build) !void {
             }
         }
 
-        cimgui.addIncludePath(imgui_dep.path("misc/freetype"));
+        cimgui.addIncludePath(config.imgui_dep.path("misc/freetype"));
         cimgui.addCSourceFile(.{
             .file = b.path("src/vendor/imgui_freetype.cpp"),
             .flags = IMGUI_C_FLAGS,
         });
     }
-    b.installArtifact(cimgui);
-
-    const zig_imgui = b.addModule("Zig-ImGui", .{
-        .root_source_file = b.path("src/generated/imgui.zig"),
-        .target = target,
-        .optimize = optimize,
-    });
-    zig_imgui.linkLibrary(cimgui);
-
-    const test_exe = b.addTest(.{
-        .root_source_file = b.path("src/tests.zig"),
-        .target = target,
-        .optimize = optimize,
-    });
-    test_exe.root_module.addImport("Zig-ImGui", zig_imgui);
-
-    const test_step = b.step("test", "Run zig-imgui tests");
-    test_step.dependOn(&test_exe.step);
+    return cimgui;
 }
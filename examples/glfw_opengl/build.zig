@@ -181,6 +181,13 @@ pub fn build(b: *std.Build) !void {
         "unsupported, but still accepted by this argument for completeness.",
     );
 
+    const remote_loopback = b.option(
+        bool,
+        "remote_loopback",
+        "Render every frame after a round trip through the DrawData wire " ++
+        "format, as a remote viewer would receive it.",
+    ) orelse false;
+
     const selected_opengl_version =
         if (force_opengl_version) |forced|
             zgl.OpenGlVersionLookupTable.get(forced)
@@ -243,6 +250,7 @@ pub fn build(b: *std.Build) !void {
         .{ .name = "mach-glfw", .module = mach_glfw_dep.module("mach-glfw") },
         .{ .name = "zgl", .module = zgl_dep.module("zgl") },
         .{ .name = "Zig-ImGui", .module = ZigImGui_dep.module("Zig-ImGui") },
+        .{ .name = "Zig-ImGui-extras", .module = ZigImGui_dep.module("Zig-ImGui-extras") },
     };
 
     const exe = b.addExecutable(.{
@@ -260,6 +268,7 @@ pub fn build(b: *std.Build) !void {
         opts.addOption(u32, "OPENGL_MAJOR_VERSION", selected_opengl_version.major);
         opts.addOption(u32, "OPENGL_MINOR_VERSION", selected_opengl_version.minor);
         opts.addOption(bool, "OPENGL_ES_PROFILE", selected_opengl_version.es);
+        opts.addOption(bool, "REMOTE_LOOPBACK", remote_loopback);
         exe.root_module.addImport("build_options", opts.createModule());
     }
 
@@ -9,6 +9,7 @@ const glfw = @import("mach-glfw");
 const zgl_helpers = @import("zgl");
 const zgl = zgl_helpers.binding;
 const zimgui = @import("Zig-ImGui");
+const zimgui_extras = @import("Zig-ImGui-extras");
 
 
 /// Default GLFW error handling callback
@@ -106,10 +107,30 @@ pub fn main() !u8 {
 
     const clear_color = zimgui.Vec4.init(1.0, 0.0, 1.0, 1.0);
 
+    // With -Dremote_loopback=true, frames are encoded to the DrawData wire
+    // format and decoded again before rendering, like a remote viewer would
+    var gpa = std.heap.GeneralPurposeAllocator(.{}){};
+    defer _ = gpa.deinit();
+    var loopback_buffer = std.ArrayList(u8).init(gpa.allocator());
+    defer loopback_buffer.deinit();
+    var loopback_encoder = zimgui_extras.DrawDataEncoder.init(gpa.allocator());
+    defer loopback_encoder.deinit();
+    var loopback_decoder = zimgui_extras.DrawDataDecoder.init(gpa.allocator());
+    defer loopback_decoder.deinit();
+
+    // Only build frames when there may be something new to show, and only
+    // submit the ones that differ from what is already on screen
+    var scheduler = zimgui_extras.FrameScheduler.init(.{});
+
     // Main loop
     while (!window.shouldClose()) {
-        // Poll and handle events (inputs, window resize, etc.)
-        glfw.pollEvents();
+        // Poll and handle events (inputs, window resize, etc.), or wait for
+        // them when nothing on screen is changing
+        switch (scheduler.nextWait()) {
+            .poll => glfw.pollEvents(),
+            .timeout => |seconds| glfw.waitEventsTimeout(seconds),
+            .block => glfw.waitEvents(),
+        }
 
         // Start the Dear ImGui frame
         imgui_ogl.ImGui_ImplOpenGL3_NewFrame();
@@ -143,6 +164,13 @@ pub fn main() !u8 {
 
         // Rendering
         zimgui.Render();
+        if (!scheduler.endFrame(zimgui.GetDrawData())) continue;
+        const draw_data = if (build_options.REMOTE_LOOPBACK) blk: {
+            loopback_buffer.clearRetainingCapacity();
+            _ = try loopback_encoder.writeFrame(loopback_buffer.writer(), zimgui.GetDrawData());
+            var stream = std.io.fixedBufferStream(loopback_buffer.items);
+            break :blk try loopback_decoder.readFrame(stream.reader());
+        } else zimgui.GetDrawData();
         const fb_size = window.getFramebufferSize();
         zgl.viewport(0, 0, @intCast(fb_size.width), @intCast(fb_size.height));
         zgl.clearColor(
@@ -152,7 +180,7 @@ pub fn main() !u8 {
             clear_color.w,
         );
         zgl.clear(zgl.COLOR_BUFFER_BIT);
-        imgui_ogl.ImGui_ImplOpenGL3_RenderDrawData(zimgui.GetDrawData());
+        imgui_ogl.ImGui_ImplOpenGL3_RenderDrawData(draw_data);
 
         window.swapBuffers();
     }
@@ -242,6 +242,15 @@ pub fn build(b: *std.Build) !void {
         }
     }
 
+    const ring_renderer = b.option(
+        bool,
+        "ring_renderer",
+        "Render with the zig renderer in src/ring_renderer.zig, which " ++
+        "streams geometry through persistently mapped buffers, instead of " ++
+        "ImGui_ImplVulkan_RenderDrawData. Default=true",
+    )
+        orelse true;
+
     const use_system_vk_xml = b.option(
         bool,
         "use_system_vk_xml",
@@ -326,6 +335,7 @@ pub fn build(b: *std.Build) !void {
             },
         },
         .{ .name = "Zig-ImGui", .module = ZigImGui_dep.module("Zig-ImGui") },
+        .{ .name = "Zig-ImGui-extras", .module = ZigImGui_dep.module("Zig-ImGui-extras") },
     };
 
     const exe = b.addExecutable(.{
@@ -417,10 +427,12 @@ pub fn build(b: *std.Build) !void {
         const opts = b.addOptions();
         opts.addOption(VulkanDriverMode, "MOLTENVK_DRIVER_MODE", moltenvk_mode);
         opts.addOption(VulkanDriverMode, "SWIFTSHADER_DRIVER_MODE", swiftshader_mode);
+        opts.addOption(bool, "RING_RENDERER", ring_renderer);
         exe.root_module.addImport("build_options", opts.createModule());
     }
 
-    // add shader compilation to demo how it can be done in a build script
+    // add shader compilation to demo how it can be done in a build script,
+    // the shaders are used by src/ring_renderer.zig
     const compile_frag_step = try get_shader_compiler(b, true);
     switch (compile_frag_step.compiler_kind) {
         .glslang => compile_frag_step.run_step.addArg("-V"),
@@ -3,6 +3,8 @@ const std = @import("std");
 
 const imgui_glfw = @import("imgui_glfw.zig");
 const imgui_vk = @import("imgui_vk.zig");
+const pipeline_cache = @import("pipeline_cache.zig");
+const ring_renderer = @import("ring_renderer.zig");
 const static_vulkan = @import("static_vulkan.zig");
 const vk_dispatch = @import("vk_dispatch.zig");
 
@@ -10,6 +12,7 @@ const build_options = @import("build_options");
 const glfw = @import("mach-glfw");
 const vk = @import("vk");
 const zimgui = @import("Zig-ImGui");
+const zimgui_extras = @import("Zig-ImGui-extras");
 
 
 const SwapchainState = enum {
@@ -516,6 +519,7 @@ fn frame_render(
     draw_data: *const zimgui.DrawData,
     device: vk.Device,
     queue: vk.Queue,
+    renderer: ?*ring_renderer.RingRenderer,
 ) !SwapchainState {
     const image_acquired_semaphore = wd.frames_semaphores.?[wd.semaphore_index].image_acquired_semaphore;
     const render_complete_semaphore = wd.frames_semaphores.?[wd.semaphore_index].render_complete_semaphore;
@@ -531,6 +535,7 @@ fn frame_render(
             else => return err,
         };
     if (out.result == .suboptimal_khr) return .rebuild_swapchain;
+    wd.frame_index = out.image_index;
 
     const frame_data = wd.frames.?[wd.frame_index];
     // wait indefinitely instead of periodically checking
@@ -563,7 +568,11 @@ fn frame_render(
     vk_dispatch.device_wrapper.cmdBeginRenderPass(frame_data.command_buffer, &render_pass_begin_info, .@"inline");
 
     // Record Dear Imgui primitives into command buffer
-    imgui_vk.ImGui_ImplVulkan_RenderDrawData(draw_data, frame_data.command_buffer, .null_handle);
+    if (renderer) |r| {
+        try r.render(draw_data, frame_data.command_buffer, wd.frame_index, wd.image_count);
+    } else {
+        imgui_vk.ImGui_ImplVulkan_RenderDrawData(draw_data, frame_data.command_buffer, .null_handle);
+    }
 
     // Submit command buffer
     vk_dispatch.device_wrapper.cmdEndRenderPass(frame_data.command_buffer);
@@ -608,48 +617,6 @@ fn frame_present(wd: *imgui_vk.ImGui_ImplVulkanH_Window, queue: vk.Queue) !Swapc
     return .reuse_swapchain;
 }
 
-/// ImGui's helper functions load pre-compiled SPIR-V shaders for you, so this
-/// is completely unnecessary. This is only to demo how to include shaders
-/// easily in a zig project.
-fn load_dummy_shaders(device: vk.Device) !void {
-    // Shader modules are loaded from u32 arrays, and `@alignOf(u32) == 4`.
-    // Unfortunately, @embedFile is an `[] align (1) const u8`, and compounding
-    // problems, @alignCast cannot increase the pointer alignment of a type to
-    // fix this. However, @alignCast does assert that it was able to do the
-    // conversion because it was already aligned correctly. By making this a
-    // comptime block, we are able to take advantage of this and verify at
-    // compile time that the embedded shader is able to be coerced safely into
-    // an `[] align (4) const u8`. Then, we can safely use
-    // `std.mem.bytesAsSlice()` to cast these well aligned bytes into a
-    // `[] align (4) const u32`, aka a `[]const u32` for short.
-    const frag_src: []const u32 = comptime blk: {
-        const raw: []const u8 = @embedFile("imgui.frag.spv");
-        const aligned: [] align(@alignOf(u32)) const u8 = @alignCast(raw);
-        break :blk std.mem.bytesAsSlice(u32, aligned[0..]);
-    };
-    const frag_module = try vk_dispatch.device_wrapper.createShaderModule(
-        device,
-        &.{ .code_size = frag_src.len * @sizeOf(u32), .p_code = frag_src.ptr },
-        null,
-    );
-
-    // same trick as above
-    const vert_src: []const u32 = comptime blk: {
-        const raw: []const u8 = @embedFile("imgui.vert.spv");
-        const aligned: [] align(@alignOf(u32)) const u8 = @alignCast(raw);
-        break :blk std.mem.bytesAsSlice(u32, aligned[0..]);
-    };
-    const vert_module = try vk_dispatch.device_wrapper.createShaderModule(
-        device,
-        &.{ .code_size = vert_src.len * @sizeOf(u32), .p_code = vert_src.ptr },
-        null,
-    );
-
-    // just immediately delete after verifying that we *can* load these modules
-    vk_dispatch.device_wrapper.destroyShaderModule(device, vert_module, null);
-    vk_dispatch.device_wrapper.destroyShaderModule(device, frag_module, null);
-}
-
 // Main code
 pub fn main() !u8 {
     glfw.setErrorCallback(glfw_error_callback);
@@ -704,6 +671,15 @@ pub fn main() !u8 {
     init_info.image_count = wd.image_count;
     init_info.render_pass = wd.render_pass;
 
+    // Pipelines created at startup are compiled much faster when the driver
+    // can reuse its work from the previous run
+    var persistent_pipeline_cache = try pipeline_cache.PersistentPipelineCache.init(
+        gpa.allocator(),
+        init_info.physical_device,
+        init_info.device,
+    );
+    init_info.pipeline_cache = persistent_pipeline_cache.handle;
+
     // Setup Dear ImGui context
     const im_context = zimgui.CreateContext();
     defer zimgui.DestroyContext();
@@ -726,15 +702,32 @@ pub fn main() !u8 {
 
     // INSERT LOAD FONTS HERE
 
-    try load_dummy_shaders(init_info.device);
+    // Either stream geometry through persistently mapped buffers from zig, or
+    // let the backend manage its own per-frame buffers. The pipeline stays
+    // compatible with the render pass recreated on swapchain rebuilds, since
+    // its format never changes.
+    var renderer: ?ring_renderer.RingRenderer =
+        if (build_options.RING_RENDERER)
+            try ring_renderer.RingRenderer.init(init_info, wd.render_pass, persistent_pipeline_cache.handle)
+        else
+            null;
 
     // Our state
     var rebuild_swapchain = false;
 
+    // Only build frames when there may be something new to show, and only
+    // submit the ones that differ from what is already on screen
+    var scheduler = zimgui_extras.FrameScheduler.init(.{});
+
     // Main loop
     while (!window.shouldClose()) {
-        // Poll and handle events (inputs, window resize, etc.)
-        glfw.pollEvents();
+        // Poll and handle events (inputs, window resize, etc.), or wait for
+        // them when nothing on screen is changing
+        switch (scheduler.nextWait()) {
+            .poll => glfw.pollEvents(),
+            .timeout => |seconds| glfw.waitEventsTimeout(seconds),
+            .block => glfw.waitEvents(),
+        }
 
         // Rebuild swap chain?
         if (rebuild_swapchain) {
@@ -793,7 +786,7 @@ pub fn main() !u8 {
         zimgui.Render();
         const draw_data = zimgui.GetDrawData();
         const is_minimized = (draw_data.DisplaySize.x <= 0.0) and (draw_data.DisplaySize.y <= 0.0);
-        if (!is_minimized) {
+        if (scheduler.endFrame(draw_data) and !is_minimized) {
             wd.clear_value.color.float_32 = .{
                 CLEAR_COLOR.x * CLEAR_COLOR.w,
                 CLEAR_COLOR.y * CLEAR_COLOR.w,
@@ -801,21 +794,29 @@ pub fn main() !u8 {
                 CLEAR_COLOR.w,
             };
 
-            if (try frame_render(&wd, draw_data, init_info.device, init_info.queue) == .reuse_swapchain) {
+            const maybe_renderer = if (renderer) |*r| r else null;
+            if (try frame_render(&wd, draw_data, init_info.device, init_info.queue, maybe_renderer) == .reuse_swapchain) {
                 if (try frame_present(&wd, init_info.queue) == .reuse_swapchain) {
                     continue;
                 }
             }
 
+            // The new swapchain images need to be drawn again
             rebuild_swapchain = true;
+            scheduler.invalidate();
+            scheduler.keepAwake();
         }
     }
 
     // Cleanup
     try vk_dispatch.device_wrapper.deviceWaitIdle(init_info.device);
+    if (renderer) |*r| r.deinit();
     imgui_vk.ImGui_ImplVulkan_Shutdown();
     imgui_glfw.ImGui_ImplGlfw_Shutdown();
 
+    // Every pipeline created through the cache is gone now
+    persistent_pipeline_cache.deinit(gpa.allocator(), init_info.device);
+
     cleanup_vulkan_window(init_info.instance, init_info.device, &wd);
     cleanup_vulkan(init_info);
 
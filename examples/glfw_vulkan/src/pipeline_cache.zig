@@ -0,0 +1,121 @@
+//! A vk.PipelineCache that is loaded from and saved to disk, so that the
+//! pipelines created at startup (Dear ImGui's own and the ones from
+//! ring_renderer.zig) can skip shader compilation on later runs.
+//!
+//! A missing, unreadable or foreign cache file is never an error, the cache
+//! then simply starts out empty. The file is only replaced once a complete new
+//! one has been written, so a crash while saving never leaves a truncated
+//! cache behind.
+
+const std = @import("std");
+
+const vk = @import("vk");
+const vk_dispatch = @import("vk_dispatch.zig");
+
+const APP_NAME = "Zig-ImGui-glfw-vulkan";
+const FILE_NAME = "pipeline_cache.bin";
+
+/// Size of VkPipelineCacheHeaderVersionOne
+const HEADER_SIZE = 16 + vk.UUID_SIZE;
+
+pub const PersistentPipelineCache = struct {
+    handle: vk.PipelineCache,
+    /// Where the cache file lives, null if no such directory could be
+    /// opened, in which case the cache is only kept in memory.
+    dir: ?std.fs.Dir,
+
+    /// Load the cache file from the application data directory, if there is
+    /// one that was written by the same driver and device.
+    pub fn init(
+        allocator: std.mem.Allocator,
+        physical_device: vk.PhysicalDevice,
+        device: vk.Device,
+    ) !PersistentPipelineCache {
+        var dir: ?std.fs.Dir = open_cache_dir(allocator) catch |err| blk: {
+            std.log.warn("Pipeline cache: no cache directory ({s}), not persisting", .{ @errorName(err) });
+            break :blk null;
+        };
+        errdefer if (dir) |*d| d.close();
+
+        const initial_data: []const u8 = if (dir) |d| blk: {
+            const data = d.readFileAlloc(allocator, FILE_NAME, 256 * 1024 * 1024) catch |err| {
+                if (err != error.FileNotFound) {
+                    std.log.warn("Pipeline cache: failed to read {s}: {s}", .{ FILE_NAME, @errorName(err) });
+                }
+                break :blk &.{};
+            };
+            const properties = vk_dispatch.instance_wrapper.getPhysicalDeviceProperties(physical_device);
+            if (!is_compatible(data, properties)) {
+                std.log.info("Pipeline cache: ignoring {s} written by another driver or device", .{ FILE_NAME });
+                allocator.free(data);
+                break :blk &.{};
+            }
+            break :blk data;
+        } else &.{};
+        defer allocator.free(initial_data);
+
+        const handle = try vk_dispatch.device_wrapper.createPipelineCache(device, &.{
+            .initial_data_size = initial_data.len,
+            .p_initial_data = initial_data.ptr,
+        }, null);
+        std.log.info("Pipeline cache: loaded {d} bytes", .{ initial_data.len });
+
+        return .{ .handle = handle, .dir = dir };
+    }
+
+    /// Save the cache, then destroy it. Must be called after every pipeline
+    /// created with the cache was, since the driver may still add to it
+    /// until then.
+    pub fn deinit(self: *PersistentPipelineCache, allocator: std.mem.Allocator, device: vk.Device) void {
+        if (self.dir) |*dir| {
+            self.save(allocator, device, dir.*) catch |err| {
+                std.log.warn("Pipeline cache: failed to save {s}: {s}", .{ FILE_NAME, @errorName(err) });
+            };
+            dir.close();
+        }
+        vk_dispatch.device_wrapper.destroyPipelineCache(device, self.handle, null);
+        self.* = undefined;
+    }
+
+    fn save(self: *const PersistentPipelineCache, allocator: std.mem.Allocator, device: vk.Device, dir: std.fs.Dir) !void {
+        var size: usize = 0;
+        _ = try vk_dispatch.device_wrapper.getPipelineCacheData(device, self.handle, &size, null);
+        const data = try allocator.alloc(u8, size);
+        defer allocator.free(data);
+        // `size` may only shrink between the two calls, and the second call
+        // updates it to the number of bytes actually written.
+        _ = try vk_dispatch.device_wrapper.getPipelineCacheData(device, self.handle, &size, data.ptr);
+
+        var atomic_file = try dir.atomicFile(FILE_NAME, .{});
+        defer atomic_file.deinit();
+        try atomic_file.file.writeAll(data[0..size]);
+        try atomic_file.finish();
+        std.log.info("Pipeline cache: saved {d} bytes", .{ size });
+    }
+};
+
+fn open_cache_dir(allocator: std.mem.Allocator) !std.fs.Dir {
+    const path = try std.fs.getAppDataDir(allocator, APP_NAME);
+    defer allocator.free(path);
+    return std.fs.cwd().makeOpenPath(path, .{});
+}
+
+/// Checks the header the driver puts at the start of every cache blob. The
+/// spec requires drivers to reject incompatible data themselves, but not all
+/// of them do so gracefully.
+fn is_compatible(data: []const u8, properties: vk.PhysicalDeviceProperties) bool {
+    if (data.len < HEADER_SIZE) return false;
+    // Unlike the rest of the API, these fields are always little endian.
+    const header_size = std.mem.readInt(u32, data[0..4], .little);
+    const header_version = std.mem.readInt(u32, data[4..8], .little);
+    const vendor_id = std.mem.readInt(u32, data[8..12], .little);
+    const device_id = std.mem.readInt(u32, data[12..16], .little);
+    const uuid = data[16..HEADER_SIZE];
+
+    return header_size >= HEADER_SIZE and
+        header_size <= data.len and
+        header_version == 1 and // VK_PIPELINE_CACHE_HEADER_VERSION_ONE
+        vendor_id == properties.vendor_id and
+        device_id == properties.device_id and
+        std.mem.eql(u8, uuid, &properties.pipeline_cache_uuid);
+}
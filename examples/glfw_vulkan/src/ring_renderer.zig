@@ -0,0 +1,506 @@
+//! Renders Dear ImGui draw data into the command buffers of an
+//! ImGui_ImplVulkanH_Window, like ImGui_ImplVulkan_RenderDrawData does, but
+//! streams the geometry through one persistently mapped buffer instead of
+//! per-frame vertex and index buffers that are resized, mapped and unmapped
+//! every frame.
+//!
+//! The buffer is split into one region per frame in flight. The region of a
+//! frame is only written after frame_render waited on that frame's fence, so
+//! the CPU never overwrites geometry the GPU may still be reading, without
+//! any extra synchronisation. The buffer only has to be reallocated when a
+//! frame needs more space than a region has, or the number of frames in
+//! flight changes.
+//!
+//! Textures are the descriptor sets the stock backend uses as TextureIDs (the
+//! font atlas, and anything added with ImGui_ImplVulkan_AddTexture), so the
+//! backend is still needed to upload fonts.
+
+const std = @import("std");
+
+const imgui_vk = @import("imgui_vk.zig");
+const vk_dispatch = @import("vk_dispatch.zig");
+
+const vk = @import("vk");
+const zimgui = @import("Zig-ImGui");
+
+/// Value of ImDrawCallback_ResetRenderState in imgui.h
+const RESET_RENDER_STATE_CALLBACK: usize = @bitCast(@as(isize, -8));
+
+/// Regions are never smaller than this, so that small frames do not cause a
+/// reallocation each time the UI grows a little.
+const MIN_REGION_SIZE: vk.DeviceSize = 256 * 1024;
+
+/// Keeps the start of every region aligned for any vertex or index offset.
+const REGION_ALIGNMENT: vk.DeviceSize = 256;
+
+pub const RingRenderer = struct {
+    device: vk.Device,
+    memory_properties: vk.PhysicalDeviceMemoryProperties,
+    descriptor_set_layout: vk.DescriptorSetLayout,
+    pipeline_layout: vk.PipelineLayout,
+    pipeline: vk.Pipeline,
+
+    buffer: vk.Buffer = .null_handle,
+    memory: vk.DeviceMemory = .null_handle,
+    /// The whole buffer, mapped for as long as it exists
+    mapped: [*]u8 = undefined,
+    region_size: vk.DeviceSize = 0,
+    region_count: u32 = 0,
+    stats: Stats = .{},
+
+    pub const Stats = struct {
+        frames: u64 = 0,
+        bytes_uploaded: u64 = 0,
+        reallocations: u64 = 0,
+    };
+
+    /// Creates a pipeline compatible with `render_pass`, through
+    /// `pipeline_cache`. No geometry buffer is allocated until the first
+    /// frame is rendered.
+    pub fn init(
+        init_info: imgui_vk.ImGui_ImplVulkan_InitInfo,
+        render_pass: vk.RenderPass,
+        pipeline_cache: vk.PipelineCache,
+    ) !RingRenderer {
+        const device = init_info.device;
+
+        // Must be identical to the layout the stock backend allocates texture
+        // descriptor sets with, so that those sets can be bound here.
+        const descriptor_set_layout = try vk_dispatch.device_wrapper.createDescriptorSetLayout(device, &.{
+            .binding_count = 1,
+            .p_bindings = &@as([1]vk.DescriptorSetLayoutBinding, .{
+                .{
+                    .binding = 0,
+                    .descriptor_type = .combined_image_sampler,
+                    .descriptor_count = 1,
+                    .stage_flags = .{ .fragment_bit = true },
+                },
+            }),
+        }, null);
+        errdefer vk_dispatch.device_wrapper.destroyDescriptorSetLayout(device, descriptor_set_layout, null);
+
+        // Scale and translation, see imgui.vert.glsl
+        const pipeline_layout = try vk_dispatch.device_wrapper.createPipelineLayout(device, &.{
+            .set_layout_count = 1,
+            .p_set_layouts = &@as([1]vk.DescriptorSetLayout, .{ descriptor_set_layout }),
+            .push_constant_range_count = 1,
+            .p_push_constant_ranges = &@as([1]vk.PushConstantRange, .{
+                .{ .stage_flags = .{ .vertex_bit = true }, .offset = 0, .size = 4 * @sizeOf(f32) },
+            }),
+        }, null);
+        errdefer vk_dispatch.device_wrapper.destroyPipelineLayout(device, pipeline_layout, null);
+
+        const pipeline = try create_pipeline(
+            device,
+            pipeline_layout,
+            render_pass,
+            init_info.subpass,
+            init_info.msaa_samples,
+            pipeline_cache,
+        );
+
+        return .{
+            .device = device,
+            .memory_properties = vk_dispatch.instance_wrapper.getPhysicalDeviceMemoryProperties(init_info.physical_device),
+            .descriptor_set_layout = descriptor_set_layout,
+            .pipeline_layout = pipeline_layout,
+            .pipeline = pipeline,
+        };
+    }
+
+    /// The device must be idle.
+    pub fn deinit(self: *RingRenderer) void {
+        self.free_buffer();
+        vk_dispatch.device_wrapper.destroyPipeline(self.device, self.pipeline, null);
+        vk_dispatch.device_wrapper.destroyPipelineLayout(self.device, self.pipeline_layout, null);
+        vk_dispatch.device_wrapper.destroyDescriptorSetLayout(self.device, self.descriptor_set_layout, null);
+        self.* = undefined;
+    }
+
+    /// Upload `draw_data` into the region of `frame_index` and record the
+    /// draw calls into `command_buffer`, inside an active render pass.
+    /// `frame_index` must be one whose previous submission has completed.
+    pub fn render(
+        self: *RingRenderer,
+        draw_data: *const zimgui.DrawData,
+        command_buffer: vk.CommandBuffer,
+        frame_index: u32,
+        frame_count: u32,
+    ) !void {
+        const fb_width = draw_data.DisplaySize.x * draw_data.FramebufferScale.x;
+        const fb_height = draw_data.DisplaySize.y * draw_data.FramebufferScale.y;
+        if (fb_width <= 0 or fb_height <= 0) return;
+
+        const vertex_bytes = @as(usize, @intCast(draw_data.TotalVtxCount)) * @sizeOf(zimgui.DrawVert);
+        const index_bytes = @as(usize, @intCast(draw_data.TotalIdxCount)) * @sizeOf(zimgui.DrawIdx);
+        const index_start = std.mem.alignForward(usize, vertex_bytes, @sizeOf(u32));
+        const needed = index_start + index_bytes;
+        if (needed > self.region_size or frame_count != self.region_count) {
+            try self.reallocate(frame_count, needed);
+        }
+
+        // Copy every list's geometry into this frame's region
+        const region_start: usize = @intCast(self.region_size * frame_index);
+        const vertex_offset = region_start;
+        const index_offset = region_start + index_start;
+        if (needed > 0) {
+            const vertices: []zimgui.DrawVert = @alignCast(std.mem.bytesAsSlice(
+                zimgui.DrawVert,
+                self.mapped[vertex_offset..][0..vertex_bytes],
+            ));
+            const indices: []zimgui.DrawIdx = @alignCast(std.mem.bytesAsSlice(
+                zimgui.DrawIdx,
+                self.mapped[index_offset..][0..index_bytes],
+            ));
+            var vtx_written: usize = 0;
+            var idx_written: usize = 0;
+            for (draw_data.CmdLists.items()) |maybe_list| {
+                const list = maybe_list orelse continue;
+                const list_vertices = list.VtxBuffer.items();
+                const list_indices = list.IdxBuffer.items();
+                @memcpy(vertices[vtx_written..][0..list_vertices.len], list_vertices);
+                @memcpy(indices[idx_written..][0..list_indices.len], list_indices);
+                vtx_written += list_vertices.len;
+                idx_written += list_indices.len;
+            }
+            // The memory is host coherent, so there is nothing to flush.
+        }
+        self.stats.frames += 1;
+        self.stats.bytes_uploaded += vertex_bytes + index_bytes;
+
+        self.setup_render_state(draw_data, command_buffer, vertex_offset, index_offset, fb_width, fb_height);
+
+        // Project scissor/clipping rectangles into framebuffer space
+        const clip_off = draw_data.DisplayPos;
+        const clip_scale = draw_data.FramebufferScale;
+
+        var global_vtx_offset: u32 = 0;
+        var global_idx_offset: u32 = 0;
+        for (draw_data.CmdLists.items()) |maybe_list| {
+            const list = maybe_list orelse continue;
+            for (list.CmdBuffer.items()) |*cmd| {
+                if (cmd.UserCallback) |callback| {
+                    if (@intFromPtr(callback) == RESET_RENDER_STATE_CALLBACK) {
+                        self.setup_render_state(draw_data, command_buffer, vertex_offset, index_offset, fb_width, fb_height);
+                    } else {
+                        const user_callback: *const fn (?*const zimgui.DrawList, ?*const zimgui.DrawCmd) callconv(.C) void =
+                            @ptrCast(callback);
+                        user_callback(list, cmd);
+                    }
+                    continue;
+                }
+
+                const clip_min_x = @max((cmd.ClipRect.x - clip_off.x) * clip_scale.x, 0);
+                const clip_min_y = @max((cmd.ClipRect.y - clip_off.y) * clip_scale.y, 0);
+                const clip_max_x = @min((cmd.ClipRect.z - clip_off.x) * clip_scale.x, fb_width);
+                const clip_max_y = @min((cmd.ClipRect.w - clip_off.y) * clip_scale.y, fb_height);
+                if (clip_max_x <= clip_min_x or clip_max_y <= clip_min_y) continue;
+
+                vk_dispatch.device_wrapper.cmdSetScissor(command_buffer, 0, 1, &@as([1]vk.Rect2D, .{
+                    .{
+                        .offset = .{ .x = @intFromFloat(clip_min_x), .y = @intFromFloat(clip_min_y) },
+                        .extent = .{
+                            .width = @intFromFloat(clip_max_x - clip_min_x),
+                            .height = @intFromFloat(clip_max_y - clip_min_y),
+                        },
+                    },
+                }));
+
+                // The stock backend's TextureIDs are VkDescriptorSets
+                const descriptor_set: vk.DescriptorSet = @enumFromInt(@intFromEnum(cmd.TextureId));
+                vk_dispatch.device_wrapper.cmdBindDescriptorSets(
+                    command_buffer,
+                    .graphics,
+                    self.pipeline_layout,
+                    0,
+                    1,
+                    &@as([1]vk.DescriptorSet, .{ descriptor_set }),
+                    0,
+                    null,
+                );
+
+                vk_dispatch.device_wrapper.cmdDrawIndexed(
+                    command_buffer,
+                    cmd.ElemCount,
+                    1,
+                    cmd.IdxOffset + global_idx_offset,
+                    @intCast(cmd.VtxOffset + global_vtx_offset),
+                    0,
+                );
+            }
+            global_idx_offset += list.IdxBuffer.Size;
+            global_vtx_offset += list.VtxBuffer.Size;
+        }
+
+        // Leave the scissor covering the whole framebuffer, like the stock
+        // backend does, for anything drawn after ImGui in the same pass.
+        vk_dispatch.device_wrapper.cmdSetScissor(command_buffer, 0, 1, &@as([1]vk.Rect2D, .{
+            .{
+                .offset = .{ .x = 0, .y = 0 },
+                .extent = .{ .width = @intFromFloat(fb_width), .height = @intFromFloat(fb_height) },
+            },
+        }));
+    }
+
+    fn setup_render_state(
+        self: *const RingRenderer,
+        draw_data: *const zimgui.DrawData,
+        command_buffer: vk.CommandBuffer,
+        vertex_offset: vk.DeviceSize,
+        index_offset: vk.DeviceSize,
+        fb_width: f32,
+        fb_height: f32,
+    ) void {
+        vk_dispatch.device_wrapper.cmdBindPipeline(command_buffer, .graphics, self.pipeline);
+
+        if (draw_data.TotalVtxCount > 0) {
+            vk_dispatch.device_wrapper.cmdBindVertexBuffers(
+                command_buffer,
+                0,
+                1,
+                &@as([1]vk.Buffer, .{ self.buffer }),
+                &@as([1]vk.DeviceSize, .{ vertex_offset }),
+            );
+            vk_dispatch.device_wrapper.cmdBindIndexBuffer(
+                command_buffer,
+                self.buffer,
+                index_offset,
+                if (@sizeOf(zimgui.DrawIdx) == 2) .uint16 else .uint32,
+            );
+        }
+
+        vk_dispatch.device_wrapper.cmdSetViewport(command_buffer, 0, 1, &@as([1]vk.Viewport, .{
+            .{ .x = 0, .y = 0, .width = fb_width, .height = fb_height, .min_depth = 0, .max_depth = 1 },
+        }));
+
+        // Map ImGui's display space to clip space
+        const scale_x = 2.0 / draw_data.DisplaySize.x;
+        const scale_y = 2.0 / draw_data.DisplaySize.y;
+        const push_constants = [4]f32{
+            scale_x,
+            scale_y,
+            -1.0 - draw_data.DisplayPos.x * scale_x,
+            -1.0 - draw_data.DisplayPos.y * scale_y,
+        };
+        vk_dispatch.device_wrapper.cmdPushConstants(
+            command_buffer,
+            self.pipeline_layout,
+            .{ .vertex_bit = true },
+            0,
+            @sizeOf(@TypeOf(push_constants)),
+            &push_constants,
+        );
+    }
+
+    /// Replace the buffer with one that has `region_count` regions of at
+    /// least `min_region_size` bytes. Waits for the device to be idle, since
+    /// other regions of the old buffer may still be in use.
+    fn reallocate(self: *RingRenderer, region_count: u32, min_region_size: vk.DeviceSize) !void {
+        try vk_dispatch.device_wrapper.deviceWaitIdle(self.device);
+        self.free_buffer();
+
+        // Grow geometrically, so a UI that keeps growing reallocates rarely
+        const region_size = std.mem.alignForward(
+            vk.DeviceSize,
+            @max(MIN_REGION_SIZE, std.math.ceilPowerOfTwoAssert(vk.DeviceSize, @max(min_region_size, 1))),
+            REGION_ALIGNMENT,
+        );
+        const size = region_size * region_count;
+
+        const buffer = try vk_dispatch.device_wrapper.createBuffer(self.device, &.{
+            .size = size,
+            .usage = .{ .vertex_buffer_bit = true, .index_buffer_bit = true },
+            .sharing_mode = .exclusive,
+        }, null);
+        errdefer vk_dispatch.device_wrapper.destroyBuffer(self.device, buffer, null);
+
+        const requirements = vk_dispatch.device_wrapper.getBufferMemoryRequirements(self.device, buffer);
+        const memory = try vk_dispatch.device_wrapper.allocateMemory(self.device, &.{
+            .allocation_size = requirements.size,
+            .memory_type_index = try self.find_memory_type(requirements.memory_type_bits),
+        }, null);
+        errdefer vk_dispatch.device_wrapper.freeMemory(self.device, memory, null);
+
+        try vk_dispatch.device_wrapper.bindBufferMemory(self.device, buffer, memory, 0);
+        const mapped = try vk_dispatch.device_wrapper.mapMemory(self.device, memory, 0, vk.WHOLE_SIZE, .{});
+
+        self.buffer = buffer;
+        self.memory = memory;
+        self.mapped = @ptrCast(mapped.?);
+        self.region_size = region_size;
+        self.region_count = region_count;
+        self.stats.reallocations += 1;
+        std.log.info(
+            "Ring renderer: {d} regions of {d} KiB",
+            .{ region_count, region_size / 1024 },
+        );
+    }
+
+    fn free_buffer(self: *RingRenderer) void {
+        if (self.buffer == .null_handle) return;
+        // Freeing the memory implicitly unmaps it
+        vk_dispatch.device_wrapper.destroyBuffer(self.device, self.buffer, null);
+        vk_dispatch.device_wrapper.freeMemory(self.device, self.memory, null);
+        self.buffer = .null_handle;
+        self.memory = .null_handle;
+        self.region_size = 0;
+        self.region_count = 0;
+    }
+
+    /// Prefers memory that is also device local (resizable BAR, integrated
+    /// GPUs and CPU drivers), the spec guarantees that at least one host
+    /// visible and coherent type exists.
+    fn find_memory_type(self: *const RingRenderer, type_bits: u32) !u32 {
+        const host: vk.MemoryPropertyFlags = .{ .host_visible_bit = true, .host_coherent_bit = true };
+        const preferred = host.merge(.{ .device_local_bit = true });
+        for ([_]vk.MemoryPropertyFlags{ preferred, host }) |wanted| {
+            for (self.memory_properties.memory_types[0..self.memory_properties.memory_type_count], 0..) |memory_type, i| {
+                if (type_bits & (@as(u32, 1) << @intCast(i)) == 0) continue;
+                if (memory_type.property_flags.contains(wanted)) return @intCast(i);
+            }
+        }
+        return error.NoSuitableMemoryType;
+    }
+};
+
+fn create_pipeline(
+    device: vk.Device,
+    pipeline_layout: vk.PipelineLayout,
+    render_pass: vk.RenderPass,
+    subpass: u32,
+    msaa_samples: vk.SampleCountFlags,
+    pipeline_cache: vk.PipelineCache,
+) !vk.Pipeline {
+    const vert_module = try vk_dispatch.device_wrapper.createShaderModule(device, &.{
+        .code_size = VERT_SPIRV.len * @sizeOf(u32),
+        .p_code = VERT_SPIRV.ptr,
+    }, null);
+    defer vk_dispatch.device_wrapper.destroyShaderModule(device, vert_module, null);
+    const frag_module = try vk_dispatch.device_wrapper.createShaderModule(device, &.{
+        .code_size = FRAG_SPIRV.len * @sizeOf(u32),
+        .p_code = FRAG_SPIRV.ptr,
+    }, null);
+    defer vk_dispatch.device_wrapper.destroyShaderModule(device, frag_module, null);
+
+    const stages = [2]vk.PipelineShaderStageCreateInfo{
+        .{ .stage = .{ .vertex_bit = true }, .module = vert_module, .p_name = "main" },
+        .{ .stage = .{ .fragment_bit = true }, .module = frag_module, .p_name = "main" },
+    };
+
+    const binding = [1]vk.VertexInputBindingDescription{
+        .{ .binding = 0, .stride = @sizeOf(zimgui.DrawVert), .input_rate = .vertex },
+    };
+    const attributes = [3]vk.VertexInputAttributeDescription{
+        .{ .location = 0, .binding = 0, .format = .r32g32_sfloat, .offset = @offsetOf(zimgui.DrawVert, "pos") },
+        .{ .location = 1, .binding = 0, .format = .r32g32_sfloat, .offset = @offsetOf(zimgui.DrawVert, "uv") },
+        .{ .location = 2, .binding = 0, .format = .r8g8b8a8_unorm, .offset = @offsetOf(zimgui.DrawVert, "col") },
+    };
+
+    const color_attachment = [1]vk.PipelineColorBlendAttachmentState{
+        .{
+            .blend_enable = vk.TRUE,
+            .src_color_blend_factor = .src_alpha,
+            .dst_color_blend_factor = .one_minus_src_alpha,
+            .color_blend_op = .add,
+            .src_alpha_blend_factor = .one,
+            .dst_alpha_blend_factor = .one_minus_src_alpha,
+            .alpha_blend_op = .add,
+            .color_write_mask = .{ .r_bit = true, .g_bit = true, .b_bit = true, .a_bit = true },
+        },
+    };
+
+    const dynamic_states = [2]vk.DynamicState{ .viewport, .scissor };
+
+    const create_info: vk.GraphicsPipelineCreateInfo = .{
+        .stage_count = stages.len,
+        .p_stages = &stages,
+        .p_vertex_input_state = &.{
+            .vertex_binding_description_count = binding.len,
+            .p_vertex_binding_descriptions = &binding,
+            .vertex_attribute_description_count = attributes.len,
+            .p_vertex_attribute_descriptions = &attributes,
+        },
+        .p_input_assembly_state = &.{
+            .topology = .triangle_list,
+            .primitive_restart_enable = vk.FALSE,
+        },
+        .p_viewport_state = &.{ .viewport_count = 1, .scissor_count = 1 },
+        .p_rasterization_state = &.{
+            .depth_clamp_enable = vk.FALSE,
+            .rasterizer_discard_enable = vk.FALSE,
+            .polygon_mode = .fill,
+            .cull_mode = .{},
+            .front_face = .counter_clockwise,
+            .depth_bias_enable = vk.FALSE,
+            .depth_bias_constant_factor = 0,
+            .depth_bias_clamp = 0,
+            .depth_bias_slope_factor = 0,
+            .line_width = 1,
+        },
+        .p_multisample_state = &.{
+            .rasterization_samples = if (msaa_samples.toInt() != 0) msaa_samples else .{ .@"1_bit" = true },
+            .sample_shading_enable = vk.FALSE,
+            .min_sample_shading = 0,
+            .alpha_to_coverage_enable = vk.FALSE,
+            .alpha_to_one_enable = vk.FALSE,
+        },
+        .p_depth_stencil_state = &.{
+            .depth_test_enable = vk.FALSE,
+            .depth_write_enable = vk.FALSE,
+            .depth_compare_op = .never,
+            .depth_bounds_test_enable = vk.FALSE,
+            .stencil_test_enable = vk.FALSE,
+            .front = std.mem.zeroes(vk.StencilOpState),
+            .back = std.mem.zeroes(vk.StencilOpState),
+            .min_depth_bounds = 0,
+            .max_depth_bounds = 0,
+        },
+        .p_color_blend_state = &.{
+            .logic_op_enable = vk.FALSE,
+            .logic_op = .clear,
+            .attachment_count = color_attachment.len,
+            .p_attachments = &color_attachment,
+            .blend_constants = .{ 0, 0, 0, 0 },
+        },
+        .p_dynamic_state = &.{
+            .dynamic_state_count = dynamic_states.len,
+            .p_dynamic_states = &dynamic_states,
+        },
+        .layout = pipeline_layout,
+        .render_pass = render_pass,
+        .subpass = subpass,
+        .base_pipeline_index = -1,
+    };
+
+    var pipeline: vk.Pipeline = undefined;
+    _ = try vk_dispatch.device_wrapper.createGraphicsPipelines(
+        device,
+        pipeline_cache,
+        1,
+        &@as([1]vk.GraphicsPipelineCreateInfo, .{ create_info }),
+        null,
+        @ptrCast(&pipeline),
+    );
+    return pipeline;
+}
+
+// Shader modules are loaded from u32 arrays, and `@alignOf(u32) == 4`.
+// Unfortunately, @embedFile is an `[] align (1) const u8`, and compounding
+// problems, @alignCast cannot increase the pointer alignment of a type to
+// fix this. However, @alignCast does assert that it was able to do the
+// conversion because it was already aligned correctly. By doing this at
+// comptime, we are able to take advantage of this and verify at compile time
+// that the embedded shader is able to be coerced safely into an
+// `[] align (4) const u8`. Then, we can safely use `std.mem.bytesAsSlice()` to
+// cast these well aligned bytes into a `[] align (4) const u32`, aka a
+// `[]const u32` for short.
+const VERT_SPIRV = embed_spirv("imgui.vert.spv");
+const FRAG_SPIRV = embed_spirv("imgui.frag.spv");
+
+fn embed_spirv(comptime name: []const u8) []const u32 {
+    comptime {
+        const raw: []const u8 = @embedFile(name);
+        const aligned: [] align(@alignOf(u32)) const u8 = @alignCast(raw);
+        return std.mem.bytesAsSlice(u32, aligned[0..]);
+    }
+}
@@ -13,6 +13,7 @@ pub const InstanceWrapperVtable = vk.InstanceWrapper(.{
     .enumerateDeviceExtensionProperties = true,
     .enumeratePhysicalDevices = true,
     .getDeviceProcAddr = true,
+    .getPhysicalDeviceMemoryProperties = true,
     .getPhysicalDeviceProperties = true,
     .getPhysicalDeviceQueueFamilyProperties = true,
     .getPhysicalDeviceSurfaceSupportKHR = true,
@@ -20,17 +21,41 @@ pub const InstanceWrapperVtable = vk.InstanceWrapper(.{
 
 pub const DeviceWrapperVtable = vk.DeviceWrapper(.{
     .acquireNextImageKHR = true,
+    .allocateMemory = true,
     .beginCommandBuffer = true,
+    .bindBufferMemory = true,
     .cmdBeginRenderPass = true,
+    .cmdBindDescriptorSets = true,
+    .cmdBindIndexBuffer = true,
+    .cmdBindPipeline = true,
+    .cmdBindVertexBuffers = true,
+    .cmdDrawIndexed = true,
     .cmdEndRenderPass = true,
+    .cmdPushConstants = true,
+    .cmdSetScissor = true,
+    .cmdSetViewport = true,
+    .createBuffer = true,
     .createDescriptorPool = true,
+    .createDescriptorSetLayout = true,
+    .createGraphicsPipelines = true,
+    .createPipelineCache = true,
+    .createPipelineLayout = true,
     .createShaderModule = true,
+    .destroyBuffer = true,
     .destroyDescriptorPool = true,
+    .destroyDescriptorSetLayout = true,
     .destroyDevice = true,
+    .destroyPipeline = true,
+    .destroyPipelineCache = true,
+    .destroyPipelineLayout = true,
     .destroyShaderModule = true,
     .deviceWaitIdle = true,
     .endCommandBuffer = true,
+    .freeMemory = true,
+    .getBufferMemoryRequirements = true,
     .getDeviceQueue = true,
+    .getPipelineCacheData = true,
+    .mapMemory = true,
     .queuePresentKHR = true,
     .queueSubmit = true,
     .resetCommandPool = true,
@@ -15,6 +15,10 @@ pub fn build(b: *std.Build) !void {
     // set a preferred release mode, allowing the user to decide how to optimize.
     _ = b.standardOptimizeOption(.{});
 
+    const emit_instrumented_raw = b.option(bool, "emit_instrumented_raw",
+        "Emit a variant of `raw` which counts and times calls, selected by Zig-ImGui's -Denable_instrumentation option."
+    ) orelse true;
+
     const imgui_dep = b.dependency("imgui", .{});
     const cimgui_dep = b.dependency("cimgui", .{});
 
@@ -189,5 +193,10 @@ pub fn build(b: *std.Build) !void {
         );
     }
 
+    python_generate_command.setEnvironmentVariable(
+        "EMIT_INSTRUMENTED_RAW",
+        if (emit_instrumented_raw) "1" else "0",
+    );
+
     b.getInstallStep().dependOn(&python_generate_command.step);
 }
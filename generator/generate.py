@@ -341,6 +341,9 @@ class ZigData:
         self.rawCommands = []
         """ []zigDecl """
 
+        self.instrumentedCommands = []
+        """ []zigDecl """
+
         self.rootFunctions = []
         """ []zigDecl """
 
@@ -515,12 +518,14 @@ class ZigData:
         paramStrs = [ '...' if typeStr == '...' else (name + ': ' + typeStr) for name, typeStr, udtptr in params ]
         retType = self.convertComplexType(retType, ParamContext('return', functionContext))
 
+        rawRetType = ('*' + retType) if jFunc.get('constructor') == True else retType
         rawDecl = '    pub extern fn {}({}) callconv(.C) {};'.format(
             rawName,
             ', '.join(paramStrs),
-            ('*' + retType) if jFunc.get('constructor') == True else retType
+            rawRetType
         )
         self.rawCommands.append(rawDecl)
+        self.instrumentedCommands.append(makeInstrumentedRawDecl(rawName, paramStrs, params, rawRetType))
 
         declName = self.makeZigFunctionName(jFunc, baseName, stname)
 
@@ -624,6 +629,70 @@ class ZigData:
         else:
             self.rootFunctions.append('\n'.join(wrapper))
 
+        if not isVarargs and not stname and isResizableTextFunction(params):
+            self.rootFunctions.append(self.makeArrayListTextFunction(jFunc, rawName, declName, params, functionContext))
+
+    def makeArrayListTextFunction(self, jFunc, rawName, declName, params, functionContext):
+        # Variant of an InputText* function which edits a *std.ArrayList(u8),
+        # see InputTextArrayListState in template.zig
+        jDefaults = jFunc['defaults']
+        wrappedName = declName + 'ArrayList'
+        wrappedRetType = 'std.mem.Allocator.Error!bool'
+
+        paramStrs = []
+        passStrs = []
+        defaultParamStrs = []
+        defaultPassStrs = []
+        hasDefaults = False
+
+        for name, typeStr, udtptr in params:
+            if name == 'buf_size':
+                passStrs.append('_state.bufSize()')
+                continue
+
+            wrappedType = typeStr
+            if name == 'buf':
+                wrappedType = '*std.ArrayList(u8)'
+                passStrs.append('_state.buf()')
+            elif name == 'flags':
+                wrappedType = typeStr.replace('FlagsInt', 'Flags')
+                passStrs.append('flags.with(.{ .CallbackResize = true }).toInt()')
+            elif name == 'callback':
+                passStrs.append('InputTextArrayListState.callback')
+            elif name == 'user_data':
+                passStrs.append('&_state')
+            elif udtptr:
+                wrappedType = typeStr[len('*const '):]
+                passStrs.append('&' + name)
+            else:
+                passStrs.append(name)
+
+            paramStrs.append(name + ': ' + wrappedType)
+
+            if name in jDefaults:
+                hasDefaults = True
+                defaultPassStrs.append(self.convertParamDefault(jDefaults[name], wrappedType, ParamContext(name, functionContext)))
+            else:
+                defaultParamStrs.append(paramStrs[-1])
+                defaultPassStrs.append(name)
+
+        defaultsName = wrappedName
+        if hasDefaults:
+            wrappedName += 'Ext'
+
+        wrapper = []
+        wrapper.append('pub inline fn '+wrappedName+'(' + ', '.join(paramStrs) + ') '+wrappedRetType+' {')
+        wrapper.append('    var _state = try InputTextArrayListState.init(buf, callback, user_data);')
+        wrapper.append('    return raw.'+rawName+'('+', '.join(passStrs)+');')
+        wrapper.append('}')
+
+        if hasDefaults:
+            wrapper.append('pub inline fn '+defaultsName+'('+', '.join(defaultParamStrs)+') '+wrappedRetType+' {')
+            wrapper.append('    return @This().'+wrappedName+'('+', '.join(defaultPassStrs)+');')
+            wrapper.append('}')
+
+        return '\n'.join(wrapper)
+
     def makeZigFunctionName(self, jFunc, baseName, struct):
         if struct:
             declName = baseName.replace(struct+'_', '')
@@ -911,11 +980,23 @@ class ZigData:
             f.write(func+'\n')
         f.write('\n')
 
-        f.write('pub const raw = struct {\n')
+        if EMIT_INSTRUMENTED_RAW:
+            f.write('pub const raw = if (instrumentation.enabled) raw_instrumented else raw_extern;\n\n')
+        else:
+            f.write('pub const raw = raw_extern;\n\n')
+
+        f.write('const raw_extern = struct {\n')
         for r in self.rawCommands:
             f.write(r+'\n')
         f.write('};\n')
 
+        if EMIT_INSTRUMENTED_RAW:
+            f.write('\n')
+            f.write('const raw_instrumented = struct {\n')
+            for r in self.instrumentedCommands:
+                f.write(r+'\n')
+            f.write('};\n')
+
         if False:
             f.write(
                 textwrap.dedent(
@@ -936,6 +1017,27 @@ class ZigData:
 def isFlags(cName):
     return cName.endswith('Flags') or cName == 'ImGuiCond'
 
+def isResizableTextFunction(params):
+    types = { name: typeStr for name, typeStr, udtptr in params }
+    return (types.get('buf') == '?[*]u8'
+        and types.get('buf_size') == 'usize'
+        and types.get('flags') == 'InputTextFlagsInt'
+        and types.get('callback') == 'InputTextCallback'
+        and 'user_data' in types)
+
+def makeInstrumentedRawDecl(rawName, paramStrs, params, retType):
+    """ Wrapper counting calls to a raw extern function. Variadic functions
+    cannot forward their arguments, so they are passed through uninstrumented. """
+    if any(typeStr == '...' for name, typeStr, udtptr in params):
+        return '    pub const {0} = raw_extern.{0};'.format(rawName)
+    return '    pub fn {}({}) callconv(.C) {} {{ return instrumentation.call(.{}, .{{ {} }}); }}'.format(
+        rawName,
+        ', '.join(paramStrs),
+        retType,
+        rawName,
+        ', '.join(name for name, typeStr, udtptr in params),
+    )
+
 ## Data
 function_name_whitelist = { 'ImGuiFreeType_GetBuilderForFreeType', 'ImGuiFreeType_SetAllocatorFunctions' }
 type_conversions = {
@@ -1032,6 +1134,9 @@ if __name__ == '__main__':
     del data.structures['ImColor']
     del data.typedefs['ImTextureID']
 
+    # Set to 0 to leave out the instrumented variant of `raw`
+    EMIT_INSTRUMENTED_RAW = os.environ.get('EMIT_INSTRUMENTED_RAW', '1') != '0'
+
     os.makedirs(os.path.dirname(OUTPUT_PATH), exist_ok=True)
     with open(OUTPUT_PATH, "w+", newline='\n') as f:
         data.writeFile(f)
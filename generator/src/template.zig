@@ -5,6 +5,7 @@
 
 const std = @import("std");
 const builtin = @import("builtin");
+const build_options = @import("build_options");
 const assert = @import("std").debug.assert;
 const imgui = @This();
 
@@ -335,9 +336,49 @@ pub const Vec2 = extern struct {
     x: f32 = 0,
     y: f32 = 0,
 
+    pub const Simd = @Vector(2, f32);
+
     pub fn init(x: f32, y: f32) Vec2 {
         return .{ .x = x, .y = y };
     }
+    pub fn splat(value: f32) Vec2 {
+        return .{ .x = value, .y = value };
+    }
+
+    pub fn toSimd(self: Vec2) Simd {
+        return .{ self.x, self.y };
+    }
+    pub fn fromSimd(value: Simd) Vec2 {
+        return .{ .x = value[0], .y = value[1] };
+    }
+
+    pub fn add(a: Vec2, b: Vec2) Vec2 {
+        return fromSimd(a.toSimd() + b.toSimd());
+    }
+    pub fn sub(a: Vec2, b: Vec2) Vec2 {
+        return fromSimd(a.toSimd() - b.toSimd());
+    }
+    /// Component-wise multiplication
+    pub fn mul(a: Vec2, b: Vec2) Vec2 {
+        return fromSimd(a.toSimd() * b.toSimd());
+    }
+    pub fn scale(self: Vec2, factor: f32) Vec2 {
+        return fromSimd(self.toSimd() * @as(Simd, @splat(factor)));
+    }
+    /// Linear interpolation, `t == 0` yields `a` and `t == 1` yields `b`
+    pub fn lerp(a: Vec2, b: Vec2, t: f32) Vec2 {
+        const va = a.toSimd();
+        return fromSimd(va + (b.toSimd() - va) * @as(Simd, @splat(t)));
+    }
+    pub fn min(a: Vec2, b: Vec2) Vec2 {
+        return fromSimd(@min(a.toSimd(), b.toSimd()));
+    }
+    pub fn max(a: Vec2, b: Vec2) Vec2 {
+        return fromSimd(@max(a.toSimd(), b.toSimd()));
+    }
+    pub fn clamp(self: Vec2, lo: Vec2, hi: Vec2) Vec2 {
+        return fromSimd(@min(@max(self.toSimd(), lo.toSimd()), hi.toSimd()));
+    }
 
     pub fn eql(self: Vec2, other: Vec2) bool {
         return self.x == other.x and self.y == other.y;
@@ -350,9 +391,75 @@ pub const Vec4 = extern struct {
     z: f32 = 0,
     w: f32 = 0,
 
+    pub const Simd = @Vector(4, f32);
+
     pub fn init(x: f32, y: f32, z: f32, w: f32) Vec4 {
         return .{ .x = x, .y = y, .z = z, .w = w };
     }
+    pub fn splat(value: f32) Vec4 {
+        return .{ .x = value, .y = value, .z = value, .w = value };
+    }
+
+    pub fn toSimd(self: Vec4) Simd {
+        return .{ self.x, self.y, self.z, self.w };
+    }
+    pub fn fromSimd(value: Simd) Vec4 {
+        return .{ .x = value[0], .y = value[1], .z = value[2], .w = value[3] };
+    }
+
+    pub fn add(a: Vec4, b: Vec4) Vec4 {
+        return fromSimd(a.toSimd() + b.toSimd());
+    }
+    pub fn sub(a: Vec4, b: Vec4) Vec4 {
+        return fromSimd(a.toSimd() - b.toSimd());
+    }
+    /// Component-wise multiplication
+    pub fn mul(a: Vec4, b: Vec4) Vec4 {
+        return fromSimd(a.toSimd() * b.toSimd());
+    }
+    pub fn scale(self: Vec4, factor: f32) Vec4 {
+        return fromSimd(self.toSimd() * @as(Simd, @splat(factor)));
+    }
+    /// Linear interpolation, `t == 0` yields `a` and `t == 1` yields `b`
+    pub fn lerp(a: Vec4, b: Vec4, t: f32) Vec4 {
+        const va = a.toSimd();
+        return fromSimd(va + (b.toSimd() - va) * @as(Simd, @splat(t)));
+    }
+    pub fn min(a: Vec4, b: Vec4) Vec4 {
+        return fromSimd(@min(a.toSimd(), b.toSimd()));
+    }
+    pub fn max(a: Vec4, b: Vec4) Vec4 {
+        return fromSimd(@max(a.toSimd(), b.toSimd()));
+    }
+    pub fn clamp(self: Vec4, lo: Vec4, hi: Vec4) Vec4 {
+        return fromSimd(@min(@max(self.toSimd(), lo.toSimd()), hi.toSimd()));
+    }
+
+    /// Pack each value to an integer 0xaabbggrr (x = red, w = alpha), with the
+    /// same saturation and rounding as ColorConvertFloat4ToU32.
+    /// `out` must be the same length as `values`.
+    pub fn packABGRSlice(values: []const Vec4, out: []u32) void {
+        assert(values.len == out.len);
+        var i: usize = 0;
+        while (i + simd_batch_len <= values.len) : (i += simd_batch_len) {
+            simdPackABGR(simd_batch_len, values[i..][0..simd_batch_len], out[i..][0..simd_batch_len]);
+        }
+        while (i < values.len) : (i += 1) {
+            simdPackABGR(1, values[i..][0..1], out[i..][0..1]);
+        }
+    }
+    /// Unpack integers 0xaabbggrr to floating point values, the inverse of packABGRSlice.
+    /// `out` must be the same length as `values`.
+    pub fn unpackABGRSlice(values: []const u32, out: []Vec4) void {
+        assert(values.len == out.len);
+        var i: usize = 0;
+        while (i + simd_batch_len <= values.len) : (i += simd_batch_len) {
+            simdUnpackABGR(simd_batch_len, values[i..][0..simd_batch_len], out[i..][0..simd_batch_len]);
+        }
+        while (i < values.len) : (i += 1) {
+            simdUnpackABGR(1, values[i..][0..1], out[i..][0..1]);
+        }
+    }
 
     pub fn eql(self: Vec4, other: Vec4) bool {
         return self.x == other.x
@@ -420,6 +527,469 @@ pub const Color = extern struct {
     pub fn eql(self: Color, other: Color) bool {
         return self.Value.eql(other.Value);
     }
+
+    /// Slice version of packABGR, `out` must be the same length as `colors`.
+    pub fn packABGRSlice(colors: []const Color, out: []u32) void {
+        Vec4.packABGRSlice(@as([*]const Vec4, @ptrCast(colors.ptr))[0..colors.len], out);
+    }
+    /// Slice version of initABGRPacked, `out` must be the same length as `values`.
+    pub fn unpackABGRSlice(values: []const u32, out: []Color) void {
+        Vec4.unpackABGRSlice(values, @as([*]Vec4, @ptrCast(out.ptr))[0..out.len]);
+    }
+
+    /// Convert HSVA values (x = hue, y = saturation, z = value, w = alpha) to
+    /// RGBA, matching ColorConvertHSVtoRGB. Hue wraps into the range [0, 1).
+    /// Alpha is passed through unchanged. `out` must be the same length as
+    /// `values`, and may be the same slice to convert in place.
+    pub fn convertHSVtoRGBSlice(values: []const Vec4, out: []Vec4) void {
+        assert(values.len == out.len);
+        var i: usize = 0;
+        while (i + simd_batch_len <= values.len) : (i += simd_batch_len) {
+            simdHSVtoRGB(simd_batch_len, values[i..][0..simd_batch_len], out[i..][0..simd_batch_len]);
+        }
+        while (i < values.len) : (i += 1) {
+            simdHSVtoRGB(1, values[i..][0..1], out[i..][0..1]);
+        }
+    }
+    /// Convert RGBA values to HSVA, matching ColorConvertRGBtoHSV.
+    /// Alpha is passed through unchanged. `out` must be the same length as
+    /// `values`, and may be the same slice to convert in place.
+    pub fn convertRGBtoHSVSlice(values: []const Vec4, out: []Vec4) void {
+        assert(values.len == out.len);
+        var i: usize = 0;
+        while (i + simd_batch_len <= values.len) : (i += simd_batch_len) {
+            simdRGBtoHSV(simd_batch_len, values[i..][0..simd_batch_len], out[i..][0..simd_batch_len]);
+        }
+        while (i < values.len) : (i += 1) {
+            simdRGBtoHSV(1, values[i..][0..1], out[i..][0..1]);
+        }
+    }
+};
+
+// The slice conversions above work on `simd_batch_len` values at a time,
+// transposed so that each vector lane holds one channel of one value.
+const simd_batch_len = std.simd.suggestVectorLength(f32) orelse 4;
+
+fn SimdBatch(comptime len: usize) type {
+    return @Vector(len, f32);
+}
+
+fn simdLoadChannel(comptime len: usize, values: *const [len]Vec4, comptime channel: []const u8) SimdBatch(len) {
+    var result: SimdBatch(len) = undefined;
+    inline for (0..len) |i| result[i] = @field(values[i], channel);
+    return result;
+}
+
+fn simdStore(comptime len: usize, out: *[len]Vec4, x: SimdBatch(len), y: SimdBatch(len), z: SimdBatch(len), w: SimdBatch(len)) void {
+    inline for (0..len) |i| out[i] = .{ .x = x[i], .y = y[i], .z = z[i], .w = w[i] };
+}
+
+fn simdSaturateUnorm(comptime len: usize, value: SimdBatch(len)) @Vector(len, u32) {
+    const V = SimdBatch(len);
+    const saturated = @min(@max(value, @as(V, @splat(0.0))), @as(V, @splat(1.0)));
+    return @intFromFloat(saturated * @as(V, @splat(255.0)) + @as(V, @splat(0.5)));
+}
+
+fn simdPackABGR(comptime len: usize, values: *const [len]Vec4, out: *[len]u32) void {
+    const Shift = @Vector(len, u5);
+    const r = simdSaturateUnorm(len, simdLoadChannel(len, values, "x"));
+    const g = simdSaturateUnorm(len, simdLoadChannel(len, values, "y"));
+    const b = simdSaturateUnorm(len, simdLoadChannel(len, values, "z"));
+    const a = simdSaturateUnorm(len, simdLoadChannel(len, values, "w"));
+    out.* = r | (g << @as(Shift, @splat(8))) | (b << @as(Shift, @splat(16))) | (a << @as(Shift, @splat(24)));
+}
+
+fn simdUnpackABGR(comptime len: usize, values: *const [len]u32, out: *[len]Vec4) void {
+    const V = SimdBatch(len);
+    const U = @Vector(len, u32);
+    const Shift = @Vector(len, u5);
+    const mask: U = @splat(0xFF);
+    const inv_255: V = @splat(1.0 / 255.0);
+    const packed_values: U = values.*;
+    const r: V = @floatFromInt(packed_values & mask);
+    const g: V = @floatFromInt((packed_values >> @as(Shift, @splat(8))) & mask);
+    const b: V = @floatFromInt((packed_values >> @as(Shift, @splat(16))) & mask);
+    const a: V = @floatFromInt(packed_values >> @as(Shift, @splat(24)));
+    simdStore(len, out, r * inv_255, g * inv_255, b * inv_255, a * inv_255);
+}
+
+fn simdHSVtoRGB(comptime len: usize, values: *const [len]Vec4, out: *[len]Vec4) void {
+    const V = SimdBatch(len);
+    const one: V = @splat(1.0);
+    const h = simdLoadChannel(len, values, "x");
+    const s = simdLoadChannel(len, values, "y");
+    const v = simdLoadChannel(len, values, "z");
+    const a = simdLoadChannel(len, values, "w");
+
+    const h6 = (h - @floor(h)) * @as(V, @splat(6.0));
+    const sector = @floor(h6);
+    const f = h6 - sector;
+    const p = v * (one - s);
+    const q = v * (one - s * f);
+    const t = v * (one - s * (one - f));
+
+    // Sector:   0  1  2  3  4  5
+    // Red:      v  q  p  p  t  v
+    // Green:    t  v  v  q  p  p
+    // Blue:     p  p  t  v  v  q
+    var r = v;
+    var g = p;
+    var b = q;
+    inline for (.{
+        .{ 0, v, t, p },
+        .{ 1, q, v, p },
+        .{ 2, p, v, t },
+        .{ 3, p, q, v },
+        .{ 4, t, p, v },
+    }) |case| {
+        const in_sector = sector == @as(V, @splat(@as(f32, case[0])));
+        r = @select(f32, in_sector, case[1], r);
+        g = @select(f32, in_sector, case[2], g);
+        b = @select(f32, in_sector, case[3], b);
+    }
+    simdStore(len, out, r, g, b, a);
+}
+
+fn simdRGBtoHSV(comptime len: usize, values: *const [len]Vec4, out: *[len]Vec4) void {
+    const V = SimdBatch(len);
+    const zero: V = @splat(0.0);
+    const epsilon: V = @splat(1e-20);
+    const r = simdLoadChannel(len, values, "x");
+    const g = simdLoadChannel(len, values, "y");
+    const b = simdLoadChannel(len, values, "z");
+    const a = simdLoadChannel(len, values, "w");
+
+    // Branchless version of the swaps performed by ColorConvertRGBtoHSV
+    const swap_gb = g < b;
+    const g1 = @select(f32, swap_gb, b, g);
+    const b1 = @select(f32, swap_gb, g, b);
+    const k1 = @select(f32, swap_gb, @as(V, @splat(-1.0)), zero);
+    const swap_rg = r < g1;
+    const r2 = @select(f32, swap_rg, g1, r);
+    const g2 = @select(f32, swap_rg, r, g1);
+    const k2 = @select(f32, swap_rg, @as(V, @splat(-2.0 / 6.0)) - k1, k1);
+
+    const chroma = r2 - @min(g2, b1);
+    const hue = @abs(k2 + (g2 - b1) / (@as(V, @splat(6.0)) * chroma + epsilon));
+    const saturation = chroma / (r2 + epsilon);
+    simdStore(len, out, hue, saturation, r2, a);
+}
+
+/// Batched versions of DrawList primitives. Each call reserves vertices and
+/// indices for many primitives at once through PrimReserve and writes them
+/// directly into the draw list, instead of crossing the C ABI per primitive.
+/// Output is not anti-aliased, matching PrimRect.
+pub const DrawListBatch = struct {
+    pub const Rect = extern struct {
+        min: Vec2,
+        max: Vec2,
+        col: u32,
+    };
+
+    pub const Line = extern struct {
+        p1: Vec2,
+        p2: Vec2,
+        col: u32,
+    };
+
+    pub const Circle = extern struct {
+        center: Vec2,
+        radius: f32,
+        col: u32,
+    };
+
+    pub const max_circle_segments = 64;
+
+    /// Keep each reservation well below the 16-bit index limit, so that
+    /// PrimReserve can start a new command with a vertex offset when needed.
+    const max_chunk_vertices = 1 << 15;
+
+    const col_alpha_mask: u32 = 0xFF000000;
+
+    const Reservation = struct {
+        vtx: [*]DrawVert,
+        idx: [*]DrawIdx,
+        base: DrawIdx,
+    };
+
+    /// DrawListSharedData is opaque here, but its first field is TexUvWhitePixel.
+    /// Reading it through the draw list instead of the current context keeps
+    /// these functions usable on draw lists filled from other threads.
+    fn texUvWhitePixel(draw_list: *const DrawList) Vec2 {
+        return @as(*const Vec2, @ptrCast(@alignCast(draw_list._Data.?))).*;
+    }
+
+    fn reserve(draw_list: *DrawList, idx_count: usize, vtx_count: usize) Reservation {
+        draw_list.PrimReserve(@intCast(idx_count), @intCast(vtx_count));
+        return .{
+            .vtx = draw_list._VtxWritePtr.?,
+            .idx = draw_list._IdxWritePtr.?,
+            .base = @truncate(draw_list._VtxCurrentIdx),
+        };
+    }
+
+    fn commit(draw_list: *DrawList, reserved_idx: usize, reserved_vtx: usize, idx_count: usize, vtx_count: usize) void {
+        draw_list._VtxWritePtr = draw_list._VtxWritePtr.? + vtx_count;
+        draw_list._IdxWritePtr = draw_list._IdxWritePtr.? + idx_count;
+        draw_list._VtxCurrentIdx += @intCast(vtx_count);
+        if (reserved_idx != idx_count or reserved_vtx != vtx_count) {
+            draw_list.PrimUnreserve(@intCast(reserved_idx - idx_count), @intCast(reserved_vtx - vtx_count));
+        }
+    }
+
+    fn writeQuad(res: Reservation, quad: usize, corners: [4]Vec2, uv: Vec2, col: u32) void {
+        const quad_indices: @Vector(6, DrawIdx) = .{ 0, 1, 2, 0, 2, 3 };
+        const base: DrawIdx = res.base +% @as(DrawIdx, @truncate(quad * 4));
+        res.idx[quad * 6 ..][0..6].* = quad_indices +% @as(@Vector(6, DrawIdx), @splat(base));
+        inline for (corners, 0..) |corner, i| {
+            res.vtx[quad * 4 + i] = .{ .pos = corner, .uv = uv, .col = col };
+        }
+    }
+
+    /// Batched AddRectFilled without rounding. Fully transparent rectangles are skipped.
+    pub fn addRectsFilled(draw_list: *DrawList, rects: []const Rect) void {
+        const uv = texUvWhitePixel(draw_list);
+        const chunk_len = max_chunk_vertices / 4;
+        var start: usize = 0;
+        while (start < rects.len) : (start += chunk_len) {
+            const chunk = rects[start..@min(start + chunk_len, rects.len)];
+            const res = reserve(draw_list, chunk.len * 6, chunk.len * 4);
+            var written: usize = 0;
+            for (chunk) |rect| {
+                if ((rect.col & col_alpha_mask) == 0) continue;
+                writeQuad(res, written, .{
+                    rect.min,
+                    .{ .x = rect.max.x, .y = rect.min.y },
+                    rect.max,
+                    .{ .x = rect.min.x, .y = rect.max.y },
+                }, uv, rect.col);
+                written += 1;
+            }
+            commit(draw_list, chunk.len * 6, chunk.len * 4, written * 6, written * 4);
+        }
+    }
+
+    /// Batched AddLine, each line is emitted as a single quad of the given thickness.
+    /// Fully transparent lines are skipped.
+    pub fn addLines(draw_list: *DrawList, lines: []const Line, thickness: f32) void {
+        const uv = texUvWhitePixel(draw_list);
+        const half_thickness: Vec2.Simd = @splat(thickness * 0.5);
+        const chunk_len = max_chunk_vertices / 4;
+        var start: usize = 0;
+        while (start < lines.len) : (start += chunk_len) {
+            const chunk = lines[start..@min(start + chunk_len, lines.len)];
+            const res = reserve(draw_list, chunk.len * 6, chunk.len * 4);
+            var written: usize = 0;
+            for (chunk) |line| {
+                if ((line.col & col_alpha_mask) == 0) continue;
+                const p1 = line.p1.toSimd();
+                const p2 = line.p2.toSimd();
+                const delta = p2 - p1;
+                const len_sq = @reduce(.Add, delta * delta);
+                const inv_len: Vec2.Simd = @splat(if (len_sq > 0.0) 1.0 / @sqrt(len_sq) else 0.0);
+                const dir = delta * inv_len;
+                const normal = Vec2.Simd{ -dir[1], dir[0] } * half_thickness;
+                writeQuad(res, written, .{
+                    Vec2.fromSimd(p1 + normal),
+                    Vec2.fromSimd(p2 + normal),
+                    Vec2.fromSimd(p2 - normal),
+                    Vec2.fromSimd(p1 - normal),
+                }, uv, line.col);
+                written += 1;
+            }
+            commit(draw_list, chunk.len * 6, chunk.len * 4, written * 6, written * 4);
+        }
+    }
+
+    /// Batched AddCircleFilled with a fixed segment count shared by all circles,
+    /// clamped to [3, max_circle_segments]. Fully transparent or zero radius
+    /// circles are skipped.
+    pub fn addCirclesFilled(draw_list: *DrawList, circles: []const Circle, num_segments: u32) void {
+        const segments: usize = std.math.clamp(num_segments, 3, max_circle_segments);
+        var unit_circle: [max_circle_segments]Vec2.Simd = undefined;
+        for (unit_circle[0..segments], 0..) |*point, i| {
+            const angle = (@as(f32, @floatFromInt(i)) / @as(f32, @floatFromInt(segments))) * std.math.tau;
+            point.* = .{ @cos(angle), @sin(angle) };
+        }
+
+        const uv = texUvWhitePixel(draw_list);
+        const vtx_per_circle = segments;
+        const idx_per_circle = (segments - 2) * 3;
+        const chunk_len = max_chunk_vertices / vtx_per_circle;
+        var start: usize = 0;
+        while (start < circles.len) : (start += chunk_len) {
+            const chunk = circles[start..@min(start + chunk_len, circles.len)];
+            const res = reserve(draw_list, chunk.len * idx_per_circle, chunk.len * vtx_per_circle);
+            var written: usize = 0;
+            for (chunk) |circle| {
+                if ((circle.col & col_alpha_mask) == 0 or circle.radius <= 0.0) continue;
+                const center = circle.center.toSimd();
+                const radius: Vec2.Simd = @splat(circle.radius);
+                const vtx = res.vtx + written * vtx_per_circle;
+                for (unit_circle[0..segments], 0..) |point, i| {
+                    vtx[i] = .{ .pos = Vec2.fromSimd(center + point * radius), .uv = uv, .col = circle.col };
+                }
+                const base: DrawIdx = res.base +% @as(DrawIdx, @truncate(written * vtx_per_circle));
+                const idx = res.idx + written * idx_per_circle;
+                for (0..segments - 2) |i| {
+                    const tri: @Vector(3, DrawIdx) = .{ 0, @intCast(i + 1), @intCast(i + 2) };
+                    idx[i * 3 ..][0..3].* = tri +% @as(@Vector(3, DrawIdx), @splat(base));
+                }
+                written += 1;
+            }
+            commit(
+                draw_list,
+                chunk.len * idx_per_circle,
+                chunk.len * vtx_per_circle,
+                written * idx_per_circle,
+                written * vtx_per_circle,
+            );
+        }
+    }
+
+    /// Slice version of DrawList.AddPolyline
+    pub fn addPolyline(draw_list: *DrawList, points: []const Vec2, col: u32, flags: DrawFlags, thickness: f32) void {
+        draw_list.AddPolyline(@constCast(points.ptr), @intCast(points.len), col, flags, thickness);
+    }
+
+    /// Slice version of DrawList.AddConvexPolyFilled
+    pub fn addConvexPolyFilled(draw_list: *DrawList, points: []const Vec2, col: u32) void {
+        draw_list.AddConvexPolyFilled(@constCast(points.ptr), @intCast(points.len), col);
+    }
+};
+
+/// Glue for the generated InputText*ArrayList functions, which edit a
+/// std.ArrayList(u8) in place and grow it through InputTextFlags.CallbackResize.
+/// `items` holds the text, followed by a null terminator within `capacity`.
+/// Other callback events are forwarded to the user's callback, with its own
+/// user data. Resize events are never forwarded.
+pub const InputTextArrayListState = struct {
+    list: *std.ArrayList(u8),
+    user_callback: InputTextCallback,
+    user_data: ?*anyopaque,
+
+    pub const callback: InputTextCallback = @ptrCast(@constCast(&resizeCallback));
+
+    pub fn init(list: *std.ArrayList(u8), user_callback: InputTextCallback, user_data: ?*anyopaque) std.mem.Allocator.Error!InputTextArrayListState {
+        try list.ensureTotalCapacity(list.items.len + 1);
+        list.allocatedSlice()[list.items.len] = 0;
+        return .{ .list = list, .user_callback = user_callback, .user_data = user_data };
+    }
+
+    pub fn buf(self: InputTextArrayListState) [*]u8 {
+        return self.list.items.ptr;
+    }
+
+    pub fn bufSize(self: InputTextArrayListState) usize {
+        return @min(self.list.capacity, std.math.maxInt(i32));
+    }
+
+    fn resizeCallback(data: ?*InputTextCallbackData) callconv(.C) i32 {
+        const d = data.?;
+        const self: *InputTextArrayListState = @ptrCast(@alignCast(d.UserData.?));
+        if (d.EventFlag.CallbackResize) {
+            assert(d.Buf.? == self.list.items.ptr);
+            const text_len: usize = @intCast(d.BufTextLen);
+            // If growing fails, ImGui truncates the text to the size we report.
+            self.list.ensureTotalCapacity(text_len + 1) catch {};
+            self.list.items.len = @min(text_len, self.bufSize() - 1);
+            d.Buf = self.list.items.ptr;
+            d.BufSize = @intCast(self.bufSize());
+            return 0;
+        }
+        if (self.user_callback) |user_callback| {
+            d.UserData = self.user_data;
+            defer d.UserData = self;
+            return user_callback(d);
+        }
+        return 0;
+    }
+};
+
+/// Call counts, and optionally timings, for every function in `raw`.
+/// Enabled by building Zig-ImGui with -Denable_instrumentation=true, and
+/// -Dinstrumentation_timing=true for timings. When disabled, `raw` refers to
+/// the extern functions directly, so none of this is compiled in.
+/// Variadic functions such as igText are not instrumented.
+pub const instrumentation = struct {
+    pub const enabled = build_options.enable_instrumentation and @hasDecl(imgui, "raw_instrumented");
+    pub const timing = enabled and build_options.instrumentation_timing;
+
+    pub const Function = blk: {
+        @setEvalBranchQuota(10000);
+        break :blk std.meta.DeclEnum(raw_extern);
+    };
+    const function_count = @typeInfo(Function).Enum.fields.len;
+
+    pub const Stats = struct {
+        calls: u64 = 0,
+        /// Only measured when timing is enabled.
+        total_ns: u64 = 0,
+    };
+
+    var table = [_]Stats{.{}} ** function_count;
+
+    fn ReturnType(comptime function: Function) type {
+        return @typeInfo(@TypeOf(@field(raw_extern, @tagName(function)))).Fn.return_type.?;
+    }
+
+    /// Called by the instrumented `raw` functions.
+    pub inline fn call(comptime function: Function, args: anytype) ReturnType(function) {
+        const stats = &table[@intFromEnum(function)];
+        _ = @atomicRmw(u64, &stats.calls, .Add, 1, .monotonic);
+        const f = @field(raw_extern, @tagName(function));
+        if (!timing) return @call(.auto, f, args);
+
+        const start = std.time.Instant.now() catch return @call(.auto, f, args);
+        defer {
+            if (std.time.Instant.now()) |end| {
+                _ = @atomicRmw(u64, &stats.total_ns, .Add, end.since(start), .monotonic);
+            } else |_| {}
+        }
+        return @call(.auto, f, args);
+    }
+
+    pub fn get(function: Function) Stats {
+        const stats = &table[@intFromEnum(function)];
+        return .{
+            .calls = @atomicLoad(u64, &stats.calls, .monotonic),
+            .total_ns = @atomicLoad(u64, &stats.total_ns, .monotonic),
+        };
+    }
+
+    pub fn reset() void {
+        for (&table) |*stats| {
+            @atomicStore(u64, &stats.calls, 0, .monotonic);
+            @atomicStore(u64, &stats.total_ns, 0, .monotonic);
+        }
+    }
+
+    /// Write one line per called function, sorted by total time when timing
+    /// is enabled, and by number of calls otherwise.
+    pub fn dump(writer: anytype) !void {
+        var order: [function_count]Function = undefined;
+        var len: usize = 0;
+        for (0..function_count) |i| {
+            const function: Function = @enumFromInt(i);
+            if (get(function).calls != 0) {
+                order[len] = function;
+                len += 1;
+            }
+        }
+        std.mem.sort(Function, order[0..len], {}, struct {
+            fn moreExpensive(_: void, a: Function, b: Function) bool {
+                const sa = get(a);
+                const sb = get(b);
+                return if (timing) sa.total_ns > sb.total_ns else sa.calls > sb.calls;
+            }
+        }.moreExpensive);
+
+        try writer.print("{s:<48} {s:>12} {s:>14} {s:>10}\n", .{ "function", "calls", "total ns", "ns/call" });
+        for (order[0..len]) |function| {
+            const stats = get(function);
+            try writer.print("{s:<48} {d:>12} {d:>14} {d:>10}\n", .{ @tagName(function), stats.calls, stats.total_ns, stats.total_ns / stats.calls });
+        }
+    }
 };
 
 fn imguiZigAlloc(_: *anyopaque, len: usize, ptr_align: u8, ret_addr: usize) ?[*]u8 {
@@ -0,0 +1,315 @@
+//! Measures how long Zig takes to compile programs against the bindings, and
+//! how much memory it needs to do so. Run through `zig build bench-compile`,
+//! which passes the consumer programs (minimal.zig, typical.zig,
+//! everything.zig) and the bindings variants to compare.
+//!
+//! Every program is compiled against every variant, once with
+//! -fno-emit-bin, which only runs semantic analysis, and once emitting an
+//! object file, which adds code generation. Each compile uses an empty local
+//! cache so nothing is reused between runs, and the fastest of `--repeat`
+//! runs is kept. Results are compared against a baseline file from an earlier
+//! run on the same machine, and the exit code is 1 if any program got slower
+//! or needed more memory than `--tolerance` percent above it. A missing
+//! baseline, or `--update-baseline`, writes the current results instead.
+//!
+//!     compile_bench --zig <zig> --work-dir <dir> --baseline <file.json>
+//!         [--update-baseline] [--repeat <n>] [--tolerance <percent>]
+//!         --program <name> <program.zig> ...
+//!         --variant <name> <imgui.zig> <build_options.zig> ...
+
+const std = @import("std");
+
+const Program = struct {
+    name: []const u8,
+    path: []const u8,
+};
+
+const Variant = struct {
+    name: []const u8,
+    bindings: []const u8,
+    options: []const u8,
+};
+
+const Config = struct {
+    zig_exe: []const u8 = "zig",
+    work_dir: []const u8 = "",
+    baseline_path: []const u8 = "",
+    update_baseline: bool = false,
+    repeat: u32 = 3,
+    tolerance_percent: f64 = 10,
+    programs: []const Program = &.{},
+    variants: []const Variant = &.{},
+};
+
+const Result = struct {
+    program: []const u8,
+    variant: []const u8,
+    /// Semantic analysis only
+    sema_ns: u64,
+    /// Semantic analysis and code generation
+    total_ns: u64,
+    /// Highest peak RSS of the compiler over all runs
+    peak_rss: u64,
+};
+
+const Baseline = struct {
+    results: []const Result,
+};
+
+const Sample = struct {
+    ns: u64,
+    peak_rss: u64,
+};
+
+const Mode = enum { sema, full };
+
+pub fn main() !u8 {
+    var arena_state = std.heap.ArenaAllocator.init(std.heap.page_allocator);
+    defer arena_state.deinit();
+    const arena = arena_state.allocator();
+
+    const config = try parseArgs(arena, try std.process.argsAlloc(arena));
+    const stdout = std.io.getStdOut().writer();
+
+    try std.fs.cwd().makePath(config.work_dir);
+
+    // Fill the global cache (compiler_rt, builtin modules, ...) before
+    // anything is measured.
+    _ = try measure(arena, config, config.programs[0], config.variants[0], .full);
+
+    var results = std.ArrayList(Result).init(arena);
+    for (config.programs) |program| {
+        for (config.variants) |variant| {
+            var sema: Sample = .{ .ns = std.math.maxInt(u64), .peak_rss = 0 };
+            var full: Sample = .{ .ns = std.math.maxInt(u64), .peak_rss = 0 };
+            for (0..config.repeat) |_| {
+                const s = try measure(arena, config, program, variant, .sema);
+                const f = try measure(arena, config, program, variant, .full);
+                sema = .{ .ns = @min(sema.ns, s.ns), .peak_rss = @max(sema.peak_rss, s.peak_rss) };
+                full = .{ .ns = @min(full.ns, f.ns), .peak_rss = @max(full.peak_rss, f.peak_rss) };
+            }
+            try results.append(.{
+                .program = program.name,
+                .variant = variant.name,
+                .sema_ns = sema.ns,
+                .total_ns = @max(full.ns, sema.ns),
+                .peak_rss = @max(sema.peak_rss, full.peak_rss),
+            });
+        }
+    }
+
+    try printResults(stdout, config, results.items);
+
+    const baseline = readBaseline(arena, config.baseline_path) catch |err| switch (err) {
+        error.FileNotFound => null,
+        else => return err,
+    };
+    if (baseline == null or config.update_baseline) {
+        try writeBaseline(config.baseline_path, results.items);
+        try stdout.print("\nBaseline written to {s}\n", .{ config.baseline_path });
+        return 0;
+    }
+
+    const regressions = try compareBaseline(stdout, config, baseline.?, results.items);
+    if (regressions > 0) {
+        try stdout.print(
+            "\n{d} regression(s) above {d:.1}% of {s}, pass --update-baseline if they are expected\n",
+            .{ regressions, config.tolerance_percent, config.baseline_path },
+        );
+        return 1;
+    }
+    try stdout.print("\nNo regressions against {s}\n", .{ config.baseline_path });
+    return 0;
+}
+
+fn parseArgs(arena: std.mem.Allocator, args: []const []const u8) !Config {
+    var config: Config = .{};
+    var programs = std.ArrayList(Program).init(arena);
+    var variants = std.ArrayList(Variant).init(arena);
+
+    var i: usize = 1;
+    while (i < args.len) : (i += 1) {
+        const arg = args[i];
+        const rest = args[i + 1 ..];
+        if (std.mem.eql(u8, arg, "--update-baseline")) {
+            config.update_baseline = true;
+        } else if (std.mem.eql(u8, arg, "--program")) {
+            if (rest.len < 2) return error.MissingArgument;
+            try programs.append(.{ .name = rest[0], .path = rest[1] });
+            i += 2;
+        } else if (std.mem.eql(u8, arg, "--variant")) {
+            if (rest.len < 3) return error.MissingArgument;
+            try variants.append(.{ .name = rest[0], .bindings = rest[1], .options = rest[2] });
+            i += 3;
+        } else {
+            if (rest.len < 1) return error.MissingArgument;
+            const value = rest[0];
+            i += 1;
+            if (std.mem.eql(u8, arg, "--zig")) {
+                config.zig_exe = value;
+            } else if (std.mem.eql(u8, arg, "--work-dir")) {
+                config.work_dir = value;
+            } else if (std.mem.eql(u8, arg, "--baseline")) {
+                config.baseline_path = value;
+            } else if (std.mem.eql(u8, arg, "--repeat")) {
+                config.repeat = @max(1, try std.fmt.parseInt(u32, value, 10));
+            } else if (std.mem.eql(u8, arg, "--tolerance")) {
+                config.tolerance_percent = try std.fmt.parseFloat(f64, value);
+            } else {
+                std.log.err("unknown argument: {s}", .{ arg });
+                return error.InvalidArgument;
+            }
+        }
+    }
+
+    if (config.work_dir.len == 0 or config.baseline_path.len == 0) return error.MissingArgument;
+    if (programs.items.len == 0 or variants.items.len == 0) return error.MissingArgument;
+    config.programs = programs.items;
+    config.variants = variants.items;
+    return config;
+}
+
+/// Compile `program` against `variant` once, with a fresh local cache.
+fn measure(arena: std.mem.Allocator, config: Config, program: Program, variant: Variant, mode: Mode) !Sample {
+    const cache_dir = try std.fs.path.join(arena, &.{ config.work_dir, "cache" });
+    const global_cache_dir = try std.fs.path.join(arena, &.{ config.work_dir, "global-cache" });
+    try std.fs.cwd().deleteTree(cache_dir);
+    defer std.fs.cwd().deleteTree(cache_dir) catch {};
+
+    const emit_bin = switch (mode) {
+        .sema => "-fno-emit-bin",
+        .full => try std.fmt.allocPrint(arena, "-femit-bin={s}", .{
+            try std.fs.path.join(arena, &.{ config.work_dir, "bench.o" }),
+        }),
+    };
+    const argv = [_][]const u8{
+        config.zig_exe,
+        "build-obj",
+        "-ODebug",
+        emit_bin,
+        "--cache-dir",
+        cache_dir,
+        "--global-cache-dir",
+        global_cache_dir,
+        "--name",
+        "bench",
+        "--dep",
+        "Zig-ImGui",
+        try std.fmt.allocPrint(arena, "-Mroot={s}", .{ program.path }),
+        "--dep",
+        "build_options",
+        try std.fmt.allocPrint(arena, "-MZig-ImGui={s}", .{ variant.bindings }),
+        try std.fmt.allocPrint(arena, "-Mbuild_options={s}", .{ variant.options }),
+    };
+
+    var child = std.process.Child.init(&argv, arena);
+    child.stdin_behavior = .Ignore;
+    child.stdout_behavior = .Ignore;
+    child.stderr_behavior = .Inherit;
+    child.request_resource_usage_statistics = true;
+
+    var timer = try std.time.Timer.start();
+    const term = try child.spawnAndWait();
+    const ns = timer.read();
+
+    switch (term) {
+        .Exited => |code| if (code != 0) {
+            std.log.err("compiling {s} against {s} failed", .{ program.name, variant.name });
+            return error.CompileFailed;
+        },
+        else => return error.CompileFailed,
+    }
+    return .{
+        .ns = ns,
+        .peak_rss = child.resource_usage_statistics.getMaxRss() orelse 0,
+    };
+}
+
+fn printResults(writer: anytype, config: Config, results: []const Result) !void {
+    try writer.print("{s:<12} {s:<16} {s:>10} {s:>10} {s:>10} {s:>12}\n", .{
+        "program", "variant", "sema", "codegen", "total", "peak RSS",
+    });
+    for (results, 0..) |result, i| {
+        try writer.print("{s:<12} {s:<16} {d:>8.3} s {d:>8.3} s {d:>8.3} s {d:>8.1} MiB", .{
+            result.program,
+            result.variant,
+            seconds(result.sema_ns),
+            seconds(result.total_ns - result.sema_ns),
+            seconds(result.total_ns),
+            mebibytes(result.peak_rss),
+        });
+        // Variants are compared to the first one, for the same program
+        const reference = results[i - i % config.variants.len];
+        if (i % config.variants.len != 0) {
+            try writer.print("  ({} time, {} RSS vs {s})", .{
+                Percent{ .value = percentChange(reference.total_ns, result.total_ns) },
+                Percent{ .value = percentChange(reference.peak_rss, result.peak_rss) },
+                reference.variant,
+            });
+        }
+        try writer.writeByte('\n');
+    }
+}
+
+/// Print every result that is worse than the baseline by more than the
+/// tolerance, and return how many there were.
+fn compareBaseline(writer: anytype, config: Config, baseline: Baseline, results: []const Result) !usize {
+    var regressions: usize = 0;
+    for (results) |result| {
+        const previous = for (baseline.results) |entry| {
+            if (std.mem.eql(u8, entry.program, result.program) and
+                std.mem.eql(u8, entry.variant, result.variant)) break entry;
+        } else continue;
+
+        const time_change = percentChange(previous.total_ns, result.total_ns);
+        const rss_change = percentChange(previous.peak_rss, result.peak_rss);
+        if (time_change > config.tolerance_percent or rss_change > config.tolerance_percent) {
+            regressions += 1;
+            try writer.print("REGRESSION {s}/{s}: {} time, {} RSS\n", .{
+                result.program,
+                result.variant,
+                Percent{ .value = time_change },
+                Percent{ .value = rss_change },
+            });
+        }
+    }
+    return regressions;
+}
+
+fn readBaseline(arena: std.mem.Allocator, path: []const u8) !?Baseline {
+    const data = try std.fs.cwd().readFileAlloc(arena, path, 1024 * 1024);
+    return try std.json.parseFromSliceLeaky(Baseline, arena, data, .{ .ignore_unknown_fields = true });
+}
+
+fn writeBaseline(path: []const u8, results: []const Result) !void {
+    if (std.fs.path.dirname(path)) |dir| try std.fs.cwd().makePath(dir);
+    var atomic_file = try std.fs.cwd().atomicFile(path, .{});
+    defer atomic_file.deinit();
+    try std.json.stringify(Baseline{ .results = results }, .{ .whitespace = .indent_2 }, atomic_file.file.writer());
+    try atomic_file.finish();
+}
+
+fn seconds(ns: u64) f64 {
+    return @as(f64, @floatFromInt(ns)) / std.time.ns_per_s;
+}
+
+fn mebibytes(bytes: u64) f64 {
+    return @as(f64, @floatFromInt(bytes)) / (1024 * 1024);
+}
+
+/// Formats a signed percentage, e.g. +12.5%
+const Percent = struct {
+    value: f64,
+
+    pub fn format(self: Percent, comptime _: []const u8, _: std.fmt.FormatOptions, writer: anytype) !void {
+        if (self.value >= 0) try writer.writeByte('+');
+        try writer.print("{d:.1}%", .{ self.value });
+    }
+};
+
+fn percentChange(before: u64, after: u64) f64 {
+    if (before == 0) return 0;
+    const b: f64 = @floatFromInt(before);
+    const a: f64 = @floatFromInt(after);
+    return (a - b) / b * 100;
+}
@@ -0,0 +1,12 @@
+//! Compile benchmark consumer: every public declaration of the bindings, like
+//! the "Compile everything" test. See compile_bench.zig.
+
+const ig = @import("Zig-ImGui");
+
+// std.testing.refAllDecls only works in test builds
+comptime {
+    @setEvalBranchQuota(100000);
+    for (@typeInfo(ig).Struct.decls) |decl| {
+        _ = &@field(ig, decl.name);
+    }
+}
@@ -0,0 +1,16 @@
+//! Compile benchmark consumer: the smallest useful program, one window with
+//! a line of text. See compile_bench.zig.
+
+const ig = @import("Zig-ImGui");
+
+export fn bench_minimal() void {
+    const context = ig.CreateContext();
+    defer ig.DestroyContextExt(context);
+
+    ig.NewFrame();
+    if (ig.Begin("Hello")) {
+        ig.Text("Hello, world!");
+    }
+    ig.End();
+    ig.Render();
+}
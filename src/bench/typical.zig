@@ -0,0 +1,93 @@
+//! Compile benchmark consumer: the kind of tool window most applications
+//! have, with menus, common widgets, a table, a tree and some custom
+//! drawing. See compile_bench.zig.
+
+const ig = @import("Zig-ImGui");
+
+const State = struct {
+    enabled: bool = true,
+    speed: f32 = 1,
+    color: [3]f32 = .{ 1, 0.5, 0 },
+    name: [64]u8 = [_]u8{0} ** 64,
+    selected: usize = 0,
+    history: [32]f32 = [_]f32{0} ** 32,
+};
+
+const modes = [_][*:0]const u8{ "Fast", "Balanced", "Quality" };
+
+export fn bench_typical() void {
+    const context = ig.CreateContext();
+    defer ig.DestroyContextExt(context);
+
+    const io = ig.GetIO();
+    io.DisplaySize = ig.Vec2.init(1280, 720);
+    io.DeltaTime = 1.0 / 60.0;
+
+    var state: State = .{};
+    ig.NewFrame();
+    buildUi(&state);
+    ig.Render();
+}
+
+fn buildUi(state: *State) void {
+    ig.SetNextWindowSize(ig.Vec2.init(400, 600));
+    defer ig.End();
+    if (!ig.Begin("Settings")) return;
+
+    if (ig.BeginMenuBar()) {
+        if (ig.BeginMenu("File")) {
+            _ = ig.MenuItem_Bool("Open");
+            _ = ig.MenuItem_Bool("Save");
+            ig.EndMenu();
+        }
+        ig.EndMenuBar();
+    }
+
+    _ = ig.Checkbox("Enabled", &state.enabled);
+    ig.SameLine();
+    if (ig.Button("Reset")) state.* = .{};
+    _ = ig.SliderFloat("Speed", &state.speed, 0, 10);
+    _ = ig.ColorEdit3("Color", &state.color);
+    _ = ig.InputText("Name", &state.name, state.name.len);
+
+    if (ig.BeginCombo("Mode", modes[state.selected])) {
+        for (modes, 0..) |mode, i| {
+            if (ig.Selectable_Bool(mode)) state.selected = i;
+        }
+        ig.EndCombo();
+    }
+
+    ig.PlotLines_FloatPtr("History", &state.history[0], state.history.len);
+    ig.Separator();
+
+    if (ig.BeginTable("Items", 3)) {
+        ig.TableSetupColumn("Name");
+        ig.TableSetupColumn("Size");
+        ig.TableSetupColumn("Kind");
+        ig.TableHeadersRow();
+        for (0..10) |row| {
+            ig.PushID_Int(@intCast(row));
+            defer ig.PopID();
+            ig.TableNextRow();
+            _ = ig.TableNextColumn();
+            ig.Text("Item %d", @as(c_int, @intCast(row)));
+            _ = ig.TableNextColumn();
+            ig.Text("%d KiB", @as(c_int, @intCast(row * 4)));
+            _ = ig.TableNextColumn();
+            _ = ig.Selectable_Bool("File");
+        }
+        ig.EndTable();
+    }
+
+    if (ig.TreeNode_Str("Details")) {
+        ig.Text("Speed: %.2f", @as(f64, state.speed));
+        ig.TreePop();
+    }
+
+    if (ig.GetWindowDrawList()) |draw_list| {
+        const origin = ig.GetCursorScreenPos();
+        const color = ig.GetColorU32_Vec4(ig.Vec4.init(state.color[0], state.color[1], state.color[2], 1));
+        draw_list.AddRectFilled(origin, origin.add(ig.Vec2.init(100, 20)), color);
+        draw_list.AddLine(origin, origin.add(ig.Vec2.init(100, 0)), color);
+    }
+}
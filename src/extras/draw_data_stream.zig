@@ -0,0 +1,367 @@
+//! A compact binary format for sending DrawData to another process.
+//!
+//! Each frame is written as a small header followed by a deflate compressed
+//! payload. The payload holds the vertex, index and command buffers of every
+//! draw list, XORed with the same buffers of the previous frame, so parts of
+//! the UI that did not change encode to runs of zeroes and compress to almost
+//! nothing. The decoder keeps the previous frame around as well, so frames
+//! must be decoded in the order they were encoded, from a reliable stream.
+//!
+//! Texture ids and clip rects are sent as they are, the viewer is responsible
+//! for mapping texture ids to its own textures. Draw callbacks cannot cross a
+//! process boundary and are dropped. Both ends must agree on endianness and
+//! on the size of DrawIdx, which is checked when decoding.
+
+const std = @import("std");
+const builtin = @import("builtin");
+const ig = @import("Zig-ImGui");
+
+pub const Error = error{
+    /// The stream does not contain a well-formed frame.
+    InvalidFrame,
+    /// The frame was written with a different endianness or DrawIdx size.
+    IncompatibleFormat,
+};
+
+const magic = [4]u8{ 'I', 'G', 'D', 'D' };
+const format_version: u8 = 1;
+/// Upper bound for frame sizes accepted by the decoder.
+const max_frame_size = 1 << 30;
+
+const flag_keyframe: u8 = 1 << 0;
+const flag_big_endian: u8 = 1 << 1;
+const flag_idx32: u8 = 1 << 2;
+const format_flags: u8 = (if (builtin.cpu.arch.endian() == .big) flag_big_endian else 0) |
+    (if (@sizeOf(ig.DrawIdx) == 4) flag_idx32 else 0);
+
+/// magic, version, flags, two reserved bytes, payload length, compressed length
+const wire_header_size = 4 + 1 + 1 + 2 + 4 + 4;
+
+/// A DrawCmd as it is sent over the wire, without the callback pointers.
+const CmdRecord = extern struct {
+    clip_rect: [4]f32,
+    texture_id: u64,
+    vtx_offset: u32,
+    idx_offset: u32,
+    elem_count: u32,
+    reserved: u32 = 0,
+};
+
+/// Buffers of one draw list as last sent, used as the base for the next delta.
+const ListBytes = struct {
+    vtx: std.ArrayListUnmanaged(u8) = .{},
+    idx: std.ArrayListUnmanaged(u8) = .{},
+    cmd: std.ArrayListUnmanaged(u8) = .{},
+
+    fn deinit(self: *ListBytes, allocator: std.mem.Allocator) void {
+        self.vtx.deinit(allocator);
+        self.idx.deinit(allocator);
+        self.cmd.deinit(allocator);
+    }
+};
+
+pub const DrawDataEncoder = struct {
+    allocator: std.mem.Allocator,
+    previous: std.ArrayListUnmanaged(ListBytes) = .{},
+    has_previous: bool = false,
+    cmd_scratch: std.ArrayListUnmanaged(CmdRecord) = .{},
+    payload: std.ArrayListUnmanaged(u8) = .{},
+    compressed: std.ArrayListUnmanaged(u8) = .{},
+
+    const Self = @This();
+
+    pub fn init(allocator: std.mem.Allocator) Self {
+        return .{ .allocator = allocator };
+    }
+
+    pub fn deinit(self: *Self) void {
+        for (self.previous.items) |*list| list.deinit(self.allocator);
+        self.previous.deinit(self.allocator);
+        self.cmd_scratch.deinit(self.allocator);
+        self.payload.deinit(self.allocator);
+        self.compressed.deinit(self.allocator);
+        self.* = undefined;
+    }
+
+    /// Make the next frame a keyframe, which does not depend on earlier
+    /// frames. Use this when a new viewer connects.
+    pub fn reset(self: *Self) void {
+        self.has_previous = false;
+    }
+
+    /// Encode `draw_data` and write it to `writer`. Returns the number of
+    /// bytes written.
+    pub fn writeFrame(self: *Self, writer: anytype, draw_data: *const ig.DrawData) !usize {
+        const keyframe = !self.has_previous;
+        const lists = draw_data.CmdLists.items();
+
+        self.payload.clearRetainingCapacity();
+        try self.appendInt(u32, @intCast(lists.len));
+        for ([_]ig.Vec2{ draw_data.DisplayPos, draw_data.DisplaySize, draw_data.FramebufferScale }) |v| {
+            try self.appendInt(u32, @bitCast(v.x));
+            try self.appendInt(u32, @bitCast(v.y));
+        }
+
+        while (self.previous.items.len < lists.len) {
+            try self.previous.append(self.allocator, .{});
+        }
+        if (keyframe) {
+            for (self.previous.items) |*previous| {
+                previous.vtx.clearRetainingCapacity();
+                previous.idx.clearRetainingCapacity();
+                previous.cmd.clearRetainingCapacity();
+            }
+        }
+        for (lists, self.previous.items[0..lists.len]) |maybe_list, *previous| {
+            self.cmd_scratch.clearRetainingCapacity();
+            var vtx: []const ig.DrawVert = &.{};
+            var idx: []const ig.DrawIdx = &.{};
+            if (maybe_list) |list| {
+                vtx = list.VtxBuffer.items();
+                idx = list.IdxBuffer.items();
+                for (list.CmdBuffer.items()) |cmd| {
+                    if (cmd.UserCallback != null) continue;
+                    try self.cmd_scratch.append(self.allocator, .{
+                        .clip_rect = .{ cmd.ClipRect.x, cmd.ClipRect.y, cmd.ClipRect.z, cmd.ClipRect.w },
+                        .texture_id = @intFromEnum(cmd.TextureId),
+                        .vtx_offset = cmd.VtxOffset,
+                        .idx_offset = cmd.IdxOffset,
+                        .elem_count = cmd.ElemCount,
+                    });
+                }
+            }
+
+            try self.appendInt(u32, @intCast(vtx.len));
+            try self.appendInt(u32, @intCast(idx.len));
+            try self.appendInt(u32, @intCast(self.cmd_scratch.items.len));
+            try self.appendDelta(&previous.vtx, std.mem.sliceAsBytes(vtx));
+            try self.appendDelta(&previous.idx, std.mem.sliceAsBytes(idx));
+            try self.appendDelta(&previous.cmd, std.mem.sliceAsBytes(self.cmd_scratch.items));
+        }
+
+        self.compressed.clearRetainingCapacity();
+        var payload_stream = std.io.fixedBufferStream(self.payload.items);
+        try std.compress.flate.compress(payload_stream.reader(), self.compressed.writer(self.allocator), .{});
+
+        var header: [wire_header_size]u8 = undefined;
+        header[0..4].* = magic;
+        header[4] = format_version;
+        header[5] = format_flags | (if (keyframe) flag_keyframe else 0);
+        header[6..8].* = .{ 0, 0 };
+        std.mem.writeInt(u32, header[8..12], @intCast(self.payload.items.len), .little);
+        std.mem.writeInt(u32, header[12..16], @intCast(self.compressed.items.len), .little);
+        try writer.writeAll(&header);
+        try writer.writeAll(self.compressed.items);
+
+        self.has_previous = true;
+        return header.len + self.compressed.items.len;
+    }
+
+    fn appendInt(self: *Self, comptime T: type, value: T) !void {
+        var bytes: [@sizeOf(T)]u8 = undefined;
+        std.mem.writeInt(T, &bytes, value, .little);
+        try self.payload.appendSlice(self.allocator, &bytes);
+    }
+
+    /// Append `current` XORed with `previous`, then make it the new previous.
+    fn appendDelta(self: *Self, previous: *std.ArrayListUnmanaged(u8), current: []const u8) !void {
+        const common = @min(previous.items.len, current.len);
+        const out = try self.payload.addManyAsSlice(self.allocator, current.len);
+        for (out[0..common], previous.items[0..common], current[0..common]) |*o, p, c| o.* = p ^ c;
+        @memcpy(out[common..], current[common..]);
+        previous.clearRetainingCapacity();
+        try previous.appendSlice(self.allocator, current);
+    }
+};
+
+pub const DrawDataDecoder = struct {
+    allocator: std.mem.Allocator,
+    /// Draw lists reconstructed so far. They persist between frames, since
+    /// each frame is decoded relative to the previous one.
+    lists: std.ArrayListUnmanaged(DecodedList) = .{},
+    /// The last decoded frame, pointing into `lists`.
+    draw_data: ig.DrawData,
+    payload: std.ArrayListUnmanaged(u8) = .{},
+    compressed: std.ArrayListUnmanaged(u8) = .{},
+
+    const DecodedList = struct {
+        draw_list: *ig.DrawList,
+        cmd: std.ArrayListUnmanaged(u8) = .{},
+    };
+
+    const Self = @This();
+
+    pub fn init(allocator: std.mem.Allocator) Self {
+        return .{
+            .allocator = allocator,
+            .draw_data = .{
+                .Valid = false,
+                .CmdListsCount = 0,
+                .TotalIdxCount = 0,
+                .TotalVtxCount = 0,
+                .CmdLists = .{},
+                .DisplayPos = ig.Vec2.init(0, 0),
+                .DisplaySize = ig.Vec2.init(0, 0),
+                .FramebufferScale = ig.Vec2.init(1, 1),
+                .OwnerViewport = null,
+            },
+        };
+    }
+
+    pub fn deinit(self: *Self) void {
+        for (self.lists.items) |*list| {
+            list.draw_list.deinit();
+            list.cmd.deinit(self.allocator);
+        }
+        self.lists.deinit(self.allocator);
+        self.draw_data.CmdLists.deinit();
+        self.payload.deinit(self.allocator);
+        self.compressed.deinit(self.allocator);
+        self.* = undefined;
+    }
+
+    /// Read and decode the next frame from `reader`. The returned DrawData is
+    /// owned by the decoder, and stays valid until the next call.
+    /// Returns error.EndOfStream if the stream ends before a frame starts, and
+    /// Error.InvalidFrame for malformed frames, including ones with indices
+    /// outside of their draw list's vertices.
+    pub fn readFrame(self: *Self, reader: anytype) !*ig.DrawData {
+        var header: [wire_header_size]u8 = undefined;
+        try reader.readNoEof(&header);
+        // The lists may be half updated, the frame must not be rendered.
+        errdefer self.draw_data.Valid = false;
+        if (!std.mem.eql(u8, header[0..4], &magic) or header[4] != format_version) return Error.InvalidFrame;
+        const flags = header[5];
+        if ((flags & (flag_big_endian | flag_idx32)) != format_flags) return Error.IncompatibleFormat;
+        const payload_len = std.mem.readInt(u32, header[8..12], .little);
+        const compressed_len = std.mem.readInt(u32, header[12..16], .little);
+        if (payload_len > max_frame_size or compressed_len > max_frame_size) return Error.InvalidFrame;
+
+        try self.compressed.resize(self.allocator, compressed_len);
+        reader.readNoEof(self.compressed.items) catch |err| switch (err) {
+            error.EndOfStream => return Error.InvalidFrame,
+            else => |e| return e,
+        };
+        // Decompress into exactly the announced size, so that a frame which
+        // inflates to more than its header says fails instead of growing
+        // the buffer without bounds.
+        try self.payload.resize(self.allocator, payload_len);
+        var compressed_stream = std.io.fixedBufferStream(self.compressed.items);
+        var payload_stream = std.io.fixedBufferStream(self.payload.items);
+        std.compress.flate.decompress(compressed_stream.reader(), payload_stream.writer()) catch return Error.InvalidFrame;
+        if (payload_stream.pos != payload_len) return Error.InvalidFrame;
+
+        var payload = Cursor{ .bytes = self.payload.items };
+        const list_count = try payload.int(u32);
+        var vectors: [3]ig.Vec2 = undefined;
+        for (&vectors) |*v| {
+            v.x = @bitCast(try payload.int(u32));
+            v.y = @bitCast(try payload.int(u32));
+        }
+
+        // Every list takes at least its three counts in the payload.
+        if (list_count > payload.remaining() / 12) return Error.InvalidFrame;
+        try self.lists.ensureTotalCapacity(self.allocator, list_count);
+        while (self.lists.items.len < list_count) {
+            self.lists.appendAssumeCapacity(.{ .draw_list = ig.DrawList.init_ImDrawList(null) });
+        }
+
+        if ((flags & flag_keyframe) != 0) {
+            for (self.lists.items) |*list| {
+                list.draw_list.VtxBuffer.Size = 0;
+                list.draw_list.IdxBuffer.Size = 0;
+                list.cmd.clearRetainingCapacity();
+            }
+        }
+
+        var total_vtx: usize = 0;
+        var total_idx: usize = 0;
+        for (self.lists.items[0..list_count]) |*list| {
+            const draw_list = list.draw_list;
+            const vtx_count = try payload.int(u32);
+            const idx_count = try payload.int(u32);
+            const cmd_count = try payload.int(u32);
+            try applyDelta(ig.DrawVert, &draw_list.VtxBuffer, try payload.take(ig.DrawVert, vtx_count));
+            try applyDelta(ig.DrawIdx, &draw_list.IdxBuffer, try payload.take(ig.DrawIdx, idx_count));
+
+            const cmd_bytes = try payload.take(CmdRecord, cmd_count);
+            const common = @min(list.cmd.items.len, cmd_bytes.len);
+            try list.cmd.resize(self.allocator, cmd_bytes.len);
+            for (list.cmd.items[0..common], cmd_bytes[0..common]) |*d, s| d.* ^= s;
+            @memcpy(list.cmd.items[common..], cmd_bytes[common..]);
+
+            draw_list.CmdBuffer.resize_undefined(cmd_count);
+            const records: [*]align(1) const CmdRecord = @ptrCast(list.cmd.items.ptr);
+            for (draw_list.CmdBuffer.items(), records[0..cmd_count]) |*cmd, record| {
+                if (@as(u64, record.idx_offset) + record.elem_count > idx_count) return Error.InvalidFrame;
+                if (record.vtx_offset > vtx_count) return Error.InvalidFrame;
+                // Renderers index vertex buffers without bounds checks.
+                const indices = draw_list.IdxBuffer.items()[record.idx_offset..][0..record.elem_count];
+                for (indices) |idx| {
+                    if (@as(u64, record.vtx_offset) + idx >= vtx_count) return Error.InvalidFrame;
+                }
+                cmd.* = .{
+                    .ClipRect = .{ .x = record.clip_rect[0], .y = record.clip_rect[1], .z = record.clip_rect[2], .w = record.clip_rect[3] },
+                    .TextureId = @enumFromInt(record.texture_id),
+                    .VtxOffset = record.vtx_offset,
+                    .IdxOffset = record.idx_offset,
+                    .ElemCount = record.elem_count,
+                    .UserCallback = null,
+                    .UserCallbackData = null,
+                };
+            }
+            total_vtx += vtx_count;
+            total_idx += idx_count;
+        }
+        if (payload.remaining() != 0) return Error.InvalidFrame;
+
+        const draw_data = &self.draw_data;
+        draw_data.CmdLists.resize_undefined(list_count);
+        for (draw_data.CmdLists.items(), self.lists.items[0..list_count]) |*out, list| out.* = list.draw_list;
+        draw_data.Valid = true;
+        draw_data.CmdListsCount = @intCast(list_count);
+        draw_data.TotalVtxCount = @intCast(total_vtx);
+        draw_data.TotalIdxCount = @intCast(total_idx);
+        draw_data.DisplayPos = vectors[0];
+        draw_data.DisplaySize = vectors[1];
+        draw_data.FramebufferScale = vectors[2];
+        return draw_data;
+    }
+
+    /// Resize `vector` to hold `delta.len` bytes, XORing the bytes it already
+    /// had with `delta` and copying the rest.
+    fn applyDelta(comptime T: type, vector: *ig.Vector(T), delta: []const u8) !void {
+        const old_len = vector.Size * @sizeOf(T);
+        vector.resize_undefined(@intCast(delta.len / @sizeOf(T)));
+        const bytes = std.mem.sliceAsBytes(vector.items());
+        const common = @min(old_len, delta.len);
+        for (bytes[0..common], delta[0..common]) |*d, s| d.* ^= s;
+        @memcpy(bytes[common..], delta[common..]);
+    }
+};
+
+/// Reads values from a decompressed payload, with bounds checks.
+const Cursor = struct {
+    bytes: []const u8,
+    pos: usize = 0,
+
+    fn remaining(self: Cursor) usize {
+        return self.bytes.len - self.pos;
+    }
+
+    fn int(self: *Cursor, comptime T: type) Error!T {
+        const bytes = try self.takeBytes(@sizeOf(T));
+        return std.mem.readInt(T, bytes[0..@sizeOf(T)], .little);
+    }
+
+    /// Take the bytes of `count` values of type T.
+    fn take(self: *Cursor, comptime T: type, count: u32) Error![]const u8 {
+        return self.takeBytes(std.math.mul(usize, count, @sizeOf(T)) catch return Error.InvalidFrame);
+    }
+
+    fn takeBytes(self: *Cursor, len: usize) Error![]const u8 {
+        if (len > self.remaining()) return Error.InvalidFrame;
+        defer self.pos += len;
+        return self.bytes[self.pos..][0..len];
+    }
+};
@@ -0,0 +1,46 @@
+//! Zig-side helpers layered on top of the generated Dear ImGui bindings.
+//! These are not part of Dear ImGui itself, and live in their own module
+//! so that the generated bindings stay a plain mapping of the C API.
+
+const std = @import("std");
+
+const text_size_cache = @import("text_size_cache.zig");
+pub const TextSizeCache = text_size_cache.TextSizeCache;
+pub const CalcTextSizeCached = text_size_cache.CalcTextSizeCached;
+pub const CalcTextSizeCachedExt = text_size_cache.CalcTextSizeCachedExt;
+
+const virtual_list = @import("virtual_list.zig");
+pub const ListClipperIterator = virtual_list.ListClipperIterator;
+pub const RowHeights = virtual_list.RowHeights;
+pub const VirtualRows = virtual_list.VirtualRows;
+
+const thread_context = @import("thread_context.zig");
+pub const thread_local_context = thread_context.thread_local_context;
+pub const ScopedContext = thread_context.ScopedContext;
+pub const spawnWithContext = thread_context.spawnWithContext;
+const parallel_draw_list = @import("parallel_draw_list.zig");
+pub const ParallelDrawLists = parallel_draw_list.ParallelDrawLists;
+pub const appendDrawList = parallel_draw_list.appendDrawList;
+const frame_scheduler = @import("frame_scheduler.zig");
+pub const FrameScheduler = frame_scheduler.FrameScheduler;
+pub const hashDrawData = frame_scheduler.hashDrawData;
+const draw_data_stream = @import("draw_data_stream.zig");
+pub const DrawDataEncoder = draw_data_stream.DrawDataEncoder;
+pub const DrawDataDecoder = draw_data_stream.DrawDataDecoder;
+const texture_registry = @import("texture_registry.zig");
+pub const Texture = texture_registry.Texture;
+pub const TextureRegistry = texture_registry.TextureRegistry;
+const ini_persistence = @import("ini_persistence.zig");
+pub const IniPersistence = ini_persistence.IniPersistence;
+const input_coalescer = @import("input_coalescer.zig");
+pub const InputCoalescer = input_coalescer.InputCoalescer;
+const memory_trimmer = @import("memory_trimmer.zig");
+pub const MemoryTrimmer = memory_trimmer.MemoryTrimmer;
+pub const MemoryTrimmerConfig = memory_trimmer.Config;
+pub const HighWaterMark = memory_trimmer.HighWaterMark;
+pub const shrinkVector = memory_trimmer.shrinkVector;
+pub const trimVector = memory_trimmer.trimVector;
+
+test {
+    std.testing.refAllDecls(@This());
+}
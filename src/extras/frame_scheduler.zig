@@ -0,0 +1,157 @@
+//! Deciding when a main loop needs to build and present a new frame.
+//!
+//! An immediate mode UI normally redraws at the display rate even when
+//! nothing on screen changes. FrameScheduler lets a main loop block on events
+//! while the UI is idle, and skip GPU submission for frames whose DrawData is
+//! identical to the last one presented:
+//!
+//!     var scheduler = FrameScheduler.init(.{});
+//!     while (running) {
+//!         switch (scheduler.nextWait()) {
+//!             .poll => glfw.pollEvents(),
+//!             .timeout => |seconds| glfw.waitEventsTimeout(seconds),
+//!             .block => glfw.waitEvents(),
+//!         }
+//!         // NewFrame, build the UI, Render
+//!         if (scheduler.endFrame(ig.GetDrawData())) {
+//!             // RenderDrawData and present
+//!         }
+//!     }
+//!
+//! Both functions use the current context, and read time from ig.GetTime(),
+//! so the scheduler can be driven headlessly by setting io.DeltaTime.
+
+const std = @import("std");
+const ig = @import("Zig-ImGui");
+
+pub const FrameScheduler = struct {
+    config: Config,
+    /// Hash of the last DrawData that was submitted, null if the next frame
+    /// must be submitted regardless.
+    last_hash: ?u64 = null,
+    /// ImGui time of the last input or visible change.
+    last_activity: f64 = -std.math.inf(f64),
+    stats: Stats = .{},
+
+    pub const Config = struct {
+        /// Keep running at full rate for this many seconds after the last input
+        /// or visible change, so that hover delays, fades and other short
+        /// animations can play out.
+        settle_time: f64 = 0.5,
+        /// While idle, still run at least this many frames per second.
+        /// 0 blocks until the next event.
+        min_refresh_rate: f64 = 0,
+        /// While a text field is active and io.ConfigInputTextCursorBlink is
+        /// set, wake up at least this often so the cursor keeps blinking.
+        cursor_blink_interval: f64 = 0.1,
+    };
+
+    pub const Wait = union(enum) {
+        /// Poll events and start the next frame immediately.
+        poll,
+        /// Wait for events, for at most this many seconds.
+        timeout: f64,
+        /// Wait for events without a timeout.
+        block,
+    };
+
+    pub const Stats = struct {
+        frames: u64 = 0,
+        submitted: u64 = 0,
+        skipped: u64 = 0,
+    };
+
+    const Self = @This();
+
+    pub fn init(config: Config) Self {
+        return .{ .config = config };
+    }
+
+    /// Keep running at full rate for at least settle_time, e.g. while the
+    /// application animates something on its own.
+    pub fn keepAwake(self: *Self) void {
+        self.last_activity = ig.GetTime();
+    }
+
+    /// Force the next frame to be submitted, e.g. after the window contents
+    /// were damaged or the swapchain was recreated.
+    pub fn invalidate(self: *Self) void {
+        self.last_hash = null;
+    }
+
+    /// How the main loop should wait for events before the next frame.
+    pub fn nextWait(self: *const Self) Wait {
+        if (ig.GetTime() - self.last_activity < self.config.settle_time) return .poll;
+
+        var timeout: ?f64 = if (self.config.min_refresh_rate > 0) 1.0 / self.config.min_refresh_rate else null;
+        const io = ig.GetIO();
+        if (io.WantTextInput and io.ConfigInputTextCursorBlink) {
+            timeout = @min(timeout orelse self.config.cursor_blink_interval, self.config.cursor_blink_interval);
+        }
+        return if (timeout) |seconds| .{ .timeout = seconds } else .block;
+    }
+
+    /// Call after Render. Returns true if `draw_data` differs from the last
+    /// submitted frame and should be rendered and presented.
+    pub fn endFrame(self: *Self, draw_data: *const ig.DrawData) bool {
+        const io = ig.GetIO();
+        const hash = hashDrawData(draw_data);
+        const changed = self.last_hash == null or self.last_hash.? != hash;
+
+        // While a text field is active, the blinking cursor changes the
+        // output on its own, and must not keep the loop at full rate.
+        if (hadInput(io) or (changed and !io.WantTextInput)) {
+            self.last_activity = ig.GetTime();
+        }
+
+        self.stats.frames += 1;
+        if (changed) {
+            self.last_hash = hash;
+            self.stats.submitted += 1;
+        } else {
+            self.stats.skipped += 1;
+        }
+        return changed;
+    }
+};
+
+/// Hash everything in `draw_data` that affects what a renderer draws.
+pub fn hashDrawData(draw_data: *const ig.DrawData) u64 {
+    var hasher = std.hash.Wyhash.init(0);
+    hashValue(&hasher, draw_data.Valid);
+    hashValue(&hasher, draw_data.DisplayPos);
+    hashValue(&hasher, draw_data.DisplaySize);
+    hashValue(&hasher, draw_data.FramebufferScale);
+    for (draw_data.CmdLists.items()) |maybe_list| {
+        const list = maybe_list orelse continue;
+        hasher.update(std.mem.sliceAsBytes(list.VtxBuffer.items()));
+        hasher.update(std.mem.sliceAsBytes(list.IdxBuffer.items()));
+        // DrawCmd has padding, so hash it field by field.
+        for (list.CmdBuffer.items()) |cmd| {
+            hashValue(&hasher, cmd.ClipRect);
+            hashValue(&hasher, cmd.TextureId);
+            hashValue(&hasher, [3]u32{ cmd.VtxOffset, cmd.IdxOffset, cmd.ElemCount });
+            hashValue(&hasher, cmd.UserCallback);
+            hashValue(&hasher, cmd.UserCallbackData);
+        }
+    }
+    return hasher.final();
+}
+
+fn hashValue(hasher: *std.hash.Wyhash, value: anytype) void {
+    hasher.update(std.mem.asBytes(&value));
+}
+
+/// Whether the frame that was just built received any mouse or keyboard input.
+fn hadInput(io: *const ig.IO) bool {
+    if (io.MouseDelta.x != 0 or io.MouseDelta.y != 0) return true;
+    if (io.MouseWheel != 0 or io.MouseWheelH != 0) return true;
+    for (io.MouseDown, io.MouseReleased) |down, released| {
+        if (down or released) return true;
+    }
+    for (io.KeysData) |key| {
+        // DownDurationPrev is set on the frame a key is released.
+        if (key.Down or key.DownDurationPrev >= 0) return true;
+    }
+    return false;
+}
@@ -0,0 +1,232 @@
+//! Saving ini settings without stalling the UI thread.
+//!
+//! With io.IniFilename set, ImGui writes the whole settings file from the UI
+//! thread every io.IniSavingRate seconds while something changed, which can
+//! take a long time on slow or network file systems. IniPersistence turns that
+//! off, and instead:
+//!
+//!  - loads the file once through a read-only memory mapping,
+//!  - pulls the settings with SaveIniSettingsToMemory only when ImGui sets
+//!    io.WantSaveIniSettings,
+//!  - skips them if they are identical to the last ones written, and
+//!  - otherwise hands them to a background thread, which atomically replaces
+//!    the file. Settings that arrive while a write is still in progress
+//!    replace the queued ones, so a slow disk never builds up a backlog.
+//!
+//!     var ini = try IniPersistence.init(allocator, "imgui.ini");
+//!     defer ini.deinit(); // before DestroyContext
+//!     try ini.load();
+//!     while (running) {
+//!         // NewFrame, build the UI, Render
+//!         try ini.update();
+//!     }
+
+const builtin = @import("builtin");
+const std = @import("std");
+const ig = @import("Zig-ImGui");
+
+pub const IniPersistence = struct {
+    allocator: std.mem.Allocator,
+    path: []const u8,
+    /// Started by the first write, the object must not be moved afterwards.
+    thread: ?std.Thread = null,
+
+    // Everything below is shared with the writer thread, guarded by `mutex`.
+    mutex: std.Thread.Mutex = .{},
+    /// Settings last handed to the writer, or loaded from the file.
+    snapshot: std.ArrayListUnmanaged(u8) = .{},
+    /// Cleared when a write fails, so that the same settings are queued
+    /// again on the next save instead of being taken as already written.
+    snapshot_valid: bool = false,
+    /// Signals the writer that settings were queued or it should stop.
+    wake: std.Thread.Condition = .{},
+    /// Signals waiters in flush that the writer finished a write.
+    idle: std.Thread.Condition = .{},
+    /// Settings waiting to be written, valid while has_pending is set.
+    pending: std.ArrayListUnmanaged(u8) = .{},
+    has_pending: bool = false,
+    /// Settings being written. Swapped with `pending` by the writer, so
+    /// buffers are reused and only the UI thread ever allocates.
+    writing: std.ArrayListUnmanaged(u8) = .{},
+    busy: bool = false,
+    stopping: bool = false,
+    stats: Stats = .{},
+    /// Error of the last failed write, if any.
+    last_error: ?anyerror = null,
+
+    pub const Stats = struct {
+        /// Times io.WantSaveIniSettings was set when update was called.
+        requests: u64 = 0,
+        /// Requests whose settings matched the last ones written.
+        unchanged: u64 = 0,
+        /// Settings handed to the writer.
+        queued: u64 = 0,
+        /// Queued settings replaced by newer ones before being written.
+        superseded: u64 = 0,
+        writes: u64 = 0,
+        failed_writes: u64 = 0,
+    };
+
+    const Self = @This();
+
+    /// `path` is relative to the current working directory.
+    pub fn init(allocator: std.mem.Allocator, path: []const u8) std.mem.Allocator.Error!Self {
+        return .{ .allocator = allocator, .path = try allocator.dupe(u8, path) };
+    }
+
+    /// Writes settings that changed since the last update, waits for the
+    /// writer thread to finish, and stops it. Must be called while the
+    /// context is still alive.
+    pub fn deinit(self: *Self) void {
+        self.save(false) catch |err| {
+            self.mutex.lock();
+            defer self.mutex.unlock();
+            self.last_error = err;
+        };
+        if (self.thread) |thread| {
+            self.mutex.lock();
+            self.stopping = true;
+            self.wake.signal();
+            self.mutex.unlock();
+            thread.join();
+        }
+        self.snapshot.deinit(self.allocator);
+        self.pending.deinit(self.allocator);
+        self.writing.deinit(self.allocator);
+        self.allocator.free(self.path);
+        self.* = undefined;
+    }
+
+    /// Turn off ImGui's own ini file handling for the current context, and
+    /// load the settings file if there is one. Call after CreateContext and
+    /// before the first NewFrame.
+    pub fn load(self: *Self) !void {
+        ig.GetIO().IniFilename = null;
+
+        const file = std.fs.cwd().openFile(self.path, .{}) catch |err| switch (err) {
+            error.FileNotFound => return,
+            else => return err,
+        };
+        defer file.close();
+
+        const size = try file.getEndPos();
+        if (size == 0) return;
+
+        if (comptime builtin.os.tag == .windows or builtin.os.tag == .wasi) {
+            const data = try file.readToEndAlloc(self.allocator, std.math.maxInt(usize));
+            defer self.allocator.free(data);
+            ig.LoadIniSettingsFromMemoryExt(data.ptr, data.len);
+            try self.setSnapshot(data);
+            return;
+        }
+
+        const mapped = try std.posix.mmap(null, size, std.posix.PROT.READ, .{ .TYPE = .PRIVATE }, file.handle, 0);
+        defer std.posix.munmap(mapped);
+        ig.LoadIniSettingsFromMemoryExt(mapped.ptr, mapped.len);
+        // Loading the file as is must not cause it to be written back.
+        try self.setSnapshot(mapped);
+    }
+
+    /// Call once per frame, on the thread that owns the context. Queues the
+    /// settings for writing if ImGui asked for them to be saved and they
+    /// changed.
+    pub fn update(self: *Self) !void {
+        if (!ig.GetIO().WantSaveIniSettings) return;
+        try self.save(true);
+    }
+
+    /// Block until every queued write has finished, e.g. before copying the
+    /// file elsewhere. Returns the error of the last write, if it failed.
+    pub fn flush(self: *Self) !void {
+        self.mutex.lock();
+        defer self.mutex.unlock();
+        while (self.has_pending or self.busy) self.idle.wait(&self.mutex);
+        if (self.last_error) |err| return err;
+    }
+
+    /// A copy of the counters, which the writer thread updates.
+    pub fn getStats(self: *Self) Stats {
+        self.mutex.lock();
+        defer self.mutex.unlock();
+        return self.stats;
+    }
+
+    fn save(self: *Self, requested: bool) !void {
+        var size: usize = 0;
+        // This also clears io.WantSaveIniSettings.
+        const data = (ig.SaveIniSettingsToMemoryExt(&size) orelse return)[0..size];
+
+        self.mutex.lock();
+        defer self.mutex.unlock();
+        if (requested) self.stats.requests += 1;
+        if (self.snapshot_valid and std.mem.eql(u8, data, self.snapshot.items)) {
+            if (requested) self.stats.unchanged += 1;
+            return;
+        }
+
+        if (self.thread == null) {
+            self.thread = try std.Thread.spawn(.{}, writerMain, .{ self });
+        }
+        try self.snapshot.ensureTotalCapacity(self.allocator, data.len);
+        try self.pending.ensureTotalCapacity(self.allocator, data.len);
+        self.snapshot.clearRetainingCapacity();
+        self.snapshot.appendSliceAssumeCapacity(data);
+        self.snapshot_valid = true;
+        self.pending.clearRetainingCapacity();
+        self.pending.appendSliceAssumeCapacity(data);
+
+        if (self.has_pending) self.stats.superseded += 1;
+        self.has_pending = true;
+        self.stats.queued += 1;
+        self.wake.signal();
+    }
+
+    fn setSnapshot(self: *Self, data: []const u8) !void {
+        self.mutex.lock();
+        defer self.mutex.unlock();
+        self.snapshot.clearRetainingCapacity();
+        try self.snapshot.appendSlice(self.allocator, data);
+        self.snapshot_valid = true;
+    }
+
+    fn writerMain(self: *Self) void {
+        self.mutex.lock();
+        defer self.mutex.unlock();
+        while (true) {
+            while (!self.has_pending and !self.stopping) self.wake.wait(&self.mutex);
+            if (!self.has_pending) break;
+
+            std.mem.swap(std.ArrayListUnmanaged(u8), &self.pending, &self.writing);
+            self.has_pending = false;
+            self.busy = true;
+
+            self.mutex.unlock();
+            const result = writeFile(self.path, self.writing.items);
+            self.mutex.lock();
+
+            self.busy = false;
+            if (result) {
+                self.stats.writes += 1;
+                self.last_error = null;
+                // With nothing queued, the snapshot is what was just written.
+                if (!self.has_pending) self.snapshot_valid = true;
+            } else |err| {
+                self.stats.failed_writes += 1;
+                self.last_error = err;
+                // The settings on disk are unknown now, whatever is saved next
+                // has to be written.
+                self.snapshot_valid = false;
+            }
+            self.idle.broadcast();
+        }
+    }
+};
+
+/// Replace the file at `path` with `data`, so that readers only ever see the
+/// old or the new contents.
+fn writeFile(path: []const u8, data: []const u8) !void {
+    var atomic_file = try std.fs.cwd().atomicFile(path, .{});
+    defer atomic_file.deinit();
+    try atomic_file.file.writeAll(data);
+    try atomic_file.finish();
+}
@@ -0,0 +1,195 @@
+//! Coalescing high-rate input events before they reach ImGui's input queue.
+//!
+//! High polling rate mice and pen tablets can report thousands of positions
+//! and wheel steps per second, and ImGui processes every queued event on the
+//! next NewFrame. InputCoalescer takes the same calls as IO's Add*Event
+//! functions, and forwards a minimal equivalent stream once per frame:
+//!
+//!  - consecutive mouse positions collapse into the last one,
+//!  - consecutive wheel events are summed,
+//!  - consecutive analog values of the same key collapse into the last one,
+//!    as long as the key stays down or up.
+//!
+//! Positions and wheel steps are not merged across each other, so a wheel
+//! step still applies to whatever was under the mouse when it happened.
+//!
+//! Buttons, keys, characters, focus and mouse source changes are never merged
+//! or reordered, and end a run of coalesced events, so every click still
+//! happens at the position the mouse had at that point, and wheel steps
+//! before and after a click are not mixed up.
+//!
+//! Events may be added from any thread, flush must be called on the thread
+//! that owns the context, before NewFrame.
+
+const std = @import("std");
+const ig = @import("Zig-ImGui");
+
+pub const InputCoalescer = struct {
+    allocator: std.mem.Allocator,
+    mutex: std.Thread.Mutex = .{},
+    events: std.ArrayListUnmanaged(Event) = .{},
+    /// Index of the first event that may still be merged into
+    run_start: usize = 0,
+    stats: Stats = .{},
+
+    pub const Stats = struct {
+        /// Events added to the coalescer
+        received: u64 = 0,
+        /// Events forwarded to ImGui
+        forwarded: u64 = 0,
+    };
+
+    const Event = union(enum) {
+        mouse_pos: ig.Vec2,
+        mouse_wheel: ig.Vec2,
+        mouse_button: struct { button: i32, down: bool },
+        mouse_source: ig.MouseSource,
+        key: struct { key: ig.Key, down: bool },
+        key_analog: struct { key: ig.Key, down: bool, value: f32 },
+        character: u32,
+        focus: bool,
+    };
+
+    const Self = @This();
+
+    pub fn init(allocator: std.mem.Allocator) Self {
+        return .{ .allocator = allocator };
+    }
+
+    pub fn deinit(self: *Self) void {
+        self.events.deinit(self.allocator);
+        self.* = undefined;
+    }
+
+    pub fn AddMousePosEvent(self: *Self, x: f32, y: f32) std.mem.Allocator.Error!void {
+        self.mutex.lock();
+        defer self.mutex.unlock();
+        self.stats.received += 1;
+        if (self.lastInRun(.mouse_pos, .mouse_wheel)) |event| {
+            event.mouse_pos = ig.Vec2.init(x, y);
+            return;
+        }
+        try self.events.append(self.allocator, .{ .mouse_pos = ig.Vec2.init(x, y) });
+    }
+
+    pub fn AddMouseWheelEvent(self: *Self, wheel_x: f32, wheel_y: f32) std.mem.Allocator.Error!void {
+        self.mutex.lock();
+        defer self.mutex.unlock();
+        self.stats.received += 1;
+        if (self.lastInRun(.mouse_wheel, .mouse_pos)) |event| {
+            event.mouse_wheel = event.mouse_wheel.add(ig.Vec2.init(wheel_x, wheel_y));
+            return;
+        }
+        try self.events.append(self.allocator, .{ .mouse_wheel = ig.Vec2.init(wheel_x, wheel_y) });
+    }
+
+    pub fn AddKeyAnalogEvent(self: *Self, key: ig.Key, down: bool, value: f32) std.mem.Allocator.Error!void {
+        self.mutex.lock();
+        defer self.mutex.unlock();
+        self.stats.received += 1;
+        var i = self.events.items.len;
+        while (i > self.run_start) {
+            i -= 1;
+            const event = &self.events.items[i];
+            if (event.* != .key_analog or event.key_analog.key != key) continue;
+            if (event.key_analog.down == down) {
+                event.key_analog.value = value;
+                return;
+            }
+            // A change of the down state must reach ImGui as it happened,
+            // and starts a new run, so nothing before it is merged into
+            // events after it.
+            try self.events.append(self.allocator, .{ .key_analog = .{ .key = key, .down = down, .value = value } });
+            self.run_start = self.events.items.len - 1;
+            return;
+        }
+        try self.events.append(self.allocator, .{ .key_analog = .{ .key = key, .down = down, .value = value } });
+    }
+
+    pub fn AddMouseButtonEvent(self: *Self, button: i32, down: bool) std.mem.Allocator.Error!void {
+        try self.addOrdered(.{ .mouse_button = .{ .button = button, .down = down } });
+    }
+
+    pub fn AddMouseSourceEvent(self: *Self, source: ig.MouseSource) std.mem.Allocator.Error!void {
+        try self.addOrdered(.{ .mouse_source = source });
+    }
+
+    pub fn AddKeyEvent(self: *Self, key: ig.Key, down: bool) std.mem.Allocator.Error!void {
+        try self.addOrdered(.{ .key = .{ .key = key, .down = down } });
+    }
+
+    pub fn AddInputCharacter(self: *Self, c: u32) std.mem.Allocator.Error!void {
+        try self.addOrdered(.{ .character = c });
+    }
+
+    /// Invalid UTF-8 sequences are replaced by U+FFFD, like ImGui does.
+    pub fn AddInputCharactersUTF8(self: *Self, str: []const u8) std.mem.Allocator.Error!void {
+        var i: usize = 0;
+        while (i < str.len) {
+            const len = std.unicode.utf8ByteSequenceLength(str[i]) catch 1;
+            const c = if (i + len <= str.len)
+                std.unicode.utf8Decode(str[i..][0..len]) catch std.unicode.replacement_character
+            else
+                std.unicode.replacement_character;
+            try self.AddInputCharacter(c);
+            i += @min(len, str.len - i);
+        }
+    }
+
+    pub fn AddFocusEvent(self: *Self, focused: bool) std.mem.Allocator.Error!void {
+        try self.addOrdered(.{ .focus = focused });
+    }
+
+    /// Forward every coalesced event to `io`, in order. Call once per frame,
+    /// before NewFrame.
+    pub fn flush(self: *Self, io: *ig.IO) void {
+        self.mutex.lock();
+        defer self.mutex.unlock();
+        for (self.events.items) |event| {
+            switch (event) {
+                .mouse_pos => |pos| io.AddMousePosEvent(pos.x, pos.y),
+                .mouse_wheel => |wheel| io.AddMouseWheelEvent(wheel.x, wheel.y),
+                .mouse_button => |e| io.AddMouseButtonEvent(e.button, e.down),
+                .mouse_source => |source| io.AddMouseSourceEvent(source),
+                .key => |e| io.AddKeyEvent(e.key, e.down),
+                .key_analog => |e| io.AddKeyAnalogEvent(e.key, e.down, e.value),
+                .character => |c| io.AddInputCharacter(c),
+                .focus => |focused| io.AddFocusEvent(focused),
+            }
+        }
+        self.stats.forwarded += self.events.items.len;
+        self.events.clearRetainingCapacity();
+        self.run_start = 0;
+    }
+
+    /// A copy of the counters, which other threads may be updating.
+    pub fn getStats(self: *Self) Stats {
+        self.mutex.lock();
+        defer self.mutex.unlock();
+        return self.stats;
+    }
+
+    /// The newest event of the current run with tag `merge_into`, unless an
+    /// event with tag `barrier` follows it. Wheel steps are applied at the
+    /// mouse position they happened at, so positions and wheel steps are
+    /// never merged across each other.
+    fn lastInRun(self: *Self, merge_into: std.meta.Tag(Event), barrier: std.meta.Tag(Event)) ?*Event {
+        var i = self.events.items.len;
+        while (i > self.run_start) {
+            i -= 1;
+            const event = &self.events.items[i];
+            const tag = std.meta.activeTag(event.*);
+            if (tag == merge_into) return event;
+            if (tag == barrier) return null;
+        }
+        return null;
+    }
+
+    fn addOrdered(self: *Self, event: Event) std.mem.Allocator.Error!void {
+        self.mutex.lock();
+        defer self.mutex.unlock();
+        self.stats.received += 1;
+        try self.events.append(self.allocator, event);
+        self.run_start = self.events.items.len;
+    }
+};
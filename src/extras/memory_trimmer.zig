@@ -0,0 +1,223 @@
+//! Giving back memory that draw lists no longer need.
+//!
+//! ImGui's vectors only ever grow: one frame with a large table or a long log
+//! window leaves every draw list it touched at that size until the window is
+//! hidden for io.ConfigMemoryCompactTimer seconds, which never happens to a
+//! window that stays visible. MemoryTrimmer follows the size of each draw
+//! list's vertex, index and command buffers over a sliding window of frames,
+//! and reallocates the ones whose capacity stays well above anything they
+//! needed in that time:
+//!
+//!  - a buffer is only trimmed once it has been watched for a full window, is
+//!    at least `min_bytes` large, and its capacity is more than `slack` times
+//!    the largest size it had over the last one to two windows,
+//!  - it is then shrunk to that largest size, so a UI that regularly peaks
+//!    does not reallocate every time it does,
+//!  - channels left behind by ChannelsSplit are freed once per window through
+//!    DrawListSplitter.ClearFreeMemory, while the list is not split,
+//!  - the same goes for the splitters that tables and legacy columns keep in
+//!    the context, and ImGui's other transient buffers are compacted through
+//!    its own GC entry points, once per window of frames.
+//!
+//! Splitters are freed whole rather than shrunk, so tables drawn every frame
+//! allocate their channels again once per window. Other memory held by
+//! tables, windows and the context is left to ImGui's compaction of windows
+//! and tables that have not been used for io.ConfigMemoryCompactTimer
+//! seconds.
+//!
+//!     var trimmer = MemoryTrimmer.init(allocator, .{});
+//!     defer trimmer.deinit();
+//!     while (running) {
+//!         // NewFrame, build the UI, Render, render the draw data
+//!         _ = try trimmer.endFrame(ig.GetDrawData().?);
+//!     }
+
+const std = @import("std");
+const ig = @import("Zig-ImGui");
+
+// src/vendor/zig_imgui_memory_trimmer.cpp
+extern fn ZigImGui_TrimTransientBuffers(min_bytes: usize, out_cleared: *c_uint) callconv(.C) usize;
+
+pub const Config = struct {
+    /// Frames a buffer is watched for before it may be trimmed, and how far
+    /// back its largest size is remembered.
+    window_frames: u32 = 300,
+    /// How many times larger than needed a buffer may stay.
+    slack: f32 = 2,
+    /// Buffers smaller than this are never trimmed.
+    min_bytes: usize = 64 * 1024,
+};
+
+/// Largest size seen over the last one to two windows of frames, kept as the
+/// maximum of the current window and the one before it.
+pub const HighWaterMark = struct {
+    current: u32 = 0,
+    previous: u32 = 0,
+    /// Frames observed in the current window
+    frames: u32 = 0,
+    /// Set once a full window was observed
+    filled: bool = false,
+
+    pub fn observe(self: *HighWaterMark, size: u32, window_frames: u32) void {
+        if (self.frames >= window_frames) {
+            self.previous = self.current;
+            self.current = 0;
+            self.frames = 0;
+            self.filled = true;
+        }
+        self.current = @max(self.current, size);
+        self.frames += 1;
+    }
+
+    pub fn peak(self: HighWaterMark) u32 {
+        return @max(self.current, self.previous);
+    }
+};
+
+/// Reallocate `vector` to hold `capacity` items, or its current size if that
+/// is larger, copying the items it holds. Vector.reserve only ever grows, this
+/// is its counterpart. Returns the number of bytes given back, 0 if the vector
+/// already was that small or the new buffer could not be allocated.
+pub fn shrinkVector(comptime T: type, vector: *ig.Vector(T), capacity: u32) usize {
+    const new_capacity = @max(capacity, vector.Size);
+    if (new_capacity >= vector.Capacity) return 0;
+    const old_data = vector.Data orelse return 0;
+
+    if (new_capacity == 0) {
+        vector.Data = null;
+    } else {
+        const new_data: [*]T = @ptrCast(@alignCast(ig.MemAlloc(new_capacity * @sizeOf(T)) orelse return 0));
+        @memcpy(new_data[0..vector.Size], old_data[0..vector.Size]);
+        vector.Data = new_data;
+    }
+    ig.MemFree(@ptrCast(old_data));
+
+    const reclaimed = @as(usize, vector.Capacity - new_capacity) * @sizeOf(T);
+    vector.Capacity = new_capacity;
+    return reclaimed;
+}
+
+/// Record the size of `vector` in `mark`, and shrink it if it stayed larger
+/// than needed, as described at the top of this file. Returns the number of
+/// bytes given back.
+pub fn trimVector(comptime T: type, vector: *ig.Vector(T), mark: *HighWaterMark, config: Config) usize {
+    mark.observe(vector.Size, config.window_frames);
+    if (!mark.filled) return 0;
+    if (@as(usize, vector.Capacity) * @sizeOf(T) < config.min_bytes) return 0;
+    const peak = mark.peak();
+    if (@as(f32, @floatFromInt(vector.Capacity)) <= @as(f32, @floatFromInt(peak)) * config.slack) return 0;
+    return shrinkVector(T, vector, peak);
+}
+
+pub const MemoryTrimmer = struct {
+    allocator: std.mem.Allocator,
+    config: Config,
+    lists: std.AutoArrayHashMapUnmanaged(*ig.DrawList, Marks) = .{},
+    cmd_lists: HighWaterMark = .{},
+    frame: u64 = 0,
+    stats: Stats = .{},
+
+    pub const Stats = struct {
+        /// Buffers reallocated to a smaller size
+        trims: u64 = 0,
+        /// Draw list, table and column splitters whose channels were freed
+        splitter_clears: u64 = 0,
+        /// Bytes given back to ImGui's allocator, in total
+        reclaimed_bytes: u64 = 0,
+    };
+
+    const Marks = struct {
+        vtx: HighWaterMark = .{},
+        idx: HighWaterMark = .{},
+        cmd: HighWaterMark = .{},
+        last_seen: u64 = 0,
+    };
+
+    const Self = @This();
+
+    pub fn init(allocator: std.mem.Allocator, config: Config) Self {
+        std.debug.assert(config.window_frames > 0);
+        return .{ .allocator = allocator, .config = config };
+    }
+
+    pub fn deinit(self: *Self) void {
+        self.lists.deinit(self.allocator);
+        self.* = undefined;
+    }
+
+    /// Watch and trim the buffers of every draw list in `draw_data`. Call
+    /// once per frame, after the draw data was rendered and before the next
+    /// NewFrame, with the context `draw_data` belongs to current. Returns the
+    /// number of bytes given back this frame.
+    pub fn endFrame(self: *Self, draw_data: *ig.DrawData) std.mem.Allocator.Error!usize {
+        self.frame += 1;
+        var reclaimed: usize = 0;
+        var trims: u64 = 0;
+
+        for (draw_data.CmdLists.items()) |maybe_list| {
+            const list = maybe_list orelse continue;
+            const gop = try self.lists.getOrPut(self.allocator, list);
+            if (!gop.found_existing) gop.value_ptr.* = .{};
+            const marks = gop.value_ptr;
+            marks.last_seen = self.frame;
+
+            const vtx = trimVector(ig.DrawVert, &list.VtxBuffer, &marks.vtx, self.config);
+            const idx = trimVector(ig.DrawIdx, &list.IdxBuffer, &marks.idx, self.config);
+            const cmd = trimVector(ig.DrawCmd, &list.CmdBuffer, &marks.cmd, self.config);
+            trims += @as(u64, @intFromBool(vtx > 0)) + @intFromBool(idx > 0) + @intFromBool(cmd > 0);
+            reclaimed += vtx + idx + cmd;
+            // Keep the write pointers where ImGui left them, at the end of the
+            // data, now in the new buffers.
+            list._VtxWritePtr = if (list.VtxBuffer.Data) |data| data + list.VtxBuffer.Size else null;
+            list._IdxWritePtr = if (list.IdxBuffer.Data) |data| data + list.IdxBuffer.Size else null;
+
+            if (marks.vtx.frames == self.config.window_frames) {
+                reclaimed += self.trimSplitter(&list._Splitter);
+            }
+        }
+
+        const cmd_lists = trimVector(?*ig.DrawList, &draw_data.CmdLists, &self.cmd_lists, self.config);
+        trims += @intFromBool(cmd_lists > 0);
+        reclaimed += cmd_lists;
+
+        if (self.frame % self.config.window_frames == 0) {
+            var cleared: c_uint = 0;
+            reclaimed += ZigImGui_TrimTransientBuffers(self.config.min_bytes, &cleared);
+            self.stats.splitter_clears += cleared;
+
+            // Forget lists that were destroyed, or whose windows are hidden
+            // and left to ImGui's own compaction, so that a new list at the
+            // same address starts over.
+            var i = self.lists.count();
+            while (i > 0) {
+                i -= 1;
+                if (self.lists.values()[i].last_seen != self.frame) self.lists.swapRemoveAt(i);
+            }
+        }
+
+        self.stats.trims += trims;
+        self.stats.reclaimed_bytes += reclaimed;
+        return reclaimed;
+    }
+
+    fn trimSplitter(self: *Self, splitter: *ig.DrawListSplitter) usize {
+        // Channels are in use between ChannelsSplit and ChannelsMerge.
+        if (splitter._Count > 1) return 0;
+        var bytes: usize = @as(usize, splitter._Channels.Capacity) * @sizeOf(ig.DrawChannel);
+        for (splitter._Channels.items(), 0..) |channel, i| {
+            // The current channel shares its buffers with the draw list.
+            if (i == splitter._Current) continue;
+            bytes += @as(usize, channel._CmdBuffer.Capacity) * @sizeOf(ig.DrawCmd);
+            bytes += @as(usize, channel._IdxBuffer.Capacity) * @sizeOf(ig.DrawIdx);
+        }
+        if (bytes == 0 or bytes < self.config.min_bytes) return 0;
+        splitter.ClearFreeMemory();
+        self.stats.splitter_clears += 1;
+        return bytes;
+    }
+
+    /// The counters, for debug overlays or logging.
+    pub fn getStats(self: *const Self) Stats {
+        return self.stats;
+    }
+};
@@ -0,0 +1,185 @@
+//! Building draw lists on worker threads.
+//!
+//! Filling a DrawList reads the context's DrawListSharedData, which is
+//! read-only while a frame is being built, and writes to the list's own
+//! buffers. Growing those buffers is not thread-safe though: Vector growth
+//! goes through ImGui's MemAlloc and MemFree, which update the current
+//! context's allocation statistics without any synchronization. So `begin`
+//! reserves room for everything the workers will add on the UI thread, and
+//! `fill` asserts that no buffer grew. Within that budget, standalone draw
+//! lists bound to the shared data can be filled from other threads without
+//! any ImGui context being current there, as long as only DrawList functions
+//! are used (no ImGui::* calls such as GetColorU32 or CalcTextSize). Once
+//! the workers are done, their geometry is appended to a window draw list on
+//! the UI thread, in list order, so the output does not depend on scheduling.
+
+const std = @import("std");
+const ig = @import("Zig-ImGui");
+
+pub const ParallelDrawLists = struct {
+    allocator: std.mem.Allocator,
+    /// Draw lists owned by this object. Only the first `active` are in use
+    /// for the current frame, the rest are kept around to reuse their buffers.
+    lists: std.ArrayListUnmanaged(*ig.DrawList) = .{},
+    active: usize = 0,
+
+    /// Room reserved in every list by `begin`. Workers must not add more than
+    /// this to a single list.
+    pub const Capacity = struct {
+        vertices: u32 = 0,
+        indices: u32 = 0,
+        /// Draw commands, one more is added by every clip rect or texture
+        /// change, and every 64K vertices with 16-bit indices.
+        commands: u32 = 1,
+        /// Points of paths built with the Path* functions, or by the
+        /// outlined shapes (AddRect, AddCircle, ...).
+        path_points: u32 = 0,
+        /// Depth of the clip rect and texture stacks, including the entry
+        /// pushed by `begin`.
+        stack_depth: u32 = 1,
+    };
+
+    const Self = @This();
+
+    pub fn init(allocator: std.mem.Allocator) Self {
+        return .{ .allocator = allocator };
+    }
+
+    pub fn deinit(self: *Self) void {
+        for (self.lists.items) |list| list.deinit();
+        self.lists.deinit(self.allocator);
+        self.* = undefined;
+    }
+
+    /// Prepare `count` empty draw lists for the current frame, with room for
+    /// `capacity` in each. Must be called on the UI thread between NewFrame
+    /// and Render. The lists start with the clip rect and texture currently
+    /// at the top of `target`'s stacks.
+    pub fn begin(self: *Self, target: *ig.DrawList, count: usize, capacity: Capacity) std.mem.Allocator.Error![]const *ig.DrawList {
+        try self.lists.ensureTotalCapacity(self.allocator, count);
+        const shared_data = ig.GetDrawListSharedData();
+        while (self.lists.items.len < count) {
+            self.lists.appendAssumeCapacity(ig.DrawList.init_ImDrawList(shared_data));
+        }
+
+        const clip_min = target.GetClipRectMin();
+        const clip_max = target.GetClipRectMax();
+        const texture_id = target._CmdHeader.TextureId;
+        for (self.lists.items[0..count]) |list| {
+            list._Data = shared_data;
+            // The old contents are dropped by _ResetForNewFrame anyway.
+            list.VtxBuffer.reserve_discard(capacity.vertices);
+            list.IdxBuffer.reserve_discard(capacity.indices);
+            list.CmdBuffer.reserve_discard(@max(capacity.commands, 1));
+            list._Path.reserve_discard(capacity.path_points);
+            list._ClipRectStack.reserve_discard(@max(capacity.stack_depth, 1));
+            list._TextureIdStack.reserve_discard(@max(capacity.stack_depth, 1));
+            list._ResetForNewFrame();
+            list.PushClipRect(clip_min, clip_max);
+            list.PushTextureID(texture_id);
+        }
+        self.active = count;
+        return self.lists.items[0..count];
+    }
+
+    /// The draw lists prepared by the last call to begin.
+    pub fn items(self: *const Self) []const *ig.DrawList {
+        return self.lists.items[0..self.active];
+    }
+
+    /// Fill every active draw list on `pool`, by calling
+    /// `func(index, draw_list, args...)` once per list, and wait for all of
+    /// them to finish. The calling thread helps with the work while waiting.
+    /// `func` must stay within the capacity passed to `begin`.
+    pub fn fill(self: *const Self, pool: *std.Thread.Pool, comptime func: anytype, args: anytype) void {
+        const Worker = struct {
+            fn run(wait_group: *std.Thread.WaitGroup, index: usize, list: *ig.DrawList, inner_args: @TypeOf(args)) void {
+                defer wait_group.finish();
+                const before = Buffers.init(list);
+                @call(.auto, func, .{ index, list } ++ inner_args);
+                // A buffer that grew was reallocated on this thread, racing
+                // with every other user of ImGui's allocator.
+                std.debug.assert(std.meta.eql(before, Buffers.init(list)));
+            }
+        };
+
+        var wait_group: std.Thread.WaitGroup = .{};
+        for (self.items(), 0..) |list, index| {
+            wait_group.start();
+            pool.spawn(Worker.run, .{ &wait_group, index, list, args }) catch {
+                Worker.run(&wait_group, index, list, args);
+            };
+        }
+        pool.waitAndWork(&wait_group);
+    }
+
+    /// Append the geometry of every active list to `target`, in list order.
+    /// Must be called on the UI thread, after fill has returned.
+    pub fn merge(self: *const Self, target: *ig.DrawList) void {
+        for (self.items()) |list| appendDrawList(target, list);
+    }
+};
+
+/// The buffers of a draw list, which only change when one of them grows.
+const Buffers = struct {
+    vtx: ?[*]ig.DrawVert,
+    idx: ?[*]ig.DrawIdx,
+    cmd: ?[*]ig.DrawCmd,
+    path: ?[*]ig.Vec2,
+    clip_rects: ?[*]ig.Vec4,
+    texture_ids: ?[*]ig.TextureID,
+
+    fn init(list: *const ig.DrawList) Buffers {
+        return .{
+            .vtx = list.VtxBuffer.Data,
+            .idx = list.IdxBuffer.Data,
+            .cmd = list.CmdBuffer.Data,
+            .path = list._Path.Data,
+            .clip_rects = list._ClipRectStack.Data,
+            .texture_ids = list._TextureIdStack.Data,
+        };
+    }
+};
+
+/// Append all commands of `source` to `target`, keeping their clip rects,
+/// textures and callbacks. Indices are rebased onto `target`'s vertices.
+pub fn appendDrawList(target: *ig.DrawList, source: *const ig.DrawList) void {
+    const vertices = source.VtxBuffer.items();
+    const indices = source.IdxBuffer.items();
+    for (source.CmdBuffer.items()) |cmd| {
+        if (cmd.UserCallback) |callback| {
+            target.AddCallback(@ptrCast(callback), cmd.UserCallbackData);
+            continue;
+        }
+        if (cmd.ElemCount == 0) continue;
+
+        const cmd_indices = indices[cmd.IdxOffset..][0..cmd.ElemCount];
+        var first: ig.DrawIdx = std.math.maxInt(ig.DrawIdx);
+        var last: ig.DrawIdx = 0;
+        for (cmd_indices) |idx| {
+            first = @min(first, idx);
+            last = @max(last, idx);
+        }
+        const cmd_vertices = vertices[cmd.VtxOffset + first ..][0 .. @as(usize, last - first) + 1];
+
+        target.PushClipRect(
+            ig.Vec2.init(cmd.ClipRect.x, cmd.ClipRect.y),
+            ig.Vec2.init(cmd.ClipRect.z, cmd.ClipRect.w),
+        );
+        target.PushTextureID(cmd.TextureId);
+        defer target.PopTextureID();
+        defer target.PopClipRect();
+
+        target.PrimReserve(@intCast(cmd_indices.len), @intCast(cmd_vertices.len));
+        const vtx_out = target._VtxWritePtr.?;
+        const idx_out = target._IdxWritePtr.?;
+        @memcpy(vtx_out[0..cmd_vertices.len], cmd_vertices);
+        const base: ig.DrawIdx = @truncate(target._VtxCurrentIdx);
+        for (idx_out[0..cmd_indices.len], cmd_indices) |*out, idx| {
+            out.* = idx - first +% base;
+        }
+        target._VtxWritePtr = vtx_out + cmd_vertices.len;
+        target._IdxWritePtr = idx_out + cmd_indices.len;
+        target._VtxCurrentIdx += @intCast(cmd_vertices.len);
+    }
+}
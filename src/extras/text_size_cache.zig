@@ -0,0 +1,246 @@
+//! Memoization of text size measurements.
+//!
+//! Layouts that measure the same labels every frame (tables, auto-sized
+//! columns, ...) can route their CalcTextSize calls through a TextSizeCache.
+//! Entries are keyed on the font, font size, wrap width and a hash of the
+//! string, and the least recently used entry is evicted once the cache is
+//! full. The cache must be invalidated whenever the font atlas is rebuilt,
+//! which `syncAtlas` detects automatically for the current context.
+
+const std = @import("std");
+const ig = @import("Zig-ImGui");
+
+pub const TextSizeCache = struct {
+    allocator: std.mem.Allocator,
+    map: std.AutoHashMapUnmanaged(Key, u32) = .{},
+    entries: []Entry,
+    len: u32 = 0,
+    /// Most recently used entry
+    head: u32 = none,
+    /// Least recently used entry
+    tail: u32 = none,
+    atlas: AtlasSnapshot = .{},
+    /// Removals from `map` since it was last rebuilt, see `insert`
+    tombstones: u32 = 0,
+    stats: Stats = .{},
+
+    const none = std.math.maxInt(u32);
+
+    pub const Stats = struct {
+        hits: u64 = 0,
+        misses: u64 = 0,
+        evictions: u64 = 0,
+        invalidations: u64 = 0,
+
+        pub fn hitRate(self: Stats) f64 {
+            const total = self.hits + self.misses;
+            if (total == 0) return 0;
+            return @as(f64, @floatFromInt(self.hits)) / @as(f64, @floatFromInt(total));
+        }
+    };
+
+    const Kind = enum(u8) {
+        calc_text_size,
+        calc_text_size_hide_after_double_hash,
+        font_calc_text_size_a,
+    };
+
+    const Key = struct {
+        font: ?*const ig.Font,
+        font_size: u32,
+        max_width: u32,
+        wrap_width: u32,
+        kind: Kind,
+        text_len: usize,
+        text_hash: u64,
+    };
+
+    const Entry = struct {
+        key: Key,
+        size: ig.Vec2,
+        prev: u32,
+        next: u32,
+    };
+
+    /// The parts of a FontAtlas which change when it is rebuilt
+    const AtlasSnapshot = struct {
+        atlas: ?*const ig.FontAtlas = null,
+        tex_pixels_alpha8: ?[*]u8 = null,
+        tex_pixels_rgba32: ?[*]u32 = null,
+        tex_width: i32 = 0,
+        tex_height: i32 = 0,
+        fonts: ?[*]?*ig.Font = null,
+        fonts_count: u32 = 0,
+        config_count: u32 = 0,
+
+        fn init(atlas: *const ig.FontAtlas) AtlasSnapshot {
+            return .{
+                .atlas = atlas,
+                .tex_pixels_alpha8 = atlas.TexPixelsAlpha8,
+                .tex_pixels_rgba32 = atlas.TexPixelsRGBA32,
+                .tex_width = atlas.TexWidth,
+                .tex_height = atlas.TexHeight,
+                .fonts = atlas.Fonts.Data,
+                .fonts_count = atlas.Fonts.Size,
+                .config_count = atlas.ConfigData.Size,
+            };
+        }
+    };
+
+    pub fn init(allocator: std.mem.Allocator, capacity: u32) !TextSizeCache {
+        std.debug.assert(capacity > 0 and capacity < none);
+        var map: std.AutoHashMapUnmanaged(Key, u32) = .{};
+        errdefer map.deinit(allocator);
+        try map.ensureTotalCapacity(allocator, capacity);
+        return .{
+            .allocator = allocator,
+            .map = map,
+            .entries = try allocator.alloc(Entry, capacity),
+        };
+    }
+
+    pub fn deinit(self: *TextSizeCache) void {
+        self.map.deinit(self.allocator);
+        self.allocator.free(self.entries);
+        self.* = undefined;
+    }
+
+    pub fn capacity(self: TextSizeCache) u32 {
+        return @intCast(self.entries.len);
+    }
+
+    /// Drop every cached measurement, for example after changing fonts.
+    pub fn invalidate(self: *TextSizeCache) void {
+        self.map.clearRetainingCapacity();
+        self.tombstones = 0;
+        self.len = 0;
+        self.head = none;
+        self.tail = none;
+        self.stats.invalidations += 1;
+    }
+
+    /// Invalidate the cache if `atlas` differs from, or has been rebuilt
+    /// since, the atlas seen on the previous call.
+    pub fn syncAtlas(self: *TextSizeCache, atlas: *const ig.FontAtlas) void {
+        const snapshot = AtlasSnapshot.init(atlas);
+        if (!std.meta.eql(snapshot, self.atlas)) {
+            if (self.len != 0) self.invalidate();
+            self.atlas = snapshot;
+        }
+    }
+
+    pub fn resetStats(self: *TextSizeCache) void {
+        self.stats = .{};
+    }
+
+    /// Cached version of CalcTextSize, using the current font and font size.
+    pub fn CalcTextSize(self: *TextSizeCache, text: []const u8) ig.Vec2 {
+        return self.CalcTextSizeExt(text, false, -1.0);
+    }
+
+    /// Cached version of CalcTextSizeExt, using the current font and font size.
+    pub fn CalcTextSizeExt(self: *TextSizeCache, text: []const u8, hide_text_after_double_hash: bool, wrap_width: f32) ig.Vec2 {
+        if (ig.GetIO().Fonts) |atlas| self.syncAtlas(atlas);
+        const key = Key{
+            .font = ig.GetFont(),
+            .font_size = @bitCast(ig.GetFontSize()),
+            .max_width = @bitCast(ig.FLT_MAX),
+            .wrap_width = @bitCast(wrap_width),
+            .kind = if (hide_text_after_double_hash) .calc_text_size_hide_after_double_hash else .calc_text_size,
+            .text_len = text.len,
+            .text_hash = std.hash.Wyhash.hash(0, text),
+        };
+        if (self.lookup(key)) |size| return size;
+        const size = ig.CalcTextSizeExt(text.ptr, text.ptr + text.len, hide_text_after_double_hash, wrap_width);
+        self.insert(key, size);
+        return size;
+    }
+
+    /// Cached version of Font.CalcTextSizeA. The caller is responsible for
+    /// calling `syncAtlas` with the font's atlas once per frame.
+    pub fn CalcTextSizeA(self: *TextSizeCache, font: *ig.Font, size: f32, max_width: f32, wrap_width: f32, text: []const u8) ig.Vec2 {
+        const key = Key{
+            .font = font,
+            .font_size = @bitCast(size),
+            .max_width = @bitCast(max_width),
+            .wrap_width = @bitCast(wrap_width),
+            .kind = .font_calc_text_size_a,
+            .text_len = text.len,
+            .text_hash = std.hash.Wyhash.hash(0, text),
+        };
+        if (self.lookup(key)) |text_size| return text_size;
+        const text_size = font.CalcTextSizeAExt(size, max_width, wrap_width, text.ptr, text.ptr + text.len, null);
+        self.insert(key, text_size);
+        return text_size;
+    }
+
+    fn lookup(self: *TextSizeCache, key: Key) ?ig.Vec2 {
+        const index = self.map.get(key) orelse {
+            self.stats.misses += 1;
+            return null;
+        };
+        self.stats.hits += 1;
+        self.unlink(index);
+        self.pushFront(index);
+        return self.entries[index].size;
+    }
+
+    fn insert(self: *TextSizeCache, key: Key, size: ig.Vec2) void {
+        const index = if (self.len < self.entries.len) blk: {
+            self.len += 1;
+            break :blk self.len - 1;
+        } else blk: {
+            const evicted = self.tail;
+            self.unlink(evicted);
+            _ = self.map.remove(self.entries[evicted].key);
+            self.tombstones += 1;
+            self.stats.evictions += 1;
+            break :blk evicted;
+        };
+        // Every removal leaves a tombstone behind, which lookups of missing
+        // keys have to probe past. Rebuilding once per `capacity` evictions
+        // keeps misses cheap at an amortized O(1) cost. The new entry is not
+        // linked yet, so it is only added to the map below.
+        if (self.tombstones >= self.entries.len) self.rebuildMap();
+        self.entries[index] = .{ .key = key, .size = size, .prev = none, .next = none };
+        self.pushFront(index);
+        // The map was sized for `capacity` entries up front, and never holds more.
+        self.map.putAssumeCapacityNoClobber(key, index);
+    }
+
+    fn rebuildMap(self: *TextSizeCache) void {
+        self.map.clearRetainingCapacity();
+        self.tombstones = 0;
+        var index = self.head;
+        while (index != none) : (index = self.entries[index].next) {
+            self.map.putAssumeCapacityNoClobber(self.entries[index].key, index);
+        }
+    }
+
+    fn unlink(self: *TextSizeCache, index: u32) void {
+        const entry = &self.entries[index];
+        if (entry.prev != none) self.entries[entry.prev].next = entry.next else self.head = entry.next;
+        if (entry.next != none) self.entries[entry.next].prev = entry.prev else self.tail = entry.prev;
+        entry.prev = none;
+        entry.next = none;
+    }
+
+    fn pushFront(self: *TextSizeCache, index: u32) void {
+        const entry = &self.entries[index];
+        entry.prev = none;
+        entry.next = self.head;
+        if (self.head != none) self.entries[self.head].prev = index;
+        self.head = index;
+        if (self.tail == none) self.tail = index;
+    }
+};
+
+/// Drop-in replacement for CalcTextSize that consults `cache` first.
+pub fn CalcTextSizeCached(cache: *TextSizeCache, text: []const u8) ig.Vec2 {
+    return cache.CalcTextSize(text);
+}
+
+/// Drop-in replacement for CalcTextSizeExt that consults `cache` first.
+pub fn CalcTextSizeCachedExt(cache: *TextSizeCache, text: []const u8, hide_text_after_double_hash: bool, wrap_width: f32) ig.Vec2 {
+    return cache.CalcTextSizeExt(text, hide_text_after_double_hash, wrap_width);
+}
@@ -0,0 +1,230 @@
+//! Lazily loaded textures with a memory budget.
+//!
+//! A TextureRegistry maps application keys (asset ids, file indices, ...) to
+//! TextureIDs. Textures are loaded and uploaded through backend callbacks the
+//! first time they are drawn, and the least recently drawn ones are unloaded
+//! at the end of a frame once the resident textures exceed the memory budget.
+//! Textures drawn during the current frame are never unloaded, so the budget
+//! can be exceeded temporarily by a frame that needs more.
+//!
+//! Image and ImageButton skip items outside the visible area without loading
+//! them, so a scrolling grid of thumbnails only keeps what was on screen
+//! recently resident.
+
+const std = @import("std");
+const ig = @import("Zig-ImGui");
+
+/// A texture as returned by a backend.
+pub const Texture = struct {
+    id: ig.TextureID,
+    /// Memory used by the texture, counted against the budget.
+    bytes: usize,
+};
+
+/// `Key` is hashed with std.hash_map.AutoContext, so it should be an integer,
+/// enum or a struct of them, rather than a slice.
+pub fn TextureRegistry(comptime Key: type) type {
+    return struct {
+        allocator: std.mem.Allocator,
+        backend: Backend,
+        config: Config,
+        map: std.AutoHashMapUnmanaged(Key, u32) = .{},
+        entries: std.ArrayListUnmanaged(Entry) = .{},
+        /// Indices of unused entries
+        free: std.ArrayListUnmanaged(u32) = .{},
+        /// Most recently used entry
+        head: u32 = none,
+        /// Least recently used entry
+        tail: u32 = none,
+        frame: u64 = 0,
+        loads_this_frame: u32 = 0,
+        stats: Stats = .{},
+
+        const Self = @This();
+        const none = std.math.maxInt(u32);
+
+        pub const Backend = struct {
+            context: ?*anyopaque,
+            /// Load and upload the texture for `key`.
+            load: *const fn (context: ?*anyopaque, key: Key) anyerror!Texture,
+            /// Release a texture returned by `load`.
+            unload: *const fn (context: ?*anyopaque, texture: Texture) void,
+        };
+
+        pub const Config = struct {
+            /// Unload least recently used textures at the end of a frame
+            /// while more than this many bytes are resident.
+            memory_budget: usize,
+            /// Load at most this many textures per frame, the others are drawn
+            /// as placeholders until a later frame.
+            max_loads_per_frame: u32 = std.math.maxInt(u32),
+        };
+
+        pub const Stats = struct {
+            resident_count: u32 = 0,
+            resident_bytes: usize = 0,
+            peak_resident_bytes: usize = 0,
+            hits: u64 = 0,
+            loads: u64 = 0,
+            failed_loads: u64 = 0,
+            deferred_loads: u64 = 0,
+            evictions: u64 = 0,
+        };
+
+        const Entry = struct {
+            key: Key,
+            /// null if loading failed
+            texture: ?Texture,
+            last_used_frame: u64,
+            prev: u32,
+            next: u32,
+        };
+
+        pub fn init(allocator: std.mem.Allocator, backend: Backend, config: Config) Self {
+            return .{ .allocator = allocator, .backend = backend, .config = config };
+        }
+
+        /// Unloads every resident texture.
+        pub fn deinit(self: *Self) void {
+            self.clear();
+            self.map.deinit(self.allocator);
+            self.entries.deinit(self.allocator);
+            self.free.deinit(self.allocator);
+            self.* = undefined;
+        }
+
+        /// Unload every resident texture, and forget failed loads.
+        pub fn clear(self: *Self) void {
+            while (self.tail != none) self.remove(self.tail);
+        }
+
+        /// Unload the texture for `key` if it is resident. A failed load is
+        /// forgotten, so the next use tries loading it again.
+        pub fn forget(self: *Self, key: Key) void {
+            if (self.map.get(key)) |index| self.remove(index);
+        }
+
+        pub fn isResident(self: *const Self, key: Key) bool {
+            const index = self.map.get(key) orelse return false;
+            return self.entries.items[index].texture != null;
+        }
+
+        /// Mark the texture for `key` as used this frame and return its id,
+        /// loading it first if needed. Returns null if loading failed, or was
+        /// deferred to a later frame by max_loads_per_frame.
+        pub fn get(self: *Self, key: Key) std.mem.Allocator.Error!?ig.TextureID {
+            if (self.map.get(key)) |index| {
+                const entry = &self.entries.items[index];
+                entry.last_used_frame = self.frame;
+                self.unlink(index);
+                self.pushFront(index);
+                const texture = entry.texture orelse return null;
+                self.stats.hits += 1;
+                return texture.id;
+            }
+
+            if (self.loads_this_frame >= self.config.max_loads_per_frame) {
+                self.stats.deferred_loads += 1;
+                return null;
+            }
+            self.loads_this_frame += 1;
+
+            try self.map.ensureUnusedCapacity(self.allocator, 1);
+            // Every entry may end up in the free list.
+            try self.free.ensureTotalCapacity(self.allocator, self.entries.items.len + 1);
+            const index: u32 = self.free.popOrNull() orelse blk: {
+                _ = try self.entries.addOne(self.allocator);
+                break :blk @intCast(self.entries.items.len - 1);
+            };
+
+            const texture = self.backend.load(self.backend.context, key) catch null;
+            self.entries.items[index] = .{
+                .key = key,
+                .texture = texture,
+                .last_used_frame = self.frame,
+                .prev = none,
+                .next = none,
+            };
+            self.map.putAssumeCapacityNoClobber(key, index);
+            self.pushFront(index);
+
+            if (texture) |t| {
+                self.stats.loads += 1;
+                self.stats.resident_count += 1;
+                self.stats.resident_bytes += t.bytes;
+                self.stats.peak_resident_bytes = @max(self.stats.peak_resident_bytes, self.stats.resident_bytes);
+                return t.id;
+            }
+            self.stats.failed_loads += 1;
+            return null;
+        }
+
+        /// Image for the texture of `key`, or an empty space of the same size
+        /// if it is not available (yet).
+        pub fn Image(self: *Self, key: Key, image_size: ig.Vec2) std.mem.Allocator.Error!void {
+            if (try self.getIfVisible(key, image_size)) |id| {
+                ig.Image(id, image_size);
+            } else {
+                ig.Dummy(image_size);
+            }
+        }
+
+        /// ImageButton for the texture of `key`, or an invisible button of the
+        /// same size if it is not available (yet).
+        pub fn ImageButton(self: *Self, str_id: [*:0]const u8, key: Key, image_size: ig.Vec2) std.mem.Allocator.Error!bool {
+            if (try self.getIfVisible(key, image_size)) |id| {
+                return ig.ImageButton(str_id, id, image_size);
+            }
+            const padding = ig.GetStyle().?.FramePadding;
+            return ig.InvisibleButton(str_id, image_size.add(padding.scale(2)));
+        }
+
+        fn getIfVisible(self: *Self, key: Key, image_size: ig.Vec2) std.mem.Allocator.Error!?ig.TextureID {
+            if (!ig.IsRectVisible_Nil(image_size)) return null;
+            return self.get(key);
+        }
+
+        /// Call once per frame, after the UI was built. Unloads least recently
+        /// used textures while over budget.
+        pub fn endFrame(self: *Self) void {
+            while (self.stats.resident_bytes > self.config.memory_budget and self.tail != none) {
+                const entry = self.entries.items[self.tail];
+                if (entry.last_used_frame == self.frame) break;
+                if (entry.texture != null) self.stats.evictions += 1;
+                self.remove(self.tail);
+            }
+            self.frame += 1;
+            self.loads_this_frame = 0;
+        }
+
+        fn remove(self: *Self, index: u32) void {
+            const entry = self.entries.items[index];
+            if (entry.texture) |texture| {
+                self.backend.unload(self.backend.context, texture);
+                self.stats.resident_count -= 1;
+                self.stats.resident_bytes -= texture.bytes;
+            }
+            self.unlink(index);
+            _ = self.map.remove(entry.key);
+            // Capacity for every entry was reserved when it was created.
+            self.free.appendAssumeCapacity(index);
+        }
+
+        fn unlink(self: *Self, index: u32) void {
+            const entry = &self.entries.items[index];
+            if (entry.prev != none) self.entries.items[entry.prev].next = entry.next else self.head = entry.next;
+            if (entry.next != none) self.entries.items[entry.next].prev = entry.prev else self.tail = entry.prev;
+            entry.prev = none;
+            entry.next = none;
+        }
+
+        fn pushFront(self: *Self, index: u32) void {
+            const entry = &self.entries.items[index];
+            entry.prev = none;
+            entry.next = self.head;
+            if (self.head != none) self.entries.items[self.head].prev = index;
+            self.head = index;
+            if (self.tail == none) self.tail = index;
+        }
+    };
+}
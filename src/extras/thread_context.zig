@@ -0,0 +1,64 @@
+//! Helpers for running ImGui contexts on worker threads.
+//!
+//! By default Dear ImGui keeps a single process-wide current context, so only
+//! one thread at a time may use ImGui. When Zig-ImGui is built with
+//! `-Denable_thread_local_context=true`, the current context is thread-local
+//! instead, and every thread can build frames for its own context in parallel.
+//! Contexts must still not be shared between threads, and a FontAtlas shared
+//! between contexts must be fully built before any of them starts a frame.
+//!
+//! Building a font atlas is not thread-safe, even with thread-local contexts:
+//! the default font is decompressed through process-wide statics in
+//! imgui_draw.cpp. Build one atlas up front and share it between the
+//! threads, or make sure no two threads build an atlas at the same time.
+
+const std = @import("std");
+const ig = @import("Zig-ImGui");
+const build_options = @import("build_options");
+
+/// True when the current context is thread-local.
+pub const thread_local_context = build_options.enable_thread_local_context;
+
+/// Makes a context current on the calling thread, and restores the previously
+/// current context when exited.
+pub const ScopedContext = struct {
+    previous: ?*ig.Context,
+
+    pub fn enter(context: *ig.Context) ScopedContext {
+        const previous = ig.GetCurrentContext();
+        ig.SetCurrentContext(context);
+        return .{ .previous = previous };
+    }
+
+    pub fn exit(self: ScopedContext) void {
+        ig.SetCurrentContext(self.previous);
+    }
+};
+
+/// Spawn a thread owning a new context for its whole lifetime. The context is
+/// current on that thread while `func(context, args...)` runs, and destroyed
+/// once it returns. `func` must return void. Requires the thread-local context build.
+///
+/// `shared_font_atlas` should be built on the calling thread beforehand. With
+/// null, the context gets its own atlas, which `func` has to build, and atlas
+/// builds on different threads must not overlap.
+pub fn spawnWithContext(
+    config: std.Thread.SpawnConfig,
+    shared_font_atlas: ?*ig.FontAtlas,
+    comptime func: anytype,
+    args: anytype,
+) std.Thread.SpawnError!std.Thread {
+    if (!thread_local_context) {
+        @compileError("spawnWithContext requires building Zig-ImGui with -Denable_thread_local_context=true");
+    }
+    const Wrapper = struct {
+        fn run(atlas: ?*ig.FontAtlas, inner_args: @TypeOf(args)) void {
+            const context = ig.CreateContextExt(atlas).?;
+            defer ig.DestroyContextExt(context);
+            ig.SetCurrentContext(context);
+            defer ig.SetCurrentContext(null);
+            @call(.auto, func, .{context} ++ inner_args);
+        }
+    };
+    return std.Thread.spawn(config, Wrapper.run, .{ shared_font_atlas, args });
+}
@@ -0,0 +1,249 @@
+//! Virtualized rendering of very long lists and tables.
+//!
+//! ListClipperIterator is a thin Zig iterator over ListClipper, yielding only
+//! the visible index ranges. VirtualRows builds on it to render rows through
+//! a callback, and additionally supports rows of varying height by keeping a
+//! prefix sum of the row heights in RowHeights. In both cases the amount of
+//! work per frame depends on the number of visible rows, not on the total.
+
+const std = @import("std");
+const ig = @import("Zig-ImGui");
+
+pub const Range = struct {
+    start: usize,
+    end: usize,
+
+    pub fn len(self: Range) usize {
+        return self.end - self.start;
+    }
+};
+
+/// Iterate the visible ranges of a list of evenly spaced items:
+///
+///     var it: ListClipperIterator = undefined;
+///     it.begin(items.len, -1.0);
+///     defer it.end();
+///     while (it.next()) |range| {
+///         for (items[range.start..range.end]) |item| { ... }
+///     }
+///
+/// ListClipper keeps a pointer to itself while stepping, so the iterator must
+/// not be moved between `begin` and `end`.
+pub const ListClipperIterator = struct {
+    clipper: ig.ListClipper,
+
+    /// A negative `items_height` measures the height of the first item.
+    pub fn begin(self: *ListClipperIterator, items_count: usize, items_height: f32) void {
+        // Matches the ImGuiListClipper constructor
+        self.clipper = .{
+            .Ctx = null,
+            .DisplayStart = 0,
+            .DisplayEnd = 0,
+            .ItemsCount = -1,
+            .ItemsHeight = 0,
+            .StartPosY = 0,
+            .TempData = null,
+        };
+        self.clipper.BeginExt(@intCast(items_count), items_height);
+    }
+
+    pub fn next(self: *ListClipperIterator) ?Range {
+        if (!self.clipper.Step()) return null;
+        return .{
+            .start = @intCast(self.clipper.DisplayStart),
+            .end = @intCast(self.clipper.DisplayEnd),
+        };
+    }
+
+    /// Make sure the item at `index` is submitted, even when it is not visible.
+    /// Must be called before the first call to `next`.
+    pub fn includeItem(self: *ListClipperIterator, index: usize) void {
+        self.clipper.IncludeItemByIndex(@intCast(index));
+    }
+
+    /// Height of one item, only valid after the first call to `next`.
+    pub fn itemsHeight(self: ListClipperIterator) f32 {
+        return self.clipper.ItemsHeight;
+    }
+
+    /// Safe to call after `next` has returned null, and when stopping early.
+    pub fn end(self: *ListClipperIterator) void {
+        self.clipper.End();
+    }
+};
+
+/// Prefix sums of row heights, for rows of varying height.
+pub const RowHeights = struct {
+    allocator: std.mem.Allocator,
+    /// offsets[i] is the distance from the top of the first row to the top of
+    /// row i, offsets[len] is the total height. Kept in f64 so that millions
+    /// of rows do not accumulate rounding errors.
+    offsets: std.ArrayListUnmanaged(f64) = .{},
+
+    pub fn init(allocator: std.mem.Allocator) RowHeights {
+        return .{ .allocator = allocator };
+    }
+
+    pub fn deinit(self: *RowHeights) void {
+        self.offsets.deinit(self.allocator);
+        self.* = undefined;
+    }
+
+    pub fn clear(self: *RowHeights) void {
+        self.offsets.clearRetainingCapacity();
+    }
+
+    pub fn len(self: RowHeights) usize {
+        return if (self.offsets.items.len == 0) 0 else self.offsets.items.len - 1;
+    }
+
+    pub fn append(self: *RowHeights, height: f32) !void {
+        if (self.offsets.items.len == 0) try self.offsets.append(self.allocator, 0);
+        const last = self.offsets.items[self.offsets.items.len - 1];
+        try self.offsets.append(self.allocator, last + height);
+    }
+
+    pub fn appendSlice(self: *RowHeights, heights: []const f32) !void {
+        try self.offsets.ensureUnusedCapacity(self.allocator, heights.len + 1);
+        for (heights) |height| self.append(height) catch unreachable;
+    }
+
+    /// Change the height of one row. This is O(n) in the number of rows after it.
+    pub fn set(self: *RowHeights, row: usize, height: f32) void {
+        const delta = @as(f64, height) - self.rowHeight(row);
+        for (self.offsets.items[row + 1 ..]) |*offset| offset.* += delta;
+    }
+
+    pub fn totalHeight(self: RowHeights) f64 {
+        return if (self.offsets.items.len == 0) 0 else self.offsets.items[self.offsets.items.len - 1];
+    }
+
+    pub fn rowOffset(self: RowHeights, row: usize) f64 {
+        return self.offsets.items[row];
+    }
+
+    pub fn rowHeight(self: RowHeights, row: usize) f32 {
+        return @floatCast(self.offsets.items[row + 1] - self.offsets.items[row]);
+    }
+
+    /// Index of the row containing `offset`, clamped to the valid rows.
+    pub fn rowAtOffset(self: RowHeights, offset: f64) usize {
+        const count = self.len();
+        if (count == 0) return 0;
+        // Find the last row whose top is at or above `offset`.
+        var lo: usize = 0;
+        var hi: usize = count;
+        while (hi - lo > 1) {
+            const mid = lo + (hi - lo) / 2;
+            if (self.offsets.items[mid] <= offset) lo = mid else hi = mid;
+        }
+        return lo;
+    }
+
+    /// The rows which overlap the range [top, bottom).
+    pub fn visibleRange(self: RowHeights, top: f64, bottom: f64) Range {
+        const count = self.len();
+        if (count == 0 or bottom <= top) return .{ .start = 0, .end = 0 };
+        const first = self.rowAtOffset(top);
+        const last = self.rowAtOffset(bottom);
+        return .{ .start = first, .end = @min(last + 1, count) };
+    }
+};
+
+/// Renders `row_count` rows through a callback, submitting only the visible ones.
+/// Rows are laid out in the current window, or in the current table when
+/// `table` is set, in which case every row is started with TableNextRow.
+pub const VirtualRows = struct {
+    row_count: usize = 0,
+    /// When set, rows use the heights stored here instead of `uniform_height`,
+    /// and `row_count` is ignored.
+    heights: ?*const RowHeights = null,
+    /// Height of every row when `heights` is null. A negative value measures
+    /// the first row, like ListClipper.
+    uniform_height: f32 = -1.0,
+    table: bool = false,
+    table_row_flags: ig.TableRowFlags = .{},
+    pending_scroll_row: ?usize = null,
+
+    /// Scroll the window so that `row` is at the top, on the next `draw`.
+    pub fn scrollToRow(self: *VirtualRows, row: usize) void {
+        self.pending_scroll_row = row;
+    }
+
+    /// Calls `renderRow(context, row_index)` for every visible row.
+    pub fn draw(
+        self: *VirtualRows,
+        context: anytype,
+        comptime renderRow: fn (@TypeOf(context), usize) void,
+    ) void {
+        if (self.heights) |heights| {
+            self.drawVariable(heights, context, renderRow);
+        } else {
+            self.drawUniform(context, renderRow);
+        }
+    }
+
+    fn drawUniform(
+        self: *VirtualRows,
+        context: anytype,
+        comptime renderRow: fn (@TypeOf(context), usize) void,
+    ) void {
+        const start_y = ig.GetCursorPosY();
+        var it: ListClipperIterator = undefined;
+        it.begin(self.row_count, self.uniform_height);
+        defer it.end();
+        while (it.next()) |range| {
+            for (range.start..range.end) |row| {
+                if (self.table) ig.TableNextRowExt(self.table_row_flags, @max(self.uniform_height, 0));
+                renderRow(context, row);
+            }
+        }
+        if (self.pending_scroll_row) |row| {
+            ig.SetScrollY(start_y + @as(f32, @floatFromInt(row)) * it.itemsHeight());
+            self.pending_scroll_row = null;
+        }
+    }
+
+    fn drawVariable(
+        self: *VirtualRows,
+        heights: *const RowHeights,
+        context: anytype,
+        comptime renderRow: fn (@TypeOf(context), usize) void,
+    ) void {
+        const start_y: f64 = ig.GetCursorPosY();
+        const scroll_y: f64 = ig.GetScrollY();
+        const window_height: f64 = ig.GetWindowHeight();
+        const total = heights.totalHeight();
+        const range = heights.visibleRange(scroll_y - start_y, scroll_y - start_y + window_height);
+
+        if (self.table) {
+            // Stand-in rows keep the table's content height equal to the sum
+            // of all row heights.
+            if (range.start > 0) {
+                ig.TableNextRowExt(.{}, @floatCast(heights.rowOffset(range.start)));
+            }
+            for (range.start..range.end) |row| {
+                ig.TableNextRowExt(self.table_row_flags, heights.rowHeight(row));
+                renderRow(context, row);
+            }
+            if (range.end < heights.len()) {
+                ig.TableNextRowExt(.{}, @floatCast(total - heights.rowOffset(range.end)));
+            }
+        } else {
+            for (range.start..range.end) |row| {
+                ig.SetCursorPosY(@floatCast(start_y + heights.rowOffset(row)));
+                renderRow(context, row);
+            }
+            // Extend the window's content to the bottom of the last row.
+            ig.SetCursorPosY(@floatCast(start_y + total));
+            ig.Dummy(ig.Vec2.init(0, 0));
+        }
+
+        if (self.pending_scroll_row) |row| {
+            if (heights.len() != 0) {
+                ig.SetScrollY(@floatCast(start_y + heights.rowOffset(@min(row, heights.len()))));
+            }
+            self.pending_scroll_row = null;
+        }
+    }
+};
@@ -5,6 +5,7 @@
 
 const std = @import("std");
 const builtin = @import("builtin");
+const build_options = @import("build_options");
 const assert = @import("std").debug.assert;
 const imgui = @This();
 
@@ -335,9 +336,49 @@ pub const Vec2 = extern struct {
     x: f32 = 0,
     y: f32 = 0,
 
+    pub const Simd = @Vector(2, f32);
+
     pub fn init(x: f32, y: f32) Vec2 {
         return .{ .x = x, .y = y };
     }
+    pub fn splat(value: f32) Vec2 {
+        return .{ .x = value, .y = value };
+    }
+
+    pub fn toSimd(self: Vec2) Simd {
+        return .{ self.x, self.y };
+    }
+    pub fn fromSimd(value: Simd) Vec2 {
+        return .{ .x = value[0], .y = value[1] };
+    }
+
+    pub fn add(a: Vec2, b: Vec2) Vec2 {
+        return fromSimd(a.toSimd() + b.toSimd());
+    }
+    pub fn sub(a: Vec2, b: Vec2) Vec2 {
+        return fromSimd(a.toSimd() - b.toSimd());
+    }
+    /// Component-wise multiplication
+    pub fn mul(a: Vec2, b: Vec2) Vec2 {
+        return fromSimd(a.toSimd() * b.toSimd());
+    }
+    pub fn scale(self: Vec2, factor: f32) Vec2 {
+        return fromSimd(self.toSimd() * @as(Simd, @splat(factor)));
+    }
+    /// Linear interpolation, `t == 0` yields `a` and `t == 1` yields `b`
+    pub fn lerp(a: Vec2, b: Vec2, t: f32) Vec2 {
+        const va = a.toSimd();
+        return fromSimd(va + (b.toSimd() - va) * @as(Simd, @splat(t)));
+    }
+    pub fn min(a: Vec2, b: Vec2) Vec2 {
+        return fromSimd(@min(a.toSimd(), b.toSimd()));
+    }
+    pub fn max(a: Vec2, b: Vec2) Vec2 {
+        return fromSimd(@max(a.toSimd(), b.toSimd()));
+    }
+    pub fn clamp(self: Vec2, lo: Vec2, hi: Vec2) Vec2 {
+        return fromSimd(@min(@max(self.toSimd(), lo.toSimd()), hi.toSimd()));
+    }
 
     pub fn eql(self: Vec2, other: Vec2) bool {
         return self.x == other.x and self.y == other.y;
@@ -350,9 +391,75 @@ pub const Vec4 = extern struct {
     z: f32 = 0,
     w: f32 = 0,
 
+    pub const Simd = @Vector(4, f32);
+
     pub fn init(x: f32, y: f32, z: f32, w: f32) Vec4 {
         return .{ .x = x, .y = y, .z = z, .w = w };
     }
+    pub fn splat(value: f32) Vec4 {
+        return .{ .x = value, .y = value, .z = value, .w = value };
+    }
+
+    pub fn toSimd(self: Vec4) Simd {
+        return .{ self.x, self.y, self.z, self.w };
+    }
+    pub fn fromSimd(value: Simd) Vec4 {
+        return .{ .x = value[0], .y = value[1], .z = value[2], .w = value[3] };
+    }
+
+    pub fn add(a: Vec4, b: Vec4) Vec4 {
+        return fromSimd(a.toSimd() + b.toSimd());
+    }
+    pub fn sub(a: Vec4, b: Vec4) Vec4 {
+        return fromSimd(a.toSimd() - b.toSimd());
+    }
+    /// Component-wise multiplication
+    pub fn mul(a: Vec4, b: Vec4) Vec4 {
+        return fromSimd(a.toSimd() * b.toSimd());
+    }
+    pub fn scale(self: Vec4, factor: f32) Vec4 {
+        return fromSimd(self.toSimd() * @as(Simd, @splat(factor)));
+    }
+    /// Linear interpolation, `t == 0` yields `a` and `t == 1` yields `b`
+    pub fn lerp(a: Vec4, b: Vec4, t: f32) Vec4 {
+        const va = a.toSimd();
+        return fromSimd(va + (b.toSimd() - va) * @as(Simd, @splat(t)));
+    }
+    pub fn min(a: Vec4, b: Vec4) Vec4 {
+        return fromSimd(@min(a.toSimd(), b.toSimd()));
+    }
+    pub fn max(a: Vec4, b: Vec4) Vec4 {
+        return fromSimd(@max(a.toSimd(), b.toSimd()));
+    }
+    pub fn clamp(self: Vec4, lo: Vec4, hi: Vec4) Vec4 {
+        return fromSimd(@min(@max(self.toSimd(), lo.toSimd()), hi.toSimd()));
+    }
+
+    /// Pack each value to an integer 0xaabbggrr (x = red, w = alpha), with the
+    /// same saturation and rounding as ColorConvertFloat4ToU32.
+    /// `out` must be the same length as `values`.
+    pub fn packABGRSlice(values: []const Vec4, out: []u32) void {
+        assert(values.len == out.len);
+        var i: usize = 0;
+        while (i + simd_batch_len <= values.len) : (i += simd_batch_len) {
+            simdPackABGR(simd_batch_len, values[i..][0..simd_batch_len], out[i..][0..simd_batch_len]);
+        }
+        while (i < values.len) : (i += 1) {
+            simdPackABGR(1, values[i..][0..1], out[i..][0..1]);
+        }
+    }
+    /// Unpack integers 0xaabbggrr to floating point values, the inverse of packABGRSlice.
+    /// `out` must be the same length as `values`.
+    pub fn unpackABGRSlice(values: []const u32, out: []Vec4) void {
+        assert(values.len == out.len);
+        var i: usize = 0;
+        while (i + simd_batch_len <= values.len) : (i += simd_batch_len) {
+            simdUnpackABGR(simd_batch_len, values[i..][0..simd_batch_len], out[i..][0..simd_batch_len]);
+        }
+        while (i < values.len) : (i += 1) {
+            simdUnpackABGR(1, values[i..][0..1], out[i..][0..1]);
+        }
+    }
 
     pub fn eql(self: Vec4, other: Vec4) bool {
         return self.x == other.x
@@ -420,6 +527,469 @@ pub const Color = extern struct {
     pub fn eql(self: Color, other: Color) bool {
         return self.Value.eql(other.Value);
     }
+
+    /// Slice version of packABGR, `out` must be the same length as `colors`.
+    pub fn packABGRSlice(colors: []const Color, out: []u32) void {
+        Vec4.packABGRSlice(@as([*]const Vec4, @ptrCast(colors.ptr))[0..colors.len], out);
+    }
+    /// Slice version of initABGRPacked, `out` must be the same length as `values`.
+    pub fn unpackABGRSlice(values: []const u32, out: []Color) void {
+        Vec4.unpackABGRSlice(values, @as([*]Vec4, @ptrCast(out.ptr))[0..out.len]);
+    }
+
+    /// Convert HSVA values (x = hue, y = saturation, z = value, w = alpha) to
+    /// RGBA, matching ColorConvertHSVtoRGB. Hue wraps into the range [0, 1).
+    /// Alpha is passed through unchanged. `out` must be the same length as
+    /// `values`, and may be the same slice to convert in place.
+    pub fn convertHSVtoRGBSlice(values: []const Vec4, out: []Vec4) void {
+        assert(values.len == out.len);
+        var i: usize = 0;
+        while (i + simd_batch_len <= values.len) : (i += simd_batch_len) {
+            simdHSVtoRGB(simd_batch_len, values[i..][0..simd_batch_len], out[i..][0..simd_batch_len]);
+        }
+        while (i < values.len) : (i += 1) {
+            simdHSVtoRGB(1, values[i..][0..1], out[i..][0..1]);
+        }
+    }
+    /// Convert RGBA values to HSVA, matching ColorConvertRGBtoHSV.
+    /// Alpha is passed through unchanged. `out` must be the same length as
+    /// `values`, and may be the same slice to convert in place.
+    pub fn convertRGBtoHSVSlice(values: []const Vec4, out: []Vec4) void {
+        assert(values.len == out.len);
+        var i: usize = 0;
+        while (i + simd_batch_len <= values.len) : (i += simd_batch_len) {
+            simdRGBtoHSV(simd_batch_len, values[i..][0..simd_batch_len], out[i..][0..simd_batch_len]);
+        }
+        while (i < values.len) : (i += 1) {
+            simdRGBtoHSV(1, values[i..][0..1], out[i..][0..1]);
+        }
+    }
+};
+
+// The slice conversions above work on `simd_batch_len` values at a time,
+// transposed so that each vector lane holds one channel of one value.
+const simd_batch_len = std.simd.suggestVectorLength(f32) orelse 4;
+
+fn SimdBatch(comptime len: usize) type {
+    return @Vector(len, f32);
+}
+
+fn simdLoadChannel(comptime len: usize, values: *const [len]Vec4, comptime channel: []const u8) SimdBatch(len) {
+    var result: SimdBatch(len) = undefined;
+    inline for (0..len) |i| result[i] = @field(values[i], channel);
+    return result;
+}
+
+fn simdStore(comptime len: usize, out: *[len]Vec4, x: SimdBatch(len), y: SimdBatch(len), z: SimdBatch(len), w: SimdBatch(len)) void {
+    inline for (0..len) |i| out[i] = .{ .x = x[i], .y = y[i], .z = z[i], .w = w[i] };
+}
+
+fn simdSaturateUnorm(comptime len: usize, value: SimdBatch(len)) @Vector(len, u32) {
+    const V = SimdBatch(len);
+    const saturated = @min(@max(value, @as(V, @splat(0.0))), @as(V, @splat(1.0)));
+    return @intFromFloat(saturated * @as(V, @splat(255.0)) + @as(V, @splat(0.5)));
+}
+
+fn simdPackABGR(comptime len: usize, values: *const [len]Vec4, out: *[len]u32) void {
+    const Shift = @Vector(len, u5);
+    const r = simdSaturateUnorm(len, simdLoadChannel(len, values, "x"));
+    const g = simdSaturateUnorm(len, simdLoadChannel(len, values, "y"));
+    const b = simdSaturateUnorm(len, simdLoadChannel(len, values, "z"));
+    const a = simdSaturateUnorm(len, simdLoadChannel(len, values, "w"));
+    out.* = r | (g << @as(Shift, @splat(8))) | (b << @as(Shift, @splat(16))) | (a << @as(Shift, @splat(24)));
+}
+
+fn simdUnpackABGR(comptime len: usize, values: *const [len]u32, out: *[len]Vec4) void {
+    const V = SimdBatch(len);
+    const U = @Vector(len, u32);
+    const Shift = @Vector(len, u5);
+    const mask: U = @splat(0xFF);
+    const inv_255: V = @splat(1.0 / 255.0);
+    const packed_values: U = values.*;
+    const r: V = @floatFromInt(packed_values & mask);
+    const g: V = @floatFromInt((packed_values >> @as(Shift, @splat(8))) & mask);
+    const b: V = @floatFromInt((packed_values >> @as(Shift, @splat(16))) & mask);
+    const a: V = @floatFromInt(packed_values >> @as(Shift, @splat(24)));
+    simdStore(len, out, r * inv_255, g * inv_255, b * inv_255, a * inv_255);
+}
+
+fn simdHSVtoRGB(comptime len: usize, values: *const [len]Vec4, out: *[len]Vec4) void {
+    const V = SimdBatch(len);
+    const one: V = @splat(1.0);
+    const h = simdLoadChannel(len, values, "x");
+    const s = simdLoadChannel(len, values, "y");
+    const v = simdLoadChannel(len, values, "z");
+    const a = simdLoadChannel(len, values, "w");
+
+    const h6 = (h - @floor(h)) * @as(V, @splat(6.0));
+    const sector = @floor(h6);
+    const f = h6 - sector;
+    const p = v * (one - s);
+    const q = v * (one - s * f);
+    const t = v * (one - s * (one - f));
+
+    // Sector:   0  1  2  3  4  5
+    // Red:      v  q  p  p  t  v
+    // Green:    t  v  v  q  p  p
+    // Blue:     p  p  t  v  v  q
+    var r = v;
+    var g = p;
+    var b = q;
+    inline for (.{
+        .{ 0, v, t, p },
+        .{ 1, q, v, p },
+        .{ 2, p, v, t },
+        .{ 3, p, q, v },
+        .{ 4, t, p, v },
+    }) |case| {
+        const in_sector = sector == @as(V, @splat(@as(f32, case[0])));
+        r = @select(f32, in_sector, case[1], r);
+        g = @select(f32, in_sector, case[2], g);
+        b = @select(f32, in_sector, case[3], b);
+    }
+    simdStore(len, out, r, g, b, a);
+}
+
+fn simdRGBtoHSV(comptime len: usize, values: *const [len]Vec4, out: *[len]Vec4) void {
+    const V = SimdBatch(len);
+    const zero: V = @splat(0.0);
+    const epsilon: V = @splat(1e-20);
+    const r = simdLoadChannel(len, values, "x");
+    const g = simdLoadChannel(len, values, "y");
+    const b = simdLoadChannel(len, values, "z");
+    const a = simdLoadChannel(len, values, "w");
+
+    // Branchless version of the swaps performed by ColorConvertRGBtoHSV
+    const swap_gb = g < b;
+    const g1 = @select(f32, swap_gb, b, g);
+    const b1 = @select(f32, swap_gb, g, b);
+    const k1 = @select(f32, swap_gb, @as(V, @splat(-1.0)), zero);
+    const swap_rg = r < g1;
+    const r2 = @select(f32, swap_rg, g1, r);
+    const g2 = @select(f32, swap_rg, r, g1);
+    const k2 = @select(f32, swap_rg, @as(V, @splat(-2.0 / 6.0)) - k1, k1);
+
+    const chroma = r2 - @min(g2, b1);
+    const hue = @abs(k2 + (g2 - b1) / (@as(V, @splat(6.0)) * chroma + epsilon));
+    const saturation = chroma / (r2 + epsilon);
+    simdStore(len, out, hue, saturation, r2, a);
+}
+
+/// Batched versions of DrawList primitives. Each call reserves vertices and
+/// indices for many primitives at once through PrimReserve and writes them
+/// directly into the draw list, instead of crossing the C ABI per primitive.
+/// Output is not anti-aliased, matching PrimRect.
+pub const DrawListBatch = struct {
+    pub const Rect = extern struct {
+        min: Vec2,
+        max: Vec2,
+        col: u32,
+    };
+
+    pub const Line = extern struct {
+        p1: Vec2,
+        p2: Vec2,
+        col: u32,
+    };
+
+    pub const Circle = extern struct {
+        center: Vec2,
+        radius: f32,
+        col: u32,
+    };
+
+    pub const max_circle_segments = 64;
+
+    /// Keep each reservation well below the 16-bit index limit, so that
+    /// PrimReserve can start a new command with a vertex offset when needed.
+    const max_chunk_vertices = 1 << 15;
+
+    const col_alpha_mask: u32 = 0xFF000000;
+
+    const Reservation = struct {
+        vtx: [*]DrawVert,
+        idx: [*]DrawIdx,
+        base: DrawIdx,
+    };
+
+    /// DrawListSharedData is opaque here, but its first field is TexUvWhitePixel.
+    /// Reading it through the draw list instead of the current context keeps
+    /// these functions usable on draw lists filled from other threads.
+    fn texUvWhitePixel(draw_list: *const DrawList) Vec2 {
+        return @as(*const Vec2, @ptrCast(@alignCast(draw_list._Data.?))).*;
+    }
+
+    fn reserve(draw_list: *DrawList, idx_count: usize, vtx_count: usize) Reservation {
+        draw_list.PrimReserve(@intCast(idx_count), @intCast(vtx_count));
+        return .{
+            .vtx = draw_list._VtxWritePtr.?,
+            .idx = draw_list._IdxWritePtr.?,
+            .base = @truncate(draw_list._VtxCurrentIdx),
+        };
+    }
+
+    fn commit(draw_list: *DrawList, reserved_idx: usize, reserved_vtx: usize, idx_count: usize, vtx_count: usize) void {
+        draw_list._VtxWritePtr = draw_list._VtxWritePtr.? + vtx_count;
+        draw_list._IdxWritePtr = draw_list._IdxWritePtr.? + idx_count;
+        draw_list._VtxCurrentIdx += @intCast(vtx_count);
+        if (reserved_idx != idx_count or reserved_vtx != vtx_count) {
+            draw_list.PrimUnreserve(@intCast(reserved_idx - idx_count), @intCast(reserved_vtx - vtx_count));
+        }
+    }
+
+    fn writeQuad(res: Reservation, quad: usize, corners: [4]Vec2, uv: Vec2, col: u32) void {
+        const quad_indices: @Vector(6, DrawIdx) = .{ 0, 1, 2, 0, 2, 3 };
+        const base: DrawIdx = res.base +% @as(DrawIdx, @truncate(quad * 4));
+        res.idx[quad * 6 ..][0..6].* = quad_indices +% @as(@Vector(6, DrawIdx), @splat(base));
+        inline for (corners, 0..) |corner, i| {
+            res.vtx[quad * 4 + i] = .{ .pos = corner, .uv = uv, .col = col };
+        }
+    }
+
+    /// Batched AddRectFilled without rounding. Fully transparent rectangles are skipped.
+    pub fn addRectsFilled(draw_list: *DrawList, rects: []const Rect) void {
+        const uv = texUvWhitePixel(draw_list);
+        const chunk_len = max_chunk_vertices / 4;
+        var start: usize = 0;
+        while (start < rects.len) : (start += chunk_len) {
+            const chunk = rects[start..@min(start + chunk_len, rects.len)];
+            const res = reserve(draw_list, chunk.len * 6, chunk.len * 4);
+            var written: usize = 0;
+            for (chunk) |rect| {
+                if ((rect.col & col_alpha_mask) == 0) continue;
+                writeQuad(res, written, .{
+                    rect.min,
+                    .{ .x = rect.max.x, .y = rect.min.y },
+                    rect.max,
+                    .{ .x = rect.min.x, .y = rect.max.y },
+                }, uv, rect.col);
+                written += 1;
+            }
+            commit(draw_list, chunk.len * 6, chunk.len * 4, written * 6, written * 4);
+        }
+    }
+
+    /// Batched AddLine, each line is emitted as a single quad of the given thickness.
+    /// Fully transparent lines are skipped.
+    pub fn addLines(draw_list: *DrawList, lines: []const Line, thickness: f32) void {
+        const uv = texUvWhitePixel(draw_list);
+        const half_thickness: Vec2.Simd = @splat(thickness * 0.5);
+        const chunk_len = max_chunk_vertices / 4;
+        var start: usize = 0;
+        while (start < lines.len) : (start += chunk_len) {
+            const chunk = lines[start..@min(start + chunk_len, lines.len)];
+            const res = reserve(draw_list, chunk.len * 6, chunk.len * 4);
+            var written: usize = 0;
+            for (chunk) |line| {
+                if ((line.col & col_alpha_mask) == 0) continue;
+                const p1 = line.p1.toSimd();
+                const p2 = line.p2.toSimd();
+                const delta = p2 - p1;
+                const len_sq = @reduce(.Add, delta * delta);
+                const inv_len: Vec2.Simd = @splat(if (len_sq > 0.0) 1.0 / @sqrt(len_sq) else 0.0);
+                const dir = delta * inv_len;
+                const normal = Vec2.Simd{ -dir[1], dir[0] } * half_thickness;
+                writeQuad(res, written, .{
+                    Vec2.fromSimd(p1 + normal),
+                    Vec2.fromSimd(p2 + normal),
+                    Vec2.fromSimd(p2 - normal),
+                    Vec2.fromSimd(p1 - normal),
+                }, uv, line.col);
+                written += 1;
+            }
+            commit(draw_list, chunk.len * 6, chunk.len * 4, written * 6, written * 4);
+        }
+    }
+
+    /// Batched AddCircleFilled with a fixed segment count shared by all circles,
+    /// clamped to [3, max_circle_segments]. Fully transparent or zero radius
+    /// circles are skipped.
+    pub fn addCirclesFilled(draw_list: *DrawList, circles: []const Circle, num_segments: u32) void {
+        const segments: usize = std.math.clamp(num_segments, 3, max_circle_segments);
+        var unit_circle: [max_circle_segments]Vec2.Simd = undefined;
+        for (unit_circle[0..segments], 0..) |*point, i| {
+            const angle = (@as(f32, @floatFromInt(i)) / @as(f32, @floatFromInt(segments))) * std.math.tau;
+            point.* = .{ @cos(angle), @sin(angle) };
+        }
+
+        const uv = texUvWhitePixel(draw_list);
+        const vtx_per_circle = segments;
+        const idx_per_circle = (segments - 2) * 3;
+        const chunk_len = max_chunk_vertices / vtx_per_circle;
+        var start: usize = 0;
+        while (start < circles.len) : (start += chunk_len) {
+            const chunk = circles[start..@min(start + chunk_len, circles.len)];
+            const res = reserve(draw_list, chunk.len * idx_per_circle, chunk.len * vtx_per_circle);
+            var written: usize = 0;
+            for (chunk) |circle| {
+                if ((circle.col & col_alpha_mask) == 0 or circle.radius <= 0.0) continue;
+                const center = circle.center.toSimd();
+                const radius: Vec2.Simd = @splat(circle.radius);
+                const vtx = res.vtx + written * vtx_per_circle;
+                for (unit_circle[0..segments], 0..) |point, i| {
+                    vtx[i] = .{ .pos = Vec2.fromSimd(center + point * radius), .uv = uv, .col = circle.col };
+                }
+                const base: DrawIdx = res.base +% @as(DrawIdx, @truncate(written * vtx_per_circle));
+                const idx = res.idx + written * idx_per_circle;
+                for (0..segments - 2) |i| {
+                    const tri: @Vector(3, DrawIdx) = .{ 0, @intCast(i + 1), @intCast(i + 2) };
+                    idx[i * 3 ..][0..3].* = tri +% @as(@Vector(3, DrawIdx), @splat(base));
+                }
+                written += 1;
+            }
+            commit(
+                draw_list,
+                chunk.len * idx_per_circle,
+                chunk.len * vtx_per_circle,
+                written * idx_per_circle,
+                written * vtx_per_circle,
+            );
+        }
+    }
+
+    /// Slice version of DrawList.AddPolyline
+    pub fn addPolyline(draw_list: *DrawList, points: []const Vec2, col: u32, flags: DrawFlags, thickness: f32) void {
+        draw_list.AddPolyline(@constCast(points.ptr), @intCast(points.len), col, flags, thickness);
+    }
+
+    /// Slice version of DrawList.AddConvexPolyFilled
+    pub fn addConvexPolyFilled(draw_list: *DrawList, points: []const Vec2, col: u32) void {
+        draw_list.AddConvexPolyFilled(@constCast(points.ptr), @intCast(points.len), col);
+    }
+};
+
+/// Glue for the generated InputText*ArrayList functions, which edit a
+/// std.ArrayList(u8) in place and grow it through InputTextFlags.CallbackResize.
+/// `items` holds the text, followed by a null terminator within `capacity`.
+/// Other callback events are forwarded to the user's callback, with its own
+/// user data. Resize events are never forwarded.
+pub const InputTextArrayListState = struct {
+    list: *std.ArrayList(u8),
+    user_callback: InputTextCallback,
+    user_data: ?*anyopaque,
+
+    pub const callback: InputTextCallback = @ptrCast(@constCast(&resizeCallback));
+
+    pub fn init(list: *std.ArrayList(u8), user_callback: InputTextCallback, user_data: ?*anyopaque) std.mem.Allocator.Error!InputTextArrayListState {
+        try list.ensureTotalCapacity(list.items.len + 1);
+        list.allocatedSlice()[list.items.len] = 0;
+        return .{ .list = list, .user_callback = user_callback, .user_data = user_data };
+    }
+
+    pub fn buf(self: InputTextArrayListState) [*]u8 {
+        return self.list.items.ptr;
+    }
+
+    pub fn bufSize(self: InputTextArrayListState) usize {
+        return @min(self.list.capacity, std.math.maxInt(i32));
+    }
+
+    fn resizeCallback(data: ?*InputTextCallbackData) callconv(.C) i32 {
+        const d = data.?;
+        const self: *InputTextArrayListState = @ptrCast(@alignCast(d.UserData.?));
+        if (d.EventFlag.CallbackResize) {
+            assert(d.Buf.? == self.list.items.ptr);
+            const text_len: usize = @intCast(d.BufTextLen);
+            // If growing fails, ImGui truncates the text to the size we report.
+            self.list.ensureTotalCapacity(text_len + 1) catch {};
+            self.list.items.len = @min(text_len, self.bufSize() - 1);
+            d.Buf = self.list.items.ptr;
+            d.BufSize = @intCast(self.bufSize());
+            return 0;
+        }
+        if (self.user_callback) |user_callback| {
+            d.UserData = self.user_data;
+            defer d.UserData = self;
+            return user_callback(d);
+        }
+        return 0;
+    }
+};
+
+/// Call counts, and optionally timings, for every function in `raw`.
+/// Enabled by building Zig-ImGui with -Denable_instrumentation=true, and
+/// -Dinstrumentation_timing=true for timings. When disabled, `raw` refers to
+/// the extern functions directly, so none of this is compiled in.
+/// Variadic functions such as igText are not instrumented.
+pub const instrumentation = struct {
+    pub const enabled = build_options.enable_instrumentation and @hasDecl(imgui, "raw_instrumented");
+    pub const timing = enabled and build_options.instrumentation_timing;
+
+    pub const Function = blk: {
+        @setEvalBranchQuota(10000);
+        break :blk std.meta.DeclEnum(raw_extern);
+    };
+    const function_count = @typeInfo(Function).Enum.fields.len;
+
+    pub const Stats = struct {
+        calls: u64 = 0,
+        /// Only measured when timing is enabled.
+        total_ns: u64 = 0,
+    };
+
+    var table = [_]Stats{.{}} ** function_count;
+
+    fn ReturnType(comptime function: Function) type {
+        return @typeInfo(@TypeOf(@field(raw_extern, @tagName(function)))).Fn.return_type.?;
+    }
+
+    /// Called by the instrumented `raw` functions.
+    pub inline fn call(comptime function: Function, args: anytype) ReturnType(function) {
+        const stats = &table[@intFromEnum(function)];
+        _ = @atomicRmw(u64, &stats.calls, .Add, 1, .monotonic);
+        const f = @field(raw_extern, @tagName(function));
+        if (!timing) return @call(.auto, f, args);
+
+        const start = std.time.Instant.now() catch return @call(.auto, f, args);
+        defer {
+            if (std.time.Instant.now()) |end| {
+                _ = @atomicRmw(u64, &stats.total_ns, .Add, end.since(start), .monotonic);
+            } else |_| {}
+        }
+        return @call(.auto, f, args);
+    }
+
+    pub fn get(function: Function) Stats {
+        const stats = &table[@intFromEnum(function)];
+        return .{
+            .calls = @atomicLoad(u64, &stats.calls, .monotonic),
+            .total_ns = @atomicLoad(u64, &stats.total_ns, .monotonic),
+        };
+    }
+
+    pub fn reset() void {
+        for (&table) |*stats| {
+            @atomicStore(u64, &stats.calls, 0, .monotonic);
+            @atomicStore(u64, &stats.total_ns, 0, .monotonic);
+        }
+    }
+
+    /// Write one line per called function, sorted by total time when timing
+    /// is enabled, and by number of calls otherwise.
+    pub fn dump(writer: anytype) !void {
+        var order: [function_count]Function = undefined;
+        var len: usize = 0;
+        for (0..function_count) |i| {
+            const function: Function = @enumFromInt(i);
+            if (get(function).calls != 0) {
+                order[len] = function;
+                len += 1;
+            }
+        }
+        std.mem.sort(Function, order[0..len], {}, struct {
+            fn moreExpensive(_: void, a: Function, b: Function) bool {
+                const sa = get(a);
+                const sb = get(b);
+                return if (timing) sa.total_ns > sb.total_ns else sa.calls > sb.calls;
+            }
+        }.moreExpensive);
+
+        try writer.print("{s:<48} {s:>12} {s:>14} {s:>10}\n", .{ "function", "calls", "total ns", "ns/call" });
+        for (order[0..len]) |function| {
+            const stats = get(function);
+            try writer.print("{s:<48} {d:>12} {d:>14} {d:>10}\n", .{ @tagName(function), stats.calls, stats.total_ns, stats.total_ns / stats.calls });
+        }
+    }
 };
 
 fn imguiZigAlloc(_: *anyopaque, len: usize, ptr_align: u8, ret_addr: usize) ?[*]u8 {
@@ -4168,6 +4738,14 @@ pub inline fn InputText(label: ?[*:0]const u8, buf: ?[*]u8, buf_size: usize) boo
     return @This().InputTextExt(label, buf, buf_size, .{}, null, null);
 }
 
+pub inline fn InputTextArrayListExt(label: ?[*:0]const u8, buf: *std.ArrayList(u8), flags: InputTextFlags, callback: InputTextCallback, user_data: ?*anyopaque) std.mem.Allocator.Error!bool {
+    var _state = try InputTextArrayListState.init(buf, callback, user_data);
+    return raw.igInputText(label, _state.buf(), _state.bufSize(), flags.with(.{ .CallbackResize = true }).toInt(), InputTextArrayListState.callback, &_state);
+}
+pub inline fn InputTextArrayList(label: ?[*:0]const u8, buf: *std.ArrayList(u8)) std.mem.Allocator.Error!bool {
+    return @This().InputTextArrayListExt(label, buf, .{}, null, null);
+}
+
 pub inline fn InputTextMultilineExt(label: ?[*:0]const u8, buf: ?[*]u8, buf_size: usize, size: Vec2, flags: InputTextFlags, callback: InputTextCallback, user_data: ?*anyopaque) bool {
     return raw.igInputTextMultiline(label, buf, buf_size, size, flags.toInt(), callback, user_data);
 }
@@ -4175,6 +4753,14 @@ pub inline fn InputTextMultiline(label: ?[*:0]const u8, buf: ?[*]u8, buf_size: u
     return @This().InputTextMultilineExt(label, buf, buf_size, .{.x=0,.y=0}, .{}, null, null);
 }
 
+pub inline fn InputTextMultilineArrayListExt(label: ?[*:0]const u8, buf: *std.ArrayList(u8), size: Vec2, flags: InputTextFlags, callback: InputTextCallback, user_data: ?*anyopaque) std.mem.Allocator.Error!bool {
+    var _state = try InputTextArrayListState.init(buf, callback, user_data);
+    return raw.igInputTextMultiline(label, _state.buf(), _state.bufSize(), size, flags.with(.{ .CallbackResize = true }).toInt(), InputTextArrayListState.callback, &_state);
+}
+pub inline fn InputTextMultilineArrayList(label: ?[*:0]const u8, buf: *std.ArrayList(u8)) std.mem.Allocator.Error!bool {
+    return @This().InputTextMultilineArrayListExt(label, buf, .{.x=0,.y=0}, .{}, null, null);
+}
+
 pub inline fn InputTextWithHintExt(label: ?[*:0]const u8, hint: ?[*:0]const u8, buf: ?[*]u8, buf_size: usize, flags: InputTextFlags, callback: InputTextCallback, user_data: ?*anyopaque) bool {
     return raw.igInputTextWithHint(label, hint, buf, buf_size, flags.toInt(), callback, user_data);
 }
@@ -4182,6 +4768,14 @@ pub inline fn InputTextWithHint(label: ?[*:0]const u8, hint: ?[*:0]const u8, buf
     return @This().InputTextWithHintExt(label, hint, buf, buf_size, .{}, null, null);
 }
 
+pub inline fn InputTextWithHintArrayListExt(label: ?[*:0]const u8, hint: ?[*:0]const u8, buf: *std.ArrayList(u8), flags: InputTextFlags, callback: InputTextCallback, user_data: ?*anyopaque) std.mem.Allocator.Error!bool {
+    var _state = try InputTextArrayListState.init(buf, callback, user_data);
+    return raw.igInputTextWithHint(label, hint, _state.buf(), _state.bufSize(), flags.with(.{ .CallbackResize = true }).toInt(), InputTextArrayListState.callback, &_state);
+}
+pub inline fn InputTextWithHintArrayList(label: ?[*:0]const u8, hint: ?[*:0]const u8, buf: *std.ArrayList(u8)) std.mem.Allocator.Error!bool {
+    return @This().InputTextWithHintArrayListExt(label, hint, buf, .{}, null, null);
+}
+
 pub inline fn InvisibleButtonExt(str_id: ?[*:0]const u8, size: Vec2, flags: ButtonFlags) bool {
     return raw.igInvisibleButton(str_id, size, flags.toInt());
 }
@@ -5116,7 +5710,9 @@ pub inline fn Value_Float(prefix: ?[*:0]const u8, v: f32) void {
     return @This().Value_FloatExt(prefix, v, null);
 }
 
-pub const raw = struct {
+pub const raw = if (instrumentation.enabled) raw_instrumented else raw_extern;
+
+const raw_extern = struct {
     pub extern fn ImColor_HSV(pOut: *Color, h: f32, s: f32, v: f32, a: f32) callconv(.C) void;
     pub extern fn ImColor_ImColor_Nil() callconv(.C) *Color;
     pub extern fn ImColor_ImColor_Float(r: f32, g: f32, b: f32, a: f32) callconv(.C) *Color;
@@ -5767,3 +6363,655 @@ pub const raw = struct {
     pub extern fn igValue_Uint(prefix: ?[*:0]const u8, v: u32) callconv(.C) void;
     pub extern fn igValue_Float(prefix: ?[*:0]const u8, v: f32, float_format: ?[*:0]const u8) callconv(.C) void;
 };
+
+const raw_instrumented = struct {
+    pub fn ImColor_HSV(pOut: *Color, h: f32, s: f32, v: f32, a: f32) callconv(.C) void { return instrumentation.call(.ImColor_HSV, .{ pOut, h, s, v, a }); }
+    pub fn ImColor_ImColor_Nil() callconv(.C) *Color { return instrumentation.call(.ImColor_ImColor_Nil, .{  }); }
+    pub fn ImColor_ImColor_Float(r: f32, g: f32, b: f32, a: f32) callconv(.C) *Color { return instrumentation.call(.ImColor_ImColor_Float, .{ r, g, b, a }); }
+    pub fn ImColor_ImColor_Vec4(col: Vec4) callconv(.C) *Color { return instrumentation.call(.ImColor_ImColor_Vec4, .{ col }); }
+    pub fn ImColor_ImColor_Int(r: i32, g: i32, b: i32, a: i32) callconv(.C) *Color { return instrumentation.call(.ImColor_ImColor_Int, .{ r, g, b, a }); }
+    pub fn ImColor_ImColor_U32(rgba: u32) callconv(.C) *Color { return instrumentation.call(.ImColor_ImColor_U32, .{ rgba }); }
+    pub fn ImColor_SetHSV(self: *Color, h: f32, s: f32, v: f32, a: f32) callconv(.C) void { return instrumentation.call(.ImColor_SetHSV, .{ self, h, s, v, a }); }
+    pub fn ImColor_destroy(self: *Color) callconv(.C) void { return instrumentation.call(.ImColor_destroy, .{ self }); }
+    pub fn ImDrawCmd_GetTexID(self: *DrawCmd) callconv(.C) TextureID { return instrumentation.call(.ImDrawCmd_GetTexID, .{ self }); }
+    pub fn ImDrawCmd_ImDrawCmd() callconv(.C) *DrawCmd { return instrumentation.call(.ImDrawCmd_ImDrawCmd, .{  }); }
+    pub fn ImDrawCmd_destroy(self: *DrawCmd) callconv(.C) void { return instrumentation.call(.ImDrawCmd_destroy, .{ self }); }
+    pub fn ImDrawData_AddDrawList(self: *DrawData, draw_list: ?*DrawList) callconv(.C) void { return instrumentation.call(.ImDrawData_AddDrawList, .{ self, draw_list }); }
+    pub fn ImDrawData_Clear(self: *DrawData) callconv(.C) void { return instrumentation.call(.ImDrawData_Clear, .{ self }); }
+    pub fn ImDrawData_DeIndexAllBuffers(self: *DrawData) callconv(.C) void { return instrumentation.call(.ImDrawData_DeIndexAllBuffers, .{ self }); }
+    pub fn ImDrawData_ImDrawData() callconv(.C) *DrawData { return instrumentation.call(.ImDrawData_ImDrawData, .{  }); }
+    pub fn ImDrawData_ScaleClipRects(self: *DrawData, fb_scale: Vec2) callconv(.C) void { return instrumentation.call(.ImDrawData_ScaleClipRects, .{ self, fb_scale }); }
+    pub fn ImDrawData_destroy(self: *DrawData) callconv(.C) void { return instrumentation.call(.ImDrawData_destroy, .{ self }); }
+    pub fn ImDrawListSplitter_Clear(self: *DrawListSplitter) callconv(.C) void { return instrumentation.call(.ImDrawListSplitter_Clear, .{ self }); }
+    pub fn ImDrawListSplitter_ClearFreeMemory(self: *DrawListSplitter) callconv(.C) void { return instrumentation.call(.ImDrawListSplitter_ClearFreeMemory, .{ self }); }
+    pub fn ImDrawListSplitter_ImDrawListSplitter() callconv(.C) *DrawListSplitter { return instrumentation.call(.ImDrawListSplitter_ImDrawListSplitter, .{  }); }
+    pub fn ImDrawListSplitter_Merge(self: *DrawListSplitter, draw_list: ?*DrawList) callconv(.C) void { return instrumentation.call(.ImDrawListSplitter_Merge, .{ self, draw_list }); }
+    pub fn ImDrawListSplitter_SetCurrentChannel(self: *DrawListSplitter, draw_list: ?*DrawList, channel_idx: i32) callconv(.C) void { return instrumentation.call(.ImDrawListSplitter_SetCurrentChannel, .{ self, draw_list, channel_idx }); }
+    pub fn ImDrawListSplitter_Split(self: *DrawListSplitter, draw_list: ?*DrawList, count: i32) callconv(.C) void { return instrumentation.call(.ImDrawListSplitter_Split, .{ self, draw_list, count }); }
+    pub fn ImDrawListSplitter_destroy(self: *DrawListSplitter) callconv(.C) void { return instrumentation.call(.ImDrawListSplitter_destroy, .{ self }); }
+    pub fn ImDrawList_AddBezierCubic(self: *DrawList, p1: Vec2, p2: Vec2, p3: Vec2, p4: Vec2, col: u32, thickness: f32, num_segments: i32) callconv(.C) void { return instrumentation.call(.ImDrawList_AddBezierCubic, .{ self, p1, p2, p3, p4, col, thickness, num_segments }); }
+    pub fn ImDrawList_AddBezierQuadratic(self: *DrawList, p1: Vec2, p2: Vec2, p3: Vec2, col: u32, thickness: f32, num_segments: i32) callconv(.C) void { return instrumentation.call(.ImDrawList_AddBezierQuadratic, .{ self, p1, p2, p3, col, thickness, num_segments }); }
+    pub fn ImDrawList_AddCallback(self: *DrawList, callback: DrawCallback, callback_data: ?*anyopaque) callconv(.C) void { return instrumentation.call(.ImDrawList_AddCallback, .{ self, callback, callback_data }); }
+    pub fn ImDrawList_AddCircle(self: *DrawList, center: Vec2, radius: f32, col: u32, num_segments: i32, thickness: f32) callconv(.C) void { return instrumentation.call(.ImDrawList_AddCircle, .{ self, center, radius, col, num_segments, thickness }); }
+    pub fn ImDrawList_AddCircleFilled(self: *DrawList, center: Vec2, radius: f32, col: u32, num_segments: i32) callconv(.C) void { return instrumentation.call(.ImDrawList_AddCircleFilled, .{ self, center, radius, col, num_segments }); }
+    pub fn ImDrawList_AddConvexPolyFilled(self: *DrawList, points: ?[*]Vec2, num_points: i32, col: u32) callconv(.C) void { return instrumentation.call(.ImDrawList_AddConvexPolyFilled, .{ self, points, num_points, col }); }
+    pub fn ImDrawList_AddDrawCmd(self: *DrawList) callconv(.C) void { return instrumentation.call(.ImDrawList_AddDrawCmd, .{ self }); }
+    pub fn ImDrawList_AddEllipse(self: *DrawList, center: Vec2, radius_x: f32, radius_y: f32, col: u32, rot: f32, num_segments: i32, thickness: f32) callconv(.C) void { return instrumentation.call(.ImDrawList_AddEllipse, .{ self, center, radius_x, radius_y, col, rot, num_segments, thickness }); }
+    pub fn ImDrawList_AddEllipseFilled(self: *DrawList, center: Vec2, radius_x: f32, radius_y: f32, col: u32, rot: f32, num_segments: i32) callconv(.C) void { return instrumentation.call(.ImDrawList_AddEllipseFilled, .{ self, center, radius_x, radius_y, col, rot, num_segments }); }
+    pub fn ImDrawList_AddImage(self: *DrawList, user_texture_id: TextureID, p_min: Vec2, p_max: Vec2, uv_min: Vec2, uv_max: Vec2, col: u32) callconv(.C) void { return instrumentation.call(.ImDrawList_AddImage, .{ self, user_texture_id, p_min, p_max, uv_min, uv_max, col }); }
+    pub fn ImDrawList_AddImageQuad(self: *DrawList, user_texture_id: TextureID, p1: Vec2, p2: Vec2, p3: Vec2, p4: Vec2, uv1: Vec2, uv2: Vec2, uv3: Vec2, uv4: Vec2, col: u32) callconv(.C) void { return instrumentation.call(.ImDrawList_AddImageQuad, .{ self, user_texture_id, p1, p2, p3, p4, uv1, uv2, uv3, uv4, col }); }
+    pub fn ImDrawList_AddImageRounded(self: *DrawList, user_texture_id: TextureID, p_min: Vec2, p_max: Vec2, uv_min: Vec2, uv_max: Vec2, col: u32, rounding: f32, flags: DrawFlagsInt) callconv(.C) void { return instrumentation.call(.ImDrawList_AddImageRounded, .{ self, user_texture_id, p_min, p_max, uv_min, uv_max, col, rounding, flags }); }
+    pub fn ImDrawList_AddLine(self: *DrawList, p1: Vec2, p2: Vec2, col: u32, thickness: f32) callconv(.C) void { return instrumentation.call(.ImDrawList_AddLine, .{ self, p1, p2, col, thickness }); }
+    pub fn ImDrawList_AddNgon(self: *DrawList, center: Vec2, radius: f32, col: u32, num_segments: i32, thickness: f32) callconv(.C) void { return instrumentation.call(.ImDrawList_AddNgon, .{ self, center, radius, col, num_segments, thickness }); }
+    pub fn ImDrawList_AddNgonFilled(self: *DrawList, center: Vec2, radius: f32, col: u32, num_segments: i32) callconv(.C) void { return instrumentation.call(.ImDrawList_AddNgonFilled, .{ self, center, radius, col, num_segments }); }
+    pub fn ImDrawList_AddPolyline(self: *DrawList, points: ?[*]Vec2, num_points: i32, col: u32, flags: DrawFlagsInt, thickness: f32) callconv(.C) void { return instrumentation.call(.ImDrawList_AddPolyline, .{ self, points, num_points, col, flags, thickness }); }
+    pub fn ImDrawList_AddQuad(self: *DrawList, p1: Vec2, p2: Vec2, p3: Vec2, p4: Vec2, col: u32, thickness: f32) callconv(.C) void { return instrumentation.call(.ImDrawList_AddQuad, .{ self, p1, p2, p3, p4, col, thickness }); }
+    pub fn ImDrawList_AddQuadFilled(self: *DrawList, p1: Vec2, p2: Vec2, p3: Vec2, p4: Vec2, col: u32) callconv(.C) void { return instrumentation.call(.ImDrawList_AddQuadFilled, .{ self, p1, p2, p3, p4, col }); }
+    pub fn ImDrawList_AddRect(self: *DrawList, p_min: Vec2, p_max: Vec2, col: u32, rounding: f32, flags: DrawFlagsInt, thickness: f32) callconv(.C) void { return instrumentation.call(.ImDrawList_AddRect, .{ self, p_min, p_max, col, rounding, flags, thickness }); }
+    pub fn ImDrawList_AddRectFilled(self: *DrawList, p_min: Vec2, p_max: Vec2, col: u32, rounding: f32, flags: DrawFlagsInt) callconv(.C) void { return instrumentation.call(.ImDrawList_AddRectFilled, .{ self, p_min, p_max, col, rounding, flags }); }
+    pub fn ImDrawList_AddRectFilledMultiColor(self: *DrawList, p_min: Vec2, p_max: Vec2, col_upr_left: u32, col_upr_right: u32, col_bot_right: u32, col_bot_left: u32) callconv(.C) void { return instrumentation.call(.ImDrawList_AddRectFilledMultiColor, .{ self, p_min, p_max, col_upr_left, col_upr_right, col_bot_right, col_bot_left }); }
+    pub fn ImDrawList_AddText_Vec2(self: *DrawList, pos: Vec2, col: u32, text_begin: ?[*]const u8, text_end: ?[*]const u8) callconv(.C) void { return instrumentation.call(.ImDrawList_AddText_Vec2, .{ self, pos, col, text_begin, text_end }); }
+    pub fn ImDrawList_AddText_FontPtr(self: *DrawList, font: ?*const Font, font_size: f32, pos: Vec2, col: u32, text_begin: ?[*]const u8, text_end: ?[*]const u8, wrap_width: f32, cpu_fine_clip_rect: ?*Vec4) callconv(.C) void { return instrumentation.call(.ImDrawList_AddText_FontPtr, .{ self, font, font_size, pos, col, text_begin, text_end, wrap_width, cpu_fine_clip_rect }); }
+    pub fn ImDrawList_AddTriangle(self: *DrawList, p1: Vec2, p2: Vec2, p3: Vec2, col: u32, thickness: f32) callconv(.C) void { return instrumentation.call(.ImDrawList_AddTriangle, .{ self, p1, p2, p3, col, thickness }); }
+    pub fn ImDrawList_AddTriangleFilled(self: *DrawList, p1: Vec2, p2: Vec2, p3: Vec2, col: u32) callconv(.C) void { return instrumentation.call(.ImDrawList_AddTriangleFilled, .{ self, p1, p2, p3, col }); }
+    pub fn ImDrawList_ChannelsMerge(self: *DrawList) callconv(.C) void { return instrumentation.call(.ImDrawList_ChannelsMerge, .{ self }); }
+    pub fn ImDrawList_ChannelsSetCurrent(self: *DrawList, n: i32) callconv(.C) void { return instrumentation.call(.ImDrawList_ChannelsSetCurrent, .{ self, n }); }
+    pub fn ImDrawList_ChannelsSplit(self: *DrawList, count: i32) callconv(.C) void { return instrumentation.call(.ImDrawList_ChannelsSplit, .{ self, count }); }
+    pub fn ImDrawList_CloneOutput(self: *DrawList) callconv(.C) ?*DrawList { return instrumentation.call(.ImDrawList_CloneOutput, .{ self }); }
+    pub fn ImDrawList_GetClipRectMax(pOut: *Vec2, self: *DrawList) callconv(.C) void { return instrumentation.call(.ImDrawList_GetClipRectMax, .{ pOut, self }); }
+    pub fn ImDrawList_GetClipRectMin(pOut: *Vec2, self: *DrawList) callconv(.C) void { return instrumentation.call(.ImDrawList_GetClipRectMin, .{ pOut, self }); }
+    pub fn ImDrawList_ImDrawList(shared_data: ?*DrawListSharedData) callconv(.C) *DrawList { return instrumentation.call(.ImDrawList_ImDrawList, .{ shared_data }); }
+    pub fn ImDrawList_PathArcTo(self: *DrawList, center: Vec2, radius: f32, a_min: f32, a_max: f32, num_segments: i32) callconv(.C) void { return instrumentation.call(.ImDrawList_PathArcTo, .{ self, center, radius, a_min, a_max, num_segments }); }
+    pub fn ImDrawList_PathArcToFast(self: *DrawList, center: Vec2, radius: f32, a_min_of_12: i32, a_max_of_12: i32) callconv(.C) void { return instrumentation.call(.ImDrawList_PathArcToFast, .{ self, center, radius, a_min_of_12, a_max_of_12 }); }
+    pub fn ImDrawList_PathBezierCubicCurveTo(self: *DrawList, p2: Vec2, p3: Vec2, p4: Vec2, num_segments: i32) callconv(.C) void { return instrumentation.call(.ImDrawList_PathBezierCubicCurveTo, .{ self, p2, p3, p4, num_segments }); }
+    pub fn ImDrawList_PathBezierQuadraticCurveTo(self: *DrawList, p2: Vec2, p3: Vec2, num_segments: i32) callconv(.C) void { return instrumentation.call(.ImDrawList_PathBezierQuadraticCurveTo, .{ self, p2, p3, num_segments }); }
+    pub fn ImDrawList_PathClear(self: *DrawList) callconv(.C) void { return instrumentation.call(.ImDrawList_PathClear, .{ self }); }
+    pub fn ImDrawList_PathEllipticalArcTo(self: *DrawList, center: Vec2, radius_x: f32, radius_y: f32, rot: f32, a_min: f32, a_max: f32, num_segments: i32) callconv(.C) void { return instrumentation.call(.ImDrawList_PathEllipticalArcTo, .{ self, center, radius_x, radius_y, rot, a_min, a_max, num_segments }); }
+    pub fn ImDrawList_PathFillConvex(self: *DrawList, col: u32) callconv(.C) void { return instrumentation.call(.ImDrawList_PathFillConvex, .{ self, col }); }
+    pub fn ImDrawList_PathLineTo(self: *DrawList, pos: Vec2) callconv(.C) void { return instrumentation.call(.ImDrawList_PathLineTo, .{ self, pos }); }
+    pub fn ImDrawList_PathLineToMergeDuplicate(self: *DrawList, pos: Vec2) callconv(.C) void { return instrumentation.call(.ImDrawList_PathLineToMergeDuplicate, .{ self, pos }); }
+    pub fn ImDrawList_PathRect(self: *DrawList, rect_min: Vec2, rect_max: Vec2, rounding: f32, flags: DrawFlagsInt) callconv(.C) void { return instrumentation.call(.ImDrawList_PathRect, .{ self, rect_min, rect_max, rounding, flags }); }
+    pub fn ImDrawList_PathStroke(self: *DrawList, col: u32, flags: DrawFlagsInt, thickness: f32) callconv(.C) void { return instrumentation.call(.ImDrawList_PathStroke, .{ self, col, flags, thickness }); }
+    pub fn ImDrawList_PopClipRect(self: *DrawList) callconv(.C) void { return instrumentation.call(.ImDrawList_PopClipRect, .{ self }); }
+    pub fn ImDrawList_PopTextureID(self: *DrawList) callconv(.C) void { return instrumentation.call(.ImDrawList_PopTextureID, .{ self }); }
+    pub fn ImDrawList_PrimQuadUV(self: *DrawList, a: Vec2, b: Vec2, c: Vec2, d: Vec2, uv_a: Vec2, uv_b: Vec2, uv_c: Vec2, uv_d: Vec2, col: u32) callconv(.C) void { return instrumentation.call(.ImDrawList_PrimQuadUV, .{ self, a, b, c, d, uv_a, uv_b, uv_c, uv_d, col }); }
+    pub fn ImDrawList_PrimRect(self: *DrawList, a: Vec2, b: Vec2, col: u32) callconv(.C) void { return instrumentation.call(.ImDrawList_PrimRect, .{ self, a, b, col }); }
+    pub fn ImDrawList_PrimRectUV(self: *DrawList, a: Vec2, b: Vec2, uv_a: Vec2, uv_b: Vec2, col: u32) callconv(.C) void { return instrumentation.call(.ImDrawList_PrimRectUV, .{ self, a, b, uv_a, uv_b, col }); }
+    pub fn ImDrawList_PrimReserve(self: *DrawList, idx_count: i32, vtx_count: i32) callconv(.C) void { return instrumentation.call(.ImDrawList_PrimReserve, .{ self, idx_count, vtx_count }); }
+    pub fn ImDrawList_PrimUnreserve(self: *DrawList, idx_count: i32, vtx_count: i32) callconv(.C) void { return instrumentation.call(.ImDrawList_PrimUnreserve, .{ self, idx_count, vtx_count }); }
+    pub fn ImDrawList_PrimVtx(self: *DrawList, pos: Vec2, uv: Vec2, col: u32) callconv(.C) void { return instrumentation.call(.ImDrawList_PrimVtx, .{ self, pos, uv, col }); }
+    pub fn ImDrawList_PrimWriteIdx(self: *DrawList, idx: DrawIdx) callconv(.C) void { return instrumentation.call(.ImDrawList_PrimWriteIdx, .{ self, idx }); }
+    pub fn ImDrawList_PrimWriteVtx(self: *DrawList, pos: Vec2, uv: Vec2, col: u32) callconv(.C) void { return instrumentation.call(.ImDrawList_PrimWriteVtx, .{ self, pos, uv, col }); }
+    pub fn ImDrawList_PushClipRect(self: *DrawList, clip_rect_min: Vec2, clip_rect_max: Vec2, intersect_with_current_clip_rect: bool) callconv(.C) void { return instrumentation.call(.ImDrawList_PushClipRect, .{ self, clip_rect_min, clip_rect_max, intersect_with_current_clip_rect }); }
+    pub fn ImDrawList_PushClipRectFullScreen(self: *DrawList) callconv(.C) void { return instrumentation.call(.ImDrawList_PushClipRectFullScreen, .{ self }); }
+    pub fn ImDrawList_PushTextureID(self: *DrawList, texture_id: TextureID) callconv(.C) void { return instrumentation.call(.ImDrawList_PushTextureID, .{ self, texture_id }); }
+    pub fn ImDrawList__CalcCircleAutoSegmentCount(self: *DrawList, radius: f32) callconv(.C) i32 { return instrumentation.call(.ImDrawList__CalcCircleAutoSegmentCount, .{ self, radius }); }
+    pub fn ImDrawList__ClearFreeMemory(self: *DrawList) callconv(.C) void { return instrumentation.call(.ImDrawList__ClearFreeMemory, .{ self }); }
+    pub fn ImDrawList__OnChangedClipRect(self: *DrawList) callconv(.C) void { return instrumentation.call(.ImDrawList__OnChangedClipRect, .{ self }); }
+    pub fn ImDrawList__OnChangedTextureID(self: *DrawList) callconv(.C) void { return instrumentation.call(.ImDrawList__OnChangedTextureID, .{ self }); }
+    pub fn ImDrawList__OnChangedVtxOffset(self: *DrawList) callconv(.C) void { return instrumentation.call(.ImDrawList__OnChangedVtxOffset, .{ self }); }
+    pub fn ImDrawList__PathArcToFastEx(self: *DrawList, center: Vec2, radius: f32, a_min_sample: i32, a_max_sample: i32, a_step: i32) callconv(.C) void { return instrumentation.call(.ImDrawList__PathArcToFastEx, .{ self, center, radius, a_min_sample, a_max_sample, a_step }); }
+    pub fn ImDrawList__PathArcToN(self: *DrawList, center: Vec2, radius: f32, a_min: f32, a_max: f32, num_segments: i32) callconv(.C) void { return instrumentation.call(.ImDrawList__PathArcToN, .{ self, center, radius, a_min, a_max, num_segments }); }
+    pub fn ImDrawList__PopUnusedDrawCmd(self: *DrawList) callconv(.C) void { return instrumentation.call(.ImDrawList__PopUnusedDrawCmd, .{ self }); }
+    pub fn ImDrawList__ResetForNewFrame(self: *DrawList) callconv(.C) void { return instrumentation.call(.ImDrawList__ResetForNewFrame, .{ self }); }
+    pub fn ImDrawList__TryMergeDrawCmds(self: *DrawList) callconv(.C) void { return instrumentation.call(.ImDrawList__TryMergeDrawCmds, .{ self }); }
+    pub fn ImDrawList_destroy(self: *DrawList) callconv(.C) void { return instrumentation.call(.ImDrawList_destroy, .{ self }); }
+    pub fn ImFontAtlasCustomRect_ImFontAtlasCustomRect() callconv(.C) *FontAtlasCustomRect { return instrumentation.call(.ImFontAtlasCustomRect_ImFontAtlasCustomRect, .{  }); }
+    pub fn ImFontAtlasCustomRect_IsPacked(self: *FontAtlasCustomRect) callconv(.C) bool { return instrumentation.call(.ImFontAtlasCustomRect_IsPacked, .{ self }); }
+    pub fn ImFontAtlasCustomRect_destroy(self: *FontAtlasCustomRect) callconv(.C) void { return instrumentation.call(.ImFontAtlasCustomRect_destroy, .{ self }); }
+    pub fn ImFontAtlas_AddCustomRectFontGlyph(self: *FontAtlas, font: ?*Font, id: Wchar, width: i32, height: i32, advance_x: f32, offset: Vec2) callconv(.C) i32 { return instrumentation.call(.ImFontAtlas_AddCustomRectFontGlyph, .{ self, font, id, width, height, advance_x, offset }); }
+    pub fn ImFontAtlas_AddCustomRectRegular(self: *FontAtlas, width: i32, height: i32) callconv(.C) i32 { return instrumentation.call(.ImFontAtlas_AddCustomRectRegular, .{ self, width, height }); }
+    pub fn ImFontAtlas_AddFont(self: *FontAtlas, font_cfg: ?*const FontConfig) callconv(.C) ?*Font { return instrumentation.call(.ImFontAtlas_AddFont, .{ self, font_cfg }); }
+    pub fn ImFontAtlas_AddFontDefault(self: *FontAtlas, font_cfg: ?*const FontConfig) callconv(.C) ?*Font { return instrumentation.call(.ImFontAtlas_AddFontDefault, .{ self, font_cfg }); }
+    pub fn ImFontAtlas_AddFontFromFileTTF(self: *FontAtlas, filename: ?[*:0]const u8, size_pixels: f32, font_cfg: ?*const FontConfig, glyph_ranges: ?[*:0]const Wchar) callconv(.C) ?*Font { return instrumentation.call(.ImFontAtlas_AddFontFromFileTTF, .{ self, filename, size_pixels, font_cfg, glyph_ranges }); }
+    pub fn ImFontAtlas_AddFontFromMemoryCompressedBase85TTF(self: *FontAtlas, compressed_font_data_base85: ?[*]const u8, size_pixels: f32, font_cfg: ?*const FontConfig, glyph_ranges: ?[*:0]const Wchar) callconv(.C) ?*Font { return instrumentation.call(.ImFontAtlas_AddFontFromMemoryCompressedBase85TTF, .{ self, compressed_font_data_base85, size_pixels, font_cfg, glyph_ranges }); }
+    pub fn ImFontAtlas_AddFontFromMemoryCompressedTTF(self: *FontAtlas, compressed_font_data: ?*const anyopaque, compressed_font_data_size: i32, size_pixels: f32, font_cfg: ?*const FontConfig, glyph_ranges: ?[*:0]const Wchar) callconv(.C) ?*Font { return instrumentation.call(.ImFontAtlas_AddFontFromMemoryCompressedTTF, .{ self, compressed_font_data, compressed_font_data_size, size_pixels, font_cfg, glyph_ranges }); }
+    pub fn ImFontAtlas_AddFontFromMemoryTTF(self: *FontAtlas, font_data: ?*anyopaque, font_data_size: i32, size_pixels: f32, font_cfg: ?*const FontConfig, glyph_ranges: ?[*:0]const Wchar) callconv(.C) ?*Font { return instrumentation.call(.ImFontAtlas_AddFontFromMemoryTTF, .{ self, font_data, font_data_size, size_pixels, font_cfg, glyph_ranges }); }
+    pub fn ImFontAtlas_Build(self: *FontAtlas) callconv(.C) bool { return instrumentation.call(.ImFontAtlas_Build, .{ self }); }
+    pub fn ImFontAtlas_CalcCustomRectUV(self: *FontAtlas, rect: ?*const FontAtlasCustomRect, out_uv_min: ?*Vec2, out_uv_max: ?*Vec2) callconv(.C) void { return instrumentation.call(.ImFontAtlas_CalcCustomRectUV, .{ self, rect, out_uv_min, out_uv_max }); }
+    pub fn ImFontAtlas_Clear(self: *FontAtlas) callconv(.C) void { return instrumentation.call(.ImFontAtlas_Clear, .{ self }); }
+    pub fn ImFontAtlas_ClearFonts(self: *FontAtlas) callconv(.C) void { return instrumentation.call(.ImFontAtlas_ClearFonts, .{ self }); }
+    pub fn ImFontAtlas_ClearInputData(self: *FontAtlas) callconv(.C) void { return instrumentation.call(.ImFontAtlas_ClearInputData, .{ self }); }
+    pub fn ImFontAtlas_ClearTexData(self: *FontAtlas) callconv(.C) void { return instrumentation.call(.ImFontAtlas_ClearTexData, .{ self }); }
+    pub fn ImFontAtlas_GetCustomRectByIndex(self: *FontAtlas, index: i32) callconv(.C) ?*FontAtlasCustomRect { return instrumentation.call(.ImFontAtlas_GetCustomRectByIndex, .{ self, index }); }
+    pub fn ImFontAtlas_GetGlyphRangesChineseFull(self: *FontAtlas) callconv(.C) ?[*:0]const Wchar { return instrumentation.call(.ImFontAtlas_GetGlyphRangesChineseFull, .{ self }); }
+    pub fn ImFontAtlas_GetGlyphRangesChineseSimplifiedCommon(self: *FontAtlas) callconv(.C) ?[*:0]const Wchar { return instrumentation.call(.ImFontAtlas_GetGlyphRangesChineseSimplifiedCommon, .{ self }); }
+    pub fn ImFontAtlas_GetGlyphRangesCyrillic(self: *FontAtlas) callconv(.C) ?[*:0]const Wchar { return instrumentation.call(.ImFontAtlas_GetGlyphRangesCyrillic, .{ self }); }
+    pub fn ImFontAtlas_GetGlyphRangesDefault(self: *FontAtlas) callconv(.C) ?[*:0]const Wchar { return instrumentation.call(.ImFontAtlas_GetGlyphRangesDefault, .{ self }); }
+    pub fn ImFontAtlas_GetGlyphRangesGreek(self: *FontAtlas) callconv(.C) ?[*:0]const Wchar { return instrumentation.call(.ImFontAtlas_GetGlyphRangesGreek, .{ self }); }
+    pub fn ImFontAtlas_GetGlyphRangesJapanese(self: *FontAtlas) callconv(.C) ?[*:0]const Wchar { return instrumentation.call(.ImFontAtlas_GetGlyphRangesJapanese, .{ self }); }
+    pub fn ImFontAtlas_GetGlyphRangesKorean(self: *FontAtlas) callconv(.C) ?[*:0]const Wchar { return instrumentation.call(.ImFontAtlas_GetGlyphRangesKorean, .{ self }); }
+    pub fn ImFontAtlas_GetGlyphRangesThai(self: *FontAtlas) callconv(.C) ?[*:0]const Wchar { return instrumentation.call(.ImFontAtlas_GetGlyphRangesThai, .{ self }); }
+    pub fn ImFontAtlas_GetGlyphRangesVietnamese(self: *FontAtlas) callconv(.C) ?[*:0]const Wchar { return instrumentation.call(.ImFontAtlas_GetGlyphRangesVietnamese, .{ self }); }
+    pub fn ImFontAtlas_GetMouseCursorTexData(self: *FontAtlas, cursor: MouseCursor, out_offset: ?*Vec2, out_size: ?*Vec2, out_uv_border: *[2]Vec2, out_uv_fill: *[2]Vec2) callconv(.C) bool { return instrumentation.call(.ImFontAtlas_GetMouseCursorTexData, .{ self, cursor, out_offset, out_size, out_uv_border, out_uv_fill }); }
+    pub fn ImFontAtlas_GetTexDataAsAlpha8(self: *FontAtlas, out_pixels: *?[*]u8, out_width: *i32, out_height: *i32, out_bytes_per_pixel: ?*i32) callconv(.C) void { return instrumentation.call(.ImFontAtlas_GetTexDataAsAlpha8, .{ self, out_pixels, out_width, out_height, out_bytes_per_pixel }); }
+    pub fn ImFontAtlas_GetTexDataAsRGBA32(self: *FontAtlas, out_pixels: *?[*]u8, out_width: *i32, out_height: *i32, out_bytes_per_pixel: ?*i32) callconv(.C) void { return instrumentation.call(.ImFontAtlas_GetTexDataAsRGBA32, .{ self, out_pixels, out_width, out_height, out_bytes_per_pixel }); }
+    pub fn ImFontAtlas_ImFontAtlas() callconv(.C) *FontAtlas { return instrumentation.call(.ImFontAtlas_ImFontAtlas, .{  }); }
+    pub fn ImFontAtlas_IsBuilt(self: *FontAtlas) callconv(.C) bool { return instrumentation.call(.ImFontAtlas_IsBuilt, .{ self }); }
+    pub fn ImFontAtlas_SetTexID(self: *FontAtlas, id: TextureID) callconv(.C) void { return instrumentation.call(.ImFontAtlas_SetTexID, .{ self, id }); }
+    pub fn ImFontAtlas_destroy(self: *FontAtlas) callconv(.C) void { return instrumentation.call(.ImFontAtlas_destroy, .{ self }); }
+    pub fn ImFontConfig_ImFontConfig() callconv(.C) *FontConfig { return instrumentation.call(.ImFontConfig_ImFontConfig, .{  }); }
+    pub fn ImFontConfig_destroy(self: *FontConfig) callconv(.C) void { return instrumentation.call(.ImFontConfig_destroy, .{ self }); }
+    pub fn ImFontGlyphRangesBuilder_AddChar(self: *FontGlyphRangesBuilder, c: Wchar) callconv(.C) void { return instrumentation.call(.ImFontGlyphRangesBuilder_AddChar, .{ self, c }); }
+    pub fn ImFontGlyphRangesBuilder_AddRanges(self: *FontGlyphRangesBuilder, ranges: ?[*:0]const Wchar) callconv(.C) void { return instrumentation.call(.ImFontGlyphRangesBuilder_AddRanges, .{ self, ranges }); }
+    pub fn ImFontGlyphRangesBuilder_AddText(self: *FontGlyphRangesBuilder, text: ?[*]const u8, text_end: ?[*]const u8) callconv(.C) void { return instrumentation.call(.ImFontGlyphRangesBuilder_AddText, .{ self, text, text_end }); }
+    pub fn ImFontGlyphRangesBuilder_BuildRanges(self: *FontGlyphRangesBuilder, out_ranges: *Vector(Wchar)) callconv(.C) void { return instrumentation.call(.ImFontGlyphRangesBuilder_BuildRanges, .{ self, out_ranges }); }
+    pub fn ImFontGlyphRangesBuilder_Clear(self: *FontGlyphRangesBuilder) callconv(.C) void { return instrumentation.call(.ImFontGlyphRangesBuilder_Clear, .{ self }); }
+    pub fn ImFontGlyphRangesBuilder_GetBit(self: *FontGlyphRangesBuilder, n: usize) callconv(.C) bool { return instrumentation.call(.ImFontGlyphRangesBuilder_GetBit, .{ self, n }); }
+    pub fn ImFontGlyphRangesBuilder_ImFontGlyphRangesBuilder() callconv(.C) *FontGlyphRangesBuilder { return instrumentation.call(.ImFontGlyphRangesBuilder_ImFontGlyphRangesBuilder, .{  }); }
+    pub fn ImFontGlyphRangesBuilder_SetBit(self: *FontGlyphRangesBuilder, n: usize) callconv(.C) void { return instrumentation.call(.ImFontGlyphRangesBuilder_SetBit, .{ self, n }); }
+    pub fn ImFontGlyphRangesBuilder_destroy(self: *FontGlyphRangesBuilder) callconv(.C) void { return instrumentation.call(.ImFontGlyphRangesBuilder_destroy, .{ self }); }
+    pub fn ImFont_AddGlyph(self: *Font, src_cfg: ?*const FontConfig, c: Wchar, x0: f32, y0: f32, x1: f32, y1: f32, u0: f32, v0: f32, u1: f32, v1: f32, advance_x: f32) callconv(.C) void { return instrumentation.call(.ImFont_AddGlyph, .{ self, src_cfg, c, x0, y0, x1, y1, u0, v0, u1, v1, advance_x }); }
+    pub fn ImFont_AddRemapChar(self: *Font, dst: Wchar, src: Wchar, overwrite_dst: bool) callconv(.C) void { return instrumentation.call(.ImFont_AddRemapChar, .{ self, dst, src, overwrite_dst }); }
+    pub fn ImFont_BuildLookupTable(self: *Font) callconv(.C) void { return instrumentation.call(.ImFont_BuildLookupTable, .{ self }); }
+    pub fn ImFont_CalcTextSizeA(pOut: *Vec2, self: *Font, size: f32, max_width: f32, wrap_width: f32, text_begin: ?[*]const u8, text_end: ?[*]const u8, remaining: ?*?[*:0]const u8) callconv(.C) void { return instrumentation.call(.ImFont_CalcTextSizeA, .{ pOut, self, size, max_width, wrap_width, text_begin, text_end, remaining }); }
+    pub fn ImFont_CalcWordWrapPositionA(self: *Font, scale: f32, text: ?[*]const u8, text_end: ?[*]const u8, wrap_width: f32) callconv(.C) ?[*]const u8 { return instrumentation.call(.ImFont_CalcWordWrapPositionA, .{ self, scale, text, text_end, wrap_width }); }
+    pub fn ImFont_ClearOutputData(self: *Font) callconv(.C) void { return instrumentation.call(.ImFont_ClearOutputData, .{ self }); }
+    pub fn ImFont_FindGlyph(self: *Font, c: Wchar) callconv(.C) ?*const FontGlyph { return instrumentation.call(.ImFont_FindGlyph, .{ self, c }); }
+    pub fn ImFont_FindGlyphNoFallback(self: *Font, c: Wchar) callconv(.C) ?*const FontGlyph { return instrumentation.call(.ImFont_FindGlyphNoFallback, .{ self, c }); }
+    pub fn ImFont_GetCharAdvance(self: *Font, c: Wchar) callconv(.C) f32 { return instrumentation.call(.ImFont_GetCharAdvance, .{ self, c }); }
+    pub fn ImFont_GetDebugName(self: *Font) callconv(.C) ?[*:0]const u8 { return instrumentation.call(.ImFont_GetDebugName, .{ self }); }
+    pub fn ImFont_GrowIndex(self: *Font, new_size: i32) callconv(.C) void { return instrumentation.call(.ImFont_GrowIndex, .{ self, new_size }); }
+    pub fn ImFont_ImFont() callconv(.C) *Font { return instrumentation.call(.ImFont_ImFont, .{  }); }
+    pub fn ImFont_IsGlyphRangeUnused(self: *Font, c_begin: u32, c_last: u32) callconv(.C) bool { return instrumentation.call(.ImFont_IsGlyphRangeUnused, .{ self, c_begin, c_last }); }
+    pub fn ImFont_IsLoaded(self: *Font) callconv(.C) bool { return instrumentation.call(.ImFont_IsLoaded, .{ self }); }
+    pub fn ImFont_RenderChar(self: *Font, draw_list: ?*DrawList, size: f32, pos: Vec2, col: u32, c: Wchar) callconv(.C) void { return instrumentation.call(.ImFont_RenderChar, .{ self, draw_list, size, pos, col, c }); }
+    pub fn ImFont_RenderText(self: *Font, draw_list: ?*DrawList, size: f32, pos: Vec2, col: u32, clip_rect: Vec4, text_begin: ?[*]const u8, text_end: ?[*]const u8, wrap_width: f32, cpu_fine_clip: bool) callconv(.C) void { return instrumentation.call(.ImFont_RenderText, .{ self, draw_list, size, pos, col, clip_rect, text_begin, text_end, wrap_width, cpu_fine_clip }); }
+    pub fn ImFont_SetGlyphVisible(self: *Font, c: Wchar, visible: bool) callconv(.C) void { return instrumentation.call(.ImFont_SetGlyphVisible, .{ self, c, visible }); }
+    pub fn ImFont_destroy(self: *Font) callconv(.C) void { return instrumentation.call(.ImFont_destroy, .{ self }); }
+    pub fn ImGuiFreeType_GetBuilderForFreeType() callconv(.C) ?*const FontBuilderIO { return instrumentation.call(.ImGuiFreeType_GetBuilderForFreeType, .{  }); }
+    pub fn ImGuiFreeType_SetAllocatorFunctions(alloc_func: ?*fn (sz: usize, user_data: ?*anyopaque) callconv(.C) ?*anyopaque, free_func: ?*fn (ptr: ?*anyopaque, user_data: ?*anyopaque) callconv(.C) void, user_data: ?*anyopaque) callconv(.C) void { return instrumentation.call(.ImGuiFreeType_SetAllocatorFunctions, .{ alloc_func, free_func, user_data }); }
+    pub fn ImGuiIO_AddFocusEvent(self: *IO, focused: bool) callconv(.C) void { return instrumentation.call(.ImGuiIO_AddFocusEvent, .{ self, focused }); }
+    pub fn ImGuiIO_AddInputCharacter(self: *IO, c: u32) callconv(.C) void { return instrumentation.call(.ImGuiIO_AddInputCharacter, .{ self, c }); }
+    pub fn ImGuiIO_AddInputCharacterUTF16(self: *IO, c: Wchar16) callconv(.C) void { return instrumentation.call(.ImGuiIO_AddInputCharacterUTF16, .{ self, c }); }
+    pub fn ImGuiIO_AddInputCharactersUTF8(self: *IO, str: ?[*:0]const u8) callconv(.C) void { return instrumentation.call(.ImGuiIO_AddInputCharactersUTF8, .{ self, str }); }
+    pub fn ImGuiIO_AddKeyAnalogEvent(self: *IO, key: Key, down: bool, v: f32) callconv(.C) void { return instrumentation.call(.ImGuiIO_AddKeyAnalogEvent, .{ self, key, down, v }); }
+    pub fn ImGuiIO_AddKeyEvent(self: *IO, key: Key, down: bool) callconv(.C) void { return instrumentation.call(.ImGuiIO_AddKeyEvent, .{ self, key, down }); }
+    pub fn ImGuiIO_AddMouseButtonEvent(self: *IO, button: i32, down: bool) callconv(.C) void { return instrumentation.call(.ImGuiIO_AddMouseButtonEvent, .{ self, button, down }); }
+    pub fn ImGuiIO_AddMousePosEvent(self: *IO, x: f32, y: f32) callconv(.C) void { return instrumentation.call(.ImGuiIO_AddMousePosEvent, .{ self, x, y }); }
+    pub fn ImGuiIO_AddMouseSourceEvent(self: *IO, source: MouseSource) callconv(.C) void { return instrumentation.call(.ImGuiIO_AddMouseSourceEvent, .{ self, source }); }
+    pub fn ImGuiIO_AddMouseViewportEvent(self: *IO, id: ID) callconv(.C) void { return instrumentation.call(.ImGuiIO_AddMouseViewportEvent, .{ self, id }); }
+    pub fn ImGuiIO_AddMouseWheelEvent(self: *IO, wheel_x: f32, wheel_y: f32) callconv(.C) void { return instrumentation.call(.ImGuiIO_AddMouseWheelEvent, .{ self, wheel_x, wheel_y }); }
+    pub fn ImGuiIO_ClearEventsQueue(self: *IO) callconv(.C) void { return instrumentation.call(.ImGuiIO_ClearEventsQueue, .{ self }); }
+    pub fn ImGuiIO_ClearInputKeys(self: *IO) callconv(.C) void { return instrumentation.call(.ImGuiIO_ClearInputKeys, .{ self }); }
+    pub fn ImGuiIO_ImGuiIO() callconv(.C) *IO { return instrumentation.call(.ImGuiIO_ImGuiIO, .{  }); }
+    pub fn ImGuiIO_SetAppAcceptingEvents(self: *IO, accepting_events: bool) callconv(.C) void { return instrumentation.call(.ImGuiIO_SetAppAcceptingEvents, .{ self, accepting_events }); }
+    pub fn ImGuiIO_SetKeyEventNativeData(self: *IO, key: Key, native_keycode: i32, native_scancode: i32, native_legacy_index: i32) callconv(.C) void { return instrumentation.call(.ImGuiIO_SetKeyEventNativeData, .{ self, key, native_keycode, native_scancode, native_legacy_index }); }
+    pub fn ImGuiIO_destroy(self: *IO) callconv(.C) void { return instrumentation.call(.ImGuiIO_destroy, .{ self }); }
+    pub fn ImGuiInputTextCallbackData_ClearSelection(self: *InputTextCallbackData) callconv(.C) void { return instrumentation.call(.ImGuiInputTextCallbackData_ClearSelection, .{ self }); }
+    pub fn ImGuiInputTextCallbackData_DeleteChars(self: *InputTextCallbackData, pos: i32, bytes_count: i32) callconv(.C) void { return instrumentation.call(.ImGuiInputTextCallbackData_DeleteChars, .{ self, pos, bytes_count }); }
+    pub fn ImGuiInputTextCallbackData_HasSelection(self: *InputTextCallbackData) callconv(.C) bool { return instrumentation.call(.ImGuiInputTextCallbackData_HasSelection, .{ self }); }
+    pub fn ImGuiInputTextCallbackData_ImGuiInputTextCallbackData() callconv(.C) *InputTextCallbackData { return instrumentation.call(.ImGuiInputTextCallbackData_ImGuiInputTextCallbackData, .{  }); }
+    pub fn ImGuiInputTextCallbackData_InsertChars(self: *InputTextCallbackData, pos: i32, text: ?[*]const u8, text_end: ?[*]const u8) callconv(.C) void { return instrumentation.call(.ImGuiInputTextCallbackData_InsertChars, .{ self, pos, text, text_end }); }
+    pub fn ImGuiInputTextCallbackData_SelectAll(self: *InputTextCallbackData) callconv(.C) void { return instrumentation.call(.ImGuiInputTextCallbackData_SelectAll, .{ self }); }
+    pub fn ImGuiInputTextCallbackData_destroy(self: *InputTextCallbackData) callconv(.C) void { return instrumentation.call(.ImGuiInputTextCallbackData_destroy, .{ self }); }
+    pub fn ImGuiListClipper_Begin(self: *ListClipper, items_count: i32, items_height: f32) callconv(.C) void { return instrumentation.call(.ImGuiListClipper_Begin, .{ self, items_count, items_height }); }
+    pub fn ImGuiListClipper_End(self: *ListClipper) callconv(.C) void { return instrumentation.call(.ImGuiListClipper_End, .{ self }); }
+    pub fn ImGuiListClipper_ImGuiListClipper() callconv(.C) *ListClipper { return instrumentation.call(.ImGuiListClipper_ImGuiListClipper, .{  }); }
+    pub fn ImGuiListClipper_IncludeItemByIndex(self: *ListClipper, item_index: i32) callconv(.C) void { return instrumentation.call(.ImGuiListClipper_IncludeItemByIndex, .{ self, item_index }); }
+    pub fn ImGuiListClipper_IncludeItemsByIndex(self: *ListClipper, item_begin: i32, item_end: i32) callconv(.C) void { return instrumentation.call(.ImGuiListClipper_IncludeItemsByIndex, .{ self, item_begin, item_end }); }
+    pub fn ImGuiListClipper_Step(self: *ListClipper) callconv(.C) bool { return instrumentation.call(.ImGuiListClipper_Step, .{ self }); }
+    pub fn ImGuiListClipper_destroy(self: *ListClipper) callconv(.C) void { return instrumentation.call(.ImGuiListClipper_destroy, .{ self }); }
+    pub fn ImGuiOnceUponAFrame_ImGuiOnceUponAFrame() callconv(.C) *OnceUponAFrame { return instrumentation.call(.ImGuiOnceUponAFrame_ImGuiOnceUponAFrame, .{  }); }
+    pub fn ImGuiOnceUponAFrame_destroy(self: *OnceUponAFrame) callconv(.C) void { return instrumentation.call(.ImGuiOnceUponAFrame_destroy, .{ self }); }
+    pub fn ImGuiPayload_Clear(self: *Payload) callconv(.C) void { return instrumentation.call(.ImGuiPayload_Clear, .{ self }); }
+    pub fn ImGuiPayload_ImGuiPayload() callconv(.C) *Payload { return instrumentation.call(.ImGuiPayload_ImGuiPayload, .{  }); }
+    pub fn ImGuiPayload_IsDataType(self: *Payload, kind: ?[*:0]const u8) callconv(.C) bool { return instrumentation.call(.ImGuiPayload_IsDataType, .{ self, kind }); }
+    pub fn ImGuiPayload_IsDelivery(self: *Payload) callconv(.C) bool { return instrumentation.call(.ImGuiPayload_IsDelivery, .{ self }); }
+    pub fn ImGuiPayload_IsPreview(self: *Payload) callconv(.C) bool { return instrumentation.call(.ImGuiPayload_IsPreview, .{ self }); }
+    pub fn ImGuiPayload_destroy(self: *Payload) callconv(.C) void { return instrumentation.call(.ImGuiPayload_destroy, .{ self }); }
+    pub fn ImGuiPlatformIO_ImGuiPlatformIO() callconv(.C) *PlatformIO { return instrumentation.call(.ImGuiPlatformIO_ImGuiPlatformIO, .{  }); }
+    pub fn ImGuiPlatformIO_destroy(self: *PlatformIO) callconv(.C) void { return instrumentation.call(.ImGuiPlatformIO_destroy, .{ self }); }
+    pub fn ImGuiPlatformImeData_ImGuiPlatformImeData() callconv(.C) *PlatformImeData { return instrumentation.call(.ImGuiPlatformImeData_ImGuiPlatformImeData, .{  }); }
+    pub fn ImGuiPlatformImeData_destroy(self: *PlatformImeData) callconv(.C) void { return instrumentation.call(.ImGuiPlatformImeData_destroy, .{ self }); }
+    pub fn ImGuiPlatformMonitor_ImGuiPlatformMonitor() callconv(.C) *PlatformMonitor { return instrumentation.call(.ImGuiPlatformMonitor_ImGuiPlatformMonitor, .{  }); }
+    pub fn ImGuiPlatformMonitor_destroy(self: *PlatformMonitor) callconv(.C) void { return instrumentation.call(.ImGuiPlatformMonitor_destroy, .{ self }); }
+    pub fn ImGuiStoragePair_ImGuiStoragePair_Int(_key: ID, _val: i32) callconv(.C) *StoragePair { return instrumentation.call(.ImGuiStoragePair_ImGuiStoragePair_Int, .{ _key, _val }); }
+    pub fn ImGuiStoragePair_ImGuiStoragePair_Float(_key: ID, _val: f32) callconv(.C) *StoragePair { return instrumentation.call(.ImGuiStoragePair_ImGuiStoragePair_Float, .{ _key, _val }); }
+    pub fn ImGuiStoragePair_ImGuiStoragePair_Ptr(_key: ID, _val: ?*anyopaque) callconv(.C) *StoragePair { return instrumentation.call(.ImGuiStoragePair_ImGuiStoragePair_Ptr, .{ _key, _val }); }
+    pub fn ImGuiStoragePair_destroy(self: *StoragePair) callconv(.C) void { return instrumentation.call(.ImGuiStoragePair_destroy, .{ self }); }
+    pub fn ImGuiStorage_BuildSortByKey(self: *Storage) callconv(.C) void { return instrumentation.call(.ImGuiStorage_BuildSortByKey, .{ self }); }
+    pub fn ImGuiStorage_Clear(self: *Storage) callconv(.C) void { return instrumentation.call(.ImGuiStorage_Clear, .{ self }); }
+    pub fn ImGuiStorage_GetBool(self: *Storage, key: ID, default_val: bool) callconv(.C) bool { return instrumentation.call(.ImGuiStorage_GetBool, .{ self, key, default_val }); }
+    pub fn ImGuiStorage_GetBoolRef(self: *Storage, key: ID, default_val: bool) callconv(.C) ?*bool { return instrumentation.call(.ImGuiStorage_GetBoolRef, .{ self, key, default_val }); }
+    pub fn ImGuiStorage_GetFloat(self: *Storage, key: ID, default_val: f32) callconv(.C) f32 { return instrumentation.call(.ImGuiStorage_GetFloat, .{ self, key, default_val }); }
+    pub fn ImGuiStorage_GetFloatRef(self: *Storage, key: ID, default_val: f32) callconv(.C) ?*f32 { return instrumentation.call(.ImGuiStorage_GetFloatRef, .{ self, key, default_val }); }
+    pub fn ImGuiStorage_GetInt(self: *Storage, key: ID, default_val: i32) callconv(.C) i32 { return instrumentation.call(.ImGuiStorage_GetInt, .{ self, key, default_val }); }
+    pub fn ImGuiStorage_GetIntRef(self: *Storage, key: ID, default_val: i32) callconv(.C) ?*i32 { return instrumentation.call(.ImGuiStorage_GetIntRef, .{ self, key, default_val }); }
+    pub fn ImGuiStorage_GetVoidPtr(self: *Storage, key: ID) callconv(.C) ?*anyopaque { return instrumentation.call(.ImGuiStorage_GetVoidPtr, .{ self, key }); }
+    pub fn ImGuiStorage_GetVoidPtrRef(self: *Storage, key: ID, default_val: ?*anyopaque) callconv(.C) ?*?*anyopaque { return instrumentation.call(.ImGuiStorage_GetVoidPtrRef, .{ self, key, default_val }); }
+    pub fn ImGuiStorage_SetAllInt(self: *Storage, val: i32) callconv(.C) void { return instrumentation.call(.ImGuiStorage_SetAllInt, .{ self, val }); }
+    pub fn ImGuiStorage_SetBool(self: *Storage, key: ID, val: bool) callconv(.C) void { return instrumentation.call(.ImGuiStorage_SetBool, .{ self, key, val }); }
+    pub fn ImGuiStorage_SetFloat(self: *Storage, key: ID, val: f32) callconv(.C) void { return instrumentation.call(.ImGuiStorage_SetFloat, .{ self, key, val }); }
+    pub fn ImGuiStorage_SetInt(self: *Storage, key: ID, val: i32) callconv(.C) void { return instrumentation.call(.ImGuiStorage_SetInt, .{ self, key, val }); }
+    pub fn ImGuiStorage_SetVoidPtr(self: *Storage, key: ID, val: ?*anyopaque) callconv(.C) void { return instrumentation.call(.ImGuiStorage_SetVoidPtr, .{ self, key, val }); }
+    pub fn ImGuiStyle_ImGuiStyle() callconv(.C) *Style { return instrumentation.call(.ImGuiStyle_ImGuiStyle, .{  }); }
+    pub fn ImGuiStyle_ScaleAllSizes(self: *Style, scale_factor: f32) callconv(.C) void { return instrumentation.call(.ImGuiStyle_ScaleAllSizes, .{ self, scale_factor }); }
+    pub fn ImGuiStyle_destroy(self: *Style) callconv(.C) void { return instrumentation.call(.ImGuiStyle_destroy, .{ self }); }
+    pub fn ImGuiTableColumnSortSpecs_ImGuiTableColumnSortSpecs() callconv(.C) *TableColumnSortSpecs { return instrumentation.call(.ImGuiTableColumnSortSpecs_ImGuiTableColumnSortSpecs, .{  }); }
+    pub fn ImGuiTableColumnSortSpecs_destroy(self: *TableColumnSortSpecs) callconv(.C) void { return instrumentation.call(.ImGuiTableColumnSortSpecs_destroy, .{ self }); }
+    pub fn ImGuiTableSortSpecs_ImGuiTableSortSpecs() callconv(.C) *TableSortSpecs { return instrumentation.call(.ImGuiTableSortSpecs_ImGuiTableSortSpecs, .{  }); }
+    pub fn ImGuiTableSortSpecs_destroy(self: *TableSortSpecs) callconv(.C) void { return instrumentation.call(.ImGuiTableSortSpecs_destroy, .{ self }); }
+    pub fn ImGuiTextBuffer_ImGuiTextBuffer() callconv(.C) *TextBuffer { return instrumentation.call(.ImGuiTextBuffer_ImGuiTextBuffer, .{  }); }
+    pub fn ImGuiTextBuffer_append(self: *TextBuffer, str: ?[*]const u8, str_end: ?[*]const u8) callconv(.C) void { return instrumentation.call(.ImGuiTextBuffer_append, .{ self, str, str_end }); }
+    pub const ImGuiTextBuffer_appendf = raw_extern.ImGuiTextBuffer_appendf;
+    pub fn ImGuiTextBuffer_begin(self: *TextBuffer) callconv(.C) [*]const u8 { return instrumentation.call(.ImGuiTextBuffer_begin, .{ self }); }
+    pub fn ImGuiTextBuffer_c_str(self: *TextBuffer) callconv(.C) [*:0]const u8 { return instrumentation.call(.ImGuiTextBuffer_c_str, .{ self }); }
+    pub fn ImGuiTextBuffer_clear(self: *TextBuffer) callconv(.C) void { return instrumentation.call(.ImGuiTextBuffer_clear, .{ self }); }
+    pub fn ImGuiTextBuffer_destroy(self: *TextBuffer) callconv(.C) void { return instrumentation.call(.ImGuiTextBuffer_destroy, .{ self }); }
+    pub fn ImGuiTextBuffer_empty(self: *TextBuffer) callconv(.C) bool { return instrumentation.call(.ImGuiTextBuffer_empty, .{ self }); }
+    pub fn ImGuiTextBuffer_end(self: *TextBuffer) callconv(.C) [*]const u8 { return instrumentation.call(.ImGuiTextBuffer_end, .{ self }); }
+    pub fn ImGuiTextBuffer_reserve(self: *TextBuffer, capacity: i32) callconv(.C) void { return instrumentation.call(.ImGuiTextBuffer_reserve, .{ self, capacity }); }
+    pub fn ImGuiTextBuffer_size(self: *TextBuffer) callconv(.C) i32 { return instrumentation.call(.ImGuiTextBuffer_size, .{ self }); }
+    pub fn ImGuiTextFilter_Build(self: *TextFilter) callconv(.C) void { return instrumentation.call(.ImGuiTextFilter_Build, .{ self }); }
+    pub fn ImGuiTextFilter_Clear(self: *TextFilter) callconv(.C) void { return instrumentation.call(.ImGuiTextFilter_Clear, .{ self }); }
+    pub fn ImGuiTextFilter_Draw(self: *TextFilter, label: ?[*:0]const u8, width: f32) callconv(.C) bool { return instrumentation.call(.ImGuiTextFilter_Draw, .{ self, label, width }); }
+    pub fn ImGuiTextFilter_ImGuiTextFilter(default_filter: ?[*:0]const u8) callconv(.C) *TextFilter { return instrumentation.call(.ImGuiTextFilter_ImGuiTextFilter, .{ default_filter }); }
+    pub fn ImGuiTextFilter_IsActive(self: *TextFilter) callconv(.C) bool { return instrumentation.call(.ImGuiTextFilter_IsActive, .{ self }); }
+    pub fn ImGuiTextFilter_PassFilter(self: *TextFilter, text: ?[*]const u8, text_end: ?[*]const u8) callconv(.C) bool { return instrumentation.call(.ImGuiTextFilter_PassFilter, .{ self, text, text_end }); }
+    pub fn ImGuiTextFilter_destroy(self: *TextFilter) callconv(.C) void { return instrumentation.call(.ImGuiTextFilter_destroy, .{ self }); }
+    pub fn ImGuiTextRange_ImGuiTextRange_Nil() callconv(.C) *TextRange { return instrumentation.call(.ImGuiTextRange_ImGuiTextRange_Nil, .{  }); }
+    pub fn ImGuiTextRange_ImGuiTextRange_Str(_b: ?[*]const u8, _e: ?[*]const u8) callconv(.C) *TextRange { return instrumentation.call(.ImGuiTextRange_ImGuiTextRange_Str, .{ _b, _e }); }
+    pub fn ImGuiTextRange_destroy(self: *TextRange) callconv(.C) void { return instrumentation.call(.ImGuiTextRange_destroy, .{ self }); }
+    pub fn ImGuiTextRange_empty(self: *TextRange) callconv(.C) bool { return instrumentation.call(.ImGuiTextRange_empty, .{ self }); }
+    pub fn ImGuiTextRange_split(self: *TextRange, separator: u8, out: ?*Vector(TextRange)) callconv(.C) void { return instrumentation.call(.ImGuiTextRange_split, .{ self, separator, out }); }
+    pub fn ImGuiViewport_GetCenter(pOut: *Vec2, self: *Viewport) callconv(.C) void { return instrumentation.call(.ImGuiViewport_GetCenter, .{ pOut, self }); }
+    pub fn ImGuiViewport_GetWorkCenter(pOut: *Vec2, self: *Viewport) callconv(.C) void { return instrumentation.call(.ImGuiViewport_GetWorkCenter, .{ pOut, self }); }
+    pub fn ImGuiViewport_ImGuiViewport() callconv(.C) *Viewport { return instrumentation.call(.ImGuiViewport_ImGuiViewport, .{  }); }
+    pub fn ImGuiViewport_destroy(self: *Viewport) callconv(.C) void { return instrumentation.call(.ImGuiViewport_destroy, .{ self }); }
+    pub fn ImGuiWindowClass_ImGuiWindowClass() callconv(.C) *WindowClass { return instrumentation.call(.ImGuiWindowClass_ImGuiWindowClass, .{  }); }
+    pub fn ImGuiWindowClass_destroy(self: *WindowClass) callconv(.C) void { return instrumentation.call(.ImGuiWindowClass_destroy, .{ self }); }
+    pub fn ImVec2_ImVec2_Nil() callconv(.C) *Vec2 { return instrumentation.call(.ImVec2_ImVec2_Nil, .{  }); }
+    pub fn ImVec2_ImVec2_Float(_x: f32, _y: f32) callconv(.C) *Vec2 { return instrumentation.call(.ImVec2_ImVec2_Float, .{ _x, _y }); }
+    pub fn ImVec2_destroy(self: *Vec2) callconv(.C) void { return instrumentation.call(.ImVec2_destroy, .{ self }); }
+    pub fn ImVec4_ImVec4_Nil() callconv(.C) *Vec4 { return instrumentation.call(.ImVec4_ImVec4_Nil, .{  }); }
+    pub fn ImVec4_ImVec4_Float(_x: f32, _y: f32, _z: f32, _w: f32) callconv(.C) *Vec4 { return instrumentation.call(.ImVec4_ImVec4_Float, .{ _x, _y, _z, _w }); }
+    pub fn ImVec4_destroy(self: *Vec4) callconv(.C) void { return instrumentation.call(.ImVec4_destroy, .{ self }); }
+    pub fn igAcceptDragDropPayload(kind: ?[*:0]const u8, flags: DragDropFlagsInt) callconv(.C) ?*const Payload { return instrumentation.call(.igAcceptDragDropPayload, .{ kind, flags }); }
+    pub fn igAlignTextToFramePadding() callconv(.C) void { return instrumentation.call(.igAlignTextToFramePadding, .{  }); }
+    pub fn igArrowButton(str_id: ?[*:0]const u8, dir: Dir) callconv(.C) bool { return instrumentation.call(.igArrowButton, .{ str_id, dir }); }
+    pub fn igBegin(name: ?[*:0]const u8, p_open: ?*bool, flags: WindowFlagsInt) callconv(.C) bool { return instrumentation.call(.igBegin, .{ name, p_open, flags }); }
+    pub fn igBeginChild_Str(str_id: ?[*:0]const u8, size: Vec2, child_flags: ChildFlagsInt, window_flags: WindowFlagsInt) callconv(.C) bool { return instrumentation.call(.igBeginChild_Str, .{ str_id, size, child_flags, window_flags }); }
+    pub fn igBeginChild_ID(id: ID, size: Vec2, child_flags: ChildFlagsInt, window_flags: WindowFlagsInt) callconv(.C) bool { return instrumentation.call(.igBeginChild_ID, .{ id, size, child_flags, window_flags }); }
+    pub fn igBeginCombo(label: ?[*:0]const u8, preview_value: ?[*:0]const u8, flags: ComboFlagsInt) callconv(.C) bool { return instrumentation.call(.igBeginCombo, .{ label, preview_value, flags }); }
+    pub fn igBeginDisabled(disabled: bool) callconv(.C) void { return instrumentation.call(.igBeginDisabled, .{ disabled }); }
+    pub fn igBeginDragDropSource(flags: DragDropFlagsInt) callconv(.C) bool { return instrumentation.call(.igBeginDragDropSource, .{ flags }); }
+    pub fn igBeginDragDropTarget() callconv(.C) bool { return instrumentation.call(.igBeginDragDropTarget, .{  }); }
+    pub fn igBeginGroup() callconv(.C) void { return instrumentation.call(.igBeginGroup, .{  }); }
+    pub fn igBeginItemTooltip() callconv(.C) bool { return instrumentation.call(.igBeginItemTooltip, .{  }); }
+    pub fn igBeginListBox(label: ?[*:0]const u8, size: Vec2) callconv(.C) bool { return instrumentation.call(.igBeginListBox, .{ label, size }); }
+    pub fn igBeginMainMenuBar() callconv(.C) bool { return instrumentation.call(.igBeginMainMenuBar, .{  }); }
+    pub fn igBeginMenu(label: ?[*:0]const u8, enabled: bool) callconv(.C) bool { return instrumentation.call(.igBeginMenu, .{ label, enabled }); }
+    pub fn igBeginMenuBar() callconv(.C) bool { return instrumentation.call(.igBeginMenuBar, .{  }); }
+    pub fn igBeginPopup(str_id: ?[*:0]const u8, flags: WindowFlagsInt) callconv(.C) bool { return instrumentation.call(.igBeginPopup, .{ str_id, flags }); }
+    pub fn igBeginPopupContextItem(str_id: ?[*:0]const u8, popup_flags: PopupFlagsInt) callconv(.C) bool { return instrumentation.call(.igBeginPopupContextItem, .{ str_id, popup_flags }); }
+    pub fn igBeginPopupContextVoid(str_id: ?[*:0]const u8, popup_flags: PopupFlagsInt) callconv(.C) bool { return instrumentation.call(.igBeginPopupContextVoid, .{ str_id, popup_flags }); }
+    pub fn igBeginPopupContextWindow(str_id: ?[*:0]const u8, popup_flags: PopupFlagsInt) callconv(.C) bool { return instrumentation.call(.igBeginPopupContextWindow, .{ str_id, popup_flags }); }
+    pub fn igBeginPopupModal(name: ?[*:0]const u8, p_open: ?*bool, flags: WindowFlagsInt) callconv(.C) bool { return instrumentation.call(.igBeginPopupModal, .{ name, p_open, flags }); }
+    pub fn igBeginTabBar(str_id: ?[*:0]const u8, flags: TabBarFlagsInt) callconv(.C) bool { return instrumentation.call(.igBeginTabBar, .{ str_id, flags }); }
+    pub fn igBeginTabItem(label: ?[*:0]const u8, p_open: ?*bool, flags: TabItemFlagsInt) callconv(.C) bool { return instrumentation.call(.igBeginTabItem, .{ label, p_open, flags }); }
+    pub fn igBeginTable(str_id: ?[*:0]const u8, column: i32, flags: TableFlagsInt, outer_size: Vec2, inner_width: f32) callconv(.C) bool { return instrumentation.call(.igBeginTable, .{ str_id, column, flags, outer_size, inner_width }); }
+    pub fn igBeginTooltip() callconv(.C) bool { return instrumentation.call(.igBeginTooltip, .{  }); }
+    pub fn igBullet() callconv(.C) void { return instrumentation.call(.igBullet, .{  }); }
+    pub const igBulletText = raw_extern.igBulletText;
+    pub fn igButton(label: ?[*:0]const u8, size: Vec2) callconv(.C) bool { return instrumentation.call(.igButton, .{ label, size }); }
+    pub fn igCalcItemWidth() callconv(.C) f32 { return instrumentation.call(.igCalcItemWidth, .{  }); }
+    pub fn igCalcTextSize(pOut: *Vec2, text: ?[*]const u8, text_end: ?[*]const u8, hide_text_after_double_hash: bool, wrap_width: f32) callconv(.C) void { return instrumentation.call(.igCalcTextSize, .{ pOut, text, text_end, hide_text_after_double_hash, wrap_width }); }
+    pub fn igCheckbox(label: ?[*:0]const u8, v: *bool) callconv(.C) bool { return instrumentation.call(.igCheckbox, .{ label, v }); }
+    pub fn igCheckboxFlags_IntPtr(label: ?[*:0]const u8, flags: *i32, flags_value: i32) callconv(.C) bool { return instrumentation.call(.igCheckboxFlags_IntPtr, .{ label, flags, flags_value }); }
+    pub fn igCheckboxFlags_UintPtr(label: ?[*:0]const u8, flags: *u32, flags_value: u32) callconv(.C) bool { return instrumentation.call(.igCheckboxFlags_UintPtr, .{ label, flags, flags_value }); }
+    pub fn igCloseCurrentPopup() callconv(.C) void { return instrumentation.call(.igCloseCurrentPopup, .{  }); }
+    pub fn igCollapsingHeader_TreeNodeFlags(label: ?[*:0]const u8, flags: TreeNodeFlagsInt) callconv(.C) bool { return instrumentation.call(.igCollapsingHeader_TreeNodeFlags, .{ label, flags }); }
+    pub fn igCollapsingHeader_BoolPtr(label: ?[*:0]const u8, p_visible: ?*bool, flags: TreeNodeFlagsInt) callconv(.C) bool { return instrumentation.call(.igCollapsingHeader_BoolPtr, .{ label, p_visible, flags }); }
+    pub fn igColorButton(desc_id: ?[*:0]const u8, col: Vec4, flags: ColorEditFlagsInt, size: Vec2) callconv(.C) bool { return instrumentation.call(.igColorButton, .{ desc_id, col, flags, size }); }
+    pub fn igColorConvertFloat4ToU32(in: Vec4) callconv(.C) u32 { return instrumentation.call(.igColorConvertFloat4ToU32, .{ in }); }
+    pub fn igColorConvertHSVtoRGB(h: f32, s: f32, v: f32, out_r: *f32, out_g: *f32, out_b: *f32) callconv(.C) void { return instrumentation.call(.igColorConvertHSVtoRGB, .{ h, s, v, out_r, out_g, out_b }); }
+    pub fn igColorConvertRGBtoHSV(r: f32, g: f32, b: f32, out_h: *f32, out_s: *f32, out_v: *f32) callconv(.C) void { return instrumentation.call(.igColorConvertRGBtoHSV, .{ r, g, b, out_h, out_s, out_v }); }
+    pub fn igColorConvertU32ToFloat4(pOut: *Vec4, in: u32) callconv(.C) void { return instrumentation.call(.igColorConvertU32ToFloat4, .{ pOut, in }); }
+    pub fn igColorEdit3(label: ?[*:0]const u8, col: *[3]f32, flags: ColorEditFlagsInt) callconv(.C) bool { return instrumentation.call(.igColorEdit3, .{ label, col, flags }); }
+    pub fn igColorEdit4(label: ?[*:0]const u8, col: *[4]f32, flags: ColorEditFlagsInt) callconv(.C) bool { return instrumentation.call(.igColorEdit4, .{ label, col, flags }); }
+    pub fn igColorPicker3(label: ?[*:0]const u8, col: *[3]f32, flags: ColorEditFlagsInt) callconv(.C) bool { return instrumentation.call(.igColorPicker3, .{ label, col, flags }); }
+    pub fn igColorPicker4(label: ?[*:0]const u8, col: *[4]f32, flags: ColorEditFlagsInt, ref_col: ?*const[4]f32) callconv(.C) bool { return instrumentation.call(.igColorPicker4, .{ label, col, flags, ref_col }); }
+    pub fn igColumns(count: i32, id: ?[*:0]const u8, border: bool) callconv(.C) void { return instrumentation.call(.igColumns, .{ count, id, border }); }
+    pub fn igCombo_Str_arr(label: ?[*:0]const u8, current_item: ?*i32, items: [*]const[*:0]const u8, items_count: i32, popup_max_height_in_items: i32) callconv(.C) bool { return instrumentation.call(.igCombo_Str_arr, .{ label, current_item, items, items_count, popup_max_height_in_items }); }
+    pub fn igCombo_Str(label: ?[*:0]const u8, current_item: ?*i32, items_separated_by_zeros: ?[*]const u8, popup_max_height_in_items: i32) callconv(.C) bool { return instrumentation.call(.igCombo_Str, .{ label, current_item, items_separated_by_zeros, popup_max_height_in_items }); }
+    pub fn igCombo_FnStrPtr(label: ?[*:0]const u8, current_item: ?*i32, getter: ?*fn (user_data: ?*anyopaque, idx: i32) callconv(.C) ?[*:0]const u8, user_data: ?*anyopaque, items_count: i32, popup_max_height_in_items: i32) callconv(.C) bool { return instrumentation.call(.igCombo_FnStrPtr, .{ label, current_item, getter, user_data, items_count, popup_max_height_in_items }); }
+    pub fn igCreateContext(shared_font_atlas: ?*FontAtlas) callconv(.C) ?*Context { return instrumentation.call(.igCreateContext, .{ shared_font_atlas }); }
+    pub fn igDebugCheckVersionAndDataLayout(version_str: ?[*:0]const u8, sz_io: usize, sz_style: usize, sz_vec2: usize, sz_vec4: usize, sz_drawvert: usize, sz_drawidx: usize) callconv(.C) bool { return instrumentation.call(.igDebugCheckVersionAndDataLayout, .{ version_str, sz_io, sz_style, sz_vec2, sz_vec4, sz_drawvert, sz_drawidx }); }
+    pub fn igDebugFlashStyleColor(idx: Col) callconv(.C) void { return instrumentation.call(.igDebugFlashStyleColor, .{ idx }); }
+    pub fn igDebugStartItemPicker() callconv(.C) void { return instrumentation.call(.igDebugStartItemPicker, .{  }); }
+    pub fn igDebugTextEncoding(text: ?[*]const u8) callconv(.C) void { return instrumentation.call(.igDebugTextEncoding, .{ text }); }
+    pub fn igDestroyContext(ctx: ?*Context) callconv(.C) void { return instrumentation.call(.igDestroyContext, .{ ctx }); }
+    pub fn igDestroyPlatformWindows() callconv(.C) void { return instrumentation.call(.igDestroyPlatformWindows, .{  }); }
+    pub fn igDockSpace(id: ID, size: Vec2, flags: DockNodeFlagsInt, window_class: ?*const WindowClass) callconv(.C) ID { return instrumentation.call(.igDockSpace, .{ id, size, flags, window_class }); }
+    pub fn igDockSpaceOverViewport(viewport: ?*const Viewport, flags: DockNodeFlagsInt, window_class: ?*const WindowClass) callconv(.C) ID { return instrumentation.call(.igDockSpaceOverViewport, .{ viewport, flags, window_class }); }
+    pub fn igDragFloat(label: ?[*:0]const u8, v: *f32, v_speed: f32, v_min: f32, v_max: f32, format: ?[*:0]const u8, flags: SliderFlagsInt) callconv(.C) bool { return instrumentation.call(.igDragFloat, .{ label, v, v_speed, v_min, v_max, format, flags }); }
+    pub fn igDragFloat2(label: ?[*:0]const u8, v: *[2]f32, v_speed: f32, v_min: f32, v_max: f32, format: ?[*:0]const u8, flags: SliderFlagsInt) callconv(.C) bool { return instrumentation.call(.igDragFloat2, .{ label, v, v_speed, v_min, v_max, format, flags }); }
+    pub fn igDragFloat3(label: ?[*:0]const u8, v: *[3]f32, v_speed: f32, v_min: f32, v_max: f32, format: ?[*:0]const u8, flags: SliderFlagsInt) callconv(.C) bool { return instrumentation.call(.igDragFloat3, .{ label, v, v_speed, v_min, v_max, format, flags }); }
+    pub fn igDragFloat4(label: ?[*:0]const u8, v: *[4]f32, v_speed: f32, v_min: f32, v_max: f32, format: ?[*:0]const u8, flags: SliderFlagsInt) callconv(.C) bool { return instrumentation.call(.igDragFloat4, .{ label, v, v_speed, v_min, v_max, format, flags }); }
+    pub fn igDragFloatRange2(label: ?[*:0]const u8, v_current_min: *f32, v_current_max: *f32, v_speed: f32, v_min: f32, v_max: f32, format: ?[*:0]const u8, format_max: ?[*:0]const u8, flags: SliderFlagsInt) callconv(.C) bool { return instrumentation.call(.igDragFloatRange2, .{ label, v_current_min, v_current_max, v_speed, v_min, v_max, format, format_max, flags }); }
+    pub fn igDragInt(label: ?[*:0]const u8, v: *i32, v_speed: f32, v_min: i32, v_max: i32, format: ?[*:0]const u8, flags: SliderFlagsInt) callconv(.C) bool { return instrumentation.call(.igDragInt, .{ label, v, v_speed, v_min, v_max, format, flags }); }
+    pub fn igDragInt2(label: ?[*:0]const u8, v: *[2]i32, v_speed: f32, v_min: i32, v_max: i32, format: ?[*:0]const u8, flags: SliderFlagsInt) callconv(.C) bool { return instrumentation.call(.igDragInt2, .{ label, v, v_speed, v_min, v_max, format, flags }); }
+    pub fn igDragInt3(label: ?[*:0]const u8, v: *[3]i32, v_speed: f32, v_min: i32, v_max: i32, format: ?[*:0]const u8, flags: SliderFlagsInt) callconv(.C) bool { return instrumentation.call(.igDragInt3, .{ label, v, v_speed, v_min, v_max, format, flags }); }
+    pub fn igDragInt4(label: ?[*:0]const u8, v: *[4]i32, v_speed: f32, v_min: i32, v_max: i32, format: ?[*:0]const u8, flags: SliderFlagsInt) callconv(.C) bool { return instrumentation.call(.igDragInt4, .{ label, v, v_speed, v_min, v_max, format, flags }); }
+    pub fn igDragIntRange2(label: ?[*:0]const u8, v_current_min: *i32, v_current_max: *i32, v_speed: f32, v_min: i32, v_max: i32, format: ?[*:0]const u8, format_max: ?[*:0]const u8, flags: SliderFlagsInt) callconv(.C) bool { return instrumentation.call(.igDragIntRange2, .{ label, v_current_min, v_current_max, v_speed, v_min, v_max, format, format_max, flags }); }
+    pub fn igDragScalar(label: ?[*:0]const u8, data_type: DataType, p_data: ?*anyopaque, v_speed: f32, p_min: ?*const anyopaque, p_max: ?*const anyopaque, format: ?[*:0]const u8, flags: SliderFlagsInt) callconv(.C) bool { return instrumentation.call(.igDragScalar, .{ label, data_type, p_data, v_speed, p_min, p_max, format, flags }); }
+    pub fn igDragScalarN(label: ?[*:0]const u8, data_type: DataType, p_data: ?*anyopaque, components: i32, v_speed: f32, p_min: ?*const anyopaque, p_max: ?*const anyopaque, format: ?[*:0]const u8, flags: SliderFlagsInt) callconv(.C) bool { return instrumentation.call(.igDragScalarN, .{ label, data_type, p_data, components, v_speed, p_min, p_max, format, flags }); }
+    pub fn igDummy(size: Vec2) callconv(.C) void { return instrumentation.call(.igDummy, .{ size }); }
+    pub fn igEnd() callconv(.C) void { return instrumentation.call(.igEnd, .{  }); }
+    pub fn igEndChild() callconv(.C) void { return instrumentation.call(.igEndChild, .{  }); }
+    pub fn igEndCombo() callconv(.C) void { return instrumentation.call(.igEndCombo, .{  }); }
+    pub fn igEndDisabled() callconv(.C) void { return instrumentation.call(.igEndDisabled, .{  }); }
+    pub fn igEndDragDropSource() callconv(.C) void { return instrumentation.call(.igEndDragDropSource, .{  }); }
+    pub fn igEndDragDropTarget() callconv(.C) void { return instrumentation.call(.igEndDragDropTarget, .{  }); }
+    pub fn igEndFrame() callconv(.C) void { return instrumentation.call(.igEndFrame, .{  }); }
+    pub fn igEndGroup() callconv(.C) void { return instrumentation.call(.igEndGroup, .{  }); }
+    pub fn igEndListBox() callconv(.C) void { return instrumentation.call(.igEndListBox, .{  }); }
+    pub fn igEndMainMenuBar() callconv(.C) void { return instrumentation.call(.igEndMainMenuBar, .{  }); }
+    pub fn igEndMenu() callconv(.C) void { return instrumentation.call(.igEndMenu, .{  }); }
+    pub fn igEndMenuBar() callconv(.C) void { return instrumentation.call(.igEndMenuBar, .{  }); }
+    pub fn igEndPopup() callconv(.C) void { return instrumentation.call(.igEndPopup, .{  }); }
+    pub fn igEndTabBar() callconv(.C) void { return instrumentation.call(.igEndTabBar, .{  }); }
+    pub fn igEndTabItem() callconv(.C) void { return instrumentation.call(.igEndTabItem, .{  }); }
+    pub fn igEndTable() callconv(.C) void { return instrumentation.call(.igEndTable, .{  }); }
+    pub fn igEndTooltip() callconv(.C) void { return instrumentation.call(.igEndTooltip, .{  }); }
+    pub fn igFindViewportByID(id: ID) callconv(.C) ?*Viewport { return instrumentation.call(.igFindViewportByID, .{ id }); }
+    pub fn igFindViewportByPlatformHandle(platform_handle: ?*anyopaque) callconv(.C) ?*Viewport { return instrumentation.call(.igFindViewportByPlatformHandle, .{ platform_handle }); }
+    pub fn igGetAllocatorFunctions(p_alloc_func: ?*MemAllocFunc, p_free_func: ?*MemFreeFunc, p_user_data: ?*?*anyopaque) callconv(.C) void { return instrumentation.call(.igGetAllocatorFunctions, .{ p_alloc_func, p_free_func, p_user_data }); }
+    pub fn igGetBackgroundDrawList_Nil() callconv(.C) ?*DrawList { return instrumentation.call(.igGetBackgroundDrawList_Nil, .{  }); }
+    pub fn igGetBackgroundDrawList_ViewportPtr(viewport: ?*Viewport) callconv(.C) ?*DrawList { return instrumentation.call(.igGetBackgroundDrawList_ViewportPtr, .{ viewport }); }
+    pub fn igGetClipboardText() callconv(.C) ?[*:0]const u8 { return instrumentation.call(.igGetClipboardText, .{  }); }
+    pub fn igGetColorU32_Col(idx: Col, alpha_mul: f32) callconv(.C) u32 { return instrumentation.call(.igGetColorU32_Col, .{ idx, alpha_mul }); }
+    pub fn igGetColorU32_Vec4(col: Vec4) callconv(.C) u32 { return instrumentation.call(.igGetColorU32_Vec4, .{ col }); }
+    pub fn igGetColorU32_U32(col: u32, alpha_mul: f32) callconv(.C) u32 { return instrumentation.call(.igGetColorU32_U32, .{ col, alpha_mul }); }
+    pub fn igGetColumnIndex() callconv(.C) i32 { return instrumentation.call(.igGetColumnIndex, .{  }); }
+    pub fn igGetColumnOffset(column_index: i32) callconv(.C) f32 { return instrumentation.call(.igGetColumnOffset, .{ column_index }); }
+    pub fn igGetColumnWidth(column_index: i32) callconv(.C) f32 { return instrumentation.call(.igGetColumnWidth, .{ column_index }); }
+    pub fn igGetColumnsCount() callconv(.C) i32 { return instrumentation.call(.igGetColumnsCount, .{  }); }
+    pub fn igGetContentRegionAvail(pOut: *Vec2) callconv(.C) void { return instrumentation.call(.igGetContentRegionAvail, .{ pOut }); }
+    pub fn igGetContentRegionMax(pOut: *Vec2) callconv(.C) void { return instrumentation.call(.igGetContentRegionMax, .{ pOut }); }
+    pub fn igGetCurrentContext() callconv(.C) ?*Context { return instrumentation.call(.igGetCurrentContext, .{  }); }
+    pub fn igGetCursorPos(pOut: *Vec2) callconv(.C) void { return instrumentation.call(.igGetCursorPos, .{ pOut }); }
+    pub fn igGetCursorPosX() callconv(.C) f32 { return instrumentation.call(.igGetCursorPosX, .{  }); }
+    pub fn igGetCursorPosY() callconv(.C) f32 { return instrumentation.call(.igGetCursorPosY, .{  }); }
+    pub fn igGetCursorScreenPos(pOut: *Vec2) callconv(.C) void { return instrumentation.call(.igGetCursorScreenPos, .{ pOut }); }
+    pub fn igGetCursorStartPos(pOut: *Vec2) callconv(.C) void { return instrumentation.call(.igGetCursorStartPos, .{ pOut }); }
+    pub fn igGetDragDropPayload() callconv(.C) ?*const Payload { return instrumentation.call(.igGetDragDropPayload, .{  }); }
+    pub fn igGetDrawData() callconv(.C) *DrawData { return instrumentation.call(.igGetDrawData, .{  }); }
+    pub fn igGetDrawListSharedData() callconv(.C) ?*DrawListSharedData { return instrumentation.call(.igGetDrawListSharedData, .{  }); }
+    pub fn igGetFont() callconv(.C) ?*Font { return instrumentation.call(.igGetFont, .{  }); }
+    pub fn igGetFontSize() callconv(.C) f32 { return instrumentation.call(.igGetFontSize, .{  }); }
+    pub fn igGetFontTexUvWhitePixel(pOut: *Vec2) callconv(.C) void { return instrumentation.call(.igGetFontTexUvWhitePixel, .{ pOut }); }
+    pub fn igGetForegroundDrawList_Nil() callconv(.C) ?*DrawList { return instrumentation.call(.igGetForegroundDrawList_Nil, .{  }); }
+    pub fn igGetForegroundDrawList_ViewportPtr(viewport: ?*Viewport) callconv(.C) ?*DrawList { return instrumentation.call(.igGetForegroundDrawList_ViewportPtr, .{ viewport }); }
+    pub fn igGetFrameCount() callconv(.C) i32 { return instrumentation.call(.igGetFrameCount, .{  }); }
+    pub fn igGetFrameHeight() callconv(.C) f32 { return instrumentation.call(.igGetFrameHeight, .{  }); }
+    pub fn igGetFrameHeightWithSpacing() callconv(.C) f32 { return instrumentation.call(.igGetFrameHeightWithSpacing, .{  }); }
+    pub fn igGetID_Str(str_id: ?[*:0]const u8) callconv(.C) ID { return instrumentation.call(.igGetID_Str, .{ str_id }); }
+    pub fn igGetID_StrStr(str_id_begin: ?[*]const u8, str_id_end: ?[*]const u8) callconv(.C) ID { return instrumentation.call(.igGetID_StrStr, .{ str_id_begin, str_id_end }); }
+    pub fn igGetID_Ptr(ptr_id: ?*const anyopaque) callconv(.C) ID { return instrumentation.call(.igGetID_Ptr, .{ ptr_id }); }
+    pub fn igGetIO() callconv(.C) *IO { return instrumentation.call(.igGetIO, .{  }); }
+    pub fn igGetItemID() callconv(.C) ID { return instrumentation.call(.igGetItemID, .{  }); }
+    pub fn igGetItemRectMax(pOut: *Vec2) callconv(.C) void { return instrumentation.call(.igGetItemRectMax, .{ pOut }); }
+    pub fn igGetItemRectMin(pOut: *Vec2) callconv(.C) void { return instrumentation.call(.igGetItemRectMin, .{ pOut }); }
+    pub fn igGetItemRectSize(pOut: *Vec2) callconv(.C) void { return instrumentation.call(.igGetItemRectSize, .{ pOut }); }
+    pub fn igGetKeyIndex(key: Key) callconv(.C) Key { return instrumentation.call(.igGetKeyIndex, .{ key }); }
+    pub fn igGetKeyName(key: Key) callconv(.C) ?[*:0]const u8 { return instrumentation.call(.igGetKeyName, .{ key }); }
+    pub fn igGetKeyPressedAmount(key: Key, repeat_delay: f32, rate: f32) callconv(.C) i32 { return instrumentation.call(.igGetKeyPressedAmount, .{ key, repeat_delay, rate }); }
+    pub fn igGetMainViewport() callconv(.C) ?*Viewport { return instrumentation.call(.igGetMainViewport, .{  }); }
+    pub fn igGetMouseClickedCount(button: MouseButton) callconv(.C) i32 { return instrumentation.call(.igGetMouseClickedCount, .{ button }); }
+    pub fn igGetMouseCursor() callconv(.C) MouseCursor { return instrumentation.call(.igGetMouseCursor, .{  }); }
+    pub fn igGetMouseDragDelta(pOut: *Vec2, button: MouseButton, lock_threshold: f32) callconv(.C) void { return instrumentation.call(.igGetMouseDragDelta, .{ pOut, button, lock_threshold }); }
+    pub fn igGetMousePos(pOut: *Vec2) callconv(.C) void { return instrumentation.call(.igGetMousePos, .{ pOut }); }
+    pub fn igGetMousePosOnOpeningCurrentPopup(pOut: *Vec2) callconv(.C) void { return instrumentation.call(.igGetMousePosOnOpeningCurrentPopup, .{ pOut }); }
+    pub fn igGetPlatformIO() callconv(.C) ?*PlatformIO { return instrumentation.call(.igGetPlatformIO, .{  }); }
+    pub fn igGetScrollMaxX() callconv(.C) f32 { return instrumentation.call(.igGetScrollMaxX, .{  }); }
+    pub fn igGetScrollMaxY() callconv(.C) f32 { return instrumentation.call(.igGetScrollMaxY, .{  }); }
+    pub fn igGetScrollX() callconv(.C) f32 { return instrumentation.call(.igGetScrollX, .{  }); }
+    pub fn igGetScrollY() callconv(.C) f32 { return instrumentation.call(.igGetScrollY, .{  }); }
+    pub fn igGetStateStorage() callconv(.C) ?*Storage { return instrumentation.call(.igGetStateStorage, .{  }); }
+    pub fn igGetStyle() callconv(.C) ?*Style { return instrumentation.call(.igGetStyle, .{  }); }
+    pub fn igGetStyleColorName(idx: Col) callconv(.C) ?[*:0]const u8 { return instrumentation.call(.igGetStyleColorName, .{ idx }); }
+    pub fn igGetStyleColorVec4(idx: Col) callconv(.C) ?*Vec4 { return instrumentation.call(.igGetStyleColorVec4, .{ idx }); }
+    pub fn igGetTextLineHeight() callconv(.C) f32 { return instrumentation.call(.igGetTextLineHeight, .{  }); }
+    pub fn igGetTextLineHeightWithSpacing() callconv(.C) f32 { return instrumentation.call(.igGetTextLineHeightWithSpacing, .{  }); }
+    pub fn igGetTime() callconv(.C) f64 { return instrumentation.call(.igGetTime, .{  }); }
+    pub fn igGetTreeNodeToLabelSpacing() callconv(.C) f32 { return instrumentation.call(.igGetTreeNodeToLabelSpacing, .{  }); }
+    pub fn igGetVersion() callconv(.C) ?[*:0]const u8 { return instrumentation.call(.igGetVersion, .{  }); }
+    pub fn igGetWindowContentRegionMax(pOut: *Vec2) callconv(.C) void { return instrumentation.call(.igGetWindowContentRegionMax, .{ pOut }); }
+    pub fn igGetWindowContentRegionMin(pOut: *Vec2) callconv(.C) void { return instrumentation.call(.igGetWindowContentRegionMin, .{ pOut }); }
+    pub fn igGetWindowDockID() callconv(.C) ID { return instrumentation.call(.igGetWindowDockID, .{  }); }
+    pub fn igGetWindowDpiScale() callconv(.C) f32 { return instrumentation.call(.igGetWindowDpiScale, .{  }); }
+    pub fn igGetWindowDrawList() callconv(.C) ?*DrawList { return instrumentation.call(.igGetWindowDrawList, .{  }); }
+    pub fn igGetWindowHeight() callconv(.C) f32 { return instrumentation.call(.igGetWindowHeight, .{  }); }
+    pub fn igGetWindowPos(pOut: *Vec2) callconv(.C) void { return instrumentation.call(.igGetWindowPos, .{ pOut }); }
+    pub fn igGetWindowSize(pOut: *Vec2) callconv(.C) void { return instrumentation.call(.igGetWindowSize, .{ pOut }); }
+    pub fn igGetWindowViewport() callconv(.C) ?*Viewport { return instrumentation.call(.igGetWindowViewport, .{  }); }
+    pub fn igGetWindowWidth() callconv(.C) f32 { return instrumentation.call(.igGetWindowWidth, .{  }); }
+    pub fn igImage(user_texture_id: TextureID, image_size: Vec2, uv0: Vec2, uv1: Vec2, tint_col: Vec4, border_col: Vec4) callconv(.C) void { return instrumentation.call(.igImage, .{ user_texture_id, image_size, uv0, uv1, tint_col, border_col }); }
+    pub fn igImageButton(str_id: ?[*:0]const u8, user_texture_id: TextureID, image_size: Vec2, uv0: Vec2, uv1: Vec2, bg_col: Vec4, tint_col: Vec4) callconv(.C) bool { return instrumentation.call(.igImageButton, .{ str_id, user_texture_id, image_size, uv0, uv1, bg_col, tint_col }); }
+    pub fn igIndent(indent_w: f32) callconv(.C) void { return instrumentation.call(.igIndent, .{ indent_w }); }
+    pub fn igInputDouble(label: ?[*:0]const u8, v: *f64, step: f64, step_fast: f64, format: ?[*:0]const u8, flags: InputTextFlagsInt) callconv(.C) bool { return instrumentation.call(.igInputDouble, .{ label, v, step, step_fast, format, flags }); }
+    pub fn igInputFloat(label: ?[*:0]const u8, v: *f32, step: f32, step_fast: f32, format: ?[*:0]const u8, flags: InputTextFlagsInt) callconv(.C) bool { return instrumentation.call(.igInputFloat, .{ label, v, step, step_fast, format, flags }); }
+    pub fn igInputFloat2(label: ?[*:0]const u8, v: *[2]f32, format: ?[*:0]const u8, flags: InputTextFlagsInt) callconv(.C) bool { return instrumentation.call(.igInputFloat2, .{ label, v, format, flags }); }
+    pub fn igInputFloat3(label: ?[*:0]const u8, v: *[3]f32, format: ?[*:0]const u8, flags: InputTextFlagsInt) callconv(.C) bool { return instrumentation.call(.igInputFloat3, .{ label, v, format, flags }); }
+    pub fn igInputFloat4(label: ?[*:0]const u8, v: *[4]f32, format: ?[*:0]const u8, flags: InputTextFlagsInt) callconv(.C) bool { return instrumentation.call(.igInputFloat4, .{ label, v, format, flags }); }
+    pub fn igInputInt(label: ?[*:0]const u8, v: *i32, step: i32, step_fast: i32, flags: InputTextFlagsInt) callconv(.C) bool { return instrumentation.call(.igInputInt, .{ label, v, step, step_fast, flags }); }
+    pub fn igInputInt2(label: ?[*:0]const u8, v: *[2]i32, flags: InputTextFlagsInt) callconv(.C) bool { return instrumentation.call(.igInputInt2, .{ label, v, flags }); }
+    pub fn igInputInt3(label: ?[*:0]const u8, v: *[3]i32, flags: InputTextFlagsInt) callconv(.C) bool { return instrumentation.call(.igInputInt3, .{ label, v, flags }); }
+    pub fn igInputInt4(label: ?[*:0]const u8, v: *[4]i32, flags: InputTextFlagsInt) callconv(.C) bool { return instrumentation.call(.igInputInt4, .{ label, v, flags }); }
+    pub fn igInputScalar(label: ?[*:0]const u8, data_type: DataType, p_data: ?*anyopaque, p_step: ?*const anyopaque, p_step_fast: ?*const anyopaque, format: ?[*:0]const u8, flags: InputTextFlagsInt) callconv(.C) bool { return instrumentation.call(.igInputScalar, .{ label, data_type, p_data, p_step, p_step_fast, format, flags }); }
+    pub fn igInputScalarN(label: ?[*:0]const u8, data_type: DataType, p_data: ?*anyopaque, components: i32, p_step: ?*const anyopaque, p_step_fast: ?*const anyopaque, format: ?[*:0]const u8, flags: InputTextFlagsInt) callconv(.C) bool { return instrumentation.call(.igInputScalarN, .{ label, data_type, p_data, components, p_step, p_step_fast, format, flags }); }
+    pub fn igInputText(label: ?[*:0]const u8, buf: ?[*]u8, buf_size: usize, flags: InputTextFlagsInt, callback: InputTextCallback, user_data: ?*anyopaque) callconv(.C) bool { return instrumentation.call(.igInputText, .{ label, buf, buf_size, flags, callback, user_data }); }
+    pub fn igInputTextMultiline(label: ?[*:0]const u8, buf: ?[*]u8, buf_size: usize, size: Vec2, flags: InputTextFlagsInt, callback: InputTextCallback, user_data: ?*anyopaque) callconv(.C) bool { return instrumentation.call(.igInputTextMultiline, .{ label, buf, buf_size, size, flags, callback, user_data }); }
+    pub fn igInputTextWithHint(label: ?[*:0]const u8, hint: ?[*:0]const u8, buf: ?[*]u8, buf_size: usize, flags: InputTextFlagsInt, callback: InputTextCallback, user_data: ?*anyopaque) callconv(.C) bool { return instrumentation.call(.igInputTextWithHint, .{ label, hint, buf, buf_size, flags, callback, user_data }); }
+    pub fn igInvisibleButton(str_id: ?[*:0]const u8, size: Vec2, flags: ButtonFlagsInt) callconv(.C) bool { return instrumentation.call(.igInvisibleButton, .{ str_id, size, flags }); }
+    pub fn igIsAnyItemActive() callconv(.C) bool { return instrumentation.call(.igIsAnyItemActive, .{  }); }
+    pub fn igIsAnyItemFocused() callconv(.C) bool { return instrumentation.call(.igIsAnyItemFocused, .{  }); }
+    pub fn igIsAnyItemHovered() callconv(.C) bool { return instrumentation.call(.igIsAnyItemHovered, .{  }); }
+    pub fn igIsAnyMouseDown() callconv(.C) bool { return instrumentation.call(.igIsAnyMouseDown, .{  }); }
+    pub fn igIsItemActivated() callconv(.C) bool { return instrumentation.call(.igIsItemActivated, .{  }); }
+    pub fn igIsItemActive() callconv(.C) bool { return instrumentation.call(.igIsItemActive, .{  }); }
+    pub fn igIsItemClicked(mouse_button: MouseButton) callconv(.C) bool { return instrumentation.call(.igIsItemClicked, .{ mouse_button }); }
+    pub fn igIsItemDeactivated() callconv(.C) bool { return instrumentation.call(.igIsItemDeactivated, .{  }); }
+    pub fn igIsItemDeactivatedAfterEdit() callconv(.C) bool { return instrumentation.call(.igIsItemDeactivatedAfterEdit, .{  }); }
+    pub fn igIsItemEdited() callconv(.C) bool { return instrumentation.call(.igIsItemEdited, .{  }); }
+    pub fn igIsItemFocused() callconv(.C) bool { return instrumentation.call(.igIsItemFocused, .{  }); }
+    pub fn igIsItemHovered(flags: HoveredFlagsInt) callconv(.C) bool { return instrumentation.call(.igIsItemHovered, .{ flags }); }
+    pub fn igIsItemToggledOpen() callconv(.C) bool { return instrumentation.call(.igIsItemToggledOpen, .{  }); }
+    pub fn igIsItemVisible() callconv(.C) bool { return instrumentation.call(.igIsItemVisible, .{  }); }
+    pub fn igIsKeyChordPressed(key_chord: KeyChord) callconv(.C) bool { return instrumentation.call(.igIsKeyChordPressed, .{ key_chord }); }
+    pub fn igIsKeyDown(key: Key) callconv(.C) bool { return instrumentation.call(.igIsKeyDown, .{ key }); }
+    pub fn igIsKeyPressed(key: Key, repeat: bool) callconv(.C) bool { return instrumentation.call(.igIsKeyPressed, .{ key, repeat }); }
+    pub fn igIsKeyReleased(key: Key) callconv(.C) bool { return instrumentation.call(.igIsKeyReleased, .{ key }); }
+    pub fn igIsMouseClicked(button: MouseButton, repeat: bool) callconv(.C) bool { return instrumentation.call(.igIsMouseClicked, .{ button, repeat }); }
+    pub fn igIsMouseDoubleClicked(button: MouseButton) callconv(.C) bool { return instrumentation.call(.igIsMouseDoubleClicked, .{ button }); }
+    pub fn igIsMouseDown(button: MouseButton) callconv(.C) bool { return instrumentation.call(.igIsMouseDown, .{ button }); }
+    pub fn igIsMouseDragging(button: MouseButton, lock_threshold: f32) callconv(.C) bool { return instrumentation.call(.igIsMouseDragging, .{ button, lock_threshold }); }
+    pub fn igIsMouseHoveringRect(r_min: Vec2, r_max: Vec2, clip: bool) callconv(.C) bool { return instrumentation.call(.igIsMouseHoveringRect, .{ r_min, r_max, clip }); }
+    pub fn igIsMousePosValid(mouse_pos: ?*Vec2) callconv(.C) bool { return instrumentation.call(.igIsMousePosValid, .{ mouse_pos }); }
+    pub fn igIsMouseReleased(button: MouseButton) callconv(.C) bool { return instrumentation.call(.igIsMouseReleased, .{ button }); }
+    pub fn igIsPopupOpen(str_id: ?[*:0]const u8, flags: PopupFlagsInt) callconv(.C) bool { return instrumentation.call(.igIsPopupOpen, .{ str_id, flags }); }
+    pub fn igIsRectVisible_Nil(size: Vec2) callconv(.C) bool { return instrumentation.call(.igIsRectVisible_Nil, .{ size }); }
+    pub fn igIsRectVisible_Vec2(rect_min: Vec2, rect_max: Vec2) callconv(.C) bool { return instrumentation.call(.igIsRectVisible_Vec2, .{ rect_min, rect_max }); }
+    pub fn igIsWindowAppearing() callconv(.C) bool { return instrumentation.call(.igIsWindowAppearing, .{  }); }
+    pub fn igIsWindowCollapsed() callconv(.C) bool { return instrumentation.call(.igIsWindowCollapsed, .{  }); }
+    pub fn igIsWindowDocked() callconv(.C) bool { return instrumentation.call(.igIsWindowDocked, .{  }); }
+    pub fn igIsWindowFocused(flags: FocusedFlagsInt) callconv(.C) bool { return instrumentation.call(.igIsWindowFocused, .{ flags }); }
+    pub fn igIsWindowHovered(flags: HoveredFlagsInt) callconv(.C) bool { return instrumentation.call(.igIsWindowHovered, .{ flags }); }
+    pub const igLabelText = raw_extern.igLabelText;
+    pub fn igListBox_Str_arr(label: ?[*:0]const u8, current_item: ?*i32, items: [*]const[*:0]const u8, items_count: i32, height_in_items: i32) callconv(.C) bool { return instrumentation.call(.igListBox_Str_arr, .{ label, current_item, items, items_count, height_in_items }); }
+    pub fn igListBox_FnStrPtr(label: ?[*:0]const u8, current_item: ?*i32, getter: ?*fn (user_data: ?*anyopaque, idx: i32) callconv(.C) ?[*:0]const u8, user_data: ?*anyopaque, items_count: i32, height_in_items: i32) callconv(.C) bool { return instrumentation.call(.igListBox_FnStrPtr, .{ label, current_item, getter, user_data, items_count, height_in_items }); }
+    pub fn igLoadIniSettingsFromDisk(ini_filename: ?[*:0]const u8) callconv(.C) void { return instrumentation.call(.igLoadIniSettingsFromDisk, .{ ini_filename }); }
+    pub fn igLoadIniSettingsFromMemory(ini_data: ?[*]const u8, ini_size: usize) callconv(.C) void { return instrumentation.call(.igLoadIniSettingsFromMemory, .{ ini_data, ini_size }); }
+    pub fn igLogButtons() callconv(.C) void { return instrumentation.call(.igLogButtons, .{  }); }
+    pub fn igLogFinish() callconv(.C) void { return instrumentation.call(.igLogFinish, .{  }); }
+    pub const igLogText = raw_extern.igLogText;
+    pub fn igLogToClipboard(auto_open_depth: i32) callconv(.C) void { return instrumentation.call(.igLogToClipboard, .{ auto_open_depth }); }
+    pub fn igLogToFile(auto_open_depth: i32, filename: ?[*:0]const u8) callconv(.C) void { return instrumentation.call(.igLogToFile, .{ auto_open_depth, filename }); }
+    pub fn igLogToTTY(auto_open_depth: i32) callconv(.C) void { return instrumentation.call(.igLogToTTY, .{ auto_open_depth }); }
+    pub fn igMemAlloc(size: usize) callconv(.C) ?*anyopaque { return instrumentation.call(.igMemAlloc, .{ size }); }
+    pub fn igMemFree(ptr: ?*anyopaque) callconv(.C) void { return instrumentation.call(.igMemFree, .{ ptr }); }
+    pub fn igMenuItem_Bool(label: ?[*:0]const u8, shortcut: ?[*:0]const u8, selected: bool, enabled: bool) callconv(.C) bool { return instrumentation.call(.igMenuItem_Bool, .{ label, shortcut, selected, enabled }); }
+    pub fn igMenuItem_BoolPtr(label: ?[*:0]const u8, shortcut: ?[*:0]const u8, p_selected: ?*bool, enabled: bool) callconv(.C) bool { return instrumentation.call(.igMenuItem_BoolPtr, .{ label, shortcut, p_selected, enabled }); }
+    pub fn igNewFrame() callconv(.C) void { return instrumentation.call(.igNewFrame, .{  }); }
+    pub fn igNewLine() callconv(.C) void { return instrumentation.call(.igNewLine, .{  }); }
+    pub fn igNextColumn() callconv(.C) void { return instrumentation.call(.igNextColumn, .{  }); }
+    pub fn igOpenPopup_Str(str_id: ?[*:0]const u8, popup_flags: PopupFlagsInt) callconv(.C) void { return instrumentation.call(.igOpenPopup_Str, .{ str_id, popup_flags }); }
+    pub fn igOpenPopup_ID(id: ID, popup_flags: PopupFlagsInt) callconv(.C) void { return instrumentation.call(.igOpenPopup_ID, .{ id, popup_flags }); }
+    pub fn igOpenPopupOnItemClick(str_id: ?[*:0]const u8, popup_flags: PopupFlagsInt) callconv(.C) void { return instrumentation.call(.igOpenPopupOnItemClick, .{ str_id, popup_flags }); }
+    pub fn igPlotHistogram_FloatPtr(label: ?[*:0]const u8, values: *const f32, values_count: i32, values_offset: i32, overlay_text: ?[*:0]const u8, scale_min: f32, scale_max: f32, graph_size: Vec2, stride: i32) callconv(.C) void { return instrumentation.call(.igPlotHistogram_FloatPtr, .{ label, values, values_count, values_offset, overlay_text, scale_min, scale_max, graph_size, stride }); }
+    pub fn igPlotHistogram_FnFloatPtr(label: ?[*:0]const u8, values_getter: ?*fn (data: ?*anyopaque, idx: i32) callconv(.C) f32, data: ?*anyopaque, values_count: i32, values_offset: i32, overlay_text: ?[*:0]const u8, scale_min: f32, scale_max: f32, graph_size: Vec2) callconv(.C) void { return instrumentation.call(.igPlotHistogram_FnFloatPtr, .{ label, values_getter, data, values_count, values_offset, overlay_text, scale_min, scale_max, graph_size }); }
+    pub fn igPlotLines_FloatPtr(label: ?[*:0]const u8, values: *const f32, values_count: i32, values_offset: i32, overlay_text: ?[*:0]const u8, scale_min: f32, scale_max: f32, graph_size: Vec2, stride: i32) callconv(.C) void { return instrumentation.call(.igPlotLines_FloatPtr, .{ label, values, values_count, values_offset, overlay_text, scale_min, scale_max, graph_size, stride }); }
+    pub fn igPlotLines_FnFloatPtr(label: ?[*:0]const u8, values_getter: ?*fn (data: ?*anyopaque, idx: i32) callconv(.C) f32, data: ?*anyopaque, values_count: i32, values_offset: i32, overlay_text: ?[*:0]const u8, scale_min: f32, scale_max: f32, graph_size: Vec2) callconv(.C) void { return instrumentation.call(.igPlotLines_FnFloatPtr, .{ label, values_getter, data, values_count, values_offset, overlay_text, scale_min, scale_max, graph_size }); }
+    pub fn igPopButtonRepeat() callconv(.C) void { return instrumentation.call(.igPopButtonRepeat, .{  }); }
+    pub fn igPopClipRect() callconv(.C) void { return instrumentation.call(.igPopClipRect, .{  }); }
+    pub fn igPopFont() callconv(.C) void { return instrumentation.call(.igPopFont, .{  }); }
+    pub fn igPopID() callconv(.C) void { return instrumentation.call(.igPopID, .{  }); }
+    pub fn igPopItemWidth() callconv(.C) void { return instrumentation.call(.igPopItemWidth, .{  }); }
+    pub fn igPopStyleColor(count: i32) callconv(.C) void { return instrumentation.call(.igPopStyleColor, .{ count }); }
+    pub fn igPopStyleVar(count: i32) callconv(.C) void { return instrumentation.call(.igPopStyleVar, .{ count }); }
+    pub fn igPopTabStop() callconv(.C) void { return instrumentation.call(.igPopTabStop, .{  }); }
+    pub fn igPopTextWrapPos() callconv(.C) void { return instrumentation.call(.igPopTextWrapPos, .{  }); }
+    pub fn igProgressBar(fraction: f32, size_arg: Vec2, overlay: ?[*:0]const u8) callconv(.C) void { return instrumentation.call(.igProgressBar, .{ fraction, size_arg, overlay }); }
+    pub fn igPushButtonRepeat(repeat: bool) callconv(.C) void { return instrumentation.call(.igPushButtonRepeat, .{ repeat }); }
+    pub fn igPushClipRect(clip_rect_min: Vec2, clip_rect_max: Vec2, intersect_with_current_clip_rect: bool) callconv(.C) void { return instrumentation.call(.igPushClipRect, .{ clip_rect_min, clip_rect_max, intersect_with_current_clip_rect }); }
+    pub fn igPushFont(font: ?*Font) callconv(.C) void { return instrumentation.call(.igPushFont, .{ font }); }
+    pub fn igPushID_Str(str_id: ?[*:0]const u8) callconv(.C) void { return instrumentation.call(.igPushID_Str, .{ str_id }); }
+    pub fn igPushID_StrStr(str_id_begin: ?[*]const u8, str_id_end: ?[*]const u8) callconv(.C) void { return instrumentation.call(.igPushID_StrStr, .{ str_id_begin, str_id_end }); }
+    pub fn igPushID_Ptr(ptr_id: ?*const anyopaque) callconv(.C) void { return instrumentation.call(.igPushID_Ptr, .{ ptr_id }); }
+    pub fn igPushID_Int(int_id: i32) callconv(.C) void { return instrumentation.call(.igPushID_Int, .{ int_id }); }
+    pub fn igPushItemWidth(item_width: f32) callconv(.C) void { return instrumentation.call(.igPushItemWidth, .{ item_width }); }
+    pub fn igPushStyleColor_U32(idx: Col, col: u32) callconv(.C) void { return instrumentation.call(.igPushStyleColor_U32, .{ idx, col }); }
+    pub fn igPushStyleColor_Vec4(idx: Col, col: Vec4) callconv(.C) void { return instrumentation.call(.igPushStyleColor_Vec4, .{ idx, col }); }
+    pub fn igPushStyleVar_Float(idx: StyleVar, val: f32) callconv(.C) void { return instrumentation.call(.igPushStyleVar_Float, .{ idx, val }); }
+    pub fn igPushStyleVar_Vec2(idx: StyleVar, val: Vec2) callconv(.C) void { return instrumentation.call(.igPushStyleVar_Vec2, .{ idx, val }); }
+    pub fn igPushTabStop(tab_stop: bool) callconv(.C) void { return instrumentation.call(.igPushTabStop, .{ tab_stop }); }
+    pub fn igPushTextWrapPos(wrap_local_pos_x: f32) callconv(.C) void { return instrumentation.call(.igPushTextWrapPos, .{ wrap_local_pos_x }); }
+    pub fn igRadioButton_Bool(label: ?[*:0]const u8, active: bool) callconv(.C) bool { return instrumentation.call(.igRadioButton_Bool, .{ label, active }); }
+    pub fn igRadioButton_IntPtr(label: ?[*:0]const u8, v: *i32, v_button: i32) callconv(.C) bool { return instrumentation.call(.igRadioButton_IntPtr, .{ label, v, v_button }); }
+    pub fn igRender() callconv(.C) void { return instrumentation.call(.igRender, .{  }); }
+    pub fn igRenderPlatformWindowsDefault(platform_render_arg: ?*anyopaque, renderer_render_arg: ?*anyopaque) callconv(.C) void { return instrumentation.call(.igRenderPlatformWindowsDefault, .{ platform_render_arg, renderer_render_arg }); }
+    pub fn igResetMouseDragDelta(button: MouseButton) callconv(.C) void { return instrumentation.call(.igResetMouseDragDelta, .{ button }); }
+    pub fn igSameLine(offset_from_start_x: f32, spacing: f32) callconv(.C) void { return instrumentation.call(.igSameLine, .{ offset_from_start_x, spacing }); }
+    pub fn igSaveIniSettingsToDisk(ini_filename: ?[*:0]const u8) callconv(.C) void { return instrumentation.call(.igSaveIniSettingsToDisk, .{ ini_filename }); }
+    pub fn igSaveIniSettingsToMemory(out_ini_size: ?*usize) callconv(.C) ?[*:0]const u8 { return instrumentation.call(.igSaveIniSettingsToMemory, .{ out_ini_size }); }
+    pub fn igSelectable_Bool(label: ?[*:0]const u8, selected: bool, flags: SelectableFlagsInt, size: Vec2) callconv(.C) bool { return instrumentation.call(.igSelectable_Bool, .{ label, selected, flags, size }); }
+    pub fn igSelectable_BoolPtr(label: ?[*:0]const u8, p_selected: ?*bool, flags: SelectableFlagsInt, size: Vec2) callconv(.C) bool { return instrumentation.call(.igSelectable_BoolPtr, .{ label, p_selected, flags, size }); }
+    pub fn igSeparator() callconv(.C) void { return instrumentation.call(.igSeparator, .{  }); }
+    pub fn igSeparatorText(label: ?[*:0]const u8) callconv(.C) void { return instrumentation.call(.igSeparatorText, .{ label }); }
+    pub fn igSetAllocatorFunctions(alloc_func: MemAllocFunc, free_func: MemFreeFunc, user_data: ?*anyopaque) callconv(.C) void { return instrumentation.call(.igSetAllocatorFunctions, .{ alloc_func, free_func, user_data }); }
+    pub fn igSetClipboardText(text: ?[*:0]const u8) callconv(.C) void { return instrumentation.call(.igSetClipboardText, .{ text }); }
+    pub fn igSetColorEditOptions(flags: ColorEditFlagsInt) callconv(.C) void { return instrumentation.call(.igSetColorEditOptions, .{ flags }); }
+    pub fn igSetColumnOffset(column_index: i32, offset_x: f32) callconv(.C) void { return instrumentation.call(.igSetColumnOffset, .{ column_index, offset_x }); }
+    pub fn igSetColumnWidth(column_index: i32, width: f32) callconv(.C) void { return instrumentation.call(.igSetColumnWidth, .{ column_index, width }); }
+    pub fn igSetCurrentContext(ctx: ?*Context) callconv(.C) void { return instrumentation.call(.igSetCurrentContext, .{ ctx }); }
+    pub fn igSetCursorPos(local_pos: Vec2) callconv(.C) void { return instrumentation.call(.igSetCursorPos, .{ local_pos }); }
+    pub fn igSetCursorPosX(local_x: f32) callconv(.C) void { return instrumentation.call(.igSetCursorPosX, .{ local_x }); }
+    pub fn igSetCursorPosY(local_y: f32) callconv(.C) void { return instrumentation.call(.igSetCursorPosY, .{ local_y }); }
+    pub fn igSetCursorScreenPos(pos: Vec2) callconv(.C) void { return instrumentation.call(.igSetCursorScreenPos, .{ pos }); }
+    pub fn igSetDragDropPayload(kind: ?[*:0]const u8, data: ?*const anyopaque, sz: usize, cond: CondFlagsInt) callconv(.C) bool { return instrumentation.call(.igSetDragDropPayload, .{ kind, data, sz, cond }); }
+    pub fn igSetItemDefaultFocus() callconv(.C) void { return instrumentation.call(.igSetItemDefaultFocus, .{  }); }
+    pub const igSetItemTooltip = raw_extern.igSetItemTooltip;
+    pub fn igSetKeyboardFocusHere(offset: i32) callconv(.C) void { return instrumentation.call(.igSetKeyboardFocusHere, .{ offset }); }
+    pub fn igSetMouseCursor(cursor_type: MouseCursor) callconv(.C) void { return instrumentation.call(.igSetMouseCursor, .{ cursor_type }); }
+    pub fn igSetNextFrameWantCaptureKeyboard(want_capture_keyboard: bool) callconv(.C) void { return instrumentation.call(.igSetNextFrameWantCaptureKeyboard, .{ want_capture_keyboard }); }
+    pub fn igSetNextFrameWantCaptureMouse(want_capture_mouse: bool) callconv(.C) void { return instrumentation.call(.igSetNextFrameWantCaptureMouse, .{ want_capture_mouse }); }
+    pub fn igSetNextItemAllowOverlap() callconv(.C) void { return instrumentation.call(.igSetNextItemAllowOverlap, .{  }); }
+    pub fn igSetNextItemOpen(is_open: bool, cond: CondFlagsInt) callconv(.C) void { return instrumentation.call(.igSetNextItemOpen, .{ is_open, cond }); }
+    pub fn igSetNextItemWidth(item_width: f32) callconv(.C) void { return instrumentation.call(.igSetNextItemWidth, .{ item_width }); }
+    pub fn igSetNextWindowBgAlpha(alpha: f32) callconv(.C) void { return instrumentation.call(.igSetNextWindowBgAlpha, .{ alpha }); }
+    pub fn igSetNextWindowClass(window_class: ?*const WindowClass) callconv(.C) void { return instrumentation.call(.igSetNextWindowClass, .{ window_class }); }
+    pub fn igSetNextWindowCollapsed(collapsed: bool, cond: CondFlagsInt) callconv(.C) void { return instrumentation.call(.igSetNextWindowCollapsed, .{ collapsed, cond }); }
+    pub fn igSetNextWindowContentSize(size: Vec2) callconv(.C) void { return instrumentation.call(.igSetNextWindowContentSize, .{ size }); }
+    pub fn igSetNextWindowDockID(dock_id: ID, cond: CondFlagsInt) callconv(.C) void { return instrumentation.call(.igSetNextWindowDockID, .{ dock_id, cond }); }
+    pub fn igSetNextWindowFocus() callconv(.C) void { return instrumentation.call(.igSetNextWindowFocus, .{  }); }
+    pub fn igSetNextWindowPos(pos: Vec2, cond: CondFlagsInt, pivot: Vec2) callconv(.C) void { return instrumentation.call(.igSetNextWindowPos, .{ pos, cond, pivot }); }
+    pub fn igSetNextWindowScroll(scroll: Vec2) callconv(.C) void { return instrumentation.call(.igSetNextWindowScroll, .{ scroll }); }
+    pub fn igSetNextWindowSize(size: Vec2, cond: CondFlagsInt) callconv(.C) void { return instrumentation.call(.igSetNextWindowSize, .{ size, cond }); }
+    pub fn igSetNextWindowSizeConstraints(size_min: Vec2, size_max: Vec2, custom_callback: SizeCallback, custom_callback_data: ?*anyopaque) callconv(.C) void { return instrumentation.call(.igSetNextWindowSizeConstraints, .{ size_min, size_max, custom_callback, custom_callback_data }); }
+    pub fn igSetNextWindowViewport(viewport_id: ID) callconv(.C) void { return instrumentation.call(.igSetNextWindowViewport, .{ viewport_id }); }
+    pub fn igSetScrollFromPosX(local_x: f32, center_x_ratio: f32) callconv(.C) void { return instrumentation.call(.igSetScrollFromPosX, .{ local_x, center_x_ratio }); }
+    pub fn igSetScrollFromPosY(local_y: f32, center_y_ratio: f32) callconv(.C) void { return instrumentation.call(.igSetScrollFromPosY, .{ local_y, center_y_ratio }); }
+    pub fn igSetScrollHereX(center_x_ratio: f32) callconv(.C) void { return instrumentation.call(.igSetScrollHereX, .{ center_x_ratio }); }
+    pub fn igSetScrollHereY(center_y_ratio: f32) callconv(.C) void { return instrumentation.call(.igSetScrollHereY, .{ center_y_ratio }); }
+    pub fn igSetScrollX(scroll_x: f32) callconv(.C) void { return instrumentation.call(.igSetScrollX, .{ scroll_x }); }
+    pub fn igSetScrollY(scroll_y: f32) callconv(.C) void { return instrumentation.call(.igSetScrollY, .{ scroll_y }); }
+    pub fn igSetStateStorage(storage: ?*Storage) callconv(.C) void { return instrumentation.call(.igSetStateStorage, .{ storage }); }
+    pub fn igSetTabItemClosed(tab_or_docked_window_label: ?[*:0]const u8) callconv(.C) void { return instrumentation.call(.igSetTabItemClosed, .{ tab_or_docked_window_label }); }
+    pub const igSetTooltip = raw_extern.igSetTooltip;
+    pub fn igSetWindowCollapsed_Bool(collapsed: bool, cond: CondFlagsInt) callconv(.C) void { return instrumentation.call(.igSetWindowCollapsed_Bool, .{ collapsed, cond }); }
+    pub fn igSetWindowCollapsed_Str(name: ?[*:0]const u8, collapsed: bool, cond: CondFlagsInt) callconv(.C) void { return instrumentation.call(.igSetWindowCollapsed_Str, .{ name, collapsed, cond }); }
+    pub fn igSetWindowFocus_Nil() callconv(.C) void { return instrumentation.call(.igSetWindowFocus_Nil, .{  }); }
+    pub fn igSetWindowFocus_Str(name: ?[*:0]const u8) callconv(.C) void { return instrumentation.call(.igSetWindowFocus_Str, .{ name }); }
+    pub fn igSetWindowFontScale(scale: f32) callconv(.C) void { return instrumentation.call(.igSetWindowFontScale, .{ scale }); }
+    pub fn igSetWindowPos_Vec2(pos: Vec2, cond: CondFlagsInt) callconv(.C) void { return instrumentation.call(.igSetWindowPos_Vec2, .{ pos, cond }); }
+    pub fn igSetWindowPos_Str(name: ?[*:0]const u8, pos: Vec2, cond: CondFlagsInt) callconv(.C) void { return instrumentation.call(.igSetWindowPos_Str, .{ name, pos, cond }); }
+    pub fn igSetWindowSize_Vec2(size: Vec2, cond: CondFlagsInt) callconv(.C) void { return instrumentation.call(.igSetWindowSize_Vec2, .{ size, cond }); }
+    pub fn igSetWindowSize_Str(name: ?[*:0]const u8, size: Vec2, cond: CondFlagsInt) callconv(.C) void { return instrumentation.call(.igSetWindowSize_Str, .{ name, size, cond }); }
+    pub fn igShowAboutWindow(p_open: ?*bool) callconv(.C) void { return instrumentation.call(.igShowAboutWindow, .{ p_open }); }
+    pub fn igShowDebugLogWindow(p_open: ?*bool) callconv(.C) void { return instrumentation.call(.igShowDebugLogWindow, .{ p_open }); }
+    pub fn igShowDemoWindow(p_open: ?*bool) callconv(.C) void { return instrumentation.call(.igShowDemoWindow, .{ p_open }); }
+    pub fn igShowFontSelector(label: ?[*:0]const u8) callconv(.C) void { return instrumentation.call(.igShowFontSelector, .{ label }); }
+    pub fn igShowIDStackToolWindow(p_open: ?*bool) callconv(.C) void { return instrumentation.call(.igShowIDStackToolWindow, .{ p_open }); }
+    pub fn igShowMetricsWindow(p_open: ?*bool) callconv(.C) void { return instrumentation.call(.igShowMetricsWindow, .{ p_open }); }
+    pub fn igShowStyleEditor(ref: ?*Style) callconv(.C) void { return instrumentation.call(.igShowStyleEditor, .{ ref }); }
+    pub fn igShowStyleSelector(label: ?[*:0]const u8) callconv(.C) bool { return instrumentation.call(.igShowStyleSelector, .{ label }); }
+    pub fn igShowUserGuide() callconv(.C) void { return instrumentation.call(.igShowUserGuide, .{  }); }
+    pub fn igSliderAngle(label: ?[*:0]const u8, v_rad: *f32, v_degrees_min: f32, v_degrees_max: f32, format: ?[*:0]const u8, flags: SliderFlagsInt) callconv(.C) bool { return instrumentation.call(.igSliderAngle, .{ label, v_rad, v_degrees_min, v_degrees_max, format, flags }); }
+    pub fn igSliderFloat(label: ?[*:0]const u8, v: *f32, v_min: f32, v_max: f32, format: ?[*:0]const u8, flags: SliderFlagsInt) callconv(.C) bool { return instrumentation.call(.igSliderFloat, .{ label, v, v_min, v_max, format, flags }); }
+    pub fn igSliderFloat2(label: ?[*:0]const u8, v: *[2]f32, v_min: f32, v_max: f32, format: ?[*:0]const u8, flags: SliderFlagsInt) callconv(.C) bool { return instrumentation.call(.igSliderFloat2, .{ label, v, v_min, v_max, format, flags }); }
+    pub fn igSliderFloat3(label: ?[*:0]const u8, v: *[3]f32, v_min: f32, v_max: f32, format: ?[*:0]const u8, flags: SliderFlagsInt) callconv(.C) bool { return instrumentation.call(.igSliderFloat3, .{ label, v, v_min, v_max, format, flags }); }
+    pub fn igSliderFloat4(label: ?[*:0]const u8, v: *[4]f32, v_min: f32, v_max: f32, format: ?[*:0]const u8, flags: SliderFlagsInt) callconv(.C) bool { return instrumentation.call(.igSliderFloat4, .{ label, v, v_min, v_max, format, flags }); }
+    pub fn igSliderInt(label: ?[*:0]const u8, v: *i32, v_min: i32, v_max: i32, format: ?[*:0]const u8, flags: SliderFlagsInt) callconv(.C) bool { return instrumentation.call(.igSliderInt, .{ label, v, v_min, v_max, format, flags }); }
+    pub fn igSliderInt2(label: ?[*:0]const u8, v: *[2]i32, v_min: i32, v_max: i32, format: ?[*:0]const u8, flags: SliderFlagsInt) callconv(.C) bool { return instrumentation.call(.igSliderInt2, .{ label, v, v_min, v_max, format, flags }); }
+    pub fn igSliderInt3(label: ?[*:0]const u8, v: *[3]i32, v_min: i32, v_max: i32, format: ?[*:0]const u8, flags: SliderFlagsInt) callconv(.C) bool { return instrumentation.call(.igSliderInt3, .{ label, v, v_min, v_max, format, flags }); }
+    pub fn igSliderInt4(label: ?[*:0]const u8, v: *[4]i32, v_min: i32, v_max: i32, format: ?[*:0]const u8, flags: SliderFlagsInt) callconv(.C) bool { return instrumentation.call(.igSliderInt4, .{ label, v, v_min, v_max, format, flags }); }
+    pub fn igSliderScalar(label: ?[*:0]const u8, data_type: DataType, p_data: ?*anyopaque, p_min: ?*const anyopaque, p_max: ?*const anyopaque, format: ?[*:0]const u8, flags: SliderFlagsInt) callconv(.C) bool { return instrumentation.call(.igSliderScalar, .{ label, data_type, p_data, p_min, p_max, format, flags }); }
+    pub fn igSliderScalarN(label: ?[*:0]const u8, data_type: DataType, p_data: ?*anyopaque, components: i32, p_min: ?*const anyopaque, p_max: ?*const anyopaque, format: ?[*:0]const u8, flags: SliderFlagsInt) callconv(.C) bool { return instrumentation.call(.igSliderScalarN, .{ label, data_type, p_data, components, p_min, p_max, format, flags }); }
+    pub fn igSmallButton(label: ?[*:0]const u8) callconv(.C) bool { return instrumentation.call(.igSmallButton, .{ label }); }
+    pub fn igSpacing() callconv(.C) void { return instrumentation.call(.igSpacing, .{  }); }
+    pub fn igStyleColorsClassic(dst: ?*Style) callconv(.C) void { return instrumentation.call(.igStyleColorsClassic, .{ dst }); }
+    pub fn igStyleColorsDark(dst: ?*Style) callconv(.C) void { return instrumentation.call(.igStyleColorsDark, .{ dst }); }
+    pub fn igStyleColorsLight(dst: ?*Style) callconv(.C) void { return instrumentation.call(.igStyleColorsLight, .{ dst }); }
+    pub fn igTabItemButton(label: ?[*:0]const u8, flags: TabItemFlagsInt) callconv(.C) bool { return instrumentation.call(.igTabItemButton, .{ label, flags }); }
+    pub fn igTableAngledHeadersRow() callconv(.C) void { return instrumentation.call(.igTableAngledHeadersRow, .{  }); }
+    pub fn igTableGetColumnCount() callconv(.C) i32 { return instrumentation.call(.igTableGetColumnCount, .{  }); }
+    pub fn igTableGetColumnFlags(column_n: i32) callconv(.C) TableColumnFlagsInt { return instrumentation.call(.igTableGetColumnFlags, .{ column_n }); }
+    pub fn igTableGetColumnIndex() callconv(.C) i32 { return instrumentation.call(.igTableGetColumnIndex, .{  }); }
+    pub fn igTableGetColumnName(column_n: i32) callconv(.C) ?[*:0]const u8 { return instrumentation.call(.igTableGetColumnName, .{ column_n }); }
+    pub fn igTableGetRowIndex() callconv(.C) i32 { return instrumentation.call(.igTableGetRowIndex, .{  }); }
+    pub fn igTableGetSortSpecs() callconv(.C) ?*TableSortSpecs { return instrumentation.call(.igTableGetSortSpecs, .{  }); }
+    pub fn igTableHeader(label: ?[*:0]const u8) callconv(.C) void { return instrumentation.call(.igTableHeader, .{ label }); }
+    pub fn igTableHeadersRow() callconv(.C) void { return instrumentation.call(.igTableHeadersRow, .{  }); }
+    pub fn igTableNextColumn() callconv(.C) bool { return instrumentation.call(.igTableNextColumn, .{  }); }
+    pub fn igTableNextRow(row_flags: TableRowFlagsInt, min_row_height: f32) callconv(.C) void { return instrumentation.call(.igTableNextRow, .{ row_flags, min_row_height }); }
+    pub fn igTableSetBgColor(target: TableBgTarget, color: u32, column_n: i32) callconv(.C) void { return instrumentation.call(.igTableSetBgColor, .{ target, color, column_n }); }
+    pub fn igTableSetColumnEnabled(column_n: i32, v: bool) callconv(.C) void { return instrumentation.call(.igTableSetColumnEnabled, .{ column_n, v }); }
+    pub fn igTableSetColumnIndex(column_n: i32) callconv(.C) bool { return instrumentation.call(.igTableSetColumnIndex, .{ column_n }); }
+    pub fn igTableSetupColumn(label: ?[*:0]const u8, flags: TableColumnFlagsInt, init_width_or_weight: f32, user_id: ID) callconv(.C) void { return instrumentation.call(.igTableSetupColumn, .{ label, flags, init_width_or_weight, user_id }); }
+    pub fn igTableSetupScrollFreeze(cols: i32, rows: i32) callconv(.C) void { return instrumentation.call(.igTableSetupScrollFreeze, .{ cols, rows }); }
+    pub const igText = raw_extern.igText;
+    pub const igTextColored = raw_extern.igTextColored;
+    pub const igTextDisabled = raw_extern.igTextDisabled;
+    pub fn igTextUnformatted(text: ?[*]const u8, text_end: ?[*]const u8) callconv(.C) void { return instrumentation.call(.igTextUnformatted, .{ text, text_end }); }
+    pub const igTextWrapped = raw_extern.igTextWrapped;
+    pub fn igTreeNode_Str(label: ?[*:0]const u8) callconv(.C) bool { return instrumentation.call(.igTreeNode_Str, .{ label }); }
+    pub const igTreeNode_StrStr = raw_extern.igTreeNode_StrStr;
+    pub const igTreeNode_Ptr = raw_extern.igTreeNode_Ptr;
+    pub fn igTreeNodeEx_Str(label: ?[*:0]const u8, flags: TreeNodeFlagsInt) callconv(.C) bool { return instrumentation.call(.igTreeNodeEx_Str, .{ label, flags }); }
+    pub const igTreeNodeEx_StrStr = raw_extern.igTreeNodeEx_StrStr;
+    pub const igTreeNodeEx_Ptr = raw_extern.igTreeNodeEx_Ptr;
+    pub fn igTreePop() callconv(.C) void { return instrumentation.call(.igTreePop, .{  }); }
+    pub fn igTreePush_Str(str_id: ?[*:0]const u8) callconv(.C) void { return instrumentation.call(.igTreePush_Str, .{ str_id }); }
+    pub fn igTreePush_Ptr(ptr_id: ?*const anyopaque) callconv(.C) void { return instrumentation.call(.igTreePush_Ptr, .{ ptr_id }); }
+    pub fn igUnindent(indent_w: f32) callconv(.C) void { return instrumentation.call(.igUnindent, .{ indent_w }); }
+    pub fn igUpdatePlatformWindows() callconv(.C) void { return instrumentation.call(.igUpdatePlatformWindows, .{  }); }
+    pub fn igVSliderFloat(label: ?[*:0]const u8, size: Vec2, v: *f32, v_min: f32, v_max: f32, format: ?[*:0]const u8, flags: SliderFlagsInt) callconv(.C) bool { return instrumentation.call(.igVSliderFloat, .{ label, size, v, v_min, v_max, format, flags }); }
+    pub fn igVSliderInt(label: ?[*:0]const u8, size: Vec2, v: *i32, v_min: i32, v_max: i32, format: ?[*:0]const u8, flags: SliderFlagsInt) callconv(.C) bool { return instrumentation.call(.igVSliderInt, .{ label, size, v, v_min, v_max, format, flags }); }
+    pub fn igVSliderScalar(label: ?[*:0]const u8, size: Vec2, data_type: DataType, p_data: ?*anyopaque, p_min: ?*const anyopaque, p_max: ?*const anyopaque, format: ?[*:0]const u8, flags: SliderFlagsInt) callconv(.C) bool { return instrumentation.call(.igVSliderScalar, .{ label, size, data_type, p_data, p_min, p_max, format, flags }); }
+    pub fn igValue_Bool(prefix: ?[*:0]const u8, b: bool) callconv(.C) void { return instrumentation.call(.igValue_Bool, .{ prefix, b }); }
+    pub fn igValue_Int(prefix: ?[*:0]const u8, v: i32) callconv(.C) void { return instrumentation.call(.igValue_Int, .{ prefix, v }); }
+    pub fn igValue_Uint(prefix: ?[*:0]const u8, v: u32) callconv(.C) void { return instrumentation.call(.igValue_Uint, .{ prefix, v }); }
+    pub fn igValue_Float(prefix: ?[*:0]const u8, v: f32, float_format: ?[*:0]const u8) callconv(.C) void { return instrumentation.call(.igValue_Float, .{ prefix, v, float_format }); }
+};
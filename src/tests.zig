@@ -1,5 +1,6 @@
 const std = @import("std");
 const ig = @import("Zig-ImGui");
+const extras = @import("Zig-ImGui-extras");
 const builtin = @import("builtin");
 const assert = std.debug.assert;
 
@@ -55,6 +56,7 @@ test "Compile everything" {
     @setEvalBranchQuota(10000);
     // Compile static function wrappers
     compileEverything(ig, skip_none);
+    compileEverything(extras, skip_none);
 
     // // Compile instantiations of Vector
     // // The skipping logic doesn't work in 0.9.1 or earlier
@@ -82,3 +84,1028 @@ test "Compile everything" {
     //     compileEverything(ig.Vector(?[]u8), skip_comparisons);
     // }
 }
+
+test "Vec2 and Vec4 arithmetic" {
+    const a = ig.Vec2.init(1, 2);
+    const b = ig.Vec2.init(3, -4);
+    try std.testing.expect(a.add(b).eql(ig.Vec2.init(4, -2)));
+    try std.testing.expect(a.sub(b).eql(ig.Vec2.init(-2, 6)));
+    try std.testing.expect(a.mul(b).eql(ig.Vec2.init(3, -8)));
+    try std.testing.expect(a.lerp(b, 0.5).eql(ig.Vec2.init(2, -1)));
+    try std.testing.expect(b.clamp(ig.Vec2.splat(-1), ig.Vec2.splat(1)).eql(ig.Vec2.init(1, -1)));
+
+    const c = ig.Vec4.init(0, 0.5, 1, 2);
+    try std.testing.expect(c.scale(2).eql(ig.Vec4.init(0, 1, 2, 4)));
+    try std.testing.expect(c.min(ig.Vec4.splat(0.75)).eql(ig.Vec4.init(0, 0.5, 0.75, 0.75)));
+    try std.testing.expect(c.max(ig.Vec4.splat(0.75)).eql(ig.Vec4.init(0.75, 0.75, 1, 2)));
+}
+
+test "Batched color conversions match scalar conversions" {
+    var colors: [37]ig.Color = undefined;
+    for (&colors, 0..) |*color, i| {
+        const t: f32 = @as(f32, @floatFromInt(i)) / @as(f32, @floatFromInt(colors.len));
+        color.* = ig.Color.initRGBA(t, 1.0 - t, t * t, 0.25 + t * 0.5);
+    }
+    colors[0] = ig.Color.initRGBA(-1.0, 2.0, 0.5, 1.0);
+
+    var packed_colors: [colors.len]u32 = undefined;
+    ig.Color.packABGRSlice(&colors, &packed_colors);
+    for (colors, packed_colors) |color, packed_color| {
+        try std.testing.expectEqual(color.packABGR(), packed_color);
+    }
+
+    var unpacked: [colors.len]ig.Color = undefined;
+    ig.Color.unpackABGRSlice(&packed_colors, &unpacked);
+    for (packed_colors, unpacked) |packed_color, color| {
+        try std.testing.expect(ig.Color.initABGRPacked(packed_color).eql(color));
+    }
+
+    var hsv: [colors.len]ig.Vec4 = undefined;
+    for (colors, &hsv) |color, *value| value.* = color.Value;
+    ig.Color.convertRGBtoHSVSlice(&hsv, &hsv);
+    for (colors, hsv) |color, value| {
+        var h: f32 = undefined;
+        var s: f32 = undefined;
+        var v: f32 = undefined;
+        ig.ColorConvertRGBtoHSV(color.Value.x, color.Value.y, color.Value.z, &h, &s, &v);
+        try std.testing.expectApproxEqAbs(h, value.x, 1e-5);
+        try std.testing.expectApproxEqAbs(s, value.y, 1e-5);
+        try std.testing.expectApproxEqAbs(v, value.z, 1e-5);
+        try std.testing.expectEqual(color.Value.w, value.w);
+    }
+
+    var rgb: [colors.len]ig.Vec4 = undefined;
+    ig.Color.convertHSVtoRGBSlice(&hsv, &rgb);
+    for (hsv, rgb) |value, color| {
+        const expected = ig.Color.initHSVA(value.x, value.y, value.z, value.w).Value;
+        try std.testing.expectApproxEqAbs(expected.x, color.x, 1e-5);
+        try std.testing.expectApproxEqAbs(expected.y, color.y, 1e-5);
+        try std.testing.expectApproxEqAbs(expected.z, color.z, 1e-5);
+        try std.testing.expectEqual(expected.w, color.w);
+    }
+}
+
+test "Batched rects match DrawList.AddRectFilled" {
+    const context = ig.CreateContext();
+    defer ig.DestroyContextExt(context);
+
+    const rects = [_]ig.DrawListBatch.Rect{
+        .{ .min = ig.Vec2.init(0, 0), .max = ig.Vec2.init(10, 10), .col = 0xFF0000FF },
+        .{ .min = ig.Vec2.init(5, 5), .max = ig.Vec2.init(6, 7), .col = 0x00FFFFFF },
+        .{ .min = ig.Vec2.init(-3, 2), .max = ig.Vec2.init(4, 8), .col = 0x80FF00FF },
+    };
+
+    const batched = ig.DrawList.init_ImDrawList(ig.GetDrawListSharedData());
+    defer batched.deinit();
+    batched._ResetForNewFrame();
+    ig.DrawListBatch.addRectsFilled(batched, &rects);
+
+    const reference = ig.DrawList.init_ImDrawList(ig.GetDrawListSharedData());
+    defer reference.deinit();
+    reference._ResetForNewFrame();
+    for (rects) |rect| reference.AddRectFilled(rect.min, rect.max, rect.col);
+
+    try std.testing.expectEqual(reference.VtxBuffer.Size, batched.VtxBuffer.Size);
+    try std.testing.expectEqual(reference.IdxBuffer.Size, batched.IdxBuffer.Size);
+    try std.testing.expectEqual(reference._VtxCurrentIdx, batched._VtxCurrentIdx);
+    try std.testing.expectEqualSlices(ig.DrawIdx, reference.IdxBuffer.items(), batched.IdxBuffer.items());
+    for (reference.VtxBuffer.items(), batched.VtxBuffer.items()) |expected, actual| {
+        try std.testing.expect(expected.pos.eql(actual.pos));
+        try std.testing.expect(expected.uv.eql(actual.uv));
+        try std.testing.expectEqual(expected.col, actual.col);
+    }
+    const last_cmd = batched.CmdBuffer.items()[batched.CmdBuffer.Size - 1];
+    try std.testing.expectEqual(batched.IdxBuffer.Size, last_cmd.ElemCount);
+}
+
+/// Create a context that can run frames without a platform or renderer backend.
+fn createHeadlessContext() *ig.Context {
+    const context = ig.CreateContext().?;
+    const io = ig.GetIO();
+    io.IniFilename = null;
+    io.DisplaySize = ig.Vec2.init(1280, 720);
+    io.DeltaTime = 1.0 / 60.0;
+    var pixels: ?[*]u8 = undefined;
+    var width: i32 = undefined;
+    var height: i32 = undefined;
+    io.Fonts.?.GetTexDataAsRGBA32(&pixels, &width, &height);
+    return context;
+}
+
+test "TextSizeCache" {
+    const context = createHeadlessContext();
+    defer ig.DestroyContextExt(context);
+
+    var cache = try extras.TextSizeCache.init(std.testing.allocator, 2);
+    defer cache.deinit();
+
+    ig.NewFrame();
+    const expected = ig.CalcTextSize("Hello, world!");
+    try std.testing.expect(expected.eql(extras.CalcTextSizeCached(&cache, "Hello, world!")));
+    try std.testing.expect(expected.eql(extras.CalcTextSizeCached(&cache, "Hello, world!")));
+    try std.testing.expectEqual(@as(u64, 1), cache.stats.hits);
+    try std.testing.expectEqual(@as(u64, 1), cache.stats.misses);
+
+    // "a" is the least recently used entry once "Hello, world!" is measured again.
+    _ = cache.CalcTextSize("a");
+    _ = cache.CalcTextSize("Hello, world!");
+    _ = cache.CalcTextSize("b");
+    _ = cache.CalcTextSize("Hello, world!");
+    try std.testing.expectEqual(@as(u64, 1), cache.stats.evictions);
+    try std.testing.expectEqual(@as(u64, 3), cache.stats.hits);
+    ig.EndFrame();
+
+    // Clearing the atlas texture drops every entry.
+    const atlas = ig.GetIO().Fonts.?;
+    atlas.ClearTexData();
+    cache.syncAtlas(atlas);
+    try std.testing.expectEqual(@as(u64, 1), cache.stats.invalidations);
+}
+
+test "TextSizeCache stays consistent under eviction churn" {
+    const context = createHeadlessContext();
+    defer ig.DestroyContextExt(context);
+
+    var cache = try extras.TextSizeCache.init(std.testing.allocator, 8);
+    defer cache.deinit();
+
+    ig.NewFrame();
+    var buf: [32]u8 = undefined;
+    for (0..8 * 100) |i| _ = cache.CalcTextSize(try std.fmt.bufPrint(&buf, "label {d}", .{ i }));
+    try std.testing.expectEqual(@as(u64, 8 * 99), cache.stats.evictions);
+    try std.testing.expectEqual(@as(u32, 8), cache.map.count());
+    try std.testing.expect(cache.tombstones < cache.capacity());
+
+    // The most recent entries are all still found, older ones are not.
+    cache.resetStats();
+    for (8 * 100 - 8..8 * 100) |i| {
+        const text = try std.fmt.bufPrint(&buf, "label {d}", .{ i });
+        try std.testing.expect(ig.CalcTextSize(text).eql(cache.CalcTextSize(text)));
+    }
+    try std.testing.expectEqual(@as(u64, 8), cache.stats.hits);
+    _ = cache.CalcTextSize("label 0");
+    try std.testing.expectEqual(@as(u64, 1), cache.stats.misses);
+    ig.EndFrame();
+}
+
+const RowCounter = struct {
+    rows: usize = 0,
+
+    fn render(self: *RowCounter, row: usize) void {
+        _ = row;
+        self.rows += 1;
+        ig.TextUnformatted("row");
+    }
+};
+
+fn countVisibleRows(virtual_rows: *extras.VirtualRows) usize {
+    var counter = RowCounter{};
+    ig.NewFrame();
+    ig.SetNextWindowPos(ig.Vec2.init(0, 0));
+    ig.SetNextWindowSize(ig.Vec2.init(400, 300));
+    _ = ig.Begin("Virtual rows");
+    virtual_rows.draw(&counter, RowCounter.render);
+    ig.End();
+    ig.EndFrame();
+    return counter.rows;
+}
+
+test "VirtualRows submits only visible rows" {
+    const context = createHeadlessContext();
+    defer ig.DestroyContextExt(context);
+
+    var small = extras.VirtualRows{ .row_count = 1_000 };
+    var huge = extras.VirtualRows{ .row_count = 10_000_000 };
+    _ = countVisibleRows(&small);
+    const small_rows = countVisibleRows(&small);
+    const huge_rows = countVisibleRows(&huge);
+    try std.testing.expect(small_rows < 100);
+    try std.testing.expectEqual(small_rows, huge_rows);
+
+    var heights = extras.RowHeights.init(std.testing.allocator);
+    defer heights.deinit();
+    for (0..100_000) |i| try heights.append(if (i % 2 == 0) 10 else 30);
+    try std.testing.expectEqual(@as(f64, 2_000_000), heights.totalHeight());
+    try std.testing.expectEqual(@as(usize, 1), heights.rowAtOffset(15));
+    try std.testing.expectEqual(@as(usize, 2), heights.rowAtOffset(40));
+
+    var variable = extras.VirtualRows{ .heights = &heights };
+    const variable_rows = countVisibleRows(&variable);
+    try std.testing.expect(variable_rows > 0 and variable_rows < 100);
+}
+
+const TableRows = struct {
+    rows: usize = 0,
+    /// Height of the table's content, as seen by its scrollbar
+    content_height: f32 = 0,
+
+    fn render(self: *TableRows, row: usize) void {
+        _ = row;
+        self.rows += 1;
+        _ = ig.TableNextColumn();
+        ig.TextUnformatted("row");
+    }
+};
+
+fn drawVirtualTable(virtual_rows: *extras.VirtualRows) TableRows {
+    var table_rows = TableRows{};
+    ig.NewFrame();
+    ig.SetNextWindowPos(ig.Vec2.init(0, 0));
+    ig.SetNextWindowSize(ig.Vec2.init(400, 300));
+    _ = ig.Begin("Virtual table");
+    if (ig.BeginTableExt("rows", 1, .{ .ScrollY = true }, ig.Vec2.init(0, 0), 0)) {
+        virtual_rows.draw(&table_rows, TableRows.render);
+        table_rows.content_height = ig.GetScrollMaxY() + ig.GetWindowHeight();
+        ig.EndTable();
+    }
+    ig.End();
+    ig.EndFrame();
+    return table_rows;
+}
+
+test "VirtualRows submits only visible table rows" {
+    const context = createHeadlessContext();
+    defer ig.DestroyContextExt(context);
+
+    // The scroll extent is measured at the end of a frame, so every check
+    // looks at the second frame.
+    var uniform = extras.VirtualRows{ .row_count = 10_000_000, .uniform_height = 25, .table = true };
+    _ = drawVirtualTable(&uniform);
+    const uniform_rows = drawVirtualTable(&uniform);
+    try std.testing.expect(uniform_rows.rows > 0 and uniform_rows.rows < 100);
+    try std.testing.expectApproxEqRel(@as(f32, 10_000_000 * 25), uniform_rows.content_height, 0.01);
+
+    var heights = extras.RowHeights.init(std.testing.allocator);
+    defer heights.deinit();
+    for (0..100_000) |i| try heights.append(if (i % 2 == 0) 20 else 40);
+
+    // Stand-in rows above and below the visible ones keep the full height,
+    // also when scrolled into the middle of the table.
+    var variable = extras.VirtualRows{ .heights = &heights, .table = true };
+    variable.scrollToRow(50_000);
+    _ = drawVirtualTable(&variable);
+    _ = drawVirtualTable(&variable);
+    const variable_rows = drawVirtualTable(&variable);
+    try std.testing.expect(variable_rows.rows > 0 and variable_rows.rows < 100);
+    try std.testing.expectApproxEqRel(@as(f32, 3_000_000), variable_rows.content_height, 0.01);
+}
+
+test "InputTextArrayList grows its buffer" {
+    const context = createHeadlessContext();
+    defer ig.DestroyContextExt(context);
+
+    var text = std.ArrayList(u8).init(std.testing.allocator);
+    defer text.deinit();
+    try text.appendSlice("abc");
+
+    const typed = "0123456789" ** 20;
+    for (0..4) |frame| {
+        if (frame == 2) ig.GetIO().AddInputCharactersUTF8(typed);
+        ig.NewFrame();
+        _ = ig.Begin("Editor");
+        if (frame == 0) ig.SetKeyboardFocusHere();
+        _ = try ig.InputTextArrayList("##text", &text);
+        ig.End();
+        ig.EndFrame();
+    }
+
+    try std.testing.expectEqualStrings("abc" ++ typed, text.items);
+    try std.testing.expect(text.capacity > text.items.len);
+    try std.testing.expectEqual(@as(u8, 0), text.allocatedSlice()[text.items.len]);
+}
+
+const ThreadFrames = struct {
+    fn run(context: *ig.Context, frames: usize, vertex_count: *i32) void {
+        std.debug.assert(ig.GetCurrentContext() == context);
+        const io = ig.GetIO();
+        io.IniFilename = null;
+        io.DisplaySize = ig.Vec2.init(640, 480);
+        io.DeltaTime = 1.0 / 60.0;
+        // The shared atlas was built before the thread started.
+        std.debug.assert(io.Fonts.?.TexPixelsRGBA32 != null);
+
+        for (0..frames) |_| {
+            ig.NewFrame();
+            _ = ig.Begin("Worker");
+            ig.TextUnformatted("Rendered on a worker thread");
+            ig.End();
+            ig.Render();
+        }
+        vertex_count.* = ig.GetDrawData().TotalVtxCount;
+    }
+};
+
+test "Contexts build frames on parallel threads" {
+    if (!extras.thread_local_context) return error.SkipZigTest;
+
+    // Building an atlas is not thread-safe, so the threads share one built
+    // up front.
+    const atlas = ig.FontAtlas.init_ImFontAtlas();
+    defer atlas.deinit();
+    var pixels: ?[*]u8 = undefined;
+    var width: i32 = undefined;
+    var height: i32 = undefined;
+    atlas.GetTexDataAsRGBA32(&pixels, &width, &height);
+
+    const thread_count = 8;
+    var threads: [thread_count]std.Thread = undefined;
+    var vertex_counts = [_]i32{0} ** thread_count;
+    for (&threads, &vertex_counts) |*thread, *vertex_count| {
+        thread.* = try extras.spawnWithContext(.{}, atlas, ThreadFrames.run, .{ @as(usize, 100), vertex_count });
+    }
+    for (threads) |thread| thread.join();
+
+    try std.testing.expect(ig.GetCurrentContext() == null);
+    for (vertex_counts) |vertex_count| {
+        try std.testing.expect(vertex_count > 0);
+        try std.testing.expectEqual(vertex_counts[0], vertex_count);
+    }
+}
+
+fn fillStripe(index: usize, draw_list: *ig.DrawList, stripe_rects: usize) void {
+    for (0..stripe_rects) |i| {
+        const x: f32 = @floatFromInt(i * 4);
+        const y: f32 = @floatFromInt(index * 4);
+        draw_list.AddRectFilled(ig.Vec2.init(x, y), ig.Vec2.init(x + 3, y + 3), 0xFF00FF00 | @as(u32, @intCast(index)));
+    }
+}
+
+fn absoluteIndices(allocator: std.mem.Allocator, draw_list: *ig.DrawList) ![]u32 {
+    const result = try allocator.alloc(u32, draw_list.IdxBuffer.Size);
+    for (draw_list.CmdBuffer.items()) |cmd| {
+        const indices = draw_list.IdxBuffer.items()[cmd.IdxOffset..][0..cmd.ElemCount];
+        for (result[cmd.IdxOffset..][0..cmd.ElemCount], indices) |*out, idx| out.* = cmd.VtxOffset + idx;
+    }
+    return result;
+}
+
+test "Draw lists filled on a thread pool merge in order" {
+    const context = createHeadlessContext();
+    defer ig.DestroyContextExt(context);
+    ig.GetIO().BackendFlags.RendererHasVtxOffset = true;
+    ig.NewFrame();
+    defer ig.EndFrame();
+
+    const list_count = 6;
+    const stripe_rects = 5000;
+
+    var pool: std.Thread.Pool = undefined;
+    try pool.init(.{ .allocator = std.testing.allocator, .n_jobs = 4 });
+    defer pool.deinit();
+
+    var parallel = extras.ParallelDrawLists.init(std.testing.allocator);
+    defer parallel.deinit();
+
+    const merged = ig.DrawList.init_ImDrawList(ig.GetDrawListSharedData());
+    defer merged.deinit();
+    merged._ResetForNewFrame();
+    merged.PushClipRectFullScreen();
+    _ = try parallel.begin(merged, list_count, .{
+        .vertices = stripe_rects * 4,
+        .indices = stripe_rects * 6,
+    });
+    parallel.fill(&pool, fillStripe, .{@as(usize, stripe_rects)});
+    parallel.merge(merged);
+
+    const reference = ig.DrawList.init_ImDrawList(ig.GetDrawListSharedData());
+    defer reference.deinit();
+    reference._ResetForNewFrame();
+    reference.PushClipRectFullScreen();
+    for (0..list_count) |index| fillStripe(index, reference, stripe_rects);
+
+    try std.testing.expectEqual(reference.VtxBuffer.Size, merged.VtxBuffer.Size);
+    try std.testing.expectEqual(reference.IdxBuffer.Size, merged.IdxBuffer.Size);
+    for (reference.VtxBuffer.items(), merged.VtxBuffer.items()) |expected, actual| {
+        try std.testing.expect(expected.pos.eql(actual.pos));
+        try std.testing.expectEqual(expected.col, actual.col);
+    }
+    // The lists may split into commands at different vertex offsets,
+    // so compare absolute vertex indices.
+    const expected_indices = try absoluteIndices(std.testing.allocator, reference);
+    defer std.testing.allocator.free(expected_indices);
+    const actual_indices = try absoluteIndices(std.testing.allocator, merged);
+    defer std.testing.allocator.free(actual_indices);
+    try std.testing.expectEqualSlices(u32, expected_indices, actual_indices);
+}
+
+const SchedulerScript = struct {
+    scheduler: extras.FrameScheduler,
+    button_center: ig.Vec2 = ig.Vec2.init(0, 0),
+    focus_text: bool = false,
+    text: [32]u8 = [_]u8{0} ** 32,
+
+    fn frame(self: *SchedulerScript) bool {
+        ig.NewFrame();
+        ig.SetNextWindowPos(ig.Vec2.init(10, 10));
+        _ = ig.Begin("Scheduler");
+        _ = ig.Button("Button");
+        self.button_center = ig.GetItemRectMin().add(ig.GetItemRectMax()).scale(0.5);
+        if (self.focus_text) ig.SetKeyboardFocusHere();
+        _ = ig.InputText("Text", &self.text, self.text.len);
+        ig.End();
+        ig.Render();
+        return self.scheduler.endFrame(ig.GetDrawData());
+    }
+
+    /// Run frames until the scheduler would stop polling, returning how many it took.
+    fn settle(self: *SchedulerScript) !usize {
+        for (0..100) |i| {
+            _ = self.frame();
+            if (self.scheduler.nextWait() != .poll) return i + 1;
+        }
+        return error.NeverIdle;
+    }
+};
+
+test "FrameScheduler goes idle and skips unchanged frames" {
+    const context = createHeadlessContext();
+    defer ig.DestroyContextExt(context);
+    const io = ig.GetIO();
+    io.DeltaTime = 0.05;
+
+    var script = SchedulerScript{ .scheduler = extras.FrameScheduler.init(.{ .settle_time = 0.5 }) };
+    try std.testing.expect(script.frame());
+    _ = try script.settle();
+    try std.testing.expect(script.scheduler.nextWait() == .block);
+
+    // Idle frames, e.g. after a spurious wake up, produce nothing new.
+    const submitted = script.scheduler.stats.submitted;
+    try std.testing.expect(!script.frame());
+    try std.testing.expect(!script.frame());
+    try std.testing.expectEqual(submitted, script.scheduler.stats.submitted);
+
+    // Hovering the button changes its color and wakes the scheduler up.
+    io.AddMousePosEvent(script.button_center.x, script.button_center.y);
+    try std.testing.expect(script.frame());
+    try std.testing.expect(script.scheduler.nextWait() == .poll);
+    _ = try script.settle();
+
+    // Moving the mouse within the button is input, but changes nothing on screen.
+    io.AddMousePosEvent(script.button_center.x + 1, script.button_center.y);
+    try std.testing.expect(!script.frame());
+    try std.testing.expect(script.scheduler.nextWait() == .poll);
+
+    // An active text field only needs wake ups for its blinking cursor.
+    io.AddMousePosEvent(-ig.FLT_MAX, -ig.FLT_MAX);
+    script.focus_text = true;
+    _ = script.frame();
+    script.focus_text = false;
+    _ = try script.settle();
+    try std.testing.expect(io.WantTextInput);
+    try std.testing.expectEqual(
+        extras.FrameScheduler.Wait{ .timeout = script.scheduler.config.cursor_blink_interval },
+        script.scheduler.nextWait(),
+    );
+
+    script.scheduler.config.min_refresh_rate = 1;
+    script.scheduler.config.cursor_blink_interval = 2;
+    try std.testing.expectEqual(extras.FrameScheduler.Wait{ .timeout = 1 }, script.scheduler.nextWait());
+}
+
+fn expectEqualDrawData(expected: *const ig.DrawData, actual: *const ig.DrawData) !void {
+    try std.testing.expect(expected.DisplayPos.eql(actual.DisplayPos));
+    try std.testing.expect(expected.DisplaySize.eql(actual.DisplaySize));
+    try std.testing.expect(expected.FramebufferScale.eql(actual.FramebufferScale));
+    try std.testing.expectEqual(expected.CmdListsCount, actual.CmdListsCount);
+    try std.testing.expectEqual(expected.TotalVtxCount, actual.TotalVtxCount);
+    try std.testing.expectEqual(expected.TotalIdxCount, actual.TotalIdxCount);
+    for (expected.CmdLists.items(), actual.CmdLists.items()) |expected_list, actual_list| {
+        const e = expected_list.?;
+        const a = actual_list.?;
+        try std.testing.expectEqualSlices(u8, std.mem.sliceAsBytes(e.VtxBuffer.items()), std.mem.sliceAsBytes(a.VtxBuffer.items()));
+        try std.testing.expectEqualSlices(ig.DrawIdx, e.IdxBuffer.items(), a.IdxBuffer.items());
+        try std.testing.expectEqual(e.CmdBuffer.Size, a.CmdBuffer.Size);
+        for (e.CmdBuffer.items(), a.CmdBuffer.items()) |expected_cmd, actual_cmd| {
+            try std.testing.expect(expected_cmd.ClipRect.eql(actual_cmd.ClipRect));
+            try std.testing.expectEqual(expected_cmd.TextureId, actual_cmd.TextureId);
+            try std.testing.expectEqual(expected_cmd.VtxOffset, actual_cmd.VtxOffset);
+            try std.testing.expectEqual(expected_cmd.IdxOffset, actual_cmd.IdxOffset);
+            try std.testing.expectEqual(expected_cmd.ElemCount, actual_cmd.ElemCount);
+        }
+    }
+}
+
+fn buildStreamedFrame(frame: usize, frame_count: usize) void {
+    ig.NewFrame();
+    ig.ShowDemoWindow();
+    _ = ig.Begin("Streamed");
+    ig.Text("Frame %d", @as(c_int, @intCast(frame)));
+    ig.ProgressBar(@as(f32, @floatFromInt(frame)) / @as(f32, @floatFromInt(frame_count)));
+    ig.End();
+    ig.Render();
+}
+
+/// Writes to a socket from its own thread, so that reading a frame larger
+/// than the socket buffers cannot deadlock.
+const SocketSender = struct {
+    thread: std.Thread = undefined,
+    result: anyerror!void = {},
+
+    fn start(self: *SocketSender, stream: std.net.Stream, bytes: []const u8) !void {
+        self.thread = try std.Thread.spawn(.{}, run, .{ self, stream, bytes });
+    }
+
+    fn run(self: *SocketSender, stream: std.net.Stream, bytes: []const u8) void {
+        self.result = stream.writeAll(bytes);
+    }
+
+    fn finish(self: *SocketSender) !void {
+        self.thread.join();
+        return self.result;
+    }
+};
+
+/// Encode `draw_data`, send it over the socket and decode it on the other end.
+fn streamFrame(
+    encoder: *extras.DrawDataEncoder,
+    decoder: *extras.DrawDataDecoder,
+    client: std.net.Stream,
+    server: std.net.Stream,
+    draw_data: *const ig.DrawData,
+    written: *usize,
+) !*ig.DrawData {
+    var bytes = std.ArrayList(u8).init(std.testing.allocator);
+    defer bytes.deinit();
+    written.* = try encoder.writeFrame(bytes.writer(), draw_data);
+
+    var sender = SocketSender{};
+    try sender.start(client, bytes.items);
+    const decoded = decoder.readFrame(server.reader()) catch |err| {
+        // Unblock the sender if the frame was not read to the end.
+        std.posix.shutdown(server.handle, .both) catch {};
+        sender.finish() catch {};
+        return err;
+    };
+    try sender.finish();
+    return decoded;
+}
+
+test "DrawData streams over a local socket" {
+    const context = createHeadlessContext();
+    defer ig.DestroyContextExt(context);
+
+    const address = try std.net.Address.parseIp("127.0.0.1", 0);
+    var server = try address.listen(.{});
+    defer server.deinit();
+    const client = try std.net.tcpConnectToAddress(server.listen_address);
+    defer client.close();
+    const connection = try server.accept();
+    defer connection.stream.close();
+
+    var encoder = extras.DrawDataEncoder.init(std.testing.allocator);
+    defer encoder.deinit();
+    var decoder = extras.DrawDataDecoder.init(std.testing.allocator);
+    defer decoder.deinit();
+
+    // Windows take a couple of frames to appear and size themselves.
+    for (0..3) |_| buildStreamedFrame(0, 1);
+
+    const frame_count = 60;
+    var keyframe_bytes: usize = 0;
+    var delta_bytes: usize = 0;
+    var raw_bytes: usize = 0;
+    for (0..frame_count) |frame| {
+        buildStreamedFrame(frame, frame_count);
+        const draw_data = ig.GetDrawData();
+
+        var written: usize = 0;
+        const decoded = try streamFrame(&encoder, &decoder, client, connection.stream, draw_data, &written);
+        try expectEqualDrawData(draw_data, decoded);
+
+        if (frame == 0) keyframe_bytes = written else delta_bytes += written;
+        raw_bytes += @as(usize, @intCast(draw_data.TotalVtxCount)) * @sizeOf(ig.DrawVert) +
+            @as(usize, @intCast(draw_data.TotalIdxCount)) * @sizeOf(ig.DrawIdx);
+    }
+
+    // Mostly unchanged frames cost a small fraction of their raw size.
+    const bytes_per_delta_frame = delta_bytes / (frame_count - 1);
+    try std.testing.expect(bytes_per_delta_frame < keyframe_bytes);
+    try std.testing.expect(bytes_per_delta_frame * 10 < raw_bytes / frame_count);
+
+    // A reset makes the next frame decodable on its own.
+    encoder.reset();
+    var fresh_decoder = extras.DrawDataDecoder.init(std.testing.allocator);
+    defer fresh_decoder.deinit();
+    var written: usize = 0;
+    const decoded = try streamFrame(&encoder, &fresh_decoder, client, connection.stream, ig.GetDrawData(), &written);
+    try expectEqualDrawData(ig.GetDrawData(), decoded);
+}
+
+test "DrawDataDecoder rejects indices past the vertices" {
+    const context = createHeadlessContext();
+    defer ig.DestroyContextExt(context);
+    for (0..3) |_| buildStreamedFrame(0, 1);
+    const draw_data = ig.GetDrawData();
+    const list = draw_data.CmdLists.items()[0].?;
+    list.IdxBuffer.items()[0] = @intCast(list.VtxBuffer.Size);
+
+    var encoder = extras.DrawDataEncoder.init(std.testing.allocator);
+    defer encoder.deinit();
+    var bytes = std.ArrayList(u8).init(std.testing.allocator);
+    defer bytes.deinit();
+    _ = try encoder.writeFrame(bytes.writer(), draw_data);
+
+    var decoder = extras.DrawDataDecoder.init(std.testing.allocator);
+    defer decoder.deinit();
+    var stream = std.io.fixedBufferStream(bytes.items);
+    try std.testing.expectError(error.InvalidFrame, decoder.readFrame(stream.reader()));
+    try std.testing.expect(!decoder.draw_data.Valid);
+}
+
+test "DrawDataDecoder rejects payloads larger than announced" {
+    const context = createHeadlessContext();
+    defer ig.DestroyContextExt(context);
+    for (0..3) |_| buildStreamedFrame(0, 1);
+
+    var encoder = extras.DrawDataEncoder.init(std.testing.allocator);
+    defer encoder.deinit();
+    var bytes = std.ArrayList(u8).init(std.testing.allocator);
+    defer bytes.deinit();
+    _ = try encoder.writeFrame(bytes.writer(), ig.GetDrawData());
+
+    // Claim half of the real payload length in the header.
+    const payload_len = std.mem.readInt(u32, bytes.items[8..12], .little);
+    std.mem.writeInt(u32, bytes.items[8..12], payload_len / 2, .little);
+
+    var decoder = extras.DrawDataDecoder.init(std.testing.allocator);
+    defer decoder.deinit();
+    var stream = std.io.fixedBufferStream(bytes.items);
+    try std.testing.expectError(error.InvalidFrame, decoder.readFrame(stream.reader()));
+    try std.testing.expect(decoder.payload.capacity < payload_len);
+}
+
+/// A texture backend that keeps "uploaded" textures in a hash map instead of
+/// on a GPU. Textures are 16 bytes per pixel of key, keys >= 1000 fail to load.
+const FakeTextureBackend = struct {
+    resident: std.AutoHashMap(u64, u32),
+    next_id: u64 = 1,
+    uploads: u32 = 0,
+
+    const Registry = extras.TextureRegistry(u32);
+
+    fn load(context: ?*anyopaque, key: u32) anyerror!extras.Texture {
+        const self: *FakeTextureBackend = @ptrCast(@alignCast(context.?));
+        if (key >= 1000) return error.FileNotFound;
+        const id = self.next_id;
+        self.next_id += 1;
+        self.uploads += 1;
+        try self.resident.putNoClobber(id, key);
+        return .{ .id = @enumFromInt(id), .bytes = 16 * @as(usize, key) };
+    }
+
+    fn unload(context: ?*anyopaque, texture: extras.Texture) void {
+        const self: *FakeTextureBackend = @ptrCast(@alignCast(context.?));
+        std.debug.assert(self.resident.remove(@intFromEnum(texture.id)));
+    }
+
+    fn backend(self: *FakeTextureBackend) Registry.Backend {
+        return .{ .context = self, .load = load, .unload = unload };
+    }
+};
+
+test "TextureRegistry loads lazily and evicts under budget" {
+    var fake = FakeTextureBackend{ .resident = std.AutoHashMap(u64, u32).init(std.testing.allocator) };
+    defer fake.resident.deinit();
+    var registry = FakeTextureBackend.Registry.init(std.testing.allocator, fake.backend(), .{ .memory_budget = 16 * 100 });
+
+    // Three textures of 16 * 40 bytes fit the budget of 16 * 100 bytes only two at a time.
+    const a = (try registry.get(40)).?;
+    const b = (try registry.get(41)).?;
+    try std.testing.expect(a != b);
+    try std.testing.expectEqual(a, (try registry.get(40)).?);
+    registry.endFrame();
+    try std.testing.expectEqual(@as(u32, 2), registry.stats.resident_count);
+    try std.testing.expectEqual(@as(u64, 1), registry.stats.hits);
+
+    // 41 was used least recently, and is evicted once 42 is loaded.
+    _ = try registry.get(40);
+    _ = try registry.get(42);
+    registry.endFrame();
+    try std.testing.expect(registry.isResident(40));
+    try std.testing.expect(!registry.isResident(41));
+    try std.testing.expect(registry.isResident(42));
+    try std.testing.expectEqual(@as(u64, 1), registry.stats.evictions);
+    try std.testing.expectEqual(@as(usize, 16 * 82), registry.stats.resident_bytes);
+    try std.testing.expectEqual(@as(u32, 2), fake.resident.count());
+
+    // Textures used in the current frame are kept even over budget.
+    _ = try registry.get(40);
+    _ = try registry.get(41);
+    _ = try registry.get(42);
+    registry.endFrame();
+    try std.testing.expectEqual(@as(u32, 3), registry.stats.resident_count);
+    try std.testing.expectEqual(@as(usize, 16 * 123), registry.stats.peak_resident_bytes);
+
+    // Failed loads are remembered instead of retried every frame.
+    try std.testing.expectEqual(@as(?ig.TextureID, null), try registry.get(1000));
+    try std.testing.expectEqual(@as(?ig.TextureID, null), try registry.get(1000));
+    try std.testing.expectEqual(@as(u64, 1), registry.stats.failed_loads);
+
+    registry.config.max_loads_per_frame = 1;
+    registry.endFrame();
+    _ = try registry.get(1);
+    try std.testing.expectEqual(@as(?ig.TextureID, null), try registry.get(2));
+    try std.testing.expectEqual(@as(u64, 1), registry.stats.deferred_loads);
+
+    registry.deinit();
+    try std.testing.expectEqual(@as(u32, 0), fake.resident.count());
+}
+
+test "TextureRegistry only loads visible images" {
+    const context = createHeadlessContext();
+    defer ig.DestroyContextExt(context);
+
+    var fake = FakeTextureBackend{ .resident = std.AutoHashMap(u64, u32).init(std.testing.allocator) };
+    defer fake.resident.deinit();
+    var registry = FakeTextureBackend.Registry.init(std.testing.allocator, fake.backend(), .{ .memory_budget = std.math.maxInt(usize) });
+    defer registry.deinit();
+
+    for (0..2) |_| {
+        ig.NewFrame();
+        ig.SetNextWindowPos(ig.Vec2.init(0, 0));
+        ig.SetNextWindowSize(ig.Vec2.init(200, 200));
+        _ = ig.Begin("Thumbnails");
+        for (0..100) |key| try registry.Image(@intCast(key), ig.Vec2.init(64, 64));
+        ig.End();
+        ig.Render();
+        registry.endFrame();
+    }
+
+    // Only the first few rows fit in a 200 pixels high window.
+    try std.testing.expect(fake.uploads > 0);
+    try std.testing.expect(fake.uploads < 10);
+}
+
+test "Instrumentation counts raw calls" {
+    if (!ig.instrumentation.enabled) return error.SkipZigTest;
+
+    const context = createHeadlessContext();
+    defer ig.DestroyContextExt(context);
+    ig.instrumentation.reset();
+
+    for (0..3) |_| {
+        ig.NewFrame();
+        _ = ig.Begin("Instrumented");
+        _ = ig.Button("Button");
+        ig.End();
+        ig.Render();
+    }
+    try std.testing.expectEqual(@as(u64, 3), ig.instrumentation.get(.igNewFrame).calls);
+    try std.testing.expectEqual(@as(u64, 3), ig.instrumentation.get(.igButton).calls);
+    try std.testing.expectEqual(@as(u64, 0), ig.instrumentation.get(.igShowDemoWindow).calls);
+
+    var output = std.ArrayList(u8).init(std.testing.allocator);
+    defer output.deinit();
+    try ig.instrumentation.dump(output.writer());
+    try std.testing.expect(std.mem.indexOf(u8, output.items, "igButton") != null);
+    try std.testing.expect(std.mem.indexOf(u8, output.items, "igShowDemoWindow") == null);
+
+    ig.instrumentation.reset();
+    try std.testing.expectEqual(@as(u64, 0), ig.instrumentation.get(.igNewFrame).calls);
+}
+
+test "IniPersistence writes changed settings in the background" {
+    var tmp = std.testing.tmpDir(.{});
+    defer tmp.cleanup();
+    const path = try std.fs.path.join(std.testing.allocator, &.{ ".zig-cache", "tmp", &tmp.sub_path, "imgui.ini" });
+    defer std.testing.allocator.free(path);
+
+    {
+        const context = createHeadlessContext();
+        defer ig.DestroyContextExt(context);
+        var ini = try extras.IniPersistence.init(std.testing.allocator, path);
+        defer ini.deinit();
+        try ini.load();
+
+        ig.NewFrame();
+        ig.SetNextWindowPos(ig.Vec2.init(37, 53));
+        _ = ig.Begin("Persisted");
+        ig.End();
+        ig.Render();
+
+        // Nothing is pulled until ImGui asks for the settings to be saved.
+        try ini.update();
+        try std.testing.expectEqual(@as(u64, 0), ini.getStats().requests);
+
+        ig.GetIO().WantSaveIniSettings = true;
+        try ini.update();
+        try ini.flush();
+        try std.testing.expect(!ig.GetIO().WantSaveIniSettings);
+
+        // Identical settings are not written again.
+        ig.GetIO().WantSaveIniSettings = true;
+        try ini.update();
+        try ini.flush();
+        const stats = ini.getStats();
+        try std.testing.expectEqual(@as(u64, 2), stats.requests);
+        try std.testing.expectEqual(@as(u64, 1), stats.unchanged);
+        try std.testing.expectEqual(@as(u64, 1), stats.writes);
+    }
+
+    const written = try tmp.dir.readFileAlloc(std.testing.allocator, "imgui.ini", 1024 * 1024);
+    defer std.testing.allocator.free(written);
+    try std.testing.expect(std.mem.indexOf(u8, written, "[Window][Persisted]") != null);
+
+    // A new context picks the window position up from the file.
+    const context = createHeadlessContext();
+    defer ig.DestroyContextExt(context);
+    var ini = try extras.IniPersistence.init(std.testing.allocator, path);
+    defer ini.deinit();
+    try ini.load();
+
+    ig.NewFrame();
+    _ = ig.Begin("Persisted");
+    const pos = ig.GetWindowPos();
+    ig.End();
+    ig.Render();
+    try std.testing.expectEqual(@as(f32, 37), pos.x);
+    try std.testing.expectEqual(@as(f32, 53), pos.y);
+}
+
+test "IniPersistence retries settings whose write failed" {
+    var tmp = std.testing.tmpDir(.{});
+    defer tmp.cleanup();
+    const path = try std.fs.path.join(std.testing.allocator, &.{ ".zig-cache", "tmp", &tmp.sub_path, "missing", "imgui.ini" });
+    defer std.testing.allocator.free(path);
+
+    const context = createHeadlessContext();
+    defer ig.DestroyContextExt(context);
+    var ini = try extras.IniPersistence.init(std.testing.allocator, path);
+    defer ini.deinit();
+    try ini.load();
+
+    ig.NewFrame();
+    _ = ig.Begin("Persisted");
+    ig.End();
+    ig.Render();
+
+    // The directory does not exist yet, so the first write fails.
+    ig.GetIO().WantSaveIniSettings = true;
+    try ini.update();
+    try std.testing.expectError(error.FileNotFound, ini.flush());
+
+    // The same settings are written again once that is possible.
+    try tmp.dir.makeDir("missing");
+    ig.GetIO().WantSaveIniSettings = true;
+    try ini.update();
+    try ini.flush();
+    const stats = ini.getStats();
+    try std.testing.expectEqual(@as(u64, 0), stats.unchanged);
+    try std.testing.expectEqual(@as(u64, 1), stats.failed_writes);
+    try std.testing.expectEqual(@as(u64, 1), stats.writes);
+    try tmp.dir.access("missing/imgui.ini", .{});
+}
+
+test "InputCoalescer merges motion and keeps clicks in order" {
+    const context = createHeadlessContext();
+    defer ig.DestroyContextExt(context);
+
+    var input = extras.InputCoalescer.init(std.testing.allocator);
+    defer input.deinit();
+
+    for (0..500) |i| try input.AddMousePosEvent(@floatFromInt(i), 10);
+    try input.AddMouseButtonEvent(0, true);
+    for (500..1000) |i| try input.AddMousePosEvent(@floatFromInt(i), 20);
+    try input.AddMouseButtonEvent(0, false);
+    for (0..10) |_| try input.AddMouseWheelEvent(0, 0.5);
+    try input.AddInputCharactersUTF8("h\xc3\xa9");
+
+    const Tag = std.meta.Tag(@TypeOf(input.events.items[0]));
+    const expected = [_]Tag{ .mouse_pos, .mouse_button, .mouse_pos, .mouse_button, .mouse_wheel, .character, .character };
+    try std.testing.expectEqual(expected.len, input.events.items.len);
+    for (expected, input.events.items) |tag, event| try std.testing.expectEqual(tag, std.meta.activeTag(event));
+    try std.testing.expectEqual(@as(f32, 499), input.events.items[0].mouse_pos.x);
+    try std.testing.expectEqual(@as(f32, 5), input.events.items[4].mouse_wheel.y);
+    try std.testing.expectEqual(@as(u32, 0xe9), input.events.items[6].character);
+
+    input.flush(ig.GetIO());
+    const stats = input.getStats();
+    try std.testing.expectEqual(@as(u64, 1014), stats.received);
+    try std.testing.expectEqual(@as(u64, expected.len), stats.forwarded);
+
+    // ImGui trickles the queued events over a few frames.
+    for (0..6) |_| {
+        ig.NewFrame();
+        ig.Render();
+    }
+    try std.testing.expectEqual(@as(f32, 999), ig.GetIO().MousePos.x);
+    try std.testing.expectEqual(@as(f32, 20), ig.GetIO().MousePos.y);
+    try std.testing.expect(!ig.GetIO().MouseDown[0]);
+}
+
+test "InputCoalescer keeps analog key toggles and wheel positions in order" {
+    var input = extras.InputCoalescer.init(std.testing.allocator);
+    defer input.deinit();
+
+    const key = ig.Key.GamepadL2;
+    try input.AddKeyAnalogEvent(key, false, 0.1);
+    try input.AddKeyAnalogEvent(key, true, 0.5);
+    for (0..100) |i| try input.AddKeyAnalogEvent(key, true, 0.5 + @as(f32, @floatFromInt(i)) / 1000);
+    try input.AddKeyAnalogEvent(key, false, 0.2);
+
+    try std.testing.expectEqual(@as(usize, 3), input.events.items.len);
+    const expected_down = [_]bool{ false, true, false };
+    const expected_value = [_]f32{ 0.1, 0.599, 0.2 };
+    for (input.events.items, expected_down, expected_value) |event, down, value| {
+        try std.testing.expectEqual(down, event.key_analog.down);
+        try std.testing.expectApproxEqAbs(value, event.key_analog.value, 1e-6);
+    }
+
+    // The wheel step stays between the positions it happened between.
+    var motion = extras.InputCoalescer.init(std.testing.allocator);
+    defer motion.deinit();
+    try motion.AddMousePosEvent(10, 10);
+    try motion.AddMousePosEvent(11, 10);
+    try motion.AddMouseWheelEvent(0, 1);
+    try motion.AddMousePosEvent(200, 10);
+    try motion.AddMousePosEvent(201, 10);
+    try motion.AddMouseWheelEvent(0, 1);
+    try motion.AddMouseWheelEvent(0, 1);
+
+    const Tag = std.meta.Tag(@TypeOf(motion.events.items[0]));
+    const expected = [_]Tag{ .mouse_pos, .mouse_wheel, .mouse_pos, .mouse_wheel };
+    try std.testing.expectEqual(expected.len, motion.events.items.len);
+    for (expected, motion.events.items) |tag, event| try std.testing.expectEqual(tag, std.meta.activeTag(event));
+    try std.testing.expectEqual(@as(f32, 11), motion.events.items[0].mouse_pos.x);
+    try std.testing.expectEqual(@as(f32, 201), motion.events.items[2].mouse_pos.x);
+    try std.testing.expectEqual(@as(f32, 2), motion.events.items[3].mouse_wheel.y);
+}
+
+test "MemoryTrimmer shrinks draw lists after a heavy frame" {
+    const context = createHeadlessContext();
+    defer ig.DestroyContextExt(context);
+
+    var trimmer = extras.MemoryTrimmer.init(std.testing.allocator, .{ .window_frames = 4, .min_bytes = 1024 });
+    defer trimmer.deinit();
+
+    var list: *ig.DrawList = undefined;
+    var heavy_capacity: u32 = 0;
+    var reclaimed: usize = 0;
+    for (0..12) |frame| {
+        ig.NewFrame();
+        _ = ig.Begin("Trimmed");
+        list = ig.GetWindowDrawList().?;
+        const rects: u32 = if (frame == 0) 5000 else 1;
+        for (0..rects) |i| {
+            const x: f32 = @floatFromInt(i % 100);
+            list.AddRectFilled(ig.Vec2.init(x, 0), ig.Vec2.init(x + 1, 1), 0xffffffff);
+        }
+        ig.End();
+        ig.Render();
+        if (frame == 0) heavy_capacity = list.VtxBuffer.Capacity;
+
+        const bytes = try trimmer.endFrame(ig.GetDrawData().?);
+        // Nothing is trimmed while the heavy frame is within the window.
+        if (frame < 8) try std.testing.expectEqual(@as(usize, 0), bytes);
+        reclaimed += bytes;
+    }
+
+    try std.testing.expect(heavy_capacity >= 5000 * 4);
+    try std.testing.expect(list.VtxBuffer.Capacity < heavy_capacity / 10);
+    try std.testing.expect(reclaimed > 0);
+    try std.testing.expectEqual(@as(u64, reclaimed), trimmer.getStats().reclaimed_bytes);
+
+    // The trimmed list keeps working.
+    ig.NewFrame();
+    _ = ig.Begin("Trimmed");
+    ig.GetWindowDrawList().?.AddRectFilled(ig.Vec2.init(0, 0), ig.Vec2.init(1, 1), 0xffffffff);
+    ig.End();
+    ig.Render();
+}
+
+fn drawTrimmedTable() void {
+    ig.NewFrame();
+    _ = ig.Begin("Trimmed table");
+    if (ig.BeginTable("columns", 6)) {
+        for (0..20) |_| {
+            ig.TableNextRow();
+            for (0..6) |_| {
+                _ = ig.TableNextColumn();
+                ig.TextUnformatted("cell");
+            }
+        }
+        ig.EndTable();
+    }
+    ig.End();
+    ig.Render();
+}
+
+test "MemoryTrimmer frees table channels" {
+    const context = createHeadlessContext();
+    defer ig.DestroyContextExt(context);
+
+    var trimmer = extras.MemoryTrimmer.init(std.testing.allocator, .{ .window_frames = 4, .min_bytes = 1024 });
+    defer trimmer.deinit();
+
+    for (0..4) |_| {
+        drawTrimmedTable();
+        _ = try trimmer.endFrame(ig.GetDrawData().?);
+    }
+    const stats = trimmer.getStats();
+    try std.testing.expect(stats.splitter_clears >= 1);
+    try std.testing.expect(stats.reclaimed_bytes >= 1024);
+
+    // The table allocates its channels again.
+    drawTrimmedTable();
+    try std.testing.expect(ig.GetDrawData().?.TotalVtxCount > 0);
+}